@@ -9,13 +9,12 @@ from pkgs.ui import AppComposer
 # App constants
 _CLIENT_ID = 'commander'
 _CLIENT_PASSWD = '12345'
-_CTRL_FRAME_RATE = 10
+_CTRL_POLL_RATE = 250
 
 # App data
 _globalLogger: object = None
 _logger: object = None
 _ui: object = None
-_units = {'active': None, 'list': []}
 
 
 # App customs exceptions
@@ -111,7 +110,6 @@ _units = {'active': None, 'list': []}
 #     _initPygame()
 #     _initMqttClient(_globalLogger)
 #     _initControllers(_globalLogger)
-#     TODO: set QTimer for controller events
 
 
 def main():
@@ -119,7 +117,7 @@ def main():
     Application main.
     """
     logger = initLogger()
-    app = AppComposer(logger)
+    app = AppComposer(logger, _CTRL_POLL_RATE)
     app.run()
 
 
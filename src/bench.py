@@ -0,0 +1,67 @@
+import argparse
+import json
+
+from logger import initLogger
+from pkgs.fleetBench import FleetBench
+from pkgs.mqttBroker import MqttBroker
+
+
+def _parseArgs() -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Return:
+        The arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description='Fleet load benchmark of the commander.')
+    parser.add_argument('--host', default='localhost',
+                        help='the broker host')
+    parser.add_argument('--port', type=int, default=1883,
+                        help='the broker port')
+    parser.add_argument('--username', help='the broker user name')
+    parser.add_argument('--password', help='the broker password')
+    parser.add_argument('--units', default='10,100,500,1000,2000',
+                        help='the comma separated unit counts')
+    parser.add_argument('--rate', type=float, default=50,
+                        help='the command rate of each unit in Hz')
+    parser.add_argument('--duration', type=float, default=10,
+                        help='the send duration of each step in seconds')
+    parser.add_argument('--embedded', action='store_true',
+                        help='run against an in-process broker on a free '
+                        'port instead of the host and port')
+    parser.add_argument('--output', help='the JSON report file')
+    return parser.parse_args()
+
+
+def main():
+    """
+    Benchmark main.
+    """
+    args = _parseArgs()
+    logger = initLogger()
+    broker = None
+    if args.embedded:
+        users = None if args.username is None else \
+            {args.username: args.password}
+        broker = MqttBroker(logger, users=users)
+        broker.start()
+        args.host = '127.0.0.1'
+        args.port = broker.getPort()
+    bench = FleetBench(logger, args.host, args.port, args.username,
+                       args.password, args.rate)
+    try:
+        reports = bench.run([int(count) for count in args.units.split(',')],
+                            args.duration)
+    finally:
+        if broker is not None:
+            broker.stop()
+    if args.output:
+        with open(args.output, 'w') as outputFile:
+            json.dump(reports, outputFile, indent=2)
+    else:
+        print(json.dumps(reports, indent=2))
+
+
+if __name__ == '__main__':
+    main()
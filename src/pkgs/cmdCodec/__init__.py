@@ -0,0 +1,4 @@
+from .groupCmdCodec import GroupCmdCodec     # noqa: F401
+from .rawPublish import canPublishRaw       # noqa: F401
+from .whldCmdCodec import (WhldCmd, WhldCmdCodec,     # noqa: F401
+                           combineThrtlBrake)
@@ -0,0 +1,105 @@
+import struct
+import time
+
+from .whldCmdCodec import WhldCmdCodec
+
+
+class GroupCmdCodec:
+    """
+    Unit group command binary codec, batching the commands of all the
+    members in a single payload.
+    """
+    VERSION = 1
+    # version, sequence number, timestamp (ms), member count
+    HEADER = struct.Struct('<BIIB')
+    # steering, throttle
+    AXES = struct.Struct('<hh')
+    MAX_MEMBERS = 255
+    MAX_ID_SIZE = 255
+
+    def __init__(self, topic: str) -> None:
+        """
+        Constructor.
+
+        Params:
+            topic:      The topic the group commands are published on.
+        """
+        self.topic = topic
+        self._seq = 0
+
+    @classmethod
+    def encodeId(cls, unitId: str) -> bytes:
+        """
+        Encode a member ID prefix, once per member.
+
+        Params:
+            unitId:     The member unit ID.
+
+        Return:
+            The length-prefixed ID.
+        """
+        idBytes = unitId.encode()
+        if len(idBytes) > cls.MAX_ID_SIZE:
+            raise ValueError(f"unit ID {unitId} too long")
+        return bytes((len(idBytes),)) + idBytes
+
+    def encode(self, commands: list, timestamp: float = None) -> bytes:
+        """
+        Encode the member commands with the next sequence number.
+
+        Params:
+            commands:   The (encoded ID, steering, throttle) of each
+                        member, the axes from -1 to 1.
+            timestamp:  The command time in seconds.
+                        Default: the monotonic clock.
+
+        Return:
+            The batched binary command.
+        """
+        if len(commands) > self.MAX_MEMBERS:
+            raise ValueError(f"too many group members {len(commands)}")
+        if timestamp is None:
+            timestamp = time.monotonic()
+        scale = WhldCmdCodec._scale
+        parts = [self.HEADER.pack(self.VERSION, self._seq,
+                                  int(timestamp * 1000) % WhldCmdCodec.SEQ_MOD,
+                                  len(commands))]
+        for idPrefix, steering, throttle in commands:
+            parts.append(idPrefix)
+            parts.append(self.AXES.pack(scale(steering), scale(throttle)))
+        self._seq = (self._seq + 1) % WhldCmdCodec.SEQ_MOD
+        return b''.join(parts)
+
+    @classmethod
+    def decode(cls, payload: bytes) -> tuple:
+        """
+        Decode a batched binary command.
+
+        Params:
+            payload:    The batched binary command.
+
+        Return:
+            The sequence number, the timestamp in milliseconds and the
+            member commands as a {unit ID: (steering, throttle)}
+            dictionary.
+        """
+        try:
+            version, seq, timestamp, count = \
+                cls.HEADER.unpack_from(payload, 0)
+            if version != cls.VERSION:
+                raise ValueError(f"unsupported command version {version}")
+            offset = cls.HEADER.size
+            commands = {}
+            for _ in range(count):
+                idSize = payload[offset]
+                unitId = bytes(payload[offset + 1:offset + 1 + idSize])
+                offset += 1 + idSize
+                steering, throttle = cls.AXES.unpack_from(payload, offset)
+                offset += cls.AXES.size
+                commands[unitId.decode()] = (steering / WhldCmdCodec.SCALE,
+                                             throttle / WhldCmdCodec.SCALE)
+        except (IndexError, struct.error, UnicodeDecodeError) as err:
+            raise ValueError(f"invalid group command: {err}") from err
+        if offset != len(payload):
+            raise ValueError('invalid group command size')
+        return seq, timestamp, commands
@@ -0,0 +1,15 @@
+def canPublishRaw(client: object) -> bool:
+    """
+    Check if an MQTT client can publish binary payloads.
+
+    The binary codecs are published with publishRaw(topic, payload),
+    which the common MQTT client does not offer yet. Without it, the
+    units keep the command message format.
+
+    Params:
+        client:     The MQTT client.
+
+    Return:
+        True if the client has a publishRaw method, False otherwise.
+    """
+    return callable(getattr(client, 'publishRaw', None))
@@ -0,0 +1,136 @@
+from collections import namedtuple
+import struct
+import time
+
+WhldCmd = namedtuple('WhldCmd', ('seq', 'timestamp', 'steering',
+                                 'throttle'))
+
+
+def combineThrtlBrake(thrtlModifier: float, brakeModifier: float) -> float:
+    """
+    Combine the throttle and brake modifier in a single one.
+
+    The throttle command is the throttle modifier when only the throttle
+    is active, the negated brake modifier when only the brake is active
+    and 0 otherwise.
+
+    Params:
+        thrtlModifier:  The throttle modifier.
+        brakeModifier:  The brake modifier.
+
+    Return:
+        The combined modifier.
+    """
+    modifier = 0.0
+    if thrtlModifier > 0 and brakeModifier == 0:
+        modifier = thrtlModifier
+    if brakeModifier > 0 and thrtlModifier == 0:
+        modifier = -1 * brakeModifier
+    return modifier
+
+
+class WhldCmdCodec:
+    """
+    Wheeled unit command binary codec.
+    """
+    VERSION = 1
+    # version, sequence number, timestamp (ms), steering, throttle
+    LAYOUT = struct.Struct('<BIIhh')
+    SCALE = 32767
+    SEQ_MOD = 1 << 32
+
+    def __init__(self, topic: str) -> None:
+        """
+        Constructor.
+
+        Params:
+            topic:      The topic the binary commands are published on.
+        """
+        self.topic = topic
+        self._seq = 0
+        self._buffer = bytearray(self.LAYOUT.size)
+
+    @classmethod
+    def negotiate(cls, versions: list) -> int:
+        """
+        Negotiate the binary format with a unit.
+
+        Params:
+            versions:   The binary format versions the unit supports.
+
+        Return:
+            The agreed version or None if the unit must keep the message
+            format.
+        """
+        return cls.VERSION if cls.VERSION in (versions or ()) else None
+
+    @classmethod
+    def _scale(cls, value: float) -> int:
+        """
+        Scale an axis value to int16.
+
+        Params:
+            value:      The axis value from -1 to 1.
+
+        Return:
+            The scaled value, clamped to the range.
+        """
+        scaled = round(value * cls.SCALE)
+        return -cls.SCALE if scaled < -cls.SCALE else \
+            cls.SCALE if scaled > cls.SCALE else scaled
+
+    def encode(self, steering: float, throttle: float,
+               timestamp: float = None) -> bytes:
+        """
+        Encode a command with the next sequence number.
+
+        Params:
+            steering:   The steering from -1 to 1.
+            throttle:   The throttle from -1 to 1.
+            timestamp:  The command time in seconds.
+                        Default: the monotonic clock.
+
+        Return:
+            The binary command.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        self.LAYOUT.pack_into(self._buffer, 0, self.VERSION, self._seq,
+                              int(timestamp * 1000) % self.SEQ_MOD,
+                              self._scale(steering), self._scale(throttle))
+        self._seq = (self._seq + 1) % self.SEQ_MOD
+        return bytes(self._buffer)
+
+    @classmethod
+    def decode(cls, payload: bytes) -> WhldCmd:
+        """
+        Decode a binary command.
+
+        Params:
+            payload:    The binary command.
+
+        Return:
+            The command, with the timestamp in milliseconds.
+        """
+        if len(payload) != cls.LAYOUT.size:
+            raise ValueError(f"invalid command size {len(payload)}")
+        version, seq, timestamp, steering, throttle = \
+            cls.LAYOUT.unpack(payload)
+        if version != cls.VERSION:
+            raise ValueError(f"unsupported command version {version}")
+        return WhldCmd(seq, timestamp, steering / cls.SCALE,
+                       throttle / cls.SCALE)
+
+    @classmethod
+    def isNewer(cls, seq: int, lastSeq: int) -> bool:
+        """
+        Check if a sequence number follows another one, across the wrap.
+
+        Params:
+            seq:        The received sequence number.
+            lastSeq:    The last accepted sequence number.
+
+        Return:
+            True if seq is newer than lastSeq, False otherwise.
+        """
+        return 0 < (seq - lastSeq) % cls.SEQ_MOD < cls.SEQ_MOD // 2
@@ -0,0 +1 @@
+from .cmdFilter import AxisFilter, CmdFilter    # noqa: F401
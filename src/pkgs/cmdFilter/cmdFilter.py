@@ -0,0 +1,125 @@
+class AxisFilter:
+    """
+    Single axis command filter with deadzone, hysteresis and minimum
+    delta.
+    """
+    __slots__ = ('deadzone', 'hysteresis', 'minDelta', '_held', '_sent')
+
+    ENDPOINTS = (-1.0, 0.0, 1.0)
+    EPSILON = 1e-9
+
+    def __init__(self, deadzone: float = 0.02, hysteresis: float = 0.01,
+                 minDelta: float = 0.02) -> None:
+        """
+        Constructor.
+
+        Params:
+            deadzone:       The magnitude under which the value is 0.
+                            Default: 0.02.
+            hysteresis:     The change the value must exceed to be
+                            accepted. Default: 0.01.
+            minDelta:       The change from the last published value
+                            worth publishing. Default: 0.02.
+        """
+        self.deadzone = deadzone
+        self.hysteresis = hysteresis
+        self.minDelta = minDelta
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Reset the filter state.
+        """
+        self._held = 0.0
+        self._sent = None
+
+    def update(self, value: float) -> tuple:
+        """
+        Filter a new value.
+
+        The endpoints are always accepted so the full range and the
+        neutral position stay reachable whatever the thresholds are.
+
+        Params:
+            value:      The new value.
+
+        Return:
+            The filtered value and True if it is worth publishing.
+        """
+        if -self.deadzone <= value <= self.deadzone:
+            value = 0.0
+        held = self._held
+        if abs(value - held) > self.hysteresis + self.EPSILON or \
+                (value != held and value in self.ENDPOINTS):
+            self._held = held = value
+        sent = self._sent
+        changed = sent is None or \
+            abs(held - sent) >= self.minDelta - self.EPSILON or \
+            (held != sent and held in self.ENDPOINTS)
+        return held, changed
+
+    def markSent(self) -> None:
+        """
+        Mark the held value as published.
+        """
+        self._sent = self._held
+
+
+class CmdFilter:
+    """
+    Unit command filter, only passing the meaningful changes and a low
+    rate keepalive.
+    """
+    def __init__(self, keepalivePeriod: float = 1.0,
+                 steering: AxisFilter = None, throttle: AxisFilter = None,
+                 brake: AxisFilter = None) -> None:
+        """
+        Constructor.
+
+        Params:
+            keepalivePeriod:    The period of the keepalive command in
+                                seconds. Default: 1.0.
+            steering:           The steering filter. Default: AxisFilter().
+            throttle:           The throttle filter. Default: AxisFilter().
+            brake:              The brake filter. Default: AxisFilter().
+        """
+        self._keepalivePeriod = keepalivePeriod
+        self._steering = steering or AxisFilter()
+        self._throttle = throttle or AxisFilter()
+        self._brake = brake or AxisFilter()
+        self._lastSent = None
+
+    def reset(self) -> None:
+        """
+        Reset the filter so the next command is published.
+        """
+        self._steering.reset()
+        self._throttle.reset()
+        self._brake.reset()
+        self._lastSent = None
+
+    def update(self, modifiers: object) -> object:
+        """
+        Filter a modifiers snapshot.
+
+        Params:
+            modifiers:  The modifiers snapshot.
+
+        Return:
+            The filtered snapshot to publish or None if the command
+            should be suppressed.
+        """
+        steering, steeringChanged = self._steering.update(modifiers.steering)
+        throttle, throttleChanged = self._throttle.update(modifiers.throttle)
+        brake, brakeChanged = self._brake.update(modifiers.brake)
+        now = modifiers.timestamp
+        if not (steeringChanged or throttleChanged or brakeChanged) and \
+                self._lastSent is not None and \
+                now - self._lastSent < self._keepalivePeriod:
+            return None
+        self._steering.markSent()
+        self._throttle.markSent()
+        self._brake.markSent()
+        self._lastSent = now
+        return modifiers._replace(steering=steering, throttle=throttle,
+                                  brake=brake)
@@ -0,0 +1 @@
+from .cmdScheduler import CmdScheduler    # noqa: F401
@@ -0,0 +1,203 @@
+import threading
+import time
+
+from pkgs.latency import LatencyHistogram
+
+
+class _WheelEntry:
+    """
+    Timing wheel entry of a scheduled unit.
+    """
+    __slots__ = ('unit', 'period', 'dueTick', 'cancelled')
+
+    def __init__(self, unit: object, period: int) -> None:
+        """
+        Constructor.
+
+        Params:
+            unit:       The scheduled unit.
+            period:     The send period in ticks.
+        """
+        self.unit = unit
+        self.period = period
+        self.dueTick = 0
+        self.cancelled = False
+
+
+class CmdScheduler(threading.Thread):
+    """
+    Unit command scheduler thread, sending the command of each unit at
+    its rate from a timing wheel.
+    """
+    MIN_TICK_RATE = 10
+    MAX_TICK_RATE = 1000
+
+    def __init__(self, appLogger: object, tickRate: int = 500,
+                 wheelSize: int = 256) -> None:
+        """
+        Constructor.
+
+        Params:
+            appLogger:      The application logger.
+            tickRate:       The wheel tick rate in Hz, from MIN_TICK_RATE
+                            to MAX_TICK_RATE. Default: 500.
+            wheelSize:      The number of wheel slots. Default: 256.
+        """
+        threading.Thread.__init__(self, name='CMD_SCHEDULER', daemon=True)
+        if not self.MIN_TICK_RATE <= tickRate <= self.MAX_TICK_RATE:
+            raise ValueError(f"tick rate {tickRate} Hz out of range "
+                             f"[{self.MIN_TICK_RATE}, "
+                             f"{self.MAX_TICK_RATE}]")
+        if wheelSize < 1:
+            raise ValueError(f"invalid wheel size {wheelSize}")
+        self._logger = appLogger.getLogger('CMD_SCHEDULER')
+        self._logger.info(f"creating command scheduler at {tickRate} Hz")
+        self._tickRate = tickRate
+        self._tickPeriod = 1 / tickRate
+        self._wheel = [[] for _ in range(wheelSize)]
+        self._tick = 0
+        self._start = None
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._pending = []
+        self._jitterLock = threading.Lock()
+        self._jitter = LatencyHistogram()
+        self._stopEvent = threading.Event()
+
+    def addUnit(self, unit: object, rate: float) -> None:
+        """
+        Schedule the commands of a unit or change its rate.
+
+        Params:
+            unit:       The unit.
+            rate:       The send rate in Hz, up to the tick rate. It is
+                        rounded to a whole number of ticks.
+        """
+        if not 0 < rate <= self._tickRate:
+            raise ValueError(f"unit rate {rate} Hz out of range "
+                             f"(0, {self._tickRate}]")
+        entry = _WheelEntry(unit, max(1, round(self._tickRate / rate)))
+        with self._lock:
+            previous = self._entries.get(unit)
+            if previous is not None:
+                previous.cancelled = True
+            self._entries[unit] = entry
+            self._pending.append(entry)
+        self._logger.info(f"scheduling unit {unit} at {rate} Hz")
+
+    def removeUnit(self, unit: object) -> None:
+        """
+        Stop scheduling the commands of a unit.
+
+        Params:
+            unit:       The unit.
+        """
+        with self._lock:
+            entry = self._entries.pop(unit, None)
+        if entry is not None:
+            entry.cancelled = True
+            self._logger.info(f"unscheduling unit {unit}")
+
+    def getUnitCount(self) -> int:
+        """
+        Get the number of scheduled units.
+
+        Return:
+            The number of scheduled units.
+        """
+        return len(self._entries)
+
+    def getJitterSummary(self) -> dict:
+        """
+        Get the send jitter statistics.
+
+        Return:
+            The count, p50, p99 and max lateness of the sends in
+            microseconds.
+        """
+        with self._jitterLock:
+            return {'count': self._jitter.getCount(),
+                    'p50': self._jitter.getPercentile(50),
+                    'p99': self._jitter.getPercentile(99),
+                    'max': self._jitter.getMax()}
+
+    def _insert(self, entry: _WheelEntry, dueTick: int) -> None:
+        """
+        Insert an entry in the wheel.
+
+        Params:
+            entry:      The entry.
+            dueTick:    The tick the entry is due on.
+        """
+        entry.dueTick = dueTick
+        self._wheel[dueTick % len(self._wheel)].append(entry)
+
+    def _runTick(self, tick: int, nowTick: int) -> None:
+        """
+        Send the commands due on a tick.
+
+        Params:
+            tick:       The tick to run.
+            nowTick:    The current tick of the clock, later than tick
+                        when catching up after an overrun.
+        """
+        with self._lock:
+            pending = self._pending
+            self._pending = []
+        for entry in pending:
+            if not entry.cancelled:
+                self._insert(entry, tick)
+        slotIdx = tick % len(self._wheel)
+        due = []
+        kept = []
+        for entry in self._wheel[slotIdx]:
+            if entry.cancelled:
+                continue
+            (due if entry.dueTick <= tick else kept).append(entry)
+        self._wheel[slotIdx] = kept
+        for entry in due:
+            lateness = time.monotonic() - \
+                (self._start + entry.dueTick * self._tickPeriod)
+            with self._jitterLock:
+                self._jitter.record(lateness)
+            try:
+                entry.unit.sendCommandMsg()
+            except Exception:
+                self._logger.exception(f"sending unit {entry.unit} "
+                                       f"command failed")
+            missed = (nowTick - entry.dueTick) // entry.period
+            self._insert(entry, entry.dueTick + (missed + 1) * entry.period)
+
+    def _advance(self) -> None:
+        """
+        Run the ticks elapsed since the last run.
+        """
+        nowTick = int((time.monotonic() - self._start) / self._tickPeriod)
+        while self._tick < nowTick:
+            self._tick += 1
+            self._runTick(self._tick, nowTick)
+
+    def run(self) -> None:
+        """
+        Run the scheduler until stopped.
+        """
+        self._logger.info('scheduler started')
+        self._start = time.monotonic()
+        while not self._stopEvent.is_set():
+            try:
+                self._advance()
+            except Exception:
+                self._logger.exception('scheduler tick failed')
+            deadline = self._start + (self._tick + 1) * self._tickPeriod
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                self._stopEvent.wait(delay)
+        self._logger.info('scheduler stopped')
+
+    def stop(self) -> None:
+        """
+        Stop the scheduler and wait for the thread to end.
+        """
+        self._stopEvent.set()
+        if self.is_alive():
+            self.join()
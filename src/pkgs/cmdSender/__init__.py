@@ -0,0 +1 @@
+from .cmdSender import CmdSender      # noqa: F401
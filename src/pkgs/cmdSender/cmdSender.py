@@ -0,0 +1,105 @@
+import threading
+
+
+class CmdSender(threading.Thread):
+    """
+    Unit command sender thread, publishing the latest submitted command
+    of each unit.
+    """
+    def __init__(self, appLogger: object) -> None:
+        """
+        Constructor.
+
+        Params:
+            appLogger:      The application logger.
+        """
+        threading.Thread.__init__(self, name='CMD_SENDER', daemon=True)
+        self._logger = appLogger.getLogger('CMD_SENDER')
+        self._logger.info('creating command sender')
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._replaced = 0
+        self._sent = 0
+        self._stopped = False
+
+    def submit(self, unit: object) -> None:
+        """
+        Submit the latest command of a unit.
+
+        Params:
+            unit:       The unit, whose publishCommandMsg method publishes
+                        its latest command from the sender thread.
+        """
+        with self._cond:
+            if unit in self._pending:
+                self._replaced += 1
+                return
+            self._pending[unit] = None
+            self._cond.notify()
+
+    def getPendingCount(self) -> int:
+        """
+        Get the number of units with an unsent command.
+
+        Return:
+            The number of pending units.
+        """
+        return len(self._pending)
+
+    def getReplacedCount(self) -> int:
+        """
+        Get the number of unsent commands replaced by a newer one.
+
+        Return:
+            The number of replaced commands.
+        """
+        return self._replaced
+
+    def getSentCount(self) -> int:
+        """
+        Get the number of published commands.
+
+        Return:
+            The number of published commands.
+        """
+        return self._sent
+
+    def _drain(self) -> None:
+        """
+        Publish the command of every pending unit.
+        """
+        with self._cond:
+            pending = self._pending
+            self._pending = {}
+        for unit in pending:
+            try:
+                unit.publishCommandMsg()
+                self._sent += 1
+            except Exception:
+                self._logger.exception(f"publishing unit {unit} command "
+                                       f"failed")
+
+    def run(self) -> None:
+        """
+        Publish the submitted commands until stopped.
+        """
+        self._logger.info('sender started')
+        while True:
+            with self._cond:
+                while not self._pending and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    break
+            self._drain()
+        self._logger.info('sender stopped')
+
+    def stop(self) -> None:
+        """
+        Stop the sender and wait for the thread to end. The unsent
+        commands are dropped.
+        """
+        with self._cond:
+            self._stopped = True
+            self._cond.notify()
+        if self.is_alive():
+            self.join()
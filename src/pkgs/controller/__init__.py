@@ -1 +1,4 @@
 from .controller import Controller      # noqa: F401
+from .eventRouter import EventRouter    # noqa: F401
+from .inputBackend import PygameBackend, VirtualBackend    # noqa: F401
+from .modifiers import Calibration, ModifierSnapshot   # noqa: F401
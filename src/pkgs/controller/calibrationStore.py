@@ -0,0 +1,118 @@
+import json
+import os
+import tempfile
+import threading
+
+from .modifiers import Calibration
+
+
+class CalibrationStore:
+    """
+    Controller calibration profile store, kept in a single JSON file.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Constructor.
+
+        Params:
+            path:       The profile store file path.
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._profiles = None
+
+    @staticmethod
+    def makeKey(guid: str, configName: str) -> str:
+        """
+        Make a profile key.
+
+        Params:
+            guid:       The joystick GUID.
+            configName: The normalized configuration name.
+
+        Return:
+            The profile key.
+        """
+        return f"{guid}/{configName}"
+
+    def _read(self) -> dict:
+        """
+        Read the profiles from the store file.
+
+        Return:
+            The profiles. A missing or unreadable store is empty.
+        """
+        try:
+            with open(self._path) as storeFile:
+                profiles = json.load(storeFile)
+        except (OSError, ValueError):
+            return {}
+        return profiles if isinstance(profiles, dict) else {}
+
+    def _write(self, profiles: dict) -> None:
+        """
+        Write the profiles to the store file.
+
+        Params:
+            profiles:   The profiles.
+        """
+        storeDir = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(storeDir, exist_ok=True)
+        fd, tmpPath = tempfile.mkstemp(dir=storeDir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as tmpFile:
+                json.dump(profiles, tmpFile, separators=(',', ':'),
+                          sort_keys=True)
+            os.replace(tmpPath, self._path)
+        except BaseException:
+            os.unlink(tmpPath)
+            raise
+
+    def _getProfiles(self) -> dict:
+        """
+        Get the profiles, reading the store file on the first call.
+
+        Return:
+            The profiles.
+        """
+        if self._profiles is None:
+            self._profiles = self._read()
+        return self._profiles
+
+    def load(self, guid: str, configName: str) -> Calibration:
+        """
+        Load a calibration profile.
+
+        Params:
+            guid:       The joystick GUID.
+            configName: The normalized configuration name.
+
+        Return:
+            The calibration or None if there is no valid profile.
+        """
+        with self._lock:
+            positions = self._getProfiles().get(self.makeKey(guid,
+                                                             configName))
+        if positions is None:
+            return None
+        try:
+            return Calibration(*positions)
+        except (TypeError, ValueError):
+            return None
+
+    def save(self, guid: str, configName: str,
+             calibration: Calibration) -> None:
+        """
+        Save a calibration profile.
+
+        Params:
+            guid:           The joystick GUID.
+            configName:     The normalized configuration name.
+            calibration:    The calibration.
+        """
+        with self._lock:
+            profiles = dict(self._getProfiles())
+            profiles[self.makeKey(guid, configName)] = \
+                list(calibration.positions)
+            self._write(profiles)
+            self._profiles = profiles
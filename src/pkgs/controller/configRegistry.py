@@ -0,0 +1,128 @@
+import json
+import logging
+import os
+import threading
+import time
+
+
+class ConfigRegistry:
+    """
+    Controller configuration registry.
+    """
+    CONFIG_EXT = '.json'
+
+    def __init__(self, rootDir: str, checkPeriod: float = 1.0) -> None:
+        """
+        Constructor.
+
+        Params:
+            rootDir:        The configuration directory.
+            checkPeriod:    The minimum period between two checks of the
+                            directory in seconds. Default: 1.0.
+        """
+        self._logger = logging.getLogger('CTRLR_CONFIG')
+        self._rootDir = rootDir
+        self._checkPeriod = checkPeriod
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._lastCheck = None
+
+    @staticmethod
+    def normalizeName(name: str) -> str:
+        """
+        Normalize a controller name.
+
+        Params:
+            name:       The controller name.
+
+        Return:
+            The normalized name.
+        """
+        return name.lower().replace(' ', '_')
+
+    def _scan(self) -> None:
+        """
+        Scan the configuration directory and parse the new or modified
+        configurations.
+        """
+        found = set()
+        with os.scandir(self._rootDir) as dirEntries:
+            for dirEntry in dirEntries:
+                if not dirEntry.name.endswith(self.CONFIG_EXT):
+                    continue
+                name = dirEntry.name[:-len(self.CONFIG_EXT)]
+                try:
+                    mtime = dirEntry.stat().st_mtime_ns
+                    entry = self._entries.get(name)
+                    if entry is None or entry[0] != mtime:
+                        with open(dirEntry.path) as configFile:
+                            self._entries[name] = (mtime,
+                                                   json.load(configFile))
+                except (OSError, ValueError) as err:
+                    self._logger.error(f"skipping controller configuration "
+                                       f"{dirEntry.name}: {err}")
+                    continue
+                found.add(name)
+        for name in set(self._entries) - found:
+            del self._entries[name]
+
+    def _refresh(self) -> None:
+        """
+        Refresh the registry if the check period elapsed.
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._lastCheck is None or \
+                    now - self._lastCheck >= self._checkPeriod:
+                self._scan()
+                self._lastCheck = now
+
+    def invalidate(self) -> None:
+        """
+        Force a check of the directory on the next lookup.
+        """
+        with self._lock:
+            self._lastCheck = None
+
+    def listSupported(self) -> tuple:
+        """
+        List the supported controllers.
+
+        Return:
+            The normalized names of the supported controllers.
+        """
+        self._refresh()
+        return tuple(self._entries)
+
+    def isSupported(self, name: str) -> bool:
+        """
+        Check if a controller is supported.
+
+        A controller is supported when its normalized name is the name of
+        a configuration, see normalizeName.
+
+        Params:
+            name:       The controller name.
+
+        Return:
+            True if the controller has a configuration, False otherwise.
+        """
+        self._refresh()
+        return self.normalizeName(name) in self._entries
+
+    def getConfig(self, name: str) -> dict:
+        """
+        Get a controller configuration.
+
+        Params:
+            name:       The controller name.
+
+        Return:
+            The controller configuration. It is shared and must not be
+            modified.
+        """
+        self._refresh()
+        entry = self._entries.get(self.normalizeName(name))
+        if entry is None:
+            raise ValueError(f"unsupported controller {name}")
+        return entry[1]
@@ -0,0 +1,104 @@
+from .responseCurve import ResponseCurve
+
+
+class ControlMap:
+    """
+    Compiled controller control map.
+    """
+    TYPE_KEY = 'type'
+    CTRLS_KEY = 'controls'
+    AXES_KEY = 'axes'
+    BTNS_KEY = 'buttons'
+    HATS_KEY = 'hats'
+    FUNC_KEY = 'functions'
+    STRG_KEY = 'steering'
+    THRTL_KEY = 'throttle'
+    BRK_KEY = 'brake'
+    CURVES_KEY = 'curves'
+
+    __slots__ = ('type', 'axes', 'buttons', 'hats', 'axisFuncs',
+                 'buttonFuncs', 'hatFuncs', 'steeringAxis', 'throttleAxis',
+                 'brakeAxis', 'steeringCurve', 'throttleCurve', 'brakeCurve')
+
+    def __init__(self, config: dict) -> None:
+        """
+        Constructor.
+
+        Params:
+            config:     The controller configuration.
+        """
+        controls = config[self.CTRLS_KEY]
+        axes = tuple(controls[self.AXES_KEY])
+        buttons = tuple(controls[self.BTNS_KEY])
+        hats = tuple(controls[self.HATS_KEY])
+        funcs = config[self.FUNC_KEY]
+        for control in funcs:
+            if control not in axes and control not in buttons \
+                    and control not in hats:
+                raise ValueError(f"unknown control {control} in "
+                                 f"{self.FUNC_KEY}")
+        axisFuncs = tuple(funcs.get(axis) for axis in axes)
+        curves = config.get(self.CURVES_KEY, {})
+        for func in curves:
+            if func not in (self.STRG_KEY, self.THRTL_KEY, self.BRK_KEY):
+                raise ValueError(f"unknown function {func} in "
+                                 f"{self.CURVES_KEY}")
+        self._set('type', config[self.TYPE_KEY])
+        self._set('axes', axes)
+        self._set('buttons', buttons)
+        self._set('hats', hats)
+        self._set('axisFuncs', axisFuncs)
+        self._set('buttonFuncs', tuple(funcs.get(btn) for btn in buttons))
+        self._set('hatFuncs', tuple(funcs.get(hat) for hat in hats))
+        self._set('steeringAxis', self._findAxis(axisFuncs, self.STRG_KEY))
+        self._set('throttleAxis', self._findAxis(axisFuncs, self.THRTL_KEY))
+        self._set('brakeAxis', self._findAxis(axisFuncs, self.BRK_KEY))
+        self._set('steeringCurve', self._compileCurve(curves, self.STRG_KEY))
+        self._set('throttleCurve', self._compileCurve(curves, self.THRTL_KEY))
+        self._set('brakeCurve', self._compileCurve(curves, self.BRK_KEY))
+
+    @staticmethod
+    def _compileCurve(curves: dict, func: str) -> ResponseCurve:
+        """
+        Compile the response curve of a function.
+
+        Params:
+            curves:     The response curves configuration.
+            func:       The function.
+
+        Return:
+            The response curve or None if the response is linear.
+        """
+        curve = curves.get(func)
+        if curve is None or curve.get(ResponseCurve.TYPE_KEY) == 'linear':
+            return None
+        return ResponseCurve.fromConfig(curve)
+
+    @staticmethod
+    def _findAxis(axisFuncs: tuple, func: str) -> int:
+        """
+        Find the axis mapped to a function.
+
+        Params:
+            axisFuncs:  The functions of each axis.
+            func:       The function to find.
+
+        Return:
+            The index of the axis or None if the function is not mapped.
+        """
+        if func in axisFuncs:
+            return axisFuncs.index(func)
+        return None
+
+    def _set(self, name: str, value: object) -> None:
+        """
+        Set an attribute while compiling the map.
+
+        Params:
+            name:       The attribute name.
+            value:      The attribute value.
+        """
+        object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
@@ -1,8 +1,14 @@
-import json
 import os
+import time
 
 import pygame as pg
-from pygame import event, joystick
+
+from .calibrationStore import CalibrationStore
+from .configRegistry import ConfigRegistry
+from .controlMap import ControlMap
+from .eventRouter import EventRouter
+from .inputBackend import PygameBackend
+from .modifiers import Calibration, ModifierSnapshot
 
 
 class Controller:
@@ -10,17 +16,27 @@ class Controller:
     Class implementing the controller function.
     """
     CONFIG_ROOT_DIR = './src/pkgs/controller/configs/'
-    TYPE_KEY = 'type'
-    CTRLS_KEY = 'controls'
-    AXES_KEY = 'axes'
-    BTNS_KEY = 'buttons'
-    HATS_KEY = 'hats'
-    FUNC_KEY = 'functions'
-    STRG_KEY = 'steering'
-    THRTL_KEY = 'throttle'
-    BRK_KEY = 'brake'
+    TYPE_KEY = ControlMap.TYPE_KEY
+    CTRLS_KEY = ControlMap.CTRLS_KEY
+    AXES_KEY = ControlMap.AXES_KEY
+    BTNS_KEY = ControlMap.BTNS_KEY
+    HATS_KEY = ControlMap.HATS_KEY
+    FUNC_KEY = ControlMap.FUNC_KEY
+    STRG_KEY = ControlMap.STRG_KEY
+    THRTL_KEY = ControlMap.THRTL_KEY
+    BRK_KEY = ControlMap.BRK_KEY
     RVS_KEY = 'reverse'
     CAL_SEQ = 6
+    CONFIG_REGISTRY = ConfigRegistry(CONFIG_ROOT_DIR)
+    CALIBRATION_PATH = os.path.join(os.path.expanduser('~'),
+                                    '.rcMissionCommand', 'calibrations.json')
+    CALIBRATION_STORE = CalibrationStore(CALIBRATION_PATH)
+    INPUT_EVENTS = (pg.JOYAXISMOTION, pg.JOYBUTTONDOWN, pg.JOYBUTTONUP,
+                    pg.JOYHATMOTION)
+    DEVICE_ADDED = pg.JOYDEVICEADDED
+    DEVICE_REMOVED = pg.JOYDEVICEREMOVED
+    BACKEND = PygameBackend()
+    EVENT_ROUTER = EventRouter()
 
     def __init__(self, logger: object, idx: int,
                  name: str, ndigit: int = 2) -> None:
@@ -40,22 +56,83 @@ class Controller:
         self._idx = idx
         self._ndigit = ndigit
         self._isCalibrated = False
+        self._calibration = None
         self._logger.info(f"creating controller {name}")
-        self._joystick = joystick.Joystick(idx)
+        self._joystick = self.BACKEND.getDevice(idx)
         self._joystick.init()
-        filename = f"{name.lower().replace(' ', '_')}.json"
-        configFilePath = os.path.join(self.CONFIG_ROOT_DIR, filename)
-        with open(configFilePath) as configFile:
-            self._config = json.load(configFile)
+        self._instanceId = self._joystick.get_instance_id()
+        self._axisValues = {}
+        self._buttonStates = {}
+        self._hatStates = {}
+        self._recorder = None
+        self._config = self.CONFIG_REGISTRY.getConfig(name)
+        self._configName = ConfigRegistry.normalizeName(name)
+        self._ctrlMap = ControlMap(self._config)
+        self._loadCalibration()
+        self.EVENT_ROUTER.register(self._instanceId, self.processEvents)
+
+    @classmethod
+    def setBackend(cls, backend: object) -> None:
+        """
+        Set the input backend of all the controllers.
+
+        Params:
+            backend:    The input backend, like PygameBackend or
+                        VirtualBackend.
+        """
+        cls.BACKEND = backend
 
     @classmethod
     def initFramework(cls):
         """
-        Initialize the pygame framework.
+        Initialize the input backend.
+        """
+        cls.BACKEND.init()
+
+    @classmethod
+    def getDeviceEvents(cls) -> list:
+        """
+        Get the pending device added and removed events.
+
+        Return:
+            The list of device events.
+        """
+        return cls.BACKEND.getEvents((cls.DEVICE_ADDED, cls.DEVICE_REMOVED))
+
+    @classmethod
+    def pumpEvents(cls) -> None:
+        """
+        Drain the pending input events once and dispatch them to the
+        controllers they are for.
+        """
+        cls.EVENT_ROUTER.dispatch(cls.BACKEND.getEvents(cls.INPUT_EVENTS))
+
+    @classmethod
+    def describeDevice(cls, idx: int) -> tuple:
+        """
+        Describe a connected device.
+
+        Params:
+            idx:        The device index.
+
+        Return:
+            The device name and instance ID.
+        """
+        device = cls.BACKEND.getDevice(idx)
+        return device.get_name(), device.get_instance_id()
+
+    @classmethod
+    def isSupported(cls, name: str) -> bool:
+        """
+        Check if a controller is supported.
+
+        Params:
+            name:       The controller name.
+
+        Return:
+            True if the controller is supported, False otherwise.
         """
-        pg.init()
-        pg.event.set_allowed([pg.JOYAXISMOTION, pg.JOYBUTTONDOWN,
-                              pg.JOYBUTTONUP, pg.JOYHATMOTION])
+        return cls.CONFIG_REGISTRY.isSupported(name)
 
     @classmethod
     def _listConnected(cls) -> tuple:
@@ -69,8 +146,8 @@ class Controller:
             The list of connected controller.
         """
         connected = []
-        for ctrlrId in range(joystick.get_count()):
-            ctrlrName = joystick.Joystick(ctrlrId).get_name()
+        for ctrlrId in range(cls.BACKEND.getCount()):
+            ctrlrName = cls.BACKEND.getDevice(ctrlrId).get_name()
             connected.append(ctrlrName)
         return tuple(connected)
 
@@ -79,18 +156,21 @@ class Controller:
         """
         Filter the unsupported controller.
 
+        A controller is supported when its normalized name is one of the
+        supported names, like ConfigRegistry.isSupported.
+
         Params:
             connected:  The list of connected controller.
-            supported:  The list of supported controller.
+            supported:  The list of supported controller normalized names.
 
         Return:
             A dictionary listing the filtered controllers
         """
+        supported = set(supported)
         filteredCtrlrs = {}
         for idx, ctrlrName in enumerate(connected):
-            if any(ctrlrName.lower().replace(' ', '_')
-                   in suppCtrlr for suppCtrlr in supported):
-                filteredCtrlrs[connected[idx]] = idx
+            if ConfigRegistry.normalizeName(ctrlrName) in supported:
+                filteredCtrlrs[ctrlrName] = idx
         return filteredCtrlrs
 
     @classmethod
@@ -103,10 +183,8 @@ class Controller:
             The keys is the controller name and the value is its index.
         """
         connected = cls._listConnected()
-        supported = (f.replace('.json', '')
-                     for f in os.listdir(cls.CONFIG_ROOT_DIR))
-        connected_supported = cls._filterUnsupported(connected,
-                                                     tuple(supported))
+        supported = cls.CONFIG_REGISTRY.listSupported()
+        connected_supported = cls._filterUnsupported(connected, supported)
         return connected_supported
 
     def _saveSteeringLeft(self) -> None:
@@ -114,7 +192,7 @@ class Controller:
         Save the left position of the steering.
         """
         fullLeftSteering = \
-            self._joystick.get_axis(self._getAxesMap().index(self.STRG_KEY))
+            self._joystick.get_axis(self._ctrlMap.steeringAxis)
         self._steeringLeft = abs(fullLeftSteering)
         self._logger.debug(f"saving steering left position as "
                            f"{self._steeringLeft}")
@@ -124,7 +202,7 @@ class Controller:
         Save the right position of the steering.
         """
         fullRightSteering = \
-            self._joystick.get_axis(self._getAxesMap().index(self.STRG_KEY))
+            self._joystick.get_axis(self._ctrlMap.steeringAxis)
         self._steeringRight = abs(fullRightSteering)
         self._logger.debug(f"saving steering left position as "
                            f"{self._steeringRight}")
@@ -134,8 +212,8 @@ class Controller:
         Save the throttle off position.
         """
         throttleOff = \
-            self._joystick.get_axis(self._getAxesMap().index(self.THRTL_KEY))
-        self._throttleOff = abs(throttleOff)
+            self._joystick.get_axis(self._ctrlMap.throttleAxis)
+        self._throttleOff = throttleOff
         self._logger.debug(f"saving throttle off position as "
                            f"{self._throttleOff}")
 
@@ -144,8 +222,8 @@ class Controller:
         Save the throttle full position.
         """
         throttleFull = \
-            self._joystick.get_axis(self._getAxesMap().index(self.THRTL_KEY))
-        self._throttleFull = abs(throttleFull)
+            self._joystick.get_axis(self._ctrlMap.throttleAxis)
+        self._throttleFull = throttleFull
         self._logger.debug(f"saving throttle full position as "
                            f"{self._throttleFull}")
 
@@ -154,8 +232,8 @@ class Controller:
         Save the break off position.
         """
         brakeOff = \
-            self._joystick.get_axis(self._getAxesMap().index(self.BRK_KEY))
-        self._brakeOff = abs(brakeOff)
+            self._joystick.get_axis(self._ctrlMap.brakeAxis)
+        self._brakeOff = brakeOff
         self._logger.debug(f"saving break off position as {self._brakeOff}")
 
     def _saveBrakeFull(self) -> None:
@@ -163,172 +241,296 @@ class Controller:
         Save the break full position.
         """
         brakeFull = \
-            self._joystick.get_axis(self._getAxesMap().index(self.BRK_KEY))
-        self._brakeFull = abs(brakeFull)
+            self._joystick.get_axis(self._ctrlMap.brakeAxis)
+        self._brakeFull = brakeFull
         self._logger.debug(f"saving break full position as {self._brakeFull}")
 
-    def _getAxesMap(self) -> list:
+    def _calibrate(self, calibSeqNumber: int) -> bool:
+        """
+        Calibrate the controller.
+
+        Params:
+            calibSeqNumber: calibration sequence number.
+
+        Return:
+            True if the step was recorded, False if the recorded
+            positions are degenerate and the sequence must restart from
+            the first step.
+        """
+        calibrationSeq = [
+            self._saveSteeringLeft,
+            self._saveSteeringRight,
+            self._saveThrottleOff,
+            self._saveThrottleFull,
+            self._saveBrakeOff,
+            self._saveBrakeFull
+        ]
+        self._logger.info(f"calibration seq: {calibSeqNumber}.")
+        calibrationSeq[calibSeqNumber]()
+        if calibSeqNumber == self.CAL_SEQ - 1:
+            try:
+                calibration = Calibration(self._steeringLeft,
+                                          self._steeringRight,
+                                          self._throttleOff,
+                                          self._throttleFull,
+                                          self._brakeOff, self._brakeFull)
+            except ValueError as err:
+                self._logger.error(f"calibration failed, restarting: {err}")
+                return False
+            self.applyCalibration(calibration)
+            self._saveCalibration(calibration)
+        return True
+
+    def applyCalibration(self, calibration: Calibration) -> None:
+        """
+        Apply a calibration and start processing the inputs.
+
+        The calibration is not saved, so a recorded or a test
+        calibration can be applied without overwriting the profile.
+
+        Params:
+            calibration:    The calibration.
+        """
+        self._steeringLeft, self._steeringRight, self._throttleOff, \
+            self._throttleFull, self._brakeOff, self._brakeFull = \
+            calibration.positions
+        self._calibration = calibration
+        self._readAxes()
+        self._isCalibrated = True
+
+    def _loadCalibration(self) -> None:
+        """
+        Load the calibration profile of the controller, if any.
+        """
+        calibration = self.CALIBRATION_STORE.load(self.getGuid(),
+                                                  self._configName)
+        if calibration is not None:
+            self._logger.info('loaded calibration profile')
+            self.applyCalibration(calibration)
+
+    def _saveCalibration(self, calibration: Calibration) -> None:
+        """
+        Save the calibration profile of the controller.
+
+        Params:
+            calibration:    The calibration.
+        """
+        try:
+            self.CALIBRATION_STORE.save(self.getGuid(), self._configName,
+                                        calibration)
+        except OSError as err:
+            self._logger.error(f"unable to save calibration profile: {err}")
+
+    def _readAxes(self) -> None:
+        """
+        Read the mapped axes positions from the joystick.
+
+        The positions are then kept up to date by the processed events.
         """
-        Get the controller axis mapping.
+        for axis in (self._ctrlMap.steeringAxis, self._ctrlMap.throttleAxis,
+                     self._ctrlMap.brakeAxis):
+            if axis is not None:
+                self._axisValues[axis] = self._joystick.get_axis(axis)
+
+    def getName(self) -> str:
+        """
+        Get the joystick name.
 
         Return:
-            The list containing the map of the axis.
+            The name of the controller.
         """
-        return self._config[self.CTRLS_KEY][self.AXES_KEY]
+        return self._joystick.get_name()
 
-    def _getButtonsMap(self) -> list:
+    def getIdx(self) -> int:
         """
-        Get the controller buttons mapping.
+        Get the joystick index
+        Return:
+            The index of the controller.
+        """
+        return self._idx
+
+    def getInstanceId(self) -> int:
+        """
+        Get the joystick instance ID.
+
+        The instance ID is stable for as long as the joystick stays
+        connected, unlike its index.
 
         Return:
-            The list containing the map of the buttons.
+            The instance ID of the controller.
         """
-        return self._config[self.CTRLS_KEY][self.BTNS_KEY]
+        return self._instanceId
 
-    def _getHatsMap(self) -> list:
+    def getGuid(self) -> str:
         """
-        Get the controller hats mapping.
+        Get the joystick GUID.
 
         Return:
-            The list containing the map of the hats.
+            The GUID of the controller.
         """
-        return self._config[self.CTRLS_KEY][self.HATS_KEY]
+        return self._joystick.get_guid()
 
-    def _getFuncMap(self) -> dict:
+    def getType(self) -> str:
         """
-        Get the controller function mapping.
+        Get the controller type.
 
         Return:
-            A dictionary containing the map of the functions.
+            The controller type.
         """
-        return self._config[self.FUNC_KEY]
+        return self._ctrlMap.type
 
-    def _getSteeringModifier(self) -> float:
+    def getConfigName(self) -> str:
         """
-        Get the steering modifier.
+        Get the controller configuration name.
 
         Return:
-            The steering modifier.
-        """
-        axisName = self._getFuncMap()[self.STRG_KEY]
-        steeringPos = \
-            self._joystick.get_axis(self._getAxesMap().index(axisName))
-        modifier = 0
-        if steeringPos < 0:
-            modifier = round(steeringPos / self._steeringLeft, self._ndigit)
-        else:
-            modifier = round(steeringPos / self._steeringRight, self._ndigit)
-        self._logger.debug(f"steering modifier: {modifier}")
-        return modifier
+            The normalized configuration name.
+        """
+        return self._configName
 
-    def _getThrottleModifier(self) -> float:
+    def getCalibration(self) -> Calibration:
         """
-        Get the throttle modifier.
+        Get the controller calibration.
 
         Return:
-            The throttle modifier.
+            The calibration or None if the controller is not calibrated.
         """
-        axisName = self._getFuncMap()[self.THRTL_KEY]
-        throttlePos = \
-            self._joystick.get_axis(self._getAxesMap().index(axisName))
-        tmpVal = self._throttleOff - throttlePos
-        throttleRange = self._throttleOff - self._throttleFull
-        modifier = round(tmpVal / throttleRange, self._ndigit)
-        self._logger.debug(f"throttle modifier: {modifier}")
-        return modifier
+        return self._calibration
 
-    def _getBrakeModifier(self) -> float:
+    def isCalibrated(self) -> bool:
         """
-        Get the break modifier.
+        Check if the controller is calibrated.
 
         Return:
-            The break modifier.
+            True if the controller is calibrated, False otherwise.
         """
-        axisName = self._getFuncMap()[self.BRK_KEY]
-        brakePos = \
-            self._joystick.get_axis(self._getAxesMap().index(axisName))
-        tmpVal = self._brakeOff - brakePos
-        brakeRange = self._brakeOff - self._brakeFull
-        modifier = round(tmpVal / brakeRange, self._ndigit)
-        self._logger.debug(f"break modifier: {modifier}")
-        return modifier
+        return self._isCalibrated
 
-    def _calibrate(self, calibSeqNumber: int) -> None:
+    def setRecorder(self, recorder: object) -> None:
         """
-        Calibrate the controller.
+        Set the recorder of the processed events.
 
         Params:
-            calibSeqNumber: calibration sequence number.
+            recorder:   The recorder or None to stop recording.
         """
-        calibrationSeq = [
-            self._saveSteeringLeft,
-            self._saveSteeringRight,
-            self._saveThrottleOff,
-            self._saveThrottleFull,
-            self._saveBrakeOff,
-            self._saveBrakeFull
-        ]
-        self._logger.info(f"calibration seq: {calibSeqNumber}.")
-        calibrationSeq[calibSeqNumber]()
-        if calibSeqNumber == self.CAL_SEQ - 1:
-            self._isCalibrated = True
+        self._recorder = recorder
 
-    def getName(self) -> str:
+    def getModifiers(self, timestamp: float = None) -> ModifierSnapshot:
         """
-        Get the joystick name.
+        Get the controller modifiers.
+
+        All the mapped axes are computed in a single pass from the latest
+        processed positions, then shaped by their response curve, if any.
+
+        Params:
+            timestamp:  The snapshot timestamp. Default: time.monotonic().
 
         Return:
-            The name of the controller.
-        """
-        return self._joystick.get_name()
+            The steering, throttle and brake modifiers snapshot.
+        """
+        ctrlMap = self._ctrlMap
+        values = self._axisValues
+        steering, throttle, brake = \
+            self._calibration.apply(values.get(ctrlMap.steeringAxis, 0.0),
+                                    values.get(ctrlMap.throttleAxis, 0.0),
+                                    values.get(ctrlMap.brakeAxis, 0.0))
+        ndigit = self._ndigit
+        curve = ctrlMap.steeringCurve
+        steering = round(curve.apply(steering) if curve else steering, ndigit)
+        curve = ctrlMap.throttleCurve
+        throttle = round(curve.apply(throttle) if curve else throttle, ndigit)
+        curve = ctrlMap.brakeCurve
+        brake = round(curve.apply(brake) if curve else brake, ndigit)
+        if timestamp is None:
+            timestamp = time.monotonic()
+        return ModifierSnapshot(steering, throttle, brake, timestamp)
 
-    def getIdx(self) -> int:
+    @classmethod
+    def _coalesceEvents(cls, events: list) -> tuple:
         """
-        Get the joystick index
+        Coalesce a batch of events.
+
+        Only the latest value of each axis is kept since the earlier ones
+        are stale by the time the batch is processed. Button and hat
+        events are edges and are all kept in their original order.
+
+        Params:
+            events:     The batch of events.
+
         Return:
-            The index of the controller.
+            The dictionary of the latest axis values keyed by
+            (instance_id, axis) and the list of button and hat events.
         """
-        return self._idx
+        axes = {}
+        edges = []
+        for ev in events:
+            if ev.type == pg.JOYAXISMOTION:
+                axes[(ev.instance_id, ev.axis)] = ev.value
+            elif ev.type in (pg.JOYBUTTONDOWN, pg.JOYBUTTONUP,
+                             pg.JOYHATMOTION):
+                edges.append(ev)
+        return axes, edges
 
-    def getType(self) -> str:
+    def _processAxis(self, axis: int, value: float) -> None:
         """
-        Get the controller type.
+        Process an axis motion.
 
-        Return:
-            The controller type.
+        Params:
+            axis:       The axis index.
+            value:      The axis value.
         """
-        return self._config[self.TYPE_KEY]
+        self._axisValues[axis] = value
 
-    def processEvents(self):
+    def _processEdge(self, ev: object) -> None:
         """
-        Process the controller events.
+        Process a button or hat event.
+
+        Params:
+            ev:         The button or hat event.
+        """
+        if ev.type == pg.JOYHATMOTION:
+            self._logger.debug(f"hat {ev.hat} with value {ev.value}")
+            self._hatStates[ev.hat] = ev.value
+        else:
+            pressed = ev.type == pg.JOYBUTTONDOWN
+            self._logger.debug(f"button {ev.button} "
+                               f"{'down' if pressed else 'up'}")
+            self._buttonStates[ev.button] = pressed
+
+    def processEvents(self, events: list = None) -> None:
         """
-        if self._isCalibrated:
-            for ev in event.get():
-                if event.type == pg.JOYAXISMOTION:
-                    self._logger.debug(f"processing joystick "
-                                       "{event.instance_id} "
-                                       f"axis {event.axis} with "
-                                       f"value {event.value}")
-                    self._process_axis(event.instance_id, event.axis)
-                if event.type == pg.JOYBUTTONDOWN:
-                    self._logger.debug(f"processing joystick "
-                                       "{event.instance_id} "
-                                       f"button {event.button} down")
-                    self._processButtonDown(event.instance_id, event.button)
-                if event.type == pg.JOYBUTTONUP:
-                    self._logger.debug(f"processing joystick "
-                                       "{event.instance_id} "
-                                       f"button {event.button} up")
-                if event.type == pg.JOYHATMOTION:
-                    self._logger.debug(f"processing joystick "
-                                       "{event.instance_id} "
-                                       f"hat {event.hat} with value "
-                                       f"{event.value}")
+        Process the controller events.
+
+        Without a batch, the pending events are pumped and dispatched to
+        every controller, this one included, so no controller ever drains
+        the events of another. A batch is coalesced once, so each axis is
+        processed at most once per call whatever the event rate is. The
+        raw events of the controller are handed to the recorder, if any,
+        before being coalesced.
+
+        Params:
+            events:     The batch of events to process.
+                        Default: the pending events.
+        """
+        if events is None:
+            self.pumpEvents()
+        elif self._isCalibrated:
+            recorder = self._recorder
+            if recorder is not None:
+                recorder.record([ev for ev in events
+                                 if ev.instance_id == self._instanceId])
+            axes, edges = self._coalesceEvents(events)
+            for (instanceId, axis), value in axes.items():
+                if instanceId == self._instanceId:
+                    self._processAxis(axis, value)
+            for ev in edges:
+                if ev.instance_id == self._instanceId:
+                    self._processEdge(ev)
 
     def quit(self) -> None:
         """
         Uninitialize the controller.
         """
         self._logger.info('unitializing controller')
+        self.EVENT_ROUTER.unregister(self._instanceId)
         self._joystick.quit()
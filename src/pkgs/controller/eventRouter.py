@@ -0,0 +1,62 @@
+import threading
+
+
+class EventRouter:
+    """
+    Joystick event router, dispatching the events to the handler of
+    their joystick.
+    """
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._lock = threading.Lock()
+        self._routes = {}
+
+    def register(self, instanceId: int, handler: object) -> None:
+        """
+        Register the handler of a joystick events.
+
+        Params:
+            instanceId: The joystick instance ID.
+            handler:    The callable handed the list of events of the
+                        joystick.
+        """
+        with self._lock:
+            routes = dict(self._routes)
+            routes[instanceId] = handler
+            self._routes = routes
+
+    def unregister(self, instanceId: int) -> None:
+        """
+        Unregister the handler of a joystick events.
+
+        Params:
+            instanceId: The joystick instance ID.
+        """
+        with self._lock:
+            routes = dict(self._routes)
+            routes.pop(instanceId, None)
+            self._routes = routes
+
+    def dispatch(self, events: list) -> None:
+        """
+        Dispatch a batch of events to the joystick handlers.
+
+        The events of the joysticks without handler are dropped.
+
+        Params:
+            events:     The batch of events.
+        """
+        routes = self._routes
+        batches = {}
+        for ev in events:
+            batch = batches.get(ev.instance_id)
+            if batch is None:
+                batches[ev.instance_id] = [ev]
+            else:
+                batch.append(ev)
+        for instanceId, batch in batches.items():
+            handler = routes.get(instanceId)
+            if handler is not None:
+                handler(batch)
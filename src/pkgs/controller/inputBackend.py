@@ -0,0 +1,327 @@
+import collections
+import threading
+
+import pygame as pg
+from pygame import event, joystick
+
+
+class PygameBackend:
+    """
+    Pygame input backend.
+    """
+    def init(self) -> None:
+        """
+        Initialize the pygame framework.
+        """
+        pg.init()
+        pg.event.set_allowed([pg.JOYAXISMOTION, pg.JOYBUTTONDOWN,
+                              pg.JOYBUTTONUP, pg.JOYHATMOTION,
+                              pg.JOYDEVICEADDED, pg.JOYDEVICEREMOVED])
+
+    def getCount(self) -> int:
+        """
+        Get the number of connected devices.
+
+        Return:
+            The number of connected devices.
+        """
+        return joystick.get_count()
+
+    def getDevice(self, idx: int) -> object:
+        """
+        Get a connected device.
+
+        Params:
+            idx:        The device index.
+
+        Return:
+            The pygame joystick.
+        """
+        return joystick.Joystick(idx)
+
+    def getEvents(self, types: tuple) -> list:
+        """
+        Drain the pending events of the given types.
+
+        Params:
+            types:      The event types.
+
+        Return:
+            The list of events.
+        """
+        return event.get(types)
+
+
+class VirtualJoystick:
+    """
+    Virtual joystick driven programmatically.
+    """
+    def __init__(self, backend: 'VirtualBackend', name: str, instanceId: int,
+                 numAxes: int, numButtons: int, numHats: int) -> None:
+        """
+        Constructor.
+
+        Params:
+            backend:        The virtual backend.
+            name:           The joystick name.
+            instanceId:     The joystick instance ID.
+            numAxes:        The number of axes.
+            numButtons:     The number of buttons.
+            numHats:        The number of hats.
+        """
+        self._backend = backend
+        self._name = name
+        self._instanceId = instanceId
+        self._axes = [0.0] * numAxes
+        self._buttons = [False] * numButtons
+        self._hats = [(0, 0)] * numHats
+
+    def init(self) -> None:
+        """
+        Initialize the joystick.
+        """
+
+    def quit(self) -> None:
+        """
+        Uninitialize the joystick.
+        """
+
+    def get_name(self) -> str:
+        """
+        Get the joystick name.
+
+        Return:
+            The joystick name.
+        """
+        return self._name
+
+    def get_instance_id(self) -> int:
+        """
+        Get the joystick instance ID.
+
+        Return:
+            The joystick instance ID.
+        """
+        return self._instanceId
+
+    def get_guid(self) -> str:
+        """
+        Get the joystick GUID.
+
+        Return:
+            The joystick GUID, derived from its instance ID.
+        """
+        return f"virtual-{self._instanceId}"
+
+    def get_numaxes(self) -> int:
+        """
+        Get the number of axes.
+
+        Return:
+            The number of axes.
+        """
+        return len(self._axes)
+
+    def get_axis(self, axis: int) -> float:
+        """
+        Get an axis position.
+
+        Params:
+            axis:       The axis index.
+
+        Return:
+            The axis position.
+        """
+        return self._axes[axis]
+
+    def get_button(self, button: int) -> bool:
+        """
+        Get a button state.
+
+        Params:
+            button:     The button index.
+
+        Return:
+            True if the button is pressed, False otherwise.
+        """
+        return self._buttons[button]
+
+    def get_hat(self, hat: int) -> tuple:
+        """
+        Get a hat position.
+
+        Params:
+            hat:        The hat index.
+
+        Return:
+            The hat (x, y) position.
+        """
+        return self._hats[hat]
+
+    def setAxis(self, axis: int, value: float) -> None:
+        """
+        Move an axis.
+
+        Params:
+            axis:       The axis index.
+            value:      The axis value from -1 to 1.
+        """
+        self._axes[axis] = value
+        self._backend.postEvent(pg.event.Event(
+            pg.JOYAXISMOTION, instance_id=self._instanceId, axis=axis,
+            value=value))
+
+    def setButton(self, button: int, pressed: bool) -> None:
+        """
+        Press or release a button.
+
+        Params:
+            button:     The button index.
+            pressed:    True to press the button, False to release it.
+        """
+        self._buttons[button] = pressed
+        evType = pg.JOYBUTTONDOWN if pressed else pg.JOYBUTTONUP
+        self._backend.postEvent(pg.event.Event(
+            evType, instance_id=self._instanceId, button=button))
+
+    def setHat(self, hat: int, value: tuple) -> None:
+        """
+        Move a hat.
+
+        Params:
+            hat:        The hat index.
+            value:      The hat (x, y) position.
+        """
+        self._hats[hat] = value
+        self._backend.postEvent(pg.event.Event(
+            pg.JOYHATMOTION, instance_id=self._instanceId, hat=hat,
+            value=value))
+
+    def playEvents(self, events: list) -> None:
+        """
+        Play a batch of recorded input events on the joystick.
+
+        Params:
+            events:     The input events, like the batches of
+                        InputReplayer.iterBatches.
+        """
+        for ev in events:
+            if ev.type == pg.JOYAXISMOTION:
+                self.setAxis(ev.axis, ev.value)
+            elif ev.type in (pg.JOYBUTTONDOWN, pg.JOYBUTTONUP):
+                self.setButton(ev.button, ev.type == pg.JOYBUTTONDOWN)
+            elif ev.type == pg.JOYHATMOTION:
+                self.setHat(ev.hat, ev.value)
+
+
+class VirtualBackend:
+    """
+    Virtual input backend, running the input path without hardware.
+    """
+    def __init__(self, configName: str = 'logitech_driving_force') -> None:
+        """
+        Constructor.
+
+        Params:
+            configName:     The default name of the added devices, which
+                            selects their configuration.
+                            Default: logitech_driving_force.
+        """
+        self._configName = configName
+        self._lock = threading.Lock()
+        self._devices = []
+        self._events = collections.deque()
+        self._nextInstanceId = 0
+
+    def init(self) -> None:
+        """
+        Initialize the backend.
+        """
+
+    def getCount(self) -> int:
+        """
+        Get the number of connected devices.
+
+        Return:
+            The number of connected devices.
+        """
+        return len(self._devices)
+
+    def getDevice(self, idx: int) -> VirtualJoystick:
+        """
+        Get a connected device.
+
+        Params:
+            idx:        The device index.
+
+        Return:
+            The virtual joystick.
+        """
+        return self._devices[idx]
+
+    def addDevice(self, name: str = None, numAxes: int = 6,
+                  numButtons: int = 24, numHats: int = 1) -> VirtualJoystick:
+        """
+        Connect a virtual joystick.
+
+        Params:
+            name:           The joystick name.
+                            Default: the backend configuration name.
+            numAxes:        The number of axes. Default: 6.
+            numButtons:     The number of buttons. Default: 24.
+            numHats:        The number of hats. Default: 1.
+
+        Return:
+            The virtual joystick.
+        """
+        with self._lock:
+            device = VirtualJoystick(self, name or self._configName,
+                                     self._nextInstanceId, numAxes,
+                                     numButtons, numHats)
+            self._nextInstanceId += 1
+            self._devices.append(device)
+            self._events.append(pg.event.Event(
+                pg.JOYDEVICEADDED, device_index=len(self._devices) - 1))
+        return device
+
+    def removeDevice(self, device: VirtualJoystick) -> None:
+        """
+        Disconnect a virtual joystick.
+
+        Params:
+            device:     The virtual joystick.
+        """
+        with self._lock:
+            self._devices.remove(device)
+            self._events.append(pg.event.Event(
+                pg.JOYDEVICEREMOVED, instance_id=device.get_instance_id()))
+
+    def postEvent(self, ev: object) -> None:
+        """
+        Post an event.
+
+        Params:
+            ev:         The event.
+        """
+        with self._lock:
+            self._events.append(ev)
+
+    def getEvents(self, types: tuple) -> list:
+        """
+        Drain the pending events of the given types.
+
+        The events of the other types stay queued in order.
+
+        Params:
+            types:      The event types.
+
+        Return:
+            The list of events.
+        """
+        with self._lock:
+            drained = []
+            kept = collections.deque()
+            for ev in self._events:
+                (drained if ev.type in types else kept).append(ev)
+            self._events = kept
+        return drained
@@ -0,0 +1,135 @@
+from collections import namedtuple
+
+try:
+    import numpy as np
+except ImportError:     # pragma: no cover
+    np = None
+
+
+ModifierSnapshot = namedtuple('ModifierSnapshot',
+                              ('steering', 'throttle', 'brake', 'timestamp'))
+
+
+def computeModifiersArray(samples: object, offsets: object, negScales: object,
+                          posScales: object, ndigit: int = None) -> object:
+    """
+    Compute the modifiers of a batch of axis samples with NumPy.
+
+    The calibration vectors broadcast against the samples, so a single
+    calibration can be applied to a replayed trace or one calibration
+    per row to the samples of many controllers.
+
+    Params:
+        samples:    The (..., 3) steering, throttle and brake positions.
+        offsets:    The (..., 3) calibration offsets.
+        negScales:  The (..., 3) scales applied below the offsets.
+        posScales:  The (..., 3) scales applied above the offsets.
+        ndigit:     The digit number of the modifiers or None to skip
+                    the rounding. Default: None.
+
+    Return:
+        The (..., 3) steering, throttle and brake modifiers.
+    """
+    if np is None:
+        raise RuntimeError('NumPy is required for the batched modifiers')
+    deltas = np.asarray(samples, dtype=np.float64) - offsets
+    modifiers = deltas * np.where(deltas < 0, negScales, posScales)
+    if ndigit is not None:
+        np.round(modifiers, ndigit, out=modifiers)
+    return modifiers
+
+
+class Calibration:
+    """
+    Controller calibration.
+    """
+    __slots__ = ('positions', 'offsets', 'negScales', 'posScales')
+
+    def __init__(self, steeringLeft: float, steeringRight: float,
+                 throttleOff: float, throttleFull: float,
+                 brakeOff: float, brakeFull: float) -> None:
+        """
+        Constructor.
+
+        Params:
+            steeringLeft:   The steering full left position magnitude.
+            steeringRight:  The steering full right position magnitude.
+            throttleOff:    The throttle off position.
+            throttleFull:   The throttle full position.
+            brakeOff:       The brake off position.
+            brakeFull:      The brake full position.
+        """
+        if 0 in (steeringLeft, steeringRight) or \
+                throttleOff == throttleFull or brakeOff == brakeFull:
+            raise ValueError('degenerate calibration range')
+        self.positions = (steeringLeft, steeringRight, throttleOff,
+                          throttleFull, brakeOff, brakeFull)
+        throttleScale = 1 / (throttleFull - throttleOff)
+        brakeScale = 1 / (brakeFull - brakeOff)
+        self.offsets = (0.0, throttleOff, brakeOff)
+        self.negScales = (1 / steeringLeft, throttleScale, brakeScale)
+        self.posScales = (1 / steeringRight, throttleScale, brakeScale)
+
+    @classmethod
+    def stackVectors(cls, calibrations: list) -> tuple:
+        """
+        Stack the vectors of many calibrations for computeModifiersArray.
+
+        Params:
+            calibrations:   The calibrations.
+
+        Return:
+            The (N, 3) offsets, negative scales and positive scales.
+        """
+        if np is None:
+            raise RuntimeError('NumPy is required for the batched modifiers')
+        return (np.array([cal.offsets for cal in calibrations]),
+                np.array([cal.negScales for cal in calibrations]),
+                np.array([cal.posScales for cal in calibrations]))
+
+    def apply(self, steeringPos: float, throttlePos: float,
+              brakePos: float, ndigit: int = None) -> tuple:
+        """
+        Compute the modifiers of a single sample.
+
+        Params:
+            steeringPos:    The steering position.
+            throttlePos:    The throttle position.
+            brakePos:       The brake position.
+            ndigit:         The digit number of the modifiers or None to
+                            skip the rounding. Default: None.
+
+        Return:
+            The steering, throttle and brake modifiers.
+        """
+        negScales = self.negScales
+        posScales = self.posScales
+        _, throttleOff, brakeOff = self.offsets
+        throttleDelta = throttlePos - throttleOff
+        brakeDelta = brakePos - brakeOff
+        steering = steeringPos * (negScales[0] if steeringPos < 0
+                                  else posScales[0])
+        throttle = throttleDelta * (negScales[1] if throttleDelta < 0
+                                    else posScales[1])
+        brake = brakeDelta * (negScales[2] if brakeDelta < 0
+                              else posScales[2])
+        if ndigit is None:
+            return steering, throttle, brake
+        return (round(steering, ndigit), round(throttle, ndigit),
+                round(brake, ndigit))
+
+    def applyArray(self, samples: object, ndigit: int = None) -> object:
+        """
+        Compute the modifiers of a batch of samples with NumPy.
+
+        Params:
+            samples:        The (N, 3) steering, throttle and brake
+                            positions.
+            ndigit:         The digit number of the modifiers or None to
+                            skip the rounding. Default: None.
+
+        Return:
+            The (N, 3) steering, throttle and brake modifiers.
+        """
+        return computeModifiersArray(samples, self.offsets, self.negScales,
+                                     self.posScales, ndigit)
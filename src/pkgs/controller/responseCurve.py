@@ -0,0 +1,126 @@
+from array import array
+import bisect
+
+
+class ResponseCurve:
+    """
+    Axis response curve, compiled into a lookup table.
+    """
+    TYPE_KEY = 'type'
+    SIZE = 1025
+
+    __slots__ = ('table', '_scale', '_last')
+
+    def __init__(self, func: object, size: int = SIZE) -> None:
+        """
+        Constructor.
+
+        Params:
+            func:       The response of a magnitude from 0 to 1.
+            size:       The lookup table size. Default: SIZE.
+        """
+        scale = size - 1
+        self.table = array('d', (min(max(func(idx / scale), 0.0), 1.0)
+                                 for idx in range(size)))
+        self._scale = scale
+        self._last = scale
+
+    @classmethod
+    def fromConfig(cls, config: dict) -> 'ResponseCurve':
+        """
+        Compile a response curve configuration.
+
+        The supported types are:
+            - linear:   no parameter.
+            - expo:     expo, from 0 (linear) to 1 (cubic).
+            - scurve:   gain, from 1 (linear), the slope at the center.
+            - spline:   points, the [magnitude, response] points from
+                        [0, 0] to [1, 1] interpolated by a monotone cubic
+                        spline.
+
+        Params:
+            config:     The curve configuration.
+
+        Return:
+            The response curve.
+        """
+        curveType = config.get(cls.TYPE_KEY)
+        if curveType == 'linear':
+            return cls(lambda x: x)
+        if curveType == 'expo':
+            expo = float(config.get('expo', 0.0))
+            if not 0.0 <= expo <= 1.0:
+                raise ValueError(f"expo {expo} out of range [0, 1]")
+            return cls(lambda x: (1 - expo) * x + expo * x ** 3)
+        if curveType == 'scurve':
+            gain = float(config.get('gain', 1.0))
+            if gain < 1.0:
+                raise ValueError(f"scurve gain {gain} under 1")
+            return cls(lambda x: x ** gain / (x ** gain + (1 - x) ** gain))
+        if curveType == 'spline':
+            return cls(cls._monotoneSpline(config.get('points', ())))
+        raise ValueError(f"unknown response curve type {curveType}")
+
+    @staticmethod
+    def _monotoneSpline(points: list) -> object:
+        """
+        Build a monotone cubic spline (Fritsch-Carlson) through points.
+
+        Params:
+            points:     The [x, y] points, x strictly increasing from 0
+                        to 1.
+
+        Return:
+            The spline function.
+        """
+        xs = [float(x) for x, _ in points]
+        ys = [float(y) for _, y in points]
+        if len(xs) < 2 or xs[0] != 0.0 or xs[-1] != 1.0 or \
+                any(x1 <= x0 for x0, x1 in zip(xs, xs[1:])):
+            raise ValueError('spline points must go from x = 0 to x = 1 '
+                             'with strictly increasing x')
+        slopes = [(y1 - y0) / (x1 - x0) for x0, x1, y0, y1
+                  in zip(xs, xs[1:], ys, ys[1:])]
+        tangents = [slopes[0]] + \
+            [0.0 if s0 * s1 <= 0 else (s0 + s1) / 2
+             for s0, s1 in zip(slopes, slopes[1:])] + [slopes[-1]]
+        for idx, slope in enumerate(slopes):
+            if slope == 0.0:
+                tangents[idx] = tangents[idx + 1] = 0.0
+                continue
+            alpha = tangents[idx] / slope
+            beta = tangents[idx + 1] / slope
+            norm = alpha * alpha + beta * beta
+            if norm > 9.0:
+                factor = 3.0 / norm ** 0.5
+                tangents[idx] = factor * alpha * slope
+                tangents[idx + 1] = factor * beta * slope
+
+        def spline(x: float) -> float:
+            idx = min(bisect.bisect_right(xs, x) - 1, len(slopes) - 1)
+            width = xs[idx + 1] - xs[idx]
+            t = (x - xs[idx]) / width
+            t2 = t * t
+            t3 = t2 * t
+            return (2 * t3 - 3 * t2 + 1) * ys[idx] + \
+                (t3 - 2 * t2 + t) * width * tangents[idx] + \
+                (-2 * t3 + 3 * t2) * ys[idx + 1] + \
+                (t3 - t2) * width * tangents[idx + 1]
+
+        return spline
+
+    def apply(self, modifier: float) -> float:
+        """
+        Apply the curve to a modifier.
+
+        Params:
+            modifier:   The modifier from -1 to 1.
+
+        Return:
+            The response.
+        """
+        if modifier < 0:
+            idx = int(-modifier * self._scale + 0.5)
+            return -self.table[idx if idx < self._last else self._last]
+        idx = int(modifier * self._scale + 0.5)
+        return self.table[idx if idx < self._last else self._last]
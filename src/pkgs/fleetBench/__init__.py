@@ -0,0 +1,3 @@
+from .benchPublisher import BenchPublisher          # noqa: F401
+from .fleetBench import FleetBench                  # noqa: F401
+from .simUnit import SimUnit                        # noqa: F401
@@ -0,0 +1,122 @@
+import asyncio
+import struct
+import threading
+import time
+
+from pkgs.mqttWire import CONNACK, connectPacket, disconnectPacket, \
+    parseConnack, publishPacket, readPacket
+
+# the sequence number of the WhldCmdCodec layout, after the version
+_CMD_SEQ = struct.Struct('<xI')
+
+
+class BenchPublisher:
+    """
+    Benchmark commander MQTT client.
+    """
+    def __init__(self, clientId: str = 'bench-commander') -> None:
+        """
+        Constructor.
+
+        Params:
+            clientId:   The MQTT client ID. Default: bench-commander.
+        """
+        self._clientId = clientId
+        self._loop = None
+        self._reader = None
+        self._writer = None
+        self._lock = threading.Lock()
+        self._pending = []
+        self._sendTimes = {}
+        self._sentCount = 0
+
+    async def connect(self, host: str, port: int, username: str = None,
+                      password: str = None) -> None:
+        """
+        Connect to the broker.
+
+        Params:
+            host:       The broker host.
+            port:       The broker port.
+            username:   The user name. Default: None.
+            password:   The password. Default: None.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._reader, self._writer = await asyncio.open_connection(host,
+                                                                   port)
+        self._writer.write(connectPacket(self._clientId, username, password,
+                                         keepalive=0))
+        packetType, _, body = await readPacket(self._reader)
+        if packetType != CONNACK or parseConnack(body):
+            raise ValueError(f"{self._clientId} connection refused")
+
+    async def disconnect(self) -> None:
+        """
+        Flush the pending packets and disconnect from the broker.
+        """
+        if self._writer is None:
+            return
+        self._flush()
+        self._writer.write(disconnectPacket())
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._writer = None
+
+    def publishRaw(self, topic: str, payload: bytes) -> None:
+        """
+        Publish a binary command at QoS 0.
+
+        Params:
+            topic:      The topic.
+            payload:    The binary command.
+        """
+        packet = publishPacket(topic, payload)
+        self._sendTimes[topic, _CMD_SEQ.unpack_from(payload)[0]] = \
+            time.perf_counter()
+        with self._lock:
+            self._pending.append(packet)
+            self._sentCount += 1
+            if len(self._pending) > 1:
+                return
+        self._loop.call_soon_threadsafe(self._flush)
+
+    def _flush(self) -> None:
+        """
+        Write the pending packets from the event loop.
+        """
+        with self._lock:
+            packets = self._pending
+            self._pending = []
+        if packets and self._writer is not None:
+            self._writer.write(b''.join(packets))
+
+    def popSendTime(self, topic: str, seq: int) -> float:
+        """
+        Take the send time of a command.
+
+        Params:
+            topic:      The command topic.
+            seq:        The command sequence number.
+
+        Return:
+            The send time from the performance counter or None if the
+            command is unknown.
+        """
+        return self._sendTimes.pop((topic, seq), None)
+
+    def getSentCount(self) -> int:
+        """
+        Get the number of published commands.
+
+        Return:
+            The number of published commands.
+        """
+        return self._sentCount
+
+    def reset(self) -> None:
+        """
+        Clear the send times and the count of the published commands.
+        """
+        self._sendTimes.clear()
+        with self._lock:
+            self._sentCount = 0
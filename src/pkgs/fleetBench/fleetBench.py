@@ -0,0 +1,206 @@
+import asyncio
+import os
+import resource
+import time
+
+from pkgs.cmdCodec import WhldCmdCodec
+from pkgs.cmdScheduler import CmdScheduler
+from pkgs.latency import LatencyHistogram
+
+from .benchPublisher import BenchPublisher
+from .simUnit import SimUnit
+
+
+def makeUnit(appLogger: object, client: object, unitId: str,
+             topic: str) -> object:
+    """
+    Make a commander unit publishing binary commands.
+
+    Params:
+        appLogger:  The application logger.
+        client:     The MQTT client.
+        unitId:     The unit ID.
+        topic:      The binary command topic.
+
+    Return:
+        The unit.
+    """
+    from pkgs.unit import Unit
+    unit = Unit(appLogger, client, unitId)
+    unit.setCmdCodec(WhldCmdCodec(topic))
+    return unit
+
+
+class FleetBench:
+    """
+    Fleet load benchmark.
+    """
+    TOPIC = 'bench/{}/cmd'
+    CONNECT_CONCURRENCY = 100
+    SETTLE_TIME = 0.5
+
+    def __init__(self, appLogger: object, host: str = 'localhost',
+                 port: int = 1883, username: str = None,
+                 password: str = None, rate: float = 50,
+                 unitFactory: object = makeUnit) -> None:
+        """
+        Constructor.
+
+        Params:
+            appLogger:      The application logger.
+            host:           The broker host. Default: localhost.
+            port:           The broker port. Default: 1883.
+            username:       The user name. Default: None.
+            password:       The password. Default: None.
+            rate:           The command rate of each unit in Hz.
+                            Default: 50.
+            unitFactory:    The unit factory, called with the logger, the
+                            MQTT client, the unit ID and its topic.
+                            Default: makeUnit.
+        """
+        self._appLogger = appLogger
+        self._logger = appLogger.getLogger('FLEET_BENCH')
+        self._host = host
+        self._port = port
+        self._username = username
+        self._password = password
+        self._rate = rate
+        self._unitFactory = unitFactory
+
+    @staticmethod
+    def _getRss() -> int:
+        """
+        Get the resident memory of the process.
+
+        Return:
+            The resident memory in bytes, the peak one where the current
+            one is not available.
+        """
+        try:
+            with open('/proc/self/statm') as statm:
+                return int(statm.read().split()[1]) * \
+                    os.sysconf('SC_PAGE_SIZE')
+        except (OSError, ValueError, IndexError):
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    async def _connectFleet(self, units: list) -> None:
+        """
+        Connect the simulated units, a bounded number at a time.
+
+        Params:
+            units:      The simulated units.
+        """
+        semaphore = asyncio.Semaphore(self.CONNECT_CONCURRENCY)
+
+        async def connect(unit: SimUnit) -> None:
+            async with semaphore:
+                await unit.connect(self._host, self._port, self._username,
+                                   self._password)
+
+        await asyncio.gather(*(connect(unit) for unit in units))
+
+    async def runStep(self, unitCount: int, duration: float) -> dict:
+        """
+        Run a benchmark step.
+
+        Params:
+            unitCount:  The number of units.
+            duration:   The send duration in seconds.
+
+        Return:
+            The step report.
+        """
+        if unitCount < 1:
+            raise ValueError(f"invalid unit count {unitCount}")
+        self._logger.info(f"running {unitCount} units for {duration} s")
+        histogram = LatencyHistogram()
+        publisher = BenchPublisher()
+        simUnits = [SimUnit(f"sim-{idx:04d}", self.TOPIC.format(idx),
+                            publisher, histogram)
+                    for idx in range(unitCount)]
+        scheduler = CmdScheduler(self._appLogger)
+        try:
+            await self._connectFleet(simUnits)
+            await publisher.connect(self._host, self._port, self._username,
+                                    self._password)
+            for idx, simUnit in enumerate(simUnits):
+                unit = self._unitFactory(self._appLogger, publisher,
+                                         simUnit.getId(),
+                                         self.TOPIC.format(idx))
+                unit.updateSteeringCmd(0.5)
+                unit.updateThrottleCmd(0.25, 0.0)
+                scheduler.addUnit(unit, self._rate)
+            rss = self._getRss()
+            cpuStart = time.process_time()
+            start = time.perf_counter()
+            scheduler.start()
+            await asyncio.sleep(duration)
+            scheduler.stop()
+            elapsed = time.perf_counter() - start
+            await asyncio.sleep(self.SETTLE_TIME)
+            cpu = time.process_time() - cpuStart
+            rss = max(rss, self._getRss())
+        finally:
+            scheduler.stop()
+            await publisher.disconnect()
+            await asyncio.gather(*(unit.disconnect() for unit in simUnits))
+        sent = publisher.getSentCount()
+        received = sum(unit.receivedCount for unit in simUnits)
+        cpuTime = elapsed + self.SETTLE_TIME
+        return {
+            'units': unitCount,
+            'duration': elapsed,
+            'sent': sent,
+            'received': received,
+            'lost': sent - received,
+            'publishRate': sent / elapsed,
+            'receiveRate': received / elapsed,
+            'latency': {
+                'count': histogram.getCount(),
+                'p50': histogram.getPercentile(50),
+                'p90': histogram.getPercentile(90),
+                'p99': histogram.getPercentile(99),
+                'max': histogram.getMax(),
+            },
+            'cpuPercent': 100 * cpu / cpuTime,
+            'cpuPerUnit': 100 * cpu / cpuTime / unitCount,
+            'rss': rss,
+            'rssPerUnit': rss / unitCount,
+        }
+
+    async def runSteps(self, unitCounts: list, duration: float) -> list:
+        """
+        Run a benchmark step for each unit count.
+
+        Params:
+            unitCounts: The unit counts.
+            duration:   The send duration of each step in seconds.
+
+        Return:
+            The step reports.
+        """
+        reports = []
+        for unitCount in unitCounts:
+            report = await self.runStep(unitCount, duration)
+            latency = report['latency']
+            self._logger.info(f"{unitCount} units: "
+                              f"{report['receiveRate']:.0f} msg/s, "
+                              f"p50 {latency['p50']} us, "
+                              f"p99 {latency['p99']} us, "
+                              f"cpu {report['cpuPercent']:.1f} %, "
+                              f"rss {report['rss'] >> 20} MiB")
+            reports.append(report)
+        return reports
+
+    def run(self, unitCounts: list, duration: float) -> list:
+        """
+        Run the benchmark in its own event loop.
+
+        Params:
+            unitCounts: The unit counts.
+            duration:   The send duration of each step in seconds.
+
+        Return:
+            The step reports.
+        """
+        return asyncio.run(self.runSteps(unitCounts, duration))
@@ -0,0 +1,119 @@
+import asyncio
+import time
+
+from pkgs.cmdCodec import WhldCmdCodec
+from pkgs.mqttWire import CONNACK, PUBLISH, SUBACK, connectPacket, \
+    disconnectPacket, parseConnack, parsePublish, readPacket, \
+    subscribePacket
+
+
+class SimUnit:
+    """
+    Simulated unit.
+    """
+    def __init__(self, id: str, topic: str, publisher: object,
+                 histogram: object) -> None:
+        """
+        Constructor.
+
+        Params:
+            id:         The unit ID.
+            topic:      The command topic.
+            publisher:  The benchmark publisher stamping the commands.
+            histogram:  The end to end latency histogram.
+        """
+        self._id = id
+        self._topic = topic
+        self._publisher = publisher
+        self._histogram = histogram
+        self._reader = None
+        self._writer = None
+        self._task = None
+        self.receivedCount = 0
+        self.invalidCount = 0
+
+    def getId(self) -> str:
+        """
+        Get the unit ID.
+
+        Return:
+            The unit ID.
+        """
+        return self._id
+
+    async def connect(self, host: str, port: int, username: str = None,
+                      password: str = None) -> None:
+        """
+        Connect to the broker, subscribe to the command topic and start
+        receiving.
+
+        Params:
+            host:       The broker host.
+            port:       The broker port.
+            username:   The user name. Default: None.
+            password:   The password. Default: None.
+        """
+        self._reader, self._writer = await asyncio.open_connection(host,
+                                                                   port)
+        self._writer.write(connectPacket(self._id, username, password,
+                                         keepalive=0))
+        packetType, _, body = await readPacket(self._reader)
+        if packetType != CONNACK or parseConnack(body):
+            raise ValueError(f"unit {self._id} connection refused")
+        self._writer.write(subscribePacket(1, [self._topic]))
+        packetType, _, _ = await readPacket(self._reader)
+        if packetType != SUBACK:
+            raise ValueError(f"unit {self._id} subscription refused")
+        self._task = asyncio.ensure_future(self._receive())
+
+    def onCommand(self, topic: str, payload: bytes) -> None:
+        """
+        Handle a received command.
+
+        Params:
+            topic:      The command topic.
+            payload:    The binary command.
+        """
+        received = time.perf_counter()
+        try:
+            cmd = WhldCmdCodec.decode(payload)
+        except ValueError:
+            self.invalidCount += 1
+            return
+        self.receivedCount += 1
+        sent = self._publisher.popSendTime(topic, cmd.seq)
+        if sent is not None:
+            self._histogram.record(received - sent)
+
+    async def _receive(self) -> None:
+        """
+        Receive the commands until the connection is closed.
+        """
+        try:
+            while True:
+                packetType, flags, body = await readPacket(self._reader)
+                if packetType == PUBLISH:
+                    message = parsePublish(flags, body)
+                    self.onCommand(message.topic, message.payload)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+    async def disconnect(self) -> None:
+        """
+        Disconnect from the broker.
+        """
+        if self._writer is None:
+            return
+        self._writer.write(disconnectPacket())
+        self._writer.close()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._writer = None
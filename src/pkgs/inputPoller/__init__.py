@@ -0,0 +1 @@
+from .inputPoller import InputPoller    # noqa: F401
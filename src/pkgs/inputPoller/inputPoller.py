@@ -0,0 +1,185 @@
+import threading
+import time
+
+from pkgs.cmdFilter import CmdFilter
+from pkgs.controller import Controller
+from pkgs.latency import LatencyTracker
+
+
+class InputPoller(threading.Thread):
+    """
+    Controller input polling thread.
+    """
+    MIN_RATE = 100
+    MAX_RATE = 1000
+
+    def __init__(self, appLogger: object, rate: int = 250,
+                 cmdFilter: CmdFilter = None,
+                 latency: LatencyTracker = None) -> None:
+        """
+        Constructor.
+
+        Params:
+            appLogger:      The application logger.
+            rate:           The polling rate in Hz, from MIN_RATE to
+                            MAX_RATE. Default: 250.
+            cmdFilter:      The unit command filter.
+                            Default: CmdFilter().
+            latency:        The latency tracker of the published
+                            commands. Default: None.
+        """
+        threading.Thread.__init__(self, name='INPUT_POLLER', daemon=True)
+        if not self.MIN_RATE <= rate <= self.MAX_RATE:
+            raise ValueError(f"polling rate {rate} Hz out of range "
+                             f"[{self.MIN_RATE}, {self.MAX_RATE}]")
+        self._logger = appLogger.getLogger('INPUT_POLLER')
+        self._logger.info(f"creating input poller at {rate} Hz")
+        self._period = 1 / rate
+        self._ctrlr = None
+        self._unit = None
+        self._deviceHandler = None
+        self._cmdFilter = cmdFilter or CmdFilter()
+        self._latency = latency
+        self._latest = None
+        self._overruns = 0
+        self._stopEvent = threading.Event()
+
+    def setController(self, ctrlr: object) -> None:
+        """
+        Set the controller to poll.
+
+        Params:
+            ctrlr:      The controller or None to stop polling.
+        """
+        self._logger.info(f"polling controller {ctrlr}")
+        self._latest = None
+        self._ctrlr = ctrlr
+
+    def setDeviceHandler(self, handler: object) -> None:
+        """
+        Set the handler of the device added and removed events.
+
+        Params:
+            handler:    The handler called with each device event from
+                        the polling thread or None to ignore them.
+        """
+        self._deviceHandler = handler
+
+    def setUnit(self, unit: object) -> None:
+        """
+        Set the unit receiving the commands.
+
+        Params:
+            unit:       The unit or None to stop commanding.
+        """
+        self._logger.info(f"commanding unit {unit}")
+        self._unit = None
+        self._cmdFilter.reset()
+        self._unit = unit
+
+    def getLatest(self) -> object:
+        """
+        Get the latest computed modifiers.
+
+        Return:
+            The latest modifiers snapshot or None if none was computed
+            yet.
+        """
+        return self._latest
+
+    def getOverruns(self) -> int:
+        """
+        Get the number of ticks skipped because a tick overran.
+
+        Return:
+            The number of skipped ticks.
+        """
+        return self._overruns
+
+    def _tick(self) -> None:
+        """
+        Poll the controller and publish its modifiers.
+        """
+        deviceHandler = self._deviceHandler
+        if deviceHandler is not None:
+            for ev in Controller.getDeviceEvents():
+                deviceHandler(ev)
+        ctrlr = self._ctrlr
+        if ctrlr is None:
+            return
+        dequeued = time.monotonic()
+        ctrlr.processEvents()
+        if ctrlr.isCalibrated():
+            self.publish(ctrlr.getModifiers(), dequeued)
+
+    def publish(self, modifiers: object, dequeued: float = None) -> None:
+        """
+        Publish a modifiers snapshot to the UI slot and, through the
+        command filter, to the unit.
+
+        Params:
+            modifiers:  The modifiers snapshot.
+            dequeued:   The monotonic time the events the modifiers are
+                        computed from were dequeued. The latency of the
+                        command is only tracked when given. Default: None.
+        """
+        self._latest = modifiers
+        unit = self._unit
+        if unit is None:
+            return
+        cmd = self._cmdFilter.update(modifiers)
+        if cmd is not None:
+            unit.updateSteeringCmd(cmd.steering)
+            unit.updateThrottleCmd(cmd.throttle, cmd.brake)
+            latency = self._latency
+            if latency is not None and dequeued is not None:
+                unit.sendCommandMsg(latency, dequeued, modifiers.timestamp)
+            else:
+                unit.sendCommandMsg()
+
+    def _waitNextTick(self, deadline: float) -> float:
+        """
+        Wait for the next tick deadline.
+
+        The deadlines stay on the grid set at start so the schedule does
+        not drift. Whole periods missed by an overrun are skipped rather
+        than replayed in a burst.
+
+        Params:
+            deadline:   The deadline of the tick that just ran.
+
+        Return:
+            The deadline of the next tick.
+        """
+        deadline += self._period
+        delay = deadline - time.monotonic()
+        if delay < 0:
+            missed = int(-delay / self._period)
+            self._overruns += missed
+            deadline += missed * self._period
+            delay = deadline - time.monotonic()
+        if delay > 0:
+            self._stopEvent.wait(delay)
+        return deadline
+
+    def run(self) -> None:
+        """
+        Run the polling loop until stopped.
+        """
+        self._logger.info('polling started')
+        deadline = time.monotonic()
+        while not self._stopEvent.is_set():
+            try:
+                self._tick()
+            except Exception:
+                self._logger.exception('polling tick failed')
+            deadline = self._waitNextTick(deadline)
+        self._logger.info('polling stopped')
+
+    def stop(self) -> None:
+        """
+        Stop the polling loop and wait for the thread to end.
+        """
+        self._stopEvent.set()
+        if self.is_alive():
+            self.join()
@@ -0,0 +1,2 @@
+from .inputRecorder import InputRecorder    # noqa: F401
+from .inputReplayer import InputReplayer    # noqa: F401
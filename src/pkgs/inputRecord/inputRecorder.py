@@ -0,0 +1,71 @@
+import threading
+import time
+
+from .recordFormat import CONFIG_NAME_SIZE, HEADER, MAGIC, VERSION, \
+    encodeEvent
+
+
+class InputRecorder:
+    """
+    Controller input recorder.
+    """
+    def __init__(self, path: str, configName: str,
+                 calibration: object = None) -> None:
+        """
+        Constructor.
+
+        Params:
+            path:           The recording file path.
+            configName:     The controller configuration name.
+            calibration:    The controller calibration. Default: None.
+        """
+        encodedName = configName.encode()
+        if len(encodedName) > CONFIG_NAME_SIZE:
+            raise ValueError(f"configuration name {configName} too long")
+        positions = (0.0,) * 6
+        if calibration is not None:
+            positions = calibration.positions
+        self._lock = threading.Lock()
+        self._recordCount = 0
+        self._file = open(path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, VERSION, calibration is not None,
+                                     *positions, encodedName))
+        self._start = time.monotonic()
+
+    def record(self, events: list, timestamp: float = None) -> None:
+        """
+        Record a batch of events.
+
+        Params:
+            events:     The joystick events.
+            timestamp:  The batch timestamp from the start of the session.
+                        Default: the time elapsed since the start.
+        """
+        if not events:
+            return
+        if timestamp is None:
+            timestamp = time.monotonic() - self._start
+        records = [record for record in
+                   (encodeEvent(timestamp, ev) for ev in events)
+                   if record is not None]
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(b''.join(records))
+            self._recordCount += len(records)
+
+    def getRecordCount(self) -> int:
+        """
+        Get the number of recorded events.
+
+        Return:
+            The number of recorded events.
+        """
+        return self._recordCount
+
+    def close(self) -> None:
+        """
+        Flush and close the recording.
+        """
+        with self._lock:
+            self._file.close()
@@ -0,0 +1,159 @@
+import mmap
+import threading
+import time
+
+from pkgs.controller import Calibration
+
+from .recordFormat import HEADER, MAGIC, RECORD, VERSION, decodeRecord
+
+
+class InputReplayer:
+    """
+    Controller input replayer.
+    """
+    def __init__(self, path: str) -> None:
+        """
+        Constructor.
+
+        Params:
+            path:       The recording file path.
+        """
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"empty recording {path}")
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise ValueError(f"truncated recording {path}")
+        magic, version, hasCalibration, *positions, configName = \
+            HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"unsupported recording {path}")
+        self._configName = configName.rstrip(b'\0').decode()
+        self._calibration = None
+        if hasCalibration:
+            self._calibration = Calibration(*positions)
+        # A partial record left by an interrupted session is ignored.
+        self._recordCount = (len(self._mmap) - HEADER.size) // RECORD.size
+        self._stopEvent = threading.Event()
+
+    def getConfigName(self) -> str:
+        """
+        Get the configuration name of the recorded controller.
+
+        Return:
+            The configuration name.
+        """
+        return self._configName
+
+    def getCalibration(self) -> Calibration:
+        """
+        Get the calibration of the recorded controller.
+
+        Return:
+            The calibration or None if the controller was not calibrated.
+        """
+        return self._calibration
+
+    def getRecordCount(self) -> int:
+        """
+        Get the number of recorded events.
+
+        Return:
+            The number of recorded events.
+        """
+        return self._recordCount
+
+    def getDuration(self) -> float:
+        """
+        Get the duration of the recording.
+
+        Return:
+            The timestamp of the last recorded event.
+        """
+        if self._recordCount == 0:
+            return 0.0
+        offset = HEADER.size + (self._recordCount - 1) * RECORD.size
+        return RECORD.unpack_from(self._mmap, offset)[0]
+
+    def iterBatches(self, instanceId: int) -> object:
+        """
+        Iterate over the recorded batches of events.
+
+        Params:
+            instanceId: The instance ID of the joystick the events are
+                        for.
+
+        Return:
+            An iterator of the batches timestamp and events.
+        """
+        end = HEADER.size + self._recordCount * RECORD.size
+        view = memoryview(self._mmap)[HEADER.size:end]
+        try:
+            batch = []
+            batchTimestamp = None
+            for timestamp, *fields in RECORD.iter_unpack(view):
+                if batch and timestamp != batchTimestamp:
+                    yield batchTimestamp, batch
+                    batch = []
+                batchTimestamp = timestamp
+                batch.append(decodeRecord(instanceId, *fields))
+            if batch:
+                yield batchTimestamp, batch
+        finally:
+            view.release()
+
+    def replay(self, ctrlr: object, publish: object = None,
+               speed: float = 1.0) -> int:
+        """
+        Replay the recording through a controller.
+
+        The modifiers are stamped with the recorded timestamps, so the
+        command filtering is the same whatever the replay speed is. The
+        recorded calibration is applied to a controller not calibrated,
+        so the recorded session replays without a calibration profile.
+
+        Params:
+            ctrlr:      The controller processing the events.
+            publish:    The callable publishing each modifiers snapshot,
+                        like InputPoller.publish. Default: None.
+            speed:      The replay speed factor or None to replay as
+                        fast as possible. Default: 1.0.
+
+        Return:
+            The number of replayed batches.
+        """
+        if self._calibration is not None and not ctrlr.isCalibrated():
+            ctrlr.applyCalibration(self._calibration)
+        self._stopEvent.clear()
+        start = time.monotonic()
+        batchCount = 0
+        for timestamp, events in self.iterBatches(ctrlr.getInstanceId()):
+            if speed:
+                delay = start + timestamp / speed - time.monotonic()
+                if delay > 0 and self._stopEvent.wait(delay):
+                    break
+            elif self._stopEvent.is_set():
+                break
+            ctrlr.processEvents(events)
+            if publish is not None and ctrlr.isCalibrated():
+                publish(ctrlr.getModifiers(timestamp))
+            batchCount += 1
+        return batchCount
+
+    def stop(self) -> None:
+        """
+        Stop an ongoing replay.
+        """
+        self._stopEvent.set()
+
+    def close(self) -> None:
+        """
+        Close the recording.
+        """
+        self._mmap.close()
+        self._file.close()
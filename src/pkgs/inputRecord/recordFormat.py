@@ -0,0 +1,71 @@
+import struct
+
+import pygame as pg
+
+MAGIC = b'RCIR'
+VERSION = 1
+CONFIG_NAME_SIZE = 32
+
+# magic, version, has calibration, 6 calibration positions, config name
+HEADER = struct.Struct(f"<4sHH6d{CONFIG_NAME_SIZE}s")
+# timestamp, kind, axis/button/hat index, hat x, hat y, axis value
+RECORD = struct.Struct('<dBBbb4xd')
+
+AXIS = 0
+BUTTON_DOWN = 1
+BUTTON_UP = 2
+HAT = 3
+
+
+def encodeEvent(timestamp: float, ev: object) -> bytes:
+    """
+    Encode a joystick event into a record.
+
+    Params:
+        timestamp:  The event timestamp from the start of the session.
+        ev:         The joystick event.
+
+    Return:
+        The record or None if the event is not an input event.
+    """
+    if ev.type == pg.JOYAXISMOTION:
+        return RECORD.pack(timestamp, AXIS, ev.axis, 0, 0, ev.value)
+    if ev.type == pg.JOYBUTTONDOWN:
+        return RECORD.pack(timestamp, BUTTON_DOWN, ev.button, 0, 0, 0.0)
+    if ev.type == pg.JOYBUTTONUP:
+        return RECORD.pack(timestamp, BUTTON_UP, ev.button, 0, 0, 0.0)
+    if ev.type == pg.JOYHATMOTION:
+        hatX, hatY = ev.value
+        return RECORD.pack(timestamp, HAT, ev.hat, hatX, hatY, 0.0)
+    return None
+
+
+def decodeRecord(instanceId: int, kind: int, index: int, hatX: int,
+                 hatY: int, value: float) -> object:
+    """
+    Decode the fields of a record into a joystick event.
+
+    Params:
+        instanceId: The instance ID of the joystick the event is for.
+        kind:       The record kind.
+        index:      The axis, button or hat index.
+        hatX:       The hat x position.
+        hatY:       The hat y position.
+        value:      The axis value.
+
+    Return:
+        The joystick event.
+    """
+    if kind == AXIS:
+        return pg.event.Event(pg.JOYAXISMOTION, instance_id=instanceId,
+                              axis=index, value=value)
+    if kind == BUTTON_DOWN:
+        return pg.event.Event(pg.JOYBUTTONDOWN, instance_id=instanceId,
+                              button=index)
+    if kind == BUTTON_UP:
+        return pg.event.Event(pg.JOYBUTTONUP, instance_id=instanceId,
+                              button=index)
+    if kind == HAT:
+        return pg.event.Event(pg.JOYHATMOTION, instance_id=instanceId,
+                              hat=index, value=(hatX, hatY))
+    raise ValueError(f"unknown record kind {kind}")
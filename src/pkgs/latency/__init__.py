@@ -0,0 +1 @@
+from .latencyTracker import LatencyHistogram, LatencyTracker  # noqa: F401
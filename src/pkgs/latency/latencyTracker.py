@@ -0,0 +1,187 @@
+import json
+import threading
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram, in microseconds.
+    """
+    SUB_BUCKET_BITS = 7
+    MAX_VALUE = 1 << 27
+
+    SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+    HALF_COUNT = SUB_BUCKET_COUNT >> 1
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._counts = [0] * (self._index(self.MAX_VALUE) + 1)
+        self.reset()
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        """
+        Get the bucket index of a value.
+
+        Params:
+            value:      The value in microseconds.
+
+        Return:
+            The bucket index.
+        """
+        if value < cls.SUB_BUCKET_COUNT:
+            return value
+        exponent = value.bit_length() - cls.SUB_BUCKET_BITS
+        return cls.SUB_BUCKET_COUNT + (exponent - 1) * cls.HALF_COUNT + \
+            (value >> exponent) - cls.HALF_COUNT
+
+    @classmethod
+    def _highestEquivalent(cls, index: int) -> int:
+        """
+        Get the highest value counted in a bucket.
+
+        Params:
+            index:      The bucket index.
+
+        Return:
+            The highest value of the bucket in microseconds.
+        """
+        if index < cls.SUB_BUCKET_COUNT:
+            return index
+        exponent, subIndex = divmod(index - cls.SUB_BUCKET_COUNT,
+                                    cls.HALF_COUNT)
+        exponent += 1
+        return ((subIndex + cls.HALF_COUNT + 1) << exponent) - 1
+
+    def reset(self) -> None:
+        """
+        Clear the histogram.
+        """
+        self._counts = [0] * len(self._counts)
+        self._count = 0
+        self._max = 0
+
+    def record(self, seconds: float) -> None:
+        """
+        Record a latency.
+
+        Params:
+            seconds:    The latency in seconds. It is clamped to the
+                        histogram range.
+        """
+        value = min(max(round(seconds * 1e6), 0), self.MAX_VALUE)
+        self._counts[self._index(value)] += 1
+        self._count += 1
+        if value > self._max:
+            self._max = value
+
+    def getCount(self) -> int:
+        """
+        Get the number of recorded latencies.
+
+        Return:
+            The number of recorded latencies.
+        """
+        return self._count
+
+    def getMax(self) -> int:
+        """
+        Get the maximum recorded latency.
+
+        Return:
+            The maximum latency in microseconds.
+        """
+        return self._max
+
+    def getPercentile(self, percentile: float) -> int:
+        """
+        Get a latency percentile.
+
+        Params:
+            percentile: The percentile from 0 to 100.
+
+        Return:
+            The latency in microseconds under which the percentile of
+            the recorded latencies are, 0 if none was recorded.
+        """
+        if self._count == 0:
+            return 0
+        target = max(1, -(-self._count * percentile // 100))
+        total = 0
+        for index, count in enumerate(self._counts):
+            total += count
+            if total >= target:
+                return min(self._highestEquivalent(index), self._max)
+        return self._max
+
+
+class LatencyTracker:
+    """
+    Input to publish latency tracker, one histogram per stage.
+    """
+    STAGES = ('modifiers', 'build', 'publish', 'total')
+    PERCENTILES = (('p50', 50), ('p99', 99))
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._lock = threading.Lock()
+        self._histograms = {stage: LatencyHistogram()
+                            for stage in self.STAGES}
+
+    def recordCommand(self, dequeued: float, computed: float, built: float,
+                      published: float) -> None:
+        """
+        Record the latencies of a published command.
+
+        Params:
+            dequeued:   The monotonic time the events were dequeued.
+            computed:   The monotonic time the modifiers were computed.
+            built:      The monotonic time the message was encoded.
+            published:  The monotonic time the MQTT client publish call
+                        returned.
+        """
+        histograms = self._histograms
+        with self._lock:
+            histograms['modifiers'].record(computed - dequeued)
+            histograms['build'].record(built - computed)
+            histograms['publish'].record(published - built)
+            histograms['total'].record(published - dequeued)
+
+    def getSummary(self) -> dict:
+        """
+        Get the latency summary of each stage.
+
+        Return:
+            The count, percentiles and maximum in microseconds of each
+            stage.
+        """
+        summary = {}
+        with self._lock:
+            for stage, histogram in self._histograms.items():
+                stageSummary = {'count': histogram.getCount()}
+                for name, percentile in self.PERCENTILES:
+                    stageSummary[name] = histogram.getPercentile(percentile)
+                stageSummary['max'] = histogram.getMax()
+                summary[stage] = stageSummary
+        return summary
+
+    def reset(self) -> None:
+        """
+        Clear the latencies of all the stages.
+        """
+        with self._lock:
+            for histogram in self._histograms.values():
+                histogram.reset()
+
+    def dump(self, path: str) -> None:
+        """
+        Dump the latency summary to a JSON file.
+
+        Params:
+            path:       The file path.
+        """
+        with open(path, 'w') as dumpFile:
+            json.dump(self.getSummary(), dumpFile, indent=4)
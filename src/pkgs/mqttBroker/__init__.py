@@ -0,0 +1,2 @@
+from .mqttBroker import MqttBroker          # noqa: F401
+from .topicTree import TopicTree            # noqa: F401
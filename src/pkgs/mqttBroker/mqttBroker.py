@@ -0,0 +1,441 @@
+import asyncio
+import itertools
+import threading
+
+from pkgs.mqttWire import CONNECT, DISCONNECT, PINGREQ, PUBACK, PUBLISH, \
+    SUBSCRIBE, UNSUBSCRIBE, connackPacket, parseConnect, parsePacketId, \
+    parsePublish, parseSubscribe, parseUnsubscribe, pingrespPacket, \
+    pubackPacket, publishPacket, readPacket, subackPacket, unsubackPacket
+
+from .topicTree import TopicTree
+
+
+class _Session:
+    """
+    Broker session of a connected client.
+    """
+    __slots__ = ('clientId', 'writer', 'filters', 'will', 'keepalive',
+                 'lastSeen', 'nextPacketId')
+
+    def __init__(self, clientId: str, writer: asyncio.StreamWriter,
+                 will: object, keepalive: int, now: float) -> None:
+        """
+        Constructor.
+
+        Params:
+            clientId:   The client ID.
+            writer:     The client stream writer.
+            will:       The will message or None.
+            keepalive:  The keep alive period in seconds, 0 to disable.
+            now:        The connection time of the event loop.
+        """
+        self.clientId = clientId
+        self.writer = writer
+        self.filters = set()
+        self.will = will
+        self.keepalive = keepalive
+        self.lastSeen = now
+        self.nextPacketId = 0
+
+    def getPacketId(self) -> int:
+        """
+        Get the next packet ID of the QoS 1 deliveries.
+
+        Return:
+            The packet ID, from 1 to 65535.
+        """
+        self.nextPacketId = self.nextPacketId % 0xffff + 1
+        return self.nextPacketId
+
+
+class MqttBroker(threading.Thread):
+    """
+    In-process MQTT 3.1.1 broker thread, up to QoS 1.
+    """
+    MAX_BUFFERED = 1 << 20
+    KEEPALIVE_CHECK_PERIOD = 1.0
+
+    CONNACK_BAD_CREDENTIALS = 4
+    CONNACK_NOT_AUTHORIZED = 5
+    SUBACK_FAILURE = 0x80
+
+    def __init__(self, appLogger: object, host: str = '127.0.0.1',
+                 port: int = 0, users: dict = None) -> None:
+        """
+        Constructor.
+
+        Params:
+            appLogger:  The application logger.
+            host:       The listening address. Default: 127.0.0.1.
+            port:       The listening port, 0 for any free port.
+                        Default: 0.
+            users:      The passwords by user name, None to allow the
+                        anonymous clients. Default: None.
+        """
+        threading.Thread.__init__(self, name='MQTT_BROKER', daemon=True)
+        self._logger = appLogger.getLogger('MQTT_BROKER')
+        self._host = host
+        self._port = port
+        self._users = users
+        self._loop = None
+        self._stopEvent = None
+        self._ready = threading.Event()
+        self._error = None
+        self._clients = {}
+        self._sessions = {}
+        self._topics = TopicTree()
+        self._retained = {}
+        self._clientIds = itertools.count(1)
+        self._receivedCount = 0
+        self._deliveredCount = 0
+        self._droppedCount = 0
+
+    def start(self) -> None:
+        """
+        Start the broker thread and wait until it listens.
+        """
+        threading.Thread.start(self)
+        self._ready.wait()
+        if self._error is not None:
+            self.join()
+            raise self._error
+
+    def getPort(self) -> int:
+        """
+        Get the listening port.
+
+        Return:
+            The listening port, the bound one when started on port 0.
+        """
+        return self._port
+
+    def getStats(self) -> dict:
+        """
+        Get the broker statistics.
+
+        Return:
+            The numbers of connected clients, received, delivered and
+            dropped messages and retained topics.
+        """
+        return {
+            'clients': len(self._sessions),
+            'received': self._receivedCount,
+            'delivered': self._deliveredCount,
+            'dropped': self._droppedCount,
+            'retained': len(self._retained),
+        }
+
+    def _authenticate(self, connect: object) -> int:
+        """
+        Authenticate a connection request.
+
+        Params:
+            connect:    The connection request.
+
+        Return:
+            The CONNACK return code, 0 when accepted.
+        """
+        if self._users is None:
+            return 0
+        if connect.username is None:
+            return self.CONNACK_NOT_AUTHORIZED
+        if self._users.get(connect.username) != connect.password or \
+                connect.password is None:
+            return self.CONNACK_BAD_CREDENTIALS
+        return 0
+
+    def _openSession(self, connect: object,
+                     writer: asyncio.StreamWriter) -> _Session:
+        """
+        Open the session of an accepted client, taking over the session
+        of the same client ID.
+
+        Params:
+            connect:    The connection request.
+            writer:     The client stream writer.
+
+        Return:
+            The session.
+        """
+        clientId = connect.clientId or f"auto-{next(self._clientIds)}"
+        previous = self._sessions.get(clientId)
+        if previous is not None:
+            self._logger.info(f"client {clientId} taken over")
+            self._closeSession(previous)
+        session = _Session(clientId, writer, connect.will,
+                           connect.keepalive, self._loop.time())
+        self._sessions[clientId] = session
+        return session
+
+    def _closeSession(self, session: _Session) -> None:
+        """
+        Close a session, publishing its will if it is still set.
+
+        Params:
+            session:    The session.
+        """
+        if self._sessions.get(session.clientId) is session:
+            del self._sessions[session.clientId]
+        for topicFilter in session.filters:
+            self._topics.unsubscribe(topicFilter, session)
+        session.filters.clear()
+        will, session.will = session.will, None
+        session.writer.close()
+        if will is not None:
+            self._publish(will)
+
+    def _deliver(self, session: _Session, packet: bytes) -> None:
+        """
+        Write a packet to a client unless it is closing.
+
+        Params:
+            session:    The client session.
+            packet:     The packet.
+        """
+        if not session.writer.transport.is_closing():
+            session.writer.write(packet)
+
+    def _publish(self, message: object) -> None:
+        """
+        Route a published message to the matching subscribers and
+        update the retained message of its topic.
+
+        Params:
+            message:    The message.
+        """
+        self._receivedCount += 1
+        if message.retain:
+            if message.payload:
+                self._retained[message.topic] = message
+            else:
+                self._retained.pop(message.topic, None)
+        packet = None
+        for session, qos in self._topics.match(message.topic).items():
+            transport = session.writer.transport
+            if transport.is_closing():
+                continue
+            if min(qos, message.qos):
+                sessionPacket = publishPacket(message.topic, message.payload,
+                                              1, session.getPacketId())
+            elif transport.get_write_buffer_size() > self.MAX_BUFFERED:
+                self._droppedCount += 1
+                continue
+            else:
+                if packet is None:
+                    packet = publishPacket(message.topic, message.payload)
+                sessionPacket = packet
+            self._deliveredCount += 1
+            session.writer.write(sessionPacket)
+
+    def _subscribe(self, session: _Session, packetId: int,
+                   topics: list) -> None:
+        """
+        Subscribe a client, then send it the matching retained messages.
+
+        Params:
+            session:    The client session.
+            packetId:   The SUBSCRIBE packet ID.
+            topics:     The (topic filter, requested QoS) pairs.
+        """
+        returnCodes = []
+        granted = []
+        for topicFilter, qos in topics:
+            if not TopicTree.isValidFilter(topicFilter):
+                returnCodes.append(self.SUBACK_FAILURE)
+                continue
+            qos = min(qos, 1)
+            self._topics.subscribe(topicFilter, session, qos)
+            session.filters.add(topicFilter)
+            returnCodes.append(qos)
+            granted.append((topicFilter, qos))
+        self._deliver(session, subackPacket(packetId, returnCodes))
+        for topicFilter, qos in granted:
+            for message in list(self._retained.values()):
+                if not TopicTree.matchFilter(topicFilter, message.topic):
+                    continue
+                deliverQos = min(qos, message.qos)
+                self._deliver(session, publishPacket(
+                    message.topic, message.payload, deliverQos,
+                    session.getPacketId() if deliverQos else None, True))
+
+    def _unsubscribe(self, session: _Session, packetId: int,
+                     topics: list) -> None:
+        """
+        Unsubscribe a client.
+
+        Params:
+            session:    The client session.
+            packetId:   The UNSUBSCRIBE packet ID.
+            topics:     The topic filters.
+        """
+        for topicFilter in topics:
+            if topicFilter in session.filters:
+                session.filters.discard(topicFilter)
+                self._topics.unsubscribe(topicFilter, session)
+        self._deliver(session, unsubackPacket(packetId))
+
+    async def _connect(self, reader: asyncio.StreamReader,
+                       writer: asyncio.StreamWriter) -> _Session:
+        """
+        Read the connection request of a client and open its session.
+
+        Params:
+            reader:     The client stream reader.
+            writer:     The client stream writer.
+
+        Return:
+            The session or None if the client was refused.
+        """
+        packetType, _, body = await readPacket(reader)
+        if packetType != CONNECT:
+            raise ValueError(f"unexpected packet type {packetType}")
+        connect = parseConnect(body)
+        if connect.will is not None and \
+                not TopicTree.isValidTopic(connect.will.topic):
+            raise ValueError(f"invalid will topic {connect.will.topic}")
+        returnCode = self._authenticate(connect)
+        writer.write(connackPacket(returnCode))
+        if returnCode:
+            self._logger.warning(f"client {connect.clientId} refused: "
+                                 f"{returnCode}")
+            return None
+        return self._openSession(connect, writer)
+
+    def _handlePublish(self, session: _Session, flags: int,
+                       body: bytes) -> None:
+        """
+        Handle a PUBLISH packet, acknowledging it if its QoS is 1.
+
+        Params:
+            session:    The client session.
+            flags:      The packet flags.
+            body:       The packet body.
+        """
+        message = parsePublish(flags, body)
+        if message.qos > 1:
+            raise ValueError(f"unsupported QoS {message.qos}")
+        if not TopicTree.isValidTopic(message.topic):
+            raise ValueError(f"invalid topic {message.topic}")
+        if message.qos:
+            session.writer.write(pubackPacket(message.packetId))
+        self._publish(message)
+
+    def _handlePacket(self, session: _Session, packetType: int, flags: int,
+                      body: bytes) -> bool:
+        """
+        Handle a packet of a connected client.
+
+        Params:
+            session:    The client session.
+            packetType: The packet type.
+            flags:      The packet flags.
+            body:       The packet body.
+
+        Return:
+            False if the client disconnected, True otherwise.
+        """
+        if packetType == PUBLISH:
+            self._handlePublish(session, flags, body)
+        elif packetType == PUBACK:
+            parsePacketId(body)
+        elif packetType == SUBSCRIBE:
+            self._subscribe(session, *parseSubscribe(body))
+        elif packetType == UNSUBSCRIBE:
+            self._unsubscribe(session, *parseUnsubscribe(body))
+        elif packetType == PINGREQ:
+            session.writer.write(pingrespPacket())
+        elif packetType == DISCONNECT:
+            session.will = None
+            return False
+        else:
+            raise ValueError(f"unexpected packet type {packetType}")
+        return True
+
+    async def _handleClient(self, reader: asyncio.StreamReader,
+                            writer: asyncio.StreamWriter) -> None:
+        """
+        Serve a client connection.
+
+        A protocol error, like a wildcard in a published topic, closes
+        the client.
+
+        Params:
+            reader:     The client stream reader.
+            writer:     The client stream writer.
+        """
+        session = None
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        try:
+            session = await self._connect(reader, writer)
+            while session is not None:
+                packetType, flags, body = await readPacket(reader)
+                session.lastSeen = self._loop.time()
+                if not self._handlePacket(session, packetType, flags, body):
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except ValueError as err:
+            self._logger.warning(f"closing client: {err}")
+        finally:
+            del self._clients[task]
+            if session is not None:
+                self._closeSession(session)
+            else:
+                writer.close()
+
+    async def _checkKeepalive(self) -> None:
+        """
+        Close the sessions silent for 1.5 keep alive periods.
+        """
+        while True:
+            await asyncio.sleep(self.KEEPALIVE_CHECK_PERIOD)
+            now = self._loop.time()
+            for session in list(self._sessions.values()):
+                if session.keepalive and \
+                        now - session.lastSeen > 1.5 * session.keepalive:
+                    self._logger.info(f"client {session.clientId} timed out")
+                    self._closeSession(session)
+
+    async def _serve(self) -> None:
+        """
+        Serve the clients until stopped.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stopEvent = asyncio.Event()
+        try:
+            server = await asyncio.start_server(self._handleClient,
+                                                self._host, self._port)
+        except OSError as err:
+            self._error = err
+            self._ready.set()
+            return
+        self._port = server.sockets[0].getsockname()[1]
+        self._logger.info(f"listening on {self._host}:{self._port}")
+        self._ready.set()
+        keepaliveTask = asyncio.ensure_future(self._checkKeepalive())
+        await self._stopEvent.wait()
+        keepaliveTask.cancel()
+        server.close()
+        for session in list(self._sessions.values()):
+            session.will = None
+            self._closeSession(session)
+        for writer in self._clients.values():
+            writer.close()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        await server.wait_closed()
+
+    def run(self) -> None:
+        """
+        Run the broker event loop.
+        """
+        asyncio.run(self._serve())
+
+    def stop(self) -> None:
+        """
+        Stop the broker and wait for the thread to end.
+        """
+        if self._loop is not None and self._stopEvent is not None:
+            self._loop.call_soon_threadsafe(self._stopEvent.set)
+        if self.is_alive():
+            self.join()
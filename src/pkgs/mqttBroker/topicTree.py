@@ -0,0 +1,193 @@
+class _Node:
+    """
+    Topic tree node of a topic level.
+    """
+    __slots__ = ('children', 'subscribers')
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self.children = {}
+        self.subscribers = {}
+
+
+class TopicTree:
+    """
+    MQTT subscription tree.
+    """
+    CACHE_SIZE = 4096
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._root = _Node()
+        self._cache = {}
+
+    @staticmethod
+    def isValidFilter(topicFilter: str) -> bool:
+        """
+        Check a topic filter.
+
+        Params:
+            topicFilter:    The topic filter.
+
+        Return:
+            True if the wildcards are whole levels and # is the last
+            level, False otherwise.
+        """
+        if not topicFilter:
+            return False
+        levels = topicFilter.split('/')
+        for idx, level in enumerate(levels):
+            if '#' in level and (level != '#' or idx != len(levels) - 1):
+                return False
+            if '+' in level and level != '+':
+                return False
+        return True
+
+    @staticmethod
+    def isValidTopic(topic: str) -> bool:
+        """
+        Check a topic name, the topic of a published message.
+
+        Params:
+            topic:      The topic name.
+
+        Return:
+            True if the topic is not empty and has no wildcard, False
+            otherwise.
+        """
+        return bool(topic) and '+' not in topic and '#' not in topic
+
+    @staticmethod
+    def matchFilter(topicFilter: str, topic: str) -> bool:
+        """
+        Match a topic against a single topic filter.
+
+        Params:
+            topicFilter:    The topic filter.
+            topic:          The topic.
+
+        Return:
+            True if the filter matches the topic, False otherwise.
+        """
+        if topic.startswith('$') and topicFilter[:1] in ('+', '#'):
+            return False
+        filterLevels = topicFilter.split('/')
+        topicLevels = topic.split('/')
+        for idx, level in enumerate(filterLevels):
+            if level == '#':
+                return True
+            if idx == len(topicLevels) or \
+                    level not in ('+', topicLevels[idx]):
+                return False
+        return len(filterLevels) == len(topicLevels)
+
+    def subscribe(self, topicFilter: str, subscriber: object,
+                  qos: int) -> None:
+        """
+        Add a subscription or change its QoS.
+
+        Params:
+            topicFilter:    The valid topic filter.
+            subscriber:     The subscriber.
+            qos:            The granted QoS.
+        """
+        node = self._root
+        for level in topicFilter.split('/'):
+            node = node.children.setdefault(level, _Node())
+        node.subscribers[subscriber] = qos
+        self._cache.clear()
+
+    def unsubscribe(self, topicFilter: str, subscriber: object) -> bool:
+        """
+        Remove a subscription, pruning the emptied levels.
+
+        Params:
+            topicFilter:    The topic filter.
+            subscriber:     The subscriber.
+
+        Return:
+            True if the subscription existed, False otherwise.
+        """
+        path = [self._root]
+        levels = topicFilter.split('/')
+        for level in levels:
+            node = path[-1].children.get(level)
+            if node is None:
+                return False
+            path.append(node)
+        if path[-1].subscribers.pop(subscriber, None) is None:
+            return False
+        for level, parent, node in zip(reversed(levels), reversed(path[:-1]),
+                                       reversed(path[1:])):
+            if node.children or node.subscribers:
+                break
+            del parent.children[level]
+        self._cache.clear()
+        return True
+
+    def match(self, topic: str) -> dict:
+        """
+        Match a topic against the subscriptions.
+
+        Params:
+            topic:      The topic.
+
+        Return:
+            The highest QoS of each matching subscriber. It is shared and
+            must not be modified.
+        """
+        matches = self._cache.get(topic)
+        if matches is not None:
+            return matches
+        matches = {}
+        levels = topic.split('/')
+        self._collect(self._root, levels, 0, matches, topic.startswith('$'))
+        if len(self._cache) >= self.CACHE_SIZE:
+            self._cache.clear()
+        self._cache[topic] = matches
+        return matches
+
+    def _collect(self, node: _Node, levels: list, depth: int, matches: dict,
+                 isSystem: bool) -> None:
+        """
+        Collect the subscribers of the filters matching the topic levels
+        from a node.
+
+        Params:
+            node:       The node of the matched levels.
+            levels:     The topic levels.
+            depth:      The number of matched levels.
+            matches:    The subscriber QoS being collected.
+            isSystem:   True if the topic starts with $, which the first
+                        level wildcards do not match.
+        """
+        wildcards = not (isSystem and depth == 0)
+        multi = node.children.get('#') if wildcards else None
+        if multi is not None:
+            self._addSubscribers(multi, matches)
+        if depth == len(levels):
+            self._addSubscribers(node, matches)
+            return
+        child = node.children.get(levels[depth])
+        if child is not None:
+            self._collect(child, levels, depth + 1, matches, isSystem)
+        single = node.children.get('+') if wildcards else None
+        if single is not None:
+            self._collect(single, levels, depth + 1, matches, isSystem)
+
+    @staticmethod
+    def _addSubscribers(node: _Node, matches: dict) -> None:
+        """
+        Add the subscribers of a node to the matches.
+
+        Params:
+            node:       The node.
+            matches:    The subscriber QoS being collected.
+        """
+        for subscriber, qos in node.subscribers.items():
+            if matches.get(subscriber, -1) < qos:
+                matches[subscriber] = qos
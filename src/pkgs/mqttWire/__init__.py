@@ -0,0 +1,7 @@
+from .mqttWire import CONNACK, CONNECT, DISCONNECT, PINGREQ, PINGRESP, \
+    PUBACK, PUBLISH, SUBACK, SUBSCRIBE, UNSUBACK, UNSUBSCRIBE, ConnectMsg, \
+    PublishMsg, connackPacket, connectPacket, disconnectPacket, \
+    parseConnack, parseConnect, parsePacketId, parsePublish, \
+    parseSubscribe, parseUnsubscribe, pingreqPacket, pingrespPacket, \
+    pubackPacket, publishPacket, readPacket, subackPacket, \
+    subscribePacket, unsubackPacket      # noqa: F401
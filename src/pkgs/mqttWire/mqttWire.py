@@ -0,0 +1,415 @@
+import asyncio
+from collections import namedtuple
+import struct
+
+CONNECT = 1
+CONNACK = 2
+PUBLISH = 3
+PUBACK = 4
+SUBSCRIBE = 8
+SUBACK = 9
+UNSUBSCRIBE = 10
+UNSUBACK = 11
+PINGREQ = 12
+PINGRESP = 13
+DISCONNECT = 14
+
+PROTOCOL_NAME = b'MQTT'
+PROTOCOL_LEVEL = 4
+# the MQTT 3.1 protocol name, still sent by some clients
+PROTOCOL_NAME_V31 = b'MQIsdp'
+MAX_REMAINING_LENGTH = 268435455
+
+_UINT16 = struct.Struct('>H')
+
+ConnectMsg = namedtuple('ConnectMsg', ('clientId', 'username', 'password',
+                                       'keepalive', 'cleanSession', 'will'))
+PublishMsg = namedtuple('PublishMsg', ('topic', 'payload', 'qos', 'retain',
+                                       'packetId'))
+
+# The MQTT 3.1.1 subset up to QoS 1: the packets are built and parsed as
+# bytes, the transport being left to the asyncio streams.
+
+
+def _encodeLength(length: int) -> bytes:
+    """
+    Encode a remaining length.
+
+    Params:
+        length:     The remaining length.
+
+    Return:
+        The variable length encoding.
+    """
+    if length > MAX_REMAINING_LENGTH:
+        raise ValueError(f"packet too long {length}")
+    encoded = bytearray()
+    while True:
+        digit = length & 0x7f
+        length >>= 7
+        encoded.append(digit | 0x80 if length else digit)
+        if not length:
+            return bytes(encoded)
+
+
+def _encodeString(value: object) -> bytes:
+    """
+    Encode a length-prefixed string.
+
+    Params:
+        value:      The string or bytes.
+
+    Return:
+        The encoded string.
+    """
+    if isinstance(value, str):
+        value = value.encode()
+    return _UINT16.pack(len(value)) + value
+
+
+def _decodeString(body: bytes, offset: int) -> tuple:
+    """
+    Decode a length-prefixed string.
+
+    Params:
+        body:       The packet body.
+        offset:     The string offset.
+
+    Return:
+        The string bytes and the offset after it.
+    """
+    size, = _UINT16.unpack_from(body, offset)
+    end = offset + 2 + size
+    if end > len(body):
+        raise ValueError('truncated string')
+    return bytes(body[offset + 2:end]), end
+
+
+def _packet(packetType: int, flags: int, body: bytes) -> bytes:
+    """
+    Build a packet.
+
+    Params:
+        packetType: The packet type.
+        flags:      The fixed header flags.
+        body:       The variable header and payload.
+
+    Return:
+        The packet.
+    """
+    return bytes((packetType << 4 | flags,)) + _encodeLength(len(body)) + \
+        body
+
+
+def connectPacket(clientId: str, username: str = None,
+                  password: str = None, keepalive: int = 60) -> bytes:
+    """
+    Build a CONNECT packet with a clean session.
+
+    Params:
+        clientId:   The client ID.
+        username:   The user name. Default: None.
+        password:   The password, only sent with a user name.
+                    Default: None.
+        keepalive:  The keep alive period in seconds. Default: 60.
+
+    Return:
+        The packet.
+    """
+    flags = 0x02
+    payload = _encodeString(clientId)
+    if username is not None:
+        flags |= 0x80
+        payload += _encodeString(username)
+        if password is not None:
+            flags |= 0x40
+            payload += _encodeString(password)
+    body = _encodeString(PROTOCOL_NAME) + \
+        bytes((PROTOCOL_LEVEL, flags)) + _UINT16.pack(keepalive) + payload
+    return _packet(CONNECT, 0, body)
+
+
+def parseConnect(body: bytes) -> ConnectMsg:
+    """
+    Parse a CONNECT packet body.
+
+    Params:
+        body:       The packet body.
+
+    Return:
+        The connection request, the will being a PublishMsg or None.
+    """
+    try:
+        name, offset = _decodeString(body, 0)
+        if name not in (PROTOCOL_NAME, PROTOCOL_NAME_V31):
+            raise ValueError(f"unsupported protocol {name}")
+        flags = body[offset + 1]
+        keepalive, = _UINT16.unpack_from(body, offset + 2)
+        offset += 4
+        clientId, offset = _decodeString(body, offset)
+        will = username = password = None
+        if flags & 0x04:
+            willTopic, offset = _decodeString(body, offset)
+            willPayload, offset = _decodeString(body, offset)
+            will = PublishMsg(willTopic.decode(), willPayload,
+                              flags >> 3 & 0x03, bool(flags & 0x20), None)
+        if flags & 0x80:
+            username, offset = _decodeString(body, offset)
+            username = username.decode()
+        if flags & 0x40:
+            password, offset = _decodeString(body, offset)
+            password = password.decode()
+    except (IndexError, struct.error, UnicodeDecodeError) as err:
+        raise ValueError(f"invalid CONNECT packet: {err}") from err
+    return ConnectMsg(clientId.decode(), username, password, keepalive,
+                      bool(flags & 0x02), will)
+
+
+def connackPacket(returnCode: int = 0) -> bytes:
+    """
+    Build a CONNACK packet.
+
+    Params:
+        returnCode: The connection return code, 0 when accepted.
+                    Default: 0.
+
+    Return:
+        The packet.
+    """
+    return _packet(CONNACK, 0, bytes((0, returnCode)))
+
+
+def parseConnack(body: bytes) -> int:
+    """
+    Parse a CONNACK packet body.
+
+    Params:
+        body:       The packet body.
+
+    Return:
+        The connection return code.
+    """
+    if len(body) != 2:
+        raise ValueError('invalid CONNACK packet')
+    return body[1]
+
+
+def publishPacket(topic: str, payload: bytes, qos: int = 0,
+                  packetId: int = None, retain: bool = False) -> bytes:
+    """
+    Build a PUBLISH packet.
+
+    Params:
+        topic:      The topic.
+        payload:    The payload.
+        qos:        The QoS, 0 or 1. Default: 0.
+        packetId:   The packet ID, required from QoS 1. Default: None.
+        retain:     The retain flag. Default: False.
+
+    Return:
+        The packet.
+    """
+    body = _encodeString(topic)
+    if qos:
+        body += _UINT16.pack(packetId)
+    return _packet(PUBLISH, qos << 1 | retain, body + payload)
+
+
+def parsePublish(flags: int, body: bytes) -> PublishMsg:
+    """
+    Parse a PUBLISH packet body.
+
+    Params:
+        flags:      The fixed header flags.
+        body:       The packet body.
+
+    Return:
+        The published message, the packet ID being None at QoS 0.
+    """
+    qos = flags >> 1 & 0x03
+    packetId = None
+    try:
+        topic, offset = _decodeString(body, 0)
+        topic = topic.decode()
+        if qos:
+            packetId, = _UINT16.unpack_from(body, offset)
+            offset += 2
+    except (struct.error, UnicodeDecodeError) as err:
+        raise ValueError(f"invalid PUBLISH packet: {err}") from err
+    return PublishMsg(topic, bytes(body[offset:]), qos, bool(flags & 0x01),
+                      packetId)
+
+
+def pubackPacket(packetId: int) -> bytes:
+    """
+    Build a PUBACK packet.
+
+    Params:
+        packetId:   The PUBLISH packet ID.
+
+    Return:
+        The packet.
+    """
+    return _packet(PUBACK, 0, _UINT16.pack(packetId))
+
+
+def parsePacketId(body: bytes) -> int:
+    """
+    Parse the packet ID of an acknowledgement packet body.
+
+    Params:
+        body:       The packet body.
+
+    Return:
+        The packet ID.
+    """
+    if len(body) < 2:
+        raise ValueError('missing packet ID')
+    return _UINT16.unpack_from(body)[0]
+
+
+def subscribePacket(packetId: int, topics: list, qos: int = 0) -> bytes:
+    """
+    Build a SUBSCRIBE packet.
+
+    Params:
+        packetId:   The packet ID.
+        topics:     The topic filters.
+        qos:        The requested QoS. Default: 0.
+
+    Return:
+        The packet.
+    """
+    body = _UINT16.pack(packetId) + b''.join(
+        _encodeString(topic) + bytes((qos,)) for topic in topics)
+    return _packet(SUBSCRIBE, 0x02, body)
+
+
+def parseSubscribe(body: bytes) -> tuple:
+    """
+    Parse a SUBSCRIBE packet body.
+
+    Params:
+        body:       The packet body.
+
+    Return:
+        The packet ID and the (topic filter, requested QoS) pairs.
+    """
+    try:
+        packetId, = _UINT16.unpack_from(body, 0)
+        offset = 2
+        topics = []
+        while offset < len(body):
+            topic, offset = _decodeString(body, offset)
+            topics.append((topic.decode(), body[offset] & 0x03))
+            offset += 1
+    except (IndexError, struct.error, UnicodeDecodeError) as err:
+        raise ValueError(f"invalid SUBSCRIBE packet: {err}") from err
+    if not topics:
+        raise ValueError('invalid SUBSCRIBE packet')
+    return packetId, topics
+
+
+def subackPacket(packetId: int, returnCodes: list) -> bytes:
+    """
+    Build a SUBACK packet.
+
+    Params:
+        packetId:       The SUBSCRIBE packet ID.
+        returnCodes:    The granted QoS, or 0x80 on failure, of each
+                        topic filter.
+
+    Return:
+        The packet.
+    """
+    return _packet(SUBACK, 0, _UINT16.pack(packetId) + bytes(returnCodes))
+
+
+def parseUnsubscribe(body: bytes) -> tuple:
+    """
+    Parse an UNSUBSCRIBE packet body.
+
+    Params:
+        body:       The packet body.
+
+    Return:
+        The packet ID and the topic filters.
+    """
+    try:
+        packetId, = _UINT16.unpack_from(body, 0)
+        offset = 2
+        topics = []
+        while offset < len(body):
+            topic, offset = _decodeString(body, offset)
+            topics.append(topic.decode())
+    except (struct.error, UnicodeDecodeError) as err:
+        raise ValueError(f"invalid UNSUBSCRIBE packet: {err}") from err
+    if not topics:
+        raise ValueError('invalid UNSUBSCRIBE packet')
+    return packetId, topics
+
+
+def unsubackPacket(packetId: int) -> bytes:
+    """
+    Build an UNSUBACK packet.
+
+    Params:
+        packetId:   The UNSUBSCRIBE packet ID.
+
+    Return:
+        The packet.
+    """
+    return _packet(UNSUBACK, 0, _UINT16.pack(packetId))
+
+
+def pingreqPacket() -> bytes:
+    """
+    Build a PINGREQ packet.
+
+    Return:
+        The packet.
+    """
+    return _packet(PINGREQ, 0, b'')
+
+
+def pingrespPacket() -> bytes:
+    """
+    Build a PINGRESP packet.
+
+    Return:
+        The packet.
+    """
+    return _packet(PINGRESP, 0, b'')
+
+
+def disconnectPacket() -> bytes:
+    """
+    Build a DISCONNECT packet.
+
+    Return:
+        The packet.
+    """
+    return _packet(DISCONNECT, 0, b'')
+
+
+async def readPacket(reader: asyncio.StreamReader) -> tuple:
+    """
+    Read a packet.
+
+    Params:
+        reader:     The stream reader.
+
+    Return:
+        The packet type, the fixed header flags and the packet body.
+    """
+    header = (await reader.readexactly(1))[0]
+    length = 0
+    for shift in range(0, 28, 7):
+        digit = (await reader.readexactly(1))[0]
+        length |= (digit & 0x7f) << shift
+        if not digit & 0x80:
+            break
+    else:
+        raise ValueError('invalid remaining length')
+    body = await reader.readexactly(length) if length else b''
+    return header >> 4, header & 0x0f, body
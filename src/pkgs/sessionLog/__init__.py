@@ -0,0 +1,2 @@
+from .sessionReader import SessionReader        # noqa: F401
+from .sessionRecorder import SessionRecorder    # noqa: F401
@@ -0,0 +1,86 @@
+import json
+import os
+import tempfile
+
+MANIFEST = 'session.json'
+INDEX = 'index.bin'
+VERSION = 1
+
+COMMANDS = 'commands'
+TELEMETRY = 'telemetry'
+
+# index entry: time of the first row of a block, row
+INDEX_DTYPE = [('time', '<f8'), ('row', '<u8')]
+INDEX_STRIDE = 1024
+
+
+def makeColumns(telemetryChannels: tuple) -> dict:
+    """
+    Make the column layout of each stream.
+
+    Params:
+        telemetryChannels:  The telemetry channel names.
+
+    Return:
+        The (name, dtype) columns of each stream, the time from the start
+        of the session first.
+    """
+    return {
+        COMMANDS: [('time', '<f8'), ('unit', '<u2'), ('steering', '<f4'),
+                   ('throttle', '<f4')],
+        TELEMETRY: [('time', '<f8'), ('unit', '<u2'), ('unitTime', '<f8')] +
+        [(channel, '<f4') for channel in telemetryChannels],
+    }
+
+
+def getColumnPath(directory: str, stream: str, column: str) -> str:
+    """
+    Get the path of a column file.
+
+    Params:
+        directory:  The session directory.
+        stream:     The stream name.
+        column:     The column name.
+
+    Return:
+        The column file path.
+    """
+    return os.path.join(directory, stream, f"{column}.bin")
+
+
+def writeManifest(directory: str, manifest: dict) -> None:
+    """
+    Write the session manifest atomically.
+
+    Params:
+        directory:  The session directory.
+        manifest:   The manifest.
+    """
+    fd, tmpPath = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as tmpFile:
+            json.dump(manifest, tmpFile, indent=1)
+        os.replace(tmpPath, os.path.join(directory, MANIFEST))
+    except BaseException:
+        os.unlink(tmpPath)
+        raise
+
+
+def readManifest(directory: str) -> dict:
+    """
+    Read the session manifest.
+
+    Params:
+        directory:  The session directory.
+
+    Return:
+        The manifest.
+    """
+    try:
+        with open(os.path.join(directory, MANIFEST)) as manifestFile:
+            manifest = json.load(manifestFile)
+    except (OSError, ValueError) as err:
+        raise ValueError(f"invalid session {directory}: {err}") from err
+    if manifest.get('version') != VERSION:
+        raise ValueError(f"unsupported session {directory}")
+    return manifest
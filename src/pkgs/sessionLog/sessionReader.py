@@ -0,0 +1,154 @@
+import os
+
+import numpy as np
+
+from .sessionFormat import INDEX, INDEX_DTYPE, INDEX_STRIDE, \
+    getColumnPath, readManifest
+
+
+class SessionReader:
+    """
+    Session log reader.
+    """
+    def __init__(self, directory: str) -> None:
+        """
+        Constructor.
+
+        Params:
+            directory:  The session directory.
+        """
+        manifest = readManifest(directory)
+        self._units = manifest['units']
+        self._columns = {}
+        self._indexes = {}
+        for stream, columns in manifest['streams'].items():
+            rowCount = manifest['rowCounts'][stream]
+            self._columns[stream] = {
+                name: self._mapColumn(getColumnPath(directory, stream, name),
+                                      np.dtype(dtype), rowCount)
+                for name, dtype in columns}
+            indexPath = os.path.join(directory, stream, INDEX)
+            index = np.fromfile(indexPath, dtype=INDEX_DTYPE)
+            self._indexes[stream] = \
+                index[:-(-rowCount // INDEX_STRIDE)]['time']
+
+    @staticmethod
+    def _mapColumn(path: str, dtype: np.dtype, rowCount: int) -> np.ndarray:
+        """
+        Map a column file.
+
+        Params:
+            path:       The column file path.
+            dtype:      The column data type.
+            rowCount:   The number of rows.
+
+        Return:
+            The mapped column.
+        """
+        if os.path.getsize(path) < rowCount * dtype.itemsize:
+            raise ValueError(f"truncated session column {path}")
+        if rowCount == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode='r', shape=(rowCount,))
+
+    def getStreams(self) -> list:
+        """
+        Get the stream names.
+
+        Return:
+            The stream names.
+        """
+        return list(self._columns)
+
+    def getColumnNames(self, stream: str) -> list:
+        """
+        Get the column names of a stream.
+
+        Params:
+            stream:     The stream name.
+
+        Return:
+            The column names.
+        """
+        return list(self._getStream(stream))
+
+    def getUnitIds(self) -> list:
+        """
+        Get the unit IDs, indexed by the unit column codes.
+
+        Return:
+            The unit IDs.
+        """
+        return list(self._units)
+
+    def getRowCount(self, stream: str) -> int:
+        """
+        Get the number of rows of a stream.
+
+        Params:
+            stream:     The stream name.
+
+        Return:
+            The number of rows.
+        """
+        return len(self._getStream(stream)['time'])
+
+    def _getStream(self, stream: str) -> dict:
+        """
+        Get the columns of a stream.
+
+        Params:
+            stream:     The stream name.
+
+        Return:
+            The mapped columns by name.
+        """
+        columns = self._columns.get(stream)
+        if columns is None:
+            raise ValueError(f"unknown session stream {stream}")
+        return columns
+
+    def _findRow(self, stream: str, timestamp: float) -> int:
+        """
+        Find the first row at or after a time.
+
+        Params:
+            stream:     The stream name.
+            timestamp:  The time from the start of the session.
+
+        Return:
+            The row.
+        """
+        times = self._getStream(stream)['time']
+        block = int(np.searchsorted(self._indexes[stream], timestamp,
+                                    side='left'))
+        start = max(block - 1, 0) * INDEX_STRIDE
+        end = min(block * INDEX_STRIDE + 1, len(times))
+        return start + int(np.searchsorted(times[start:end], timestamp,
+                                           side='left'))
+
+    def getRange(self, stream: str, start: float, end: float) -> dict:
+        """
+        Get the rows of a stream in a time range.
+
+        Params:
+            stream:     The stream name.
+            start:      The range start from the start of the session,
+                        included.
+            end:        The range end from the start of the session,
+                        excluded.
+
+        Return:
+            The views of the range in each column by name.
+        """
+        first = self._findRow(stream, start)
+        last = max(self._findRow(stream, end), first)
+        return {name: column[first:last]
+                for name, column in self._getStream(stream).items()}
+
+    def close(self) -> None:
+        """
+        Release the mapped columns.
+        """
+        self._columns = {}
+        self._indexes = {}
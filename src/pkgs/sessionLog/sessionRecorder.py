@@ -0,0 +1,250 @@
+import collections
+import os
+import threading
+import time
+
+import numpy as np
+
+from .sessionFormat import COMMANDS, INDEX, INDEX_DTYPE, INDEX_STRIDE, \
+    TELEMETRY, VERSION, getColumnPath, makeColumns, writeManifest
+
+
+class SessionRecorder(threading.Thread):
+    """
+    Session recorder thread, logging the sent commands and the
+    received telemetry in columns.
+    """
+    def __init__(self, appLogger: object, directory: str,
+                 telemetryChannels: tuple = ('speed', 'battery', 'rssi'),
+                 flushPeriod: float = 0.25,
+                 maxQueued: int = 65536) -> None:
+        """
+        Constructor.
+
+        Params:
+            appLogger:          The application logger.
+            directory:          The session directory, created if needed.
+            telemetryChannels:  The telemetry channel names.
+                                Default: speed, battery and rssi.
+            flushPeriod:        The write period in seconds. Default: 0.25.
+            maxQueued:          The maximum number of records waiting to
+                                be written. Default: 65536.
+        """
+        threading.Thread.__init__(self, name='SESSION_REC', daemon=True)
+        self._logger = appLogger.getLogger('SESSION_REC')
+        self._logger.info(f"recording session in {directory}")
+        self._directory = directory
+        self._flushPeriod = flushPeriod
+        self._columns = makeColumns(tuple(telemetryChannels))
+        self._queue = collections.deque(maxlen=maxQueued)
+        self._dropped = 0
+        self._failed = False
+        self._units = {}
+        self._files = {}
+        self._indexFiles = {}
+        self._rowCounts = {}
+        self._lastTimes = {}
+        for stream, columns in self._columns.items():
+            os.makedirs(os.path.join(directory, stream), exist_ok=True)
+            self._files[stream] = [
+                open(getColumnPath(directory, stream, name), 'wb')
+                for name, _ in columns]
+            self._indexFiles[stream] = open(
+                os.path.join(directory, stream, INDEX), 'wb')
+            self._rowCounts[stream] = 0
+            self._lastTimes[stream] = 0.0
+        self._start = time.monotonic()
+        self._stopEvent = threading.Event()
+        self._writeLock = threading.Lock()
+        self._writeManifest()
+
+    def _writeManifest(self) -> None:
+        """
+        Write the session manifest with the current row counts and units.
+        """
+        writeManifest(self._directory, {
+            'version': VERSION,
+            'streams': self._columns,
+            'units': list(self._units),
+            'rowCounts': self._rowCounts,
+        })
+
+    def _enqueue(self, record: tuple) -> None:
+        """
+        Queue a record, dropping the oldest one when the queue is full.
+
+        Params:
+            record:     The stream, time, unit ID and fields of the record.
+        """
+        if self._failed:
+            return
+        queue = self._queue
+        if len(queue) == queue.maxlen:
+            self._dropped += 1
+        queue.append(record)
+
+    def recordCommand(self, unitId: str, steering: float, throttle: float,
+                      timestamp: float = None) -> None:
+        """
+        Record a sent command.
+
+        Params:
+            unitId:     The unit ID.
+            steering:   The steering.
+            throttle:   The throttle.
+            timestamp:  The monotonic send time.
+                        Default: the monotonic clock.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        self._enqueue((COMMANDS, timestamp - self._start, unitId,
+                       (steering, throttle)))
+
+    def recordTelemetry(self, unitId: str, unitTime: float, values: tuple,
+                        timestamp: float = None) -> None:
+        """
+        Record a received telemetry sample.
+
+        Params:
+            unitId:     The unit ID.
+            unitTime:   The sample time of the unit in seconds.
+            values:     The channel values in channel order.
+            timestamp:  The monotonic reception time.
+                        Default: the monotonic clock.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        self._enqueue((TELEMETRY, timestamp - self._start, unitId,
+                       (unitTime, *values)))
+
+    def getDroppedCount(self) -> int:
+        """
+        Get the number of records dropped because the queue was full.
+
+        Return:
+            The number of dropped records.
+        """
+        return self._dropped
+
+    def isFailed(self) -> bool:
+        """
+        Check if the recording stopped on a write failure.
+
+        Return:
+            True if the recording failed, False otherwise.
+        """
+        return self._failed
+
+    def getRowCount(self, stream: str) -> int:
+        """
+        Get the number of rows written to a stream.
+
+        Params:
+            stream:     The stream name.
+
+        Return:
+            The number of written rows.
+        """
+        return self._rowCounts[stream]
+
+    def _getUnitCode(self, unitId: str) -> int:
+        """
+        Get the column code of a unit.
+
+        Params:
+            unitId:     The unit ID.
+
+        Return:
+            The unit code, its index in the manifest unit list.
+        """
+        code = self._units.get(unitId)
+        if code is None:
+            code = self._units[unitId] = len(self._units)
+        return code
+
+    def flush(self) -> int:
+        """
+        Write the queued records.
+
+        Return:
+            The number of written records.
+        """
+        with self._writeLock:
+            batches = {stream: [] for stream in self._columns}
+            queue = self._queue
+            while queue:
+                stream, timestamp, unitId, fields = queue.popleft()
+                batches[stream].append((timestamp,
+                                        self._getUnitCode(unitId), *fields))
+            written = 0
+            for stream, rows in batches.items():
+                if rows:
+                    self._writeRows(stream, rows)
+                    written += len(rows)
+            if written:
+                self._writeManifest()
+        return written
+
+    def _writeRows(self, stream: str, rows: list) -> None:
+        """
+        Append rows to the column files of a stream.
+
+        Params:
+            stream:     The stream name.
+            rows:       The rows, in column order.
+        """
+        rows.sort(key=lambda row: row[0])
+        columns = self._columns[stream]
+        table = np.array(rows, dtype=columns)
+        times = table['time']
+        # A record stamped before the last written one is clamped so the
+        # time column stays sorted.
+        np.maximum(times, self._lastTimes[stream], out=times)
+        first = self._rowCounts[stream]
+        for (name, _), columnFile in zip(columns, self._files[stream]):
+            columnFile.write(np.ascontiguousarray(table[name]).tobytes())
+            columnFile.flush()
+        indexRows = np.arange(-(-first // INDEX_STRIDE) * INDEX_STRIDE,
+                              first + len(rows), INDEX_STRIDE)
+        if len(indexRows):
+            index = np.empty(len(indexRows), dtype=INDEX_DTYPE)
+            index['time'] = times[indexRows - first]
+            index['row'] = indexRows
+            self._indexFiles[stream].write(index.tobytes())
+            self._indexFiles[stream].flush()
+        self._rowCounts[stream] = first + len(rows)
+        self._lastTimes[stream] = float(times[-1])
+
+    def run(self) -> None:
+        """
+        Write the queued records until stopped or until a write fails.
+        """
+        self._logger.info('recorder started')
+        while not self._stopEvent.wait(self._flushPeriod):
+            try:
+                self.flush()
+            except Exception:
+                self._logger.exception('session write failed, recording '
+                                       'stopped')
+                self._failed = True
+                self._queue.clear()
+                break
+        self._logger.info('recorder stopped')
+
+    def stop(self) -> None:
+        """
+        Stop the recorder, write the remaining records and close the
+        session.
+        """
+        self._stopEvent.set()
+        if self.is_alive():
+            self.join()
+        if not self._failed:
+            self.flush()
+        if self._dropped:
+            self._logger.warning(f"{self._dropped} records dropped")
+        with self._writeLock:
+            for stream in self._columns:
+                for columnFile in self._files[stream]:
+                    columnFile.close()
+                self._indexFiles[stream].close()
@@ -0,0 +1,4 @@
+from .decimation import lttbDecimate, minMaxDecimate    # noqa: F401
+from .ringBuffer import RingBuffer      # noqa: F401
+from .telemetryStore import TelemetryStore      # noqa: F401
+from .telemetryView import TelemetryView        # noqa: F401
@@ -0,0 +1,107 @@
+import numpy as np
+
+
+def minMaxDecimate(times: np.ndarray, values: np.ndarray,
+                   bucketSize: int) -> tuple:
+    """
+    Decimate samples to the minimum and maximum of each bucket.
+
+    The buckets are consecutive runs of bucketSize samples, the last one
+    possibly shorter. The two points of each bucket are kept in time
+    order, so the decimated line keeps every peak of the raw one.
+
+    Params:
+        times:      The sample times.
+        values:     The sample values.
+        bucketSize: The number of samples per bucket.
+
+    Return:
+        The times and values of the decimated points, two per bucket.
+    """
+    count = len(values)
+    if count == 0:
+        return np.empty(0), np.empty(0)
+    full = count // bucketSize * bucketSize
+    parts = []
+    if full:
+        parts.append(_minMaxBuckets(times[:full], values[:full],
+                                    bucketSize))
+    if full < count:
+        parts.append(_minMaxBuckets(times[full:], values[full:],
+                                    count - full))
+    if len(parts) == 1:
+        return parts[0]
+    return np.concatenate((parts[0][0], parts[1][0])), \
+        np.concatenate((parts[0][1], parts[1][1]))
+
+
+def _minMaxBuckets(times: np.ndarray, values: np.ndarray,
+                   bucketSize: int) -> tuple:
+    """
+    Decimate whole buckets to their minimum and maximum.
+
+    Params:
+        times:      The sample times, a whole number of buckets.
+        values:     The sample values, a whole number of buckets.
+        bucketSize: The number of samples per bucket.
+
+    Return:
+        The times and values of the decimated points, two per bucket.
+    """
+    buckets = values.reshape(-1, bucketSize)
+    base = np.arange(0, len(values), bucketSize)
+    argMin = buckets.argmin(axis=1)
+    argMax = buckets.argmax(axis=1)
+    first = base + np.minimum(argMin, argMax)
+    last = base + np.maximum(argMin, argMax)
+    indexes = np.column_stack((first, last)).ravel()
+    return times[indexes], values[indexes]
+
+
+def lttbDecimate(times: np.ndarray, values: np.ndarray,
+                 threshold: int) -> tuple:
+    """
+    Decimate samples with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last samples are kept and each bucket in between
+    keeps the sample forming the largest triangle with the point kept in
+    the previous bucket and the average of the next one. The triangle
+    areas of a bucket are computed at once, so the cost in Python is one
+    iteration per kept point, not per sample.
+
+    Params:
+        times:      The sample times.
+        values:     The sample values.
+        threshold:  The number of points to keep, at least 3.
+
+    Return:
+        The times and values of the kept samples.
+    """
+    count = len(values)
+    if threshold >= count or count < 3:
+        return times, values
+    if threshold < 3:
+        raise ValueError(f"LTTB threshold {threshold} under 3")
+    edges = np.linspace(1, count - 1, threshold - 1).astype(np.intp)
+    sumTimes = np.concatenate(([0.0], np.cumsum(times)))
+    sumValues = np.concatenate(([0.0], np.cumsum(values)))
+    indexes = np.empty(threshold, dtype=np.intp)
+    indexes[0] = 0
+    indexes[-1] = count - 1
+    kept = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        nextStart = end
+        nextEnd = edges[bucket + 2] if bucket + 2 < len(edges) else count
+        nextSize = nextEnd - nextStart
+        avgTime = (sumTimes[nextEnd] - sumTimes[nextStart]) / nextSize
+        avgValue = (sumValues[nextEnd] - sumValues[nextStart]) / nextSize
+        keptTime = times[kept]
+        keptValue = values[kept]
+        areas = np.abs((keptTime - avgTime) *
+                       (values[start:end] - keptValue) -
+                       (keptTime - times[start:end]) *
+                       (avgValue - keptValue))
+        kept = start + int(areas.argmax())
+        indexes[bucket + 1] = kept
+    return times[indexes], values[indexes]
@@ -0,0 +1,103 @@
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Fixed capacity ring buffer of rows.
+    """
+    def __init__(self, capacity: int, width: int = 1,
+                 dtype: object = np.float64) -> None:
+        """
+        Constructor.
+
+        Params:
+            capacity:   The number of rows kept.
+            width:      The number of columns of a row. Default: 1.
+            dtype:      The data type. Default: float64.
+        """
+        if capacity < 1 or width < 1:
+            raise ValueError(f"invalid ring buffer shape "
+                             f"({capacity}, {width})")
+        self._capacity = capacity
+        self._data = np.zeros((2 * capacity, width), dtype=dtype)
+        # head, count, total
+        self._state = (0, 0, 0)
+
+    def __len__(self) -> int:
+        """
+        Get the number of rows kept.
+
+        Return:
+            The number of rows.
+        """
+        return self._state[1]
+
+    def getCapacity(self) -> int:
+        """
+        Get the buffer capacity.
+
+        Return:
+            The number of rows kept at most.
+        """
+        return self._capacity
+
+    def getTotal(self) -> int:
+        """
+        Get the number of rows appended since the creation.
+
+        Return:
+            The number of appended rows, including the overwritten ones.
+        """
+        return self._state[2]
+
+    def append(self, row: object) -> None:
+        """
+        Append a row, overwriting the oldest one when full.
+
+        Params:
+            row:        The row values.
+        """
+        head, count, total = self._state
+        capacity = self._capacity
+        data = self._data
+        data[head] = row
+        data[head + capacity] = row
+        head += 1
+        self._state = (0 if head == capacity else head,
+                       count + 1 if count < capacity else count, total + 1)
+
+    def getWindow(self, size: int = None) -> np.ndarray:
+        """
+        Get the latest rows.
+
+        Params:
+            size:       The number of rows. Default: all the rows kept.
+
+        Return:
+            The view of the latest rows, the oldest first.
+        """
+        return self.getSnapshot(size)[0]
+
+    def getSnapshot(self, size: int = None) -> tuple:
+        """
+        Get the latest rows with the number of rows appended up to them.
+
+        Params:
+            size:       The number of rows. Default: all the rows kept.
+
+        Return:
+            The view of the latest rows, the oldest first, and the number
+            of rows appended up to the last one. The view aliases the
+            buffer and is overwritten once capacity rows are appended.
+        """
+        head, count, total = self._state
+        if size is None or size > count:
+            size = count
+        end = head + self._capacity
+        return self._data[end - size:end], total
+
+    def clear(self) -> None:
+        """
+        Drop all the rows.
+        """
+        self._state = (0, 0, self._state[2])
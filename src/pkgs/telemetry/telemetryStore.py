@@ -0,0 +1,231 @@
+import struct
+import threading
+
+import numpy as np
+
+from .ringBuffer import RingBuffer
+
+
+class TelemetryStore:
+    """
+    Unit telemetry store.
+    """
+    VERSION = 1
+    TOPIC_ROOT = 'unit'
+    TOPIC_LEAF = 'telemetry'
+    CHANNELS = ('speed', 'battery', 'rssi')
+
+    def __init__(self, channels: tuple = CHANNELS,
+                 capacity: int = 4096) -> None:
+        """
+        Constructor.
+
+        Params:
+            channels:   The channel names. Default: CHANNELS.
+            capacity:   The number of samples kept per unit.
+                        Default: 4096.
+        """
+        self._channels = tuple(channels)
+        self._columns = {channel: idx + 1
+                         for idx, channel in enumerate(self._channels)}
+        self._capacity = capacity
+        # version, unit timestamp (ms), one float32 per channel
+        self._layout = struct.Struct(f"<BI{len(self._channels)}f")
+        self._lock = threading.Lock()
+        self._buffers = {}
+        self._recorder = None
+
+    @classmethod
+    def getTopic(cls, unitId: str) -> str:
+        """
+        Get the telemetry topic of a unit.
+
+        Params:
+            unitId:     The unit ID.
+
+        Return:
+            The telemetry topic.
+        """
+        return f"{cls.TOPIC_ROOT}/{unitId}/{cls.TOPIC_LEAF}"
+
+    def getChannels(self) -> tuple:
+        """
+        Get the channel names.
+
+        Return:
+            The channel names in column order.
+        """
+        return self._channels
+
+    def getUnitIds(self) -> list:
+        """
+        Get the units with telemetry.
+
+        Return:
+            The unit IDs.
+        """
+        return list(self._buffers)
+
+    def setRecorder(self, recorder: object) -> None:
+        """
+        Set the recorder of the received samples.
+
+        Params:
+            recorder:   The session recorder or None to stop recording.
+        """
+        self._recorder = recorder
+
+    def _getBuffer(self, unitId: str) -> RingBuffer:
+        """
+        Get the ring buffer of a unit, creating it on its first sample.
+
+        Params:
+            unitId:     The unit ID.
+
+        Return:
+            The unit ring buffer.
+        """
+        buffer = self._buffers.get(unitId)
+        if buffer is None:
+            with self._lock:
+                buffer = self._buffers.get(unitId)
+                if buffer is None:
+                    buffer = RingBuffer(self._capacity,
+                                        len(self._channels) + 1)
+                    buffers = dict(self._buffers)
+                    buffers[unitId] = buffer
+                    self._buffers = buffers
+        return buffer
+
+    def append(self, unitId: str, timestamp: float, values: tuple) -> None:
+        """
+        Append a sample.
+
+        Params:
+            unitId:     The unit ID.
+            timestamp:  The sample time in seconds.
+            values:     The channel values in channel order.
+        """
+        if len(values) != len(self._channels):
+            raise ValueError(f"expected {len(self._channels)} channel "
+                             f"values, got {len(values)}")
+        self._getBuffer(unitId).append((timestamp, *values))
+        recorder = self._recorder
+        if recorder is not None:
+            recorder.recordTelemetry(unitId, timestamp, values)
+
+    def ingest(self, unitId: str, payload: bytes) -> None:
+        """
+        Decode a telemetry payload into the unit buffer.
+
+        Params:
+            unitId:     The unit ID.
+            payload:    The telemetry payload.
+        """
+        layout = self._layout
+        if len(payload) != layout.size:
+            raise ValueError(f"invalid telemetry size {len(payload)}")
+        sample = layout.unpack(payload)
+        if sample[0] != self.VERSION:
+            raise ValueError(f"unsupported telemetry version {sample[0]}")
+        self.append(unitId, sample[1] / 1000, sample[2:])
+
+    def onTelemetryMsg(self, topic: str, payload: bytes) -> None:
+        """
+        Handle a message from a unit telemetry topic.
+
+        Params:
+            topic:      The message topic, like getTopic.
+            payload:    The telemetry payload.
+        """
+        parts = topic.split('/')
+        if len(parts) != 3 or parts[0] != self.TOPIC_ROOT or \
+                parts[2] != self.TOPIC_LEAF:
+            raise ValueError(f"invalid telemetry topic {topic}")
+        self.ingest(parts[1], payload)
+
+    def removeUnit(self, unitId: str) -> None:
+        """
+        Drop the telemetry of a unit.
+
+        Params:
+            unitId:     The unit ID.
+        """
+        with self._lock:
+            buffers = dict(self._buffers)
+            buffers.pop(unitId, None)
+            self._buffers = buffers
+
+    def _getColumn(self, channel: str) -> int:
+        """
+        Get the buffer column of a channel.
+
+        Params:
+            channel:    The channel name.
+
+        Return:
+            The column index.
+        """
+        column = self._columns.get(channel)
+        if column is None:
+            raise ValueError(f"unknown telemetry channel {channel}")
+        return column
+
+    def getWindow(self, unitId: str, channel: str,
+                  size: int = None) -> tuple:
+        """
+        Get the latest samples of a unit channel.
+
+        Params:
+            unitId:     The unit ID.
+            channel:    The channel name.
+            size:       The number of samples. Default: all the samples
+                        kept.
+
+        Return:
+            The views of the sample times and values, the oldest first.
+        """
+        column = self._getColumn(channel)
+        buffer = self._buffers.get(unitId)
+        if buffer is None:
+            empty = np.empty(0)
+            return empty, empty
+        window = buffer.getWindow(size)
+        return window[:, 0], window[:, column]
+
+    def getSnapshot(self, unitId: str, channel: str) -> tuple:
+        """
+        Get all the samples kept for a unit channel with the number of
+        samples received up to them.
+
+        Params:
+            unitId:     The unit ID.
+            channel:    The channel name.
+
+        Return:
+            The views of the sample times and values, the oldest first,
+            and the number of samples received up to the last one.
+        """
+        column = self._getColumn(channel)
+        buffer = self._buffers.get(unitId)
+        if buffer is None:
+            empty = np.empty(0)
+            return empty, empty, 0
+        window, total = buffer.getSnapshot()
+        return window[:, 0], window[:, column], total
+
+    def getSince(self, unitId: str, channel: str, since: float) -> tuple:
+        """
+        Get the samples of a unit channel from a time on.
+
+        Params:
+            unitId:     The unit ID.
+            channel:    The channel name.
+            since:      The time of the oldest sample in seconds.
+
+        Return:
+            The views of the sample times and values, the oldest first.
+        """
+        times, values = self.getWindow(unitId, channel)
+        start = int(np.searchsorted(times, since, side='left'))
+        return times[start:], values[start:]
@@ -0,0 +1,120 @@
+import numpy as np
+
+from .decimation import lttbDecimate, minMaxDecimate
+
+
+class TelemetryView:
+    """
+    Decimated view of a unit telemetry channel.
+    """
+    MIN_MAX = 'minmax'
+    LTTB = 'lttb'
+
+    def __init__(self, store: object, unitId: str, channel: str,
+                 method: str = MIN_MAX) -> None:
+        """
+        Constructor.
+
+        Params:
+            store:      The telemetry store.
+            unitId:     The unit ID.
+            channel:    The channel name.
+            method:     The decimation method, MIN_MAX or LTTB.
+                        Default: MIN_MAX.
+        """
+        if method not in (self.MIN_MAX, self.LTTB):
+            raise ValueError(f"unknown decimation method {method}")
+        self._store = store
+        self._unitId = unitId
+        self._channel = channel
+        self._method = method
+        self._cacheKey = None
+        self._points = None
+        self._bucketSize = None
+        self._firstBucket = 0
+        self._bucketTimes = np.empty((0, 2))
+        self._bucketValues = np.empty((0, 2))
+
+    def getPoints(self, width: int) -> tuple:
+        """
+        Get the decimated points.
+
+        Params:
+            width:      The pixel width the points are drawn on.
+
+        Return:
+            The times and values of the points, at most about 2 points
+            per pixel.
+        """
+        width = max(int(width), 2)
+        times, values, total = self._store.getSnapshot(self._unitId,
+                                                       self._channel)
+        key = (total, width)
+        if key == self._cacheKey:
+            return self._points
+        if self._method == self.LTTB:
+            points = lttbDecimate(times, values, max(width, 3))
+        else:
+            points = self._getMinMax(times, values, total, width)
+        self._cacheKey = key
+        self._points = points
+        return points
+
+    def _getMinMax(self, times: np.ndarray, values: np.ndarray,
+                   total: int, width: int) -> tuple:
+        """
+        Decimate the samples with min-max buckets, reusing the buckets
+        completed before.
+
+        Params:
+            times:      The sample times.
+            values:     The sample values.
+            total:      The number of samples received up to the last
+                        one.
+            width:      The pixel width.
+
+        Return:
+            The times and values of the decimated points.
+        """
+        count = len(values)
+        buckets = max(width // 2, 1)
+        bucketSize = 1 << max(int(np.ceil(np.log2(max(count, 1) /
+                                                  buckets))), 0)
+        start = total - count
+        firstFull = -(-start // bucketSize)
+        endFull = total // bucketSize
+        if endFull <= firstFull:
+            return minMaxDecimate(times, values, bucketSize)
+        cacheEnd = self._firstBucket + len(self._bucketTimes)
+        if bucketSize != self._bucketSize or \
+                firstFull < self._firstBucket or cacheEnd > endFull:
+            self._bucketSize = bucketSize
+            self._firstBucket = firstFull
+            self._bucketTimes = np.empty((0, 2))
+            self._bucketValues = np.empty((0, 2))
+        elif firstFull > self._firstBucket:
+            drop = min(firstFull - self._firstBucket, len(self._bucketTimes))
+            self._bucketTimes = self._bucketTimes[drop:]
+            self._bucketValues = self._bucketValues[drop:]
+            self._firstBucket = firstFull
+        cacheEnd = self._firstBucket + len(self._bucketTimes)
+        if cacheEnd < endFull:
+            begin = cacheEnd * bucketSize - start
+            end = endFull * bucketSize - start
+            newTimes, newValues = minMaxDecimate(times[begin:end],
+                                                 values[begin:end],
+                                                 bucketSize)
+            self._bucketTimes = np.concatenate(
+                (self._bucketTimes, newTimes.reshape(-1, 2)))
+            self._bucketValues = np.concatenate(
+                (self._bucketValues, newValues.reshape(-1, 2)))
+        head = firstFull * bucketSize - start
+        tail = endFull * bucketSize - start
+        headTimes, headValues = minMaxDecimate(times[:head], values[:head],
+                                               max(head, 1))
+        tailTimes, tailValues = minMaxDecimate(times[tail:], values[tail:],
+                                               max(count - tail, 1))
+        return np.concatenate((headTimes, self._bucketTimes.ravel(),
+                               tailTimes)), \
+            np.concatenate((headValues, self._bucketValues.ravel(),
+                            tailValues))
@@ -1,7 +1,17 @@
 import sys
 
+from PySide2.QtCore import QTimer
 from PySide2.QtWidgets import QApplication
 
+from pkgs.cmdScheduler import CmdScheduler
+from pkgs.cmdSender import CmdSender
+from pkgs.inputPoller import InputPoller
+from pkgs.latency import LatencyTracker
+from pkgs.sessionLog import SessionRecorder
+from pkgs.telemetry import TelemetryStore
+from pkgs.unitPresence import UnitPresence
+from pkgs.unitRegistry import UnitRegistry
+
 from .windows import AppWindow
 
 
@@ -9,19 +19,219 @@ class AppComposer:
     """
     Application Composer.
     """
-    def __init__(self, logger: object) -> None:
+    UI_REFRESH_PERIOD = 33
+    PRESENCE_REFRESH_PERIOD = 250
+    UNIT_KEEPALIVE_RATE = 1
+
+    def __init__(self, logger: object, pollRate: int = 250,
+                 latencyDumpPath: str = None,
+                 sessionDir: str = None) -> None:
         """
         Constructor.
+
+        Params:
+            logger:             The application logger.
+            pollRate:           The controller polling rate in Hz.
+                                Default: 250.
+            latencyDumpPath:    The file the command latency summary is
+                                dumped to on exit. Default: None.
+            sessionDir:         The directory the sent commands and the
+                                received telemetry are recorded in.
+                                Default: None, no recording.
         """
         self._logger = logger.getLogger('APP_COMP')
         self._logger.info('creating Qt app')
         self._app = QApplication(sys.argv)
         self._logger.debug('creating UI')
         self._appWindow = AppWindow(logger)
+        self._latencyDumpPath = latencyDumpPath
+        self._latency = LatencyTracker()
+        self._inputPoller = InputPoller(logger, pollRate,
+                                        latency=self._latency)
+        self._inputPoller.setDeviceHandler(self._appWindow.onCtrlrDeviceEvent)
+        self._appWindow.setCtrlrHandler(self._inputPoller.setController)
+        self._cmdScheduler = CmdScheduler(logger)
+        self._cmdSender = CmdSender(logger)
+        self._units = UnitRegistry()
+        self._activeUnit = None
+        self._units.addListener(self._onUnitEvent)
+        self._appWindow.setUnitHandler(self._onUnitSelected)
+        self._presence = UnitPresence()
+        self._telemetry = TelemetryStore()
+        self._sessionRecorder = None
+        if sessionDir is not None:
+            self._sessionRecorder = SessionRecorder(
+                logger, sessionDir, self._telemetry.getChannels())
+            self._telemetry.setRecorder(self._sessionRecorder)
+        self._uiTimer = QTimer()
+        self._uiTimer.timeout.connect(self._refreshCtrlrFeedback)
+        self._presenceTimer = QTimer()
+        self._presenceTimer.timeout.connect(self._refreshUnitPresence)
+        self._presenceTimer.timeout.connect(self._appWindow.refreshTelemetry)
+
+    def _refreshCtrlrFeedback(self) -> None:
+        """
+        Refresh the controller feedback with the latest modifiers.
+        """
+        modifiers = self._inputPoller.getLatest()
+        if modifiers is not None:
+            self._appWindow.updateCtrlrFeedback(modifiers)
+
+    def _refreshUnitPresence(self) -> None:
+        """
+        Expire the silent units and push the presence diff to the unit
+        list.
+        """
+        self._presence.expire()
+        online, offline = self._presence.takeDiff()
+        if online or offline:
+            self._appWindow.updateUnitPresence(online, offline)
+
+    def _onUnitEvent(self, event: str, unit: object) -> None:
+        """
+        Keep the command scheduler, the command sender, the input
+        poller, the telemetry and the session recorder in sync with the
+        unit registry.
+
+        The active unit is commanded by the input poller through the
+        command filter, which sends its own keepalive. Only the inactive
+        units get their last command repeated by the command scheduler,
+        at the keepalive rate, so an idle fleet stays quiet. A
+        deactivated unit is set back to neutral first, so no unit keeps
+        driving without an operator.
+
+        Params:
+            event:      The registry event.
+            unit:       The affected unit.
+        """
+        if event == UnitRegistry.ADDED:
+            unit.setSender(self._cmdSender)
+            if self._sessionRecorder is not None:
+                unit.setRecorder(self._sessionRecorder)
+            self._cmdScheduler.addUnit(unit, self.UNIT_KEEPALIVE_RATE)
+        elif event == UnitRegistry.REMOVED:
+            self._cmdScheduler.removeUnit(unit)
+            unit.setSender(None)
+            self._telemetry.removeUnit(unit.getId())
+        elif event == UnitRegistry.ACTIVATED:
+            if unit is not None:
+                self._cmdScheduler.removeUnit(unit)
+            self._inputPoller.setUnit(unit)
+            previous, self._activeUnit = self._activeUnit, unit
+            if previous is not None and \
+                    self._units.get(previous.getId()) is previous:
+                previous.updateSteeringCmd(0.0)
+                previous.updateThrottleCmd(0.0, 0.0)
+                previous.sendCommandMsg()
+                self._cmdScheduler.addUnit(previous,
+                                           self.UNIT_KEEPALIVE_RATE)
+            self._appWindow.setTelemetryUnit(
+                self._telemetry, None if unit is None else unit.getId())
+
+    def _onUnitSelected(self, unitId: str) -> None:
+        """
+        Activate the unit selected in the unit list.
+
+        Params:
+            unitId:     The selected unit ID or None.
+        """
+        try:
+            self._units.setActive(unitId)
+        except ValueError:
+            self._logger.warning(f"unit {unitId} is not connected")
+            self._units.setActive(None)
+
+    def onUnitConnected(self, unit: object, cmdVersions: list = None) -> None:
+        """
+        Register a connected unit, negotiating its binary command format.
+
+        Params:
+            unit:           The unit.
+            cmdVersions:    The binary command format versions advertised
+                            by the unit. Default: None, none advertised.
+        """
+        unit.negotiateCmdCodec(cmdVersions)
+        self._units.add(unit)
+        self._presence.onCxnState(unit.getId(), True)
+
+    def getPresence(self) -> UnitPresence:
+        """
+        Get the unit presence table, fed by the connection state and
+        heartbeat messages.
+
+        Return:
+            The unit presence table.
+        """
+        return self._presence
+
+    def getTelemetry(self) -> TelemetryStore:
+        """
+        Get the unit telemetry store, fed by the unit telemetry messages.
+
+        Return:
+            The telemetry store.
+        """
+        return self._telemetry
+
+    def getUnits(self) -> UnitRegistry:
+        """
+        Get the unit registry.
+
+        Return:
+            The unit registry.
+        """
+        return self._units
+
+    def getLatencySummary(self) -> dict:
+        """
+        Get the command latency summary.
+
+        Return:
+            The latency summary of each stage, see LatencyTracker.
+        """
+        return self._latency.getSummary()
+
+    def getCmdScheduler(self) -> CmdScheduler:
+        """
+        Get the unit command scheduler.
+
+        Return:
+            The command scheduler.
+        """
+        return self._cmdScheduler
+
+    def getCmdSender(self) -> CmdSender:
+        """
+        Get the unit command sender.
+
+        Return:
+            The command sender.
+        """
+        return self._cmdSender
 
     def run(self):
         """
         Run the application.
         """
         self._appWindow.show()
-        sys.exit(self._app.exec_())
+        if self._sessionRecorder is not None:
+            self._sessionRecorder.start()
+        self._cmdSender.start()
+        self._inputPoller.start()
+        self._cmdScheduler.start()
+        self._uiTimer.start(self.UI_REFRESH_PERIOD)
+        self._presenceTimer.start(self.PRESENCE_REFRESH_PERIOD)
+        exitCode = self._app.exec_()
+        self._presenceTimer.stop()
+        self._uiTimer.stop()
+        self._inputPoller.stop()
+        self._cmdScheduler.stop()
+        self._cmdSender.stop()
+        if self._sessionRecorder is not None:
+            self._sessionRecorder.stop()
+        self._logger.info(f"command latency: {self.getLatencySummary()}")
+        self._logger.info(f"command send jitter: "
+                          f"{self._cmdScheduler.getJitterSummary()}")
+        if self._latencyDumpPath is not None:
+            self._latency.dump(self._latencyDumpPath)
+        sys.exit(exitCode)
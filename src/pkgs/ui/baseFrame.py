@@ -16,7 +16,7 @@ class BaseFrame(tk.Frame):
         Params:
             parent:             The parent of the frame.
             controllers:        The connected controllers.
-            units:              The connected units.
+            units:              The unit registry.
         """
         tk.Frame.__init__(self, parent, *args, **kwargs)
         self._logger = logging.getLogger('BASE_FRM')
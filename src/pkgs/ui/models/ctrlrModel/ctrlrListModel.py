@@ -0,0 +1,81 @@
+from PySide2.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class CtrlrListModel(QAbstractListModel):
+    """
+    Controller list model.
+    """
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        QAbstractListModel.__init__(self)
+        self._ctrlrs = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Get the number of rows.
+
+        Params:
+            parent:     The parent index.
+
+        Return:
+            The number of controllers.
+        """
+        if parent.isValid():
+            return 0
+        return len(self._ctrlrs)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        """
+        Get the data of a row.
+
+        Params:
+            index:      The row index.
+            role:       The data role.
+
+        Return:
+            The controller name for the display role, the controller for
+            the user role and None otherwise.
+        """
+        if not index.isValid() or index.row() >= len(self._ctrlrs):
+            return None
+        ctrlr = self._ctrlrs[index.row()]
+        if role == Qt.DisplayRole:
+            return ctrlr.getName()
+        if role == Qt.UserRole:
+            return ctrlr
+        return None
+
+    def getCtrlrs(self) -> tuple:
+        """
+        Get the controllers.
+
+        Return:
+            The controllers in row order.
+        """
+        return tuple(self._ctrlrs)
+
+    def appendCtrlr(self, ctrlr: object) -> None:
+        """
+        Append a controller row.
+
+        Params:
+            ctrlr:      The controller to append.
+        """
+        row = len(self._ctrlrs)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._ctrlrs.append(ctrlr)
+        self.endInsertRows()
+
+    def removeCtrlr(self, ctrlr: object) -> None:
+        """
+        Remove a controller row.
+
+        Params:
+            ctrlr:      The controller to remove.
+        """
+        row = self._ctrlrs.index(ctrlr)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._ctrlrs[row]
+        self.endRemoveRows()
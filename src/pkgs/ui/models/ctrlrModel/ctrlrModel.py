@@ -1,13 +1,17 @@
 from PySide2.QtCore import QObject, Signal
-from PySide2.QtGui import QStandardItem, QStandardItemModel
 
 from pkgs.controller import Controller
 
+from .ctrlrListModel import CtrlrListModel
+
 
 class CtrlrModel(QObject):
     """
     Controller model.
     """
+    _deviceAdded = Signal(int)
+    _deviceRemoved = Signal(int)
+
     def __init__(self, appLogger: object) -> None:
         """
         Constructor.
@@ -19,8 +23,11 @@ class CtrlrModel(QObject):
         self._appLogger = appLogger
         self._logger = appLogger.getLogger('CTRL_MODEL')
         self._logger.info('initializing...')
-        self._controllers = {'active': None, 'list': []}
-        self.model = QStandardItemModel(0, 1)
+        self._controllers = {'active': None, 'ids': {}}
+        self._activeHandler = None
+        self.model = CtrlrListModel()
+        self._deviceAdded.connect(self._onDeviceAdded)
+        self._deviceRemoved.connect(self._onDeviceRemoved)
         Controller.initFramework()
         self.updateCtrlrList()
         self._logger.info('initialized')
@@ -32,10 +39,7 @@ class CtrlrModel(QObject):
         Return:
             The list of names of current controllers.
         """
-        currentNames = []
-        for ctrlr in self._controllers['list']:
-            currentNames.append(ctrlr.getName())
-        return tuple(currentNames)
+        return tuple(ctrlr.getName() for ctrlr in self.model.getCtrlrs())
 
     def _filterAddedCtrlrs(self, newList: tuple) -> tuple:
         """
@@ -47,11 +51,8 @@ class CtrlrModel(QObject):
         Return:
             The list of controllers to add.
         """
-        currentList = map(lambda ctrlr: ctrlr.getName(),
-                          self._controllers['list'])
-        addedCtrlrs = filter(lambda newCtrlr: newCtrlr not in currentList,
-                             newList)
-        return tuple(addedCtrlrs)
+        currentNames = set(self._listCurrentCtrlrs())
+        return tuple(name for name in newList if name not in currentNames)
 
     def _filterRemovedCtrlrs(self, newList: tuple) -> tuple:
         """
@@ -63,11 +64,9 @@ class CtrlrModel(QObject):
         Return:
             The list of controllers to remove.
         """
-        currentList = map(lambda ctrlr: ctrlr.getName(),
-                          self._controllers['list'])
-        removedCtrls = filter(lambda oldCtrlr: oldCtrlr not in newList,
-                              currentList)
-        return tuple(removedCtrls)
+        newNames = set(newList)
+        return tuple(name for name in self._listCurrentCtrlrs()
+                     if name not in newNames)
 
     def _addControllers(self, availableCtrlrs: dict, addList: tuple) -> None:
         """
@@ -78,9 +77,18 @@ class CtrlrModel(QObject):
             addList:            The list of controllers to add.
         """
         for ctrlr in addList:
-            self._controllers['list'].append(Controller(self._appLogger,
-                                                        availableCtrlrs[ctrlr],
-                                                        ctrlr))
+            self._addController(Controller(self._appLogger,
+                                           availableCtrlrs[ctrlr], ctrlr))
+
+    def _addController(self, ctrlr: Controller) -> None:
+        """
+        Add a controller and its row.
+
+        Params:
+            ctrlr:              The controller to add.
+        """
+        self._controllers['ids'][ctrlr.getInstanceId()] = ctrlr
+        self.model.appendCtrlr(ctrlr)
 
     def _removeControllers(self, removeList: tuple) -> None:
         """
@@ -89,21 +97,103 @@ class CtrlrModel(QObject):
         Params:
             removeList:         The list of controllers to remove.
         """
-        if self._controllers['active'] and \
-                self._controllers['active'].getName() in removeList:
-            self._controllers['active'] = None
-        for ctrlr in self._controllers['list']:
-            if ctrlr.getName() in removeList:
-                self._controllers['list'].remove(ctrlr)
+        removeNames = set(removeList)
+        for ctrlr in self.model.getCtrlrs():
+            if ctrlr.getName() in removeNames:
+                self._removeController(ctrlr)
+
+    def _removeController(self, ctrlr: Controller) -> None:
+        """
+        Remove a controller and its row.
+
+        Params:
+            ctrlr:              The controller to remove.
+        """
+        del self._controllers['ids'][ctrlr.getInstanceId()]
+        if self._controllers['active'] is ctrlr:
+            self.setActiveCtrlr(None)
+        self.model.removeCtrlr(ctrlr)
+        ctrlr.quit()
+
+    def setActiveHandler(self, handler: object) -> None:
+        """
+        Set the handler of the active controller changes.
+
+        Params:
+            handler:            The handler called with the active
+                                controller, or None, from the model
+                                thread. It is called at once with the
+                                current one.
+        """
+        self._activeHandler = handler
+        if handler is not None:
+            handler(self._controllers['active'])
+
+    def getActiveCtrlr(self) -> Controller:
+        """
+        Get the active controller.
+
+        Return:
+            The active controller or None.
+        """
+        return self._controllers['active']
+
+    def setActiveCtrlr(self, ctrlr: Controller) -> None:
+        """
+        Set the active controller.
+
+        Params:
+            ctrlr:              The controller or None.
+        """
+        if ctrlr is self._controllers['active']:
+            return
+        self._logger.info(f"active controller: "
+                          f"{None if ctrlr is None else ctrlr.getName()}")
+        self._controllers['active'] = ctrlr
+        handler = self._activeHandler
+        if handler is not None:
+            handler(ctrlr)
+
+    def _onDeviceAdded(self, deviceIdx: int) -> None:
+        """
+        Add the controller of a newly connected device.
+
+        Params:
+            deviceIdx:          The device index.
+        """
+        name, instanceId = Controller.describeDevice(deviceIdx)
+        if instanceId in self._controllers['ids'] or \
+                not Controller.isSupported(name):
+            return
+        self._logger.info(f"controller {name} connected")
+        self._addController(Controller(self._appLogger, deviceIdx, name))
+
+    def _onDeviceRemoved(self, instanceId: int) -> None:
+        """
+        Remove the controller of a disconnected device.
+
+        Params:
+            instanceId:         The device instance ID.
+        """
+        ctrlr = self._controllers['ids'].get(instanceId)
+        if ctrlr is not None:
+            self._logger.info(f"controller {ctrlr.getName()} disconnected")
+            self._removeController(ctrlr)
 
-    def _updateModel(self) -> None:
+    def onDeviceEvent(self, ev: object) -> None:
         """
-        Update the controller combobox model.
+        Handle a device added or removed event.
+
+        The event is handed to the model thread through a signal, so it
+        can be called from the input polling thread.
+
+        Params:
+            ev:                 The device event.
         """
-        self.model.clear()
-        for ctrlr in self._controllers['list']:
-            item = QStandardItem(ctrlr.getName())
-            self.model.appendRow(item)
+        if ev.type == Controller.DEVICE_ADDED:
+            self._deviceAdded.emit(ev.device_index)
+        elif ev.type == Controller.DEVICE_REMOVED:
+            self._deviceRemoved.emit(ev.instance_id)
 
     def updateCtrlrList(self) -> None:
         """
@@ -115,5 +205,4 @@ class CtrlrModel(QObject):
         self._addControllers(connectedCtrlrs, addedCtrls)
         removedCtrlrs = self._filterRemovedCtrlrs(tuple(connectedCtrlrs))
         self._removeControllers(removedCtrlrs)
-        self._updateModel()
         self._logger.info('controller list updated')
@@ -0,0 +1 @@
+from .unitListModel import UnitListModel    # noqa: F401
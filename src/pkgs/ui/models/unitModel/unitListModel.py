@@ -0,0 +1,77 @@
+import bisect
+
+from PySide2.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class UnitListModel(QAbstractListModel):
+    """
+    Online unit list model.
+    """
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        QAbstractListModel.__init__(self)
+        self._unitIds = []
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """
+        Get the number of rows.
+
+        Params:
+            parent:     The parent index.
+
+        Return:
+            The number of online units.
+        """
+        if parent.isValid():
+            return 0
+        return len(self._unitIds)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> object:
+        """
+        Get the data of a row.
+
+        Params:
+            index:      The row index.
+            role:       The data role.
+
+        Return:
+            The unit ID for the display and user roles and None otherwise.
+        """
+        if not index.isValid() or index.row() >= len(self._unitIds):
+            return None
+        if role in (Qt.DisplayRole, Qt.UserRole):
+            return self._unitIds[index.row()]
+        return None
+
+    def getUnitIds(self) -> tuple:
+        """
+        Get the online units.
+
+        Return:
+            The unit IDs in row order.
+        """
+        return tuple(self._unitIds)
+
+    def applyDiff(self, online: list, offline: list) -> None:
+        """
+        Apply a presence diff.
+
+        Params:
+            online:     The IDs of the units gone online.
+            offline:    The IDs of the units gone offline.
+        """
+        unitIds = self._unitIds
+        for unitId in offline:
+            row = bisect.bisect_left(unitIds, unitId)
+            if row < len(unitIds) and unitIds[row] == unitId:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del unitIds[row]
+                self.endRemoveRows()
+        for unitId in online:
+            row = bisect.bisect_left(unitIds, unitId)
+            if row == len(unitIds) or unitIds[row] != unitId:
+                self.beginInsertRows(QModelIndex(), row, row)
+                unitIds.insert(row, unitId)
+                self.endInsertRows()
@@ -1,6 +1,9 @@
+import bisect
 import logging
 import tkinter as tk
 
+from pkgs.unitRegistry import UnitRegistry
+
 
 class UnitFrame(tk.LabelFrame):
     """
@@ -12,7 +15,7 @@ class UnitFrame(tk.LabelFrame):
 
         Params:
             parent:         The parent of the frame.
-            units:          The connected units.
+            units:          The unit registry.
         """
         tk.LabelFrame.__init__(self, parent, *args, **kwargs)
 
@@ -23,48 +26,58 @@ class UnitFrame(tk.LabelFrame):
         self._root = self._parent.nametowidget(self._parent.winfo_parent())
         self._units = units
 
-        self._generate_unit_id_list()
-
-        self._logger.debug(f"connected units: {self._unitIds}")
-
-        self._unitIdsVar = tk.StringVar(value=self._unitIds)
+        self._logger.debug(f"connected units: {self._units.getIds()}")
 
+        self._unitIds = sorted(self._units.getIds())
         self._unitListbox = tk.Listbox(self, height=44, width=45,
-                                       listvariable=self._unitIdsVar,
                                        selectmode='browse')
+        for unitId in self._unitIds:
+            self._unitListbox.insert(tk.END, unitId)
         self._unitListbox.grid(row=0, column=0, padx=10, pady=10)
         self._unitListbox.bind('<<ListboxSelect>>', self._select_unit)
 
-        self._root.bind('<<update-unit>>', self._update_unit_list)
+        self._units.addListener(self._on_unit_event)
 
         self._logger.debug('initialization done')
 
-    def _generate_unit_id_list(self):
-        """
-        Generate the unit ID list.
-        """
-        self._unitIds = []
-        for unit in self._units['list']:
-            self._unitIds.append(unit.get_id())
-
     def _select_unit(self, event):
         """
         The select unit event callback.
         """
         selectedUnit = self._unitListbox.get(tk.ACTIVE)
         self._logger.debug(f"changing active unit to {selectedUnit}")
-        for unit in self._units['list']:
-            if selectedUnit == unit.get_id():
-                self._units['active'] = unit
+        if selectedUnit in self._units:
+            self._units.setActive(selectedUnit)
 
-    def _update_unit_list(self, event):
+    def _on_unit_event(self, event, unit):
         """
-        Update the unit list.
+        The unit registry event callback.
+
+        The registry may notify from any thread, so the row update is
+        scheduled in the tkinter event loop.
+
+        Params:
+            event:          The registry event.
+            unit:           The affected unit.
         """
-        self._logger.debug('updating unit listbox')
-        selectedUnit = self._unitListbox.get(tk.ACTIVE)
-        self._generate_unit_id_list()
-        self._unitIdsVar.set(self._unitIds)
-        if selectedUnit not in self._unitIds:
-            self._units['active'] = None
-            self._logger.debug(f"active unit: {self._units['active']}")
+        if event in (UnitRegistry.ADDED, UnitRegistry.REMOVED):
+            self.after(0, self._update_unit_row, event, unit.getId())
+
+    def _update_unit_row(self, event, unitId):
+        """
+        Update the row of an added or removed unit.
+
+        Params:
+            event:          The registry event.
+            unitId:         The affected unit ID.
+        """
+        row = bisect.bisect_left(self._unitIds, unitId)
+        isListed = row < len(self._unitIds) and self._unitIds[row] == unitId
+        if event == UnitRegistry.ADDED and not isListed:
+            self._logger.debug(f"adding unit {unitId}")
+            self._unitIds.insert(row, unitId)
+            self._unitListbox.insert(row, unitId)
+        elif event == UnitRegistry.REMOVED and isListed:
+            self._logger.debug(f"removing unit {unitId}")
+            del self._unitIds[row]
+            self._unitListbox.delete(row)
@@ -0,0 +1 @@
+from .telemetryPlot import TelemetryPlot    # noqa: F401
@@ -0,0 +1,71 @@
+import numpy as np
+from PySide2.QtCore import QPointF
+from PySide2.QtGui import QPainter, QPolygonF
+from PySide2.QtWidgets import QWidget
+
+
+class TelemetryPlot(QWidget):
+    """
+    Telemetry channel plot.
+    """
+    def __init__(self, title: str, parent: QWidget = None) -> None:
+        """
+        Constructor.
+
+        Params:
+            title:      The plot title.
+            parent:     The parent widget. Default: None.
+        """
+        QWidget.__init__(self, parent)
+        self._title = title
+        self._view = None
+        self.setMinimumHeight(60)
+
+    def setView(self, view: object) -> None:
+        """
+        Set the plotted telemetry view.
+
+        Params:
+            view:       The telemetry view or None to clear the plot.
+        """
+        self._view = view
+        self.update()
+
+    def mapPoints(self, times: np.ndarray, values: np.ndarray) -> QPolygonF:
+        """
+        Map the points to the widget pixels.
+
+        Params:
+            times:      The point times.
+            values:     The point values.
+
+        Return:
+            The polyline of the points.
+        """
+        width = self.width() - 1
+        height = self.height() - 1
+        xs = times - times[0]
+        span = xs[-1]
+        xs = xs * (width / span) if span > 0 else np.zeros(len(xs))
+        low = values.min()
+        high = values.max()
+        ys = height - (values - low) * (height / (high - low)) \
+            if high > low else np.full(len(values), height / 2)
+        return QPolygonF([QPointF(x, y) for x, y in zip(xs.tolist(),
+                                                        ys.tolist())])
+
+    def paintEvent(self, event: object) -> None:
+        """
+        Paint the plot.
+
+        Params:
+            event:      The paint event.
+        """
+        painter = QPainter(self)
+        painter.drawText(4, 12, self._title)
+        view = self._view
+        if view is not None:
+            times, values = view.getPoints(self.width())
+            if len(values) > 1:
+                painter.drawPolyline(self.mapPoints(times, values))
+        painter.end()
@@ -1,7 +1,12 @@
 import PySide2.QtWidgets as qtw
+from PySide2.QtCore import Qt
+
+from pkgs.telemetry import TelemetryStore, TelemetryView
 
 from .appWindow_auto import Ui_MainWindow
 from ..models.ctrlrModel import CtrlrModel
+from ..models.unitModel import UnitListModel
+from ..widgets import TelemetryPlot
 
 
 class AppWindow(qtw.QMainWindow, Ui_MainWindow):
@@ -29,9 +34,131 @@ class AppWindow(qtw.QMainWindow, Ui_MainWindow):
             logger:     The application logger.
         """
         self._initCtrlrModel(logger)
+        self._initUnitModel()
+        self._initTelemetryPlots()
 
     def _initCtrlrModel(self, logger: object) -> None:
         """
         Initialize the controller model.
         """
         self._ctrlrModel = CtrlrModel(logger)
+        self.ctrlrSelect.currentIndexChanged.connect(self._onCtrlrSelected)
+        self.ctrlrSelect.setModel(self._ctrlrModel.model)
+        self._onCtrlrSelected(self.ctrlrSelect.currentIndex())
+
+    def _onCtrlrSelected(self, row: int) -> None:
+        """
+        Activate the selected controller.
+
+        Params:
+            row:        The selected row, -1 without selection.
+        """
+        ctrlrs = self._ctrlrModel.model.getCtrlrs()
+        self._ctrlrModel.setActiveCtrlr(ctrlrs[row]
+                                        if 0 <= row < len(ctrlrs) else None)
+
+    def setCtrlrHandler(self, handler: object) -> None:
+        """
+        Set the handler of the active controller changes.
+
+        Params:
+            handler:    The handler called with the active controller or
+                        None. It is called at once with the current one.
+        """
+        self._ctrlrModel.setActiveHandler(handler)
+
+    def _initUnitModel(self) -> None:
+        """
+        Initialize the unit model.
+        """
+        self._unitModel = UnitListModel()
+        self._unitHandler = None
+        self.unitsListView.setModel(self._unitModel)
+        self.unitsListView.selectionModel().selectionChanged.connect(
+            self._onUnitSelected)
+
+    def _onUnitSelected(self, selected: object, deselected: object) -> None:
+        """
+        Hand the selected unit to the unit handler.
+
+        Params:
+            selected:   The selected items.
+            deselected: The deselected items.
+        """
+        handler = self._unitHandler
+        if handler is None:
+            return
+        indexes = self.unitsListView.selectionModel().selectedIndexes()
+        handler(indexes[0].data(Qt.UserRole) if indexes else None)
+
+    def setUnitHandler(self, handler: object) -> None:
+        """
+        Set the handler of the selected unit changes.
+
+        Params:
+            handler:    The handler called with the selected unit ID or
+                        None once the selection is cleared, a unit gone
+                        offline included.
+        """
+        self._unitHandler = handler
+
+    def _initTelemetryPlots(self) -> None:
+        """
+        Initialize a plot per telemetry channel in the state tab.
+        """
+        layout = qtw.QVBoxLayout(self.stateCmdTab)
+        self._telemetryPlots = {}
+        for channel in TelemetryStore.CHANNELS:
+            plot = TelemetryPlot(channel, self.stateCmdTab)
+            layout.addWidget(plot)
+            self._telemetryPlots[channel] = plot
+
+    def setTelemetryUnit(self, store: TelemetryStore, unitId: str) -> None:
+        """
+        Plot the telemetry of a unit.
+
+        Params:
+            store:      The telemetry store.
+            unitId:     The unit ID or None to clear the plots.
+        """
+        for channel, plot in self._telemetryPlots.items():
+            plot.setView(None if unitId is None else
+                         TelemetryView(store, unitId, channel))
+
+    def refreshTelemetry(self) -> None:
+        """
+        Repaint the telemetry plots with the latest samples.
+        """
+        for plot in self._telemetryPlots.values():
+            plot.update()
+
+    def updateUnitPresence(self, online: list, offline: list) -> None:
+        """
+        Update the unit list with a presence diff.
+
+        Params:
+            online:     The IDs of the units gone online.
+            offline:    The IDs of the units gone offline.
+        """
+        self._unitModel.applyDiff(online, offline)
+
+    def onCtrlrDeviceEvent(self, ev: object) -> None:
+        """
+        Handle a controller device added or removed event.
+
+        Params:
+            ev:         The device event.
+        """
+        self._ctrlrModel.onDeviceEvent(ev)
+
+    def updateCtrlrFeedback(self, modifiers: tuple) -> None:
+        """
+        Update the controller feedback widgets.
+
+        Params:
+            modifiers:  The controller modifiers snapshot.
+        """
+        thrlBar = self.ctrlrThrlBar
+        brkBar = self.ctrlrBrkBar
+        thrlBar.setValue(int(modifiers.throttle * thrlBar.maximum()))
+        brkBar.setValue(int(modifiers.brake * brkBar.maximum()))
@@ -1,3 +1,7 @@
+import threading
+import time
+
+from ..cmdCodec import WhldCmdCodec, canPublishRaw, combineThrtlBrake
 from ..messages import UnitWhldCmdMsg
 
 
@@ -5,7 +9,10 @@ class Unit:
     """
     The unit class.
     """
-    def __init__(self, appLogger: object, client: object, id: str) -> None:
+    CMD_CODEC_TOPIC = 'unit/{}/whldCmd'
+
+    def __init__(self, appLogger: object, client: object, id: str,
+                 sender: object = None) -> None:
         """
         Constructor.
 
@@ -13,40 +20,89 @@ class Unit:
             appLogger:  The application logger.
             client:     The MQTT client.
             id:         The unit ID.
+            sender:     The command sender publishing the commands in the
+                        background or None to publish them synchronously.
+                        Default: None.
         """
         self._logger = appLogger.getLogger(f"UNIT-{id.upper()}")
         self._logger.info(f"creating unit with ID: {id}")
         self._id = id
         self._client = client
         self._cmdMsg = UnitWhldCmdMsg(self._id)
+        self._sender = sender
+        self._cmdLock = threading.Lock()
+        self._steering = 0.0
+        self._throttle = 0.0
+        self._sendMsg = None if sender is None else UnitWhldCmdMsg(self._id)
+        self._cmdCodec = None
+        self._recorder = None
+        self._latencyStamp = None
+
+    def getId(self) -> str:
+        """
+        Get the unit ID.
 
-    def _combineThrtlBrake(self, thrtlModifier: float,
-                           brakeModifier: float) -> float:
+        Return:
+            The unit ID.
         """
-        Combine the throttle and brake modifier in a single one.
+        return self._id
+
+    def setCmdCodec(self, codec: object) -> None:
+        """
+        Set the binary codec negotiated with the unit.
 
         Params:
-            thrtlModifier:  The throttle modifier.
-            brakeModifier:  The brake modifier.
+            codec:      The binary command codec, like WhldCmdCodec, or
+                        None to publish the command message. It is
+                        ignored if the MQTT client cannot publish binary
+                        payloads.
+        """
+        if codec is not None and not canPublishRaw(self._client):
+            self._logger.warning('the MQTT client cannot publish binary '
+                                 'commands, keeping the message format')
+            codec = None
+        self._logger.info(f"command format: "
+                          f"{'message' if codec is None else 'binary'}")
+        self._cmdCodec = codec
+
+    def negotiateCmdCodec(self, versions: list) -> bool:
+        """
+        Negotiate the binary command format with the unit.
+
+        Params:
+            versions:   The binary format versions advertised by the unit
+                        or None if it advertised none.
 
         Return:
-            The combined modifier.
+            True if the commands are published in the binary format,
+            False otherwise.
         """
-        modifier = 0.0
-        if thrtlModifier > 0 and brakeModifier == 0:
-            modifier = thrtlModifier
-        if brakeModifier > 0 and thrtlModifier == 0:
-            modifier = -1 * brakeModifier
-        return modifier
+        version = WhldCmdCodec.negotiate(versions)
+        self.setCmdCodec(None if version is None else
+                         WhldCmdCodec(self.CMD_CODEC_TOPIC.format(self._id)))
+        return self._cmdCodec is not None
 
-    def getId(self) -> str:
+    def setSender(self, sender: object) -> None:
         """
-        Get the unit ID.
+        Set the command sender.
 
-        Return:
-            The unit ID.
+        Params:
+            sender:     The command sender publishing the commands in the
+                        background or None to publish them synchronously.
         """
-        return self._id
+        with self._cmdLock:
+            if sender is not None and self._sendMsg is None:
+                self._sendMsg = UnitWhldCmdMsg(self._id)
+            self._sender = sender
+
+    def setRecorder(self, recorder: object) -> None:
+        """
+        Set the recorder of the sent commands.
+
+        Params:
+            recorder:   The session recorder or None to stop recording.
+        """
+        self._recorder = recorder
 
     def updateSteeringCmd(self, modifier: float) -> None:
         """
@@ -55,7 +111,9 @@ class Unit:
         Params:
             modifier:   The unit steering modifier.
         """
-        self._cmdMsg.setSteering(modifier)
+        with self._cmdLock:
+            self._steering = modifier
+            self._cmdMsg.setSteering(modifier)
 
     def updateThrottleCmd(self, thrtlModifer: float,
                           brakeModifier: float) -> None:
@@ -66,11 +124,85 @@ class Unit:
             thrtlModifier:  The unit throttle modifier.
             brakeModifier:  The unit brake modifier.
         """
-        modifier = self._combineThrtlBrake(thrtlModifer, brakeModifier)
-        self._cmdMsg.setThrottle(modifier)
+        modifier = combineThrtlBrake(thrtlModifer, brakeModifier)
+        with self._cmdLock:
+            self._throttle = modifier
+            self._cmdMsg.setThrottle(modifier)
 
-    def sendCommandMsg(self) -> None:
+    def sendCommandMsg(self, latency: object = None, dequeued: float = 0.0,
+                       computed: float = 0.0) -> None:
         """
         Send the command message.
+
+        With a command sender, the command is only submitted and replaces
+        any unsent older command of the unit.
+
+        Params:
+            latency:    The latency tracker the command is recorded to
+                        once published or None. Default: None.
+            dequeued:   The monotonic time the events were dequeued.
+                        Default: 0.0.
+            computed:   The monotonic time the modifiers were computed.
+                        Default: 0.0.
+        """
+        stamp = None if latency is None else (latency, dequeued, computed)
+        if self._sender is not None:
+            with self._cmdLock:
+                self._latencyStamp = stamp
+            self._sender.submit(self)
+            return
+        with self._cmdLock:
+            steering = self._steering
+            throttle = self._throttle
+            codec = self._cmdCodec
+            if codec is None:
+                built = time.monotonic()
+                self._client.publish(self._cmdMsg)
+            else:
+                payload = codec.encode(steering, throttle)
+                built = time.monotonic()
+        if codec is not None:
+            self._client.publishRaw(codec.topic, payload)
+        self._recordSent(steering, throttle, stamp, built)
+
+    def publishCommandMsg(self) -> None:
+        """
+        Publish the latest command from the command sender thread.
+        """
+        with self._cmdLock:
+            steering = self._steering
+            throttle = self._throttle
+            codec = self._cmdCodec
+            stamp = self._latencyStamp
+            self._latencyStamp = None
+            if codec is not None:
+                payload = codec.encode(steering, throttle)
+        if codec is not None:
+            built = time.monotonic()
+            self._client.publishRaw(codec.topic, payload)
+        else:
+            self._sendMsg.setSteering(steering)
+            self._sendMsg.setThrottle(throttle)
+            built = time.monotonic()
+            self._client.publish(self._sendMsg)
+        self._recordSent(steering, throttle, stamp, built)
+
+    def _recordSent(self, steering: float, throttle: float, stamp: tuple,
+                    built: float) -> None:
+        """
+        Record a published command.
+
+        Params:
+            steering:   The published steering modifier.
+            throttle:   The published throttle modifier.
+            stamp:      The latency tracker, dequeue and modifiers times
+                        of the command or None.
+            built:      The monotonic time the message was built.
         """
-        self._client.publish(self._cmdMsg)
+        if stamp is not None:
+            latency, dequeued, computed = stamp
+            latency.recordCommand(dequeued, computed, built,
+                                  time.monotonic())
+        recorder = self._recorder
+        if recorder is not None:
+            recorder.recordCommand(self._id, steering, throttle)
@@ -0,0 +1 @@
+from .unitGroup import GroupMember, UnitGroup      # noqa: F401
@@ -0,0 +1,274 @@
+from collections import namedtuple
+import threading
+
+from pkgs.cmdCodec import GroupCmdCodec, canPublishRaw, combineThrtlBrake
+from pkgs.messages import UnitWhldCmdMsg
+
+GroupMember = namedtuple('GroupMember', ('idPrefix', 'steeringScale',
+                                         'steeringOffset', 'throttleScale',
+                                         'throttleOffset'))
+
+
+class UnitGroup:
+    """
+    Unit group, commanded like a single unit.
+    """
+    def __init__(self, appLogger: object, client: object, id: str,
+                 topic: str, sender: object = None) -> None:
+        """
+        Constructor.
+
+        Params:
+            appLogger:  The application logger.
+            client:     The MQTT client.
+            id:         The group ID.
+            topic:      The topic the batched group commands are
+                        published on, if the client can publish binary
+                        payloads, see canPublishRaw.
+            sender:     The command sender publishing the commands in the
+                        background or None to publish them synchronously.
+                        Default: None.
+        """
+        self._logger = appLogger.getLogger(f"GROUP-{id.upper()}")
+        self._logger.info(f"creating unit group with ID: {id}")
+        self._id = id
+        self._client = client
+        self._sender = sender
+        self._codec = None
+        self._cmdMsg = None
+        if canPublishRaw(client):
+            self._codec = GroupCmdCodec(topic)
+        else:
+            self._logger.warning('the MQTT client cannot publish binary '
+                                 'commands, publishing the group command '
+                                 'message')
+            self._cmdMsg = UnitWhldCmdMsg(self._id)
+        self._cmdLock = threading.Lock()
+        self._members = {}
+        self._steering = 0.0
+        self._throttle = 0.0
+        self._recorder = None
+
+    def getId(self) -> str:
+        """
+        Get the group ID.
+
+        Return:
+            The group ID.
+        """
+        return self._id
+
+    def setSender(self, sender: object) -> None:
+        """
+        Set the command sender.
+
+        Params:
+            sender:     The command sender publishing the commands in the
+                        background or None to publish them synchronously.
+        """
+        self._sender = sender
+
+    def setRecorder(self, recorder: object) -> None:
+        """
+        Set the recorder of the sent member commands.
+
+        Params:
+            recorder:   The session recorder or None to stop recording.
+        """
+        self._recorder = recorder
+
+    def addMember(self, unitId: str, steeringScale: float = 1.0,
+                  steeringOffset: float = 0.0, throttleScale: float = 1.0,
+                  throttleOffset: float = 0.0) -> None:
+        """
+        Add a member or change its scale and offset.
+
+        The scale and offset are only applied in the batched format, the
+        command message of the group carrying a single command.
+
+        Params:
+            unitId:         The member unit ID.
+            steeringScale:  The steering scale. Default: 1.0.
+            steeringOffset: The steering offset. Default: 0.0.
+            throttleScale:  The throttle scale. Default: 1.0.
+            throttleOffset: The throttle offset. Default: 0.0.
+        """
+        member = GroupMember(GroupCmdCodec.encodeId(unitId), steeringScale,
+                             steeringOffset, throttleScale, throttleOffset)
+        if self._codec is None and (steeringScale, steeringOffset,
+                                    throttleScale, throttleOffset) != \
+                (1.0, 0.0, 1.0, 0.0):
+            raise ValueError(f"member {unitId} scale and offset need the "
+                             f"batched group format")
+        with self._cmdLock:
+            if unitId not in self._members and \
+                    len(self._members) >= GroupCmdCodec.MAX_MEMBERS:
+                raise ValueError(f"group {self._id} is full")
+            members = dict(self._members)
+            members[unitId] = member
+            self._members = members
+        self._logger.info(f"adding member {unitId}")
+
+    def removeMember(self, unitId: str) -> None:
+        """
+        Remove a member.
+
+        Params:
+            unitId:         The member unit ID.
+        """
+        with self._cmdLock:
+            members = dict(self._members)
+            members.pop(unitId, None)
+            self._members = members
+        self._logger.info(f"removing member {unitId}")
+
+    def getMemberIds(self) -> list:
+        """
+        Get the member IDs.
+
+        Return:
+            The member unit IDs in their addition order.
+        """
+        return list(self._members)
+
+    def updateSteeringCmd(self, modifier: float) -> None:
+        """
+        Update the group steering command.
+
+        Params:
+            modifier:   The group steering modifier.
+        """
+        with self._cmdLock:
+            self._steering = modifier
+
+    def updateThrottleCmd(self, thrtlModifer: float,
+                          brakeModifier: float) -> None:
+        """
+        Update the group throttle command.
+
+        The throttle and brake modifiers are combined like for a unit,
+        see combineThrtlBrake.
+
+        Params:
+            thrtlModifier:  The group throttle modifier.
+            brakeModifier:  The group brake modifier.
+        """
+        modifier = combineThrtlBrake(thrtlModifer, brakeModifier)
+        with self._cmdLock:
+            self._throttle = modifier
+
+    @staticmethod
+    def _clamp(value: float) -> float:
+        """
+        Clamp a command to its range.
+
+        Params:
+            value:      The command.
+
+        Return:
+            The command from -1 to 1.
+        """
+        return -1.0 if value < -1.0 else 1.0 if value > 1.0 else value
+
+    def _getMemberCmds(self) -> list:
+        """
+        Get the latest command of each member, the command lock held.
+
+        Return:
+            The (unit ID, steering, throttle) of each member, scaled,
+            offset and clamped.
+        """
+        steering = self._steering
+        throttle = self._throttle
+        clamp = self._clamp
+        return [(unitId,
+                 clamp(steering * member.steeringScale +
+                       member.steeringOffset),
+                 clamp(throttle * member.throttleScale +
+                       member.throttleOffset))
+                for unitId, member in self._members.items()]
+
+    def getMemberCmds(self) -> list:
+        """
+        Get the latest command of each member.
+
+        Return:
+            The (unit ID, steering, throttle) of each member, scaled,
+            offset and clamped.
+        """
+        with self._cmdLock:
+            return self._getMemberCmds()
+
+    def _buildPayload(self, memberCmds: list) -> bytes:
+        """
+        Build the batched payload of member commands, the command lock
+        held.
+
+        Params:
+            memberCmds: The member commands, like getMemberCmds.
+
+        Return:
+            The batched binary command of all the members.
+        """
+        encodeId = GroupCmdCodec.encodeId
+        members = self._members
+        return self._codec.encode([
+            (members[unitId].idPrefix if unitId in members else
+             encodeId(unitId), steering, throttle)
+            for unitId, steering, throttle in memberCmds])
+
+    def buildPayload(self, memberCmds: list = None) -> bytes:
+        """
+        Build the batched payload of the latest group command.
+
+        Params:
+            memberCmds: The member commands, like getMemberCmds.
+                        Default: the latest member commands.
+
+        Return:
+            The batched binary command of all the members.
+        """
+        if self._codec is None:
+            raise ValueError('the group publishes command messages')
+        with self._cmdLock:
+            if memberCmds is None:
+                memberCmds = self._getMemberCmds()
+            return self._buildPayload(memberCmds)
+
+    def sendCommandMsg(self) -> None:
+        """
+        Send the group command.
+
+        With a command sender, the command is only submitted and replaces
+        any unsent older command of the group.
+        """
+        if self._sender is not None:
+            self._sender.submit(self)
+            return
+        self.publishCommandMsg()
+
+    def publishCommandMsg(self) -> None:
+        """
+        Publish the latest group command in a single payload or message.
+
+        The command is snapshot and encoded under the command lock, so
+        each payload gets its own sequence number and a consistent
+        command whatever thread publishes.
+        """
+        with self._cmdLock:
+            if not self._members:
+                return
+            memberCmds = self._getMemberCmds()
+            codec = self._codec
+            if codec is None:
+                self._cmdMsg.setSteering(self._steering)
+                self._cmdMsg.setThrottle(self._throttle)
+                self._client.publish(self._cmdMsg)
+            else:
+                payload = self._buildPayload(memberCmds)
+        if codec is not None:
+            self._client.publishRaw(codec.topic, payload)
+        recorder = self._recorder
+        if recorder is not None:
+            for unitId, steering, throttle in memberCmds:
+                recorder.recordCommand(unitId, steering, throttle)
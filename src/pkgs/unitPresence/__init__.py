@@ -0,0 +1 @@
+from .unitPresence import UnitPresence      # noqa: F401
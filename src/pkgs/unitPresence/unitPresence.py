@@ -0,0 +1,145 @@
+import heapq
+import threading
+import time
+
+
+class UnitPresence:
+    """
+    Unit presence table.
+    """
+    def __init__(self, ttl: float = 3.0) -> None:
+        """
+        Constructor.
+
+        Params:
+            ttl:        The time to live of a unit presence in seconds.
+                        Default: 3.0.
+        """
+        if ttl <= 0:
+            raise ValueError(f"invalid presence TTL {ttl}")
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._deadlines = {}
+        self._heap = []
+        self._queued = set()
+        self._online = set()
+        self._offline = set()
+
+    def isOnline(self, unitId: str) -> bool:
+        """
+        Check if a unit is online.
+
+        Params:
+            unitId:     The unit ID.
+
+        Return:
+            True if the unit is online, False otherwise.
+        """
+        return unitId in self._deadlines
+
+    def getOnlineIds(self) -> list:
+        """
+        Get the online units.
+
+        Return:
+            The IDs of the online units.
+        """
+        return list(self._deadlines)
+
+    def onHeartbeat(self, unitId: str, timestamp: float = None) -> None:
+        """
+        Refresh the presence of a unit.
+
+        Params:
+            unitId:     The unit ID.
+            timestamp:  The monotonic reception time.
+                        Default: the monotonic clock.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+        deadline = timestamp + self._ttl
+        with self._lock:
+            if unitId not in self._deadlines:
+                self._setChanged(unitId, True)
+            if unitId not in self._queued:
+                heapq.heappush(self._heap, (deadline, unitId))
+                self._queued.add(unitId)
+            self._deadlines[unitId] = deadline
+
+    def onCxnState(self, unitId: str, connected: bool,
+                   timestamp: float = None) -> None:
+        """
+        Handle a unit connection state message.
+
+        Params:
+            unitId:     The unit ID.
+            connected:  True if the unit is connected, False otherwise.
+            timestamp:  The monotonic reception time.
+                        Default: the monotonic clock.
+        """
+        if connected:
+            self.onHeartbeat(unitId, timestamp)
+            return
+        with self._lock:
+            if self._deadlines.pop(unitId, None) is not None:
+                self._setChanged(unitId, False)
+
+    def _setChanged(self, unitId: str, online: bool) -> None:
+        """
+        Accumulate a presence change, a change back cancelling the
+        pending one.
+
+        Params:
+            unitId:     The unit ID.
+            online:     True if the unit went online, False otherwise.
+        """
+        added, removed = (self._online, self._offline) if online else \
+            (self._offline, self._online)
+        if unitId in removed:
+            removed.discard(unitId)
+        else:
+            added.add(unitId)
+
+    def expire(self, now: float = None) -> int:
+        """
+        Put the units whose time to live expired offline.
+
+        Params:
+            now:        The monotonic time. Default: the monotonic clock.
+
+        Return:
+            The number of expired units.
+        """
+        if now is None:
+            now = time.monotonic()
+        expired = 0
+        heap = self._heap
+        with self._lock:
+            while heap and heap[0][0] <= now:
+                _, unitId = heapq.heappop(heap)
+                deadline = self._deadlines.get(unitId)
+                if deadline is None:
+                    self._queued.discard(unitId)
+                    continue
+                if deadline > now:
+                    heapq.heappush(heap, (deadline, unitId))
+                    continue
+                del self._deadlines[unitId]
+                self._queued.discard(unitId)
+                self._setChanged(unitId, False)
+                expired += 1
+        return expired
+
+    def takeDiff(self) -> tuple:
+        """
+        Take the presence changes accumulated since the last call.
+
+        Return:
+            The sorted IDs of the units gone online and offline.
+        """
+        with self._lock:
+            online = sorted(self._online)
+            offline = sorted(self._offline)
+            self._online = set()
+            self._offline = set()
+        return online, offline
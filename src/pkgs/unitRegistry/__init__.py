@@ -0,0 +1 @@
+from .unitRegistry import UnitRegistry      # noqa: F401
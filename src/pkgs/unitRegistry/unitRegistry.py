@@ -0,0 +1,182 @@
+import threading
+
+
+class UnitRegistry:
+    """
+    Connected unit registry.
+    """
+    ADDED = 'added'
+    REMOVED = 'removed'
+    CHANGED = 'changed'
+    ACTIVATED = 'activated'
+
+    def __init__(self) -> None:
+        """
+        Constructor.
+        """
+        self._lock = threading.Lock()
+        self._units = {}
+        self._active = None
+        self._listeners = ()
+
+    def __len__(self) -> int:
+        """
+        Get the number of units.
+
+        Return:
+            The number of units.
+        """
+        return len(self._units)
+
+    def __contains__(self, unitId: str) -> bool:
+        """
+        Check if a unit is registered.
+
+        Params:
+            unitId:     The unit ID.
+
+        Return:
+            True if the unit is registered, False otherwise.
+        """
+        return unitId in self._units
+
+    def __iter__(self) -> object:
+        """
+        Iterate over the units in their connection order.
+
+        Return:
+            The unit iterator.
+        """
+        return iter(tuple(self._units.values()))
+
+    def addListener(self, listener: object) -> None:
+        """
+        Add a change listener.
+
+        Params:
+            listener:   The callable handed the event (ADDED, REMOVED,
+                        CHANGED or ACTIVATED) and the unit, the
+                        activated unit being None when none is.
+        """
+        with self._lock:
+            self._listeners = self._listeners + (listener,)
+
+    def removeListener(self, listener: object) -> None:
+        """
+        Remove a change listener.
+
+        Params:
+            listener:   The listener.
+        """
+        with self._lock:
+            self._listeners = tuple(registered for registered
+                                    in self._listeners
+                                    if registered != listener)
+
+    def _notify(self, event: str, unit: object) -> None:
+        """
+        Notify the listeners of a change.
+
+        Params:
+            event:      The change event.
+            unit:       The affected unit.
+        """
+        for listener in self._listeners:
+            listener(event, unit)
+
+    def get(self, unitId: str) -> object:
+        """
+        Get a unit.
+
+        Params:
+            unitId:     The unit ID.
+
+        Return:
+            The unit or None if it is not registered.
+        """
+        return self._units.get(unitId)
+
+    def getIds(self) -> list:
+        """
+        Get the unit IDs.
+
+        Return:
+            The unit IDs in their connection order.
+        """
+        return list(self._units)
+
+    def getActive(self) -> object:
+        """
+        Get the active unit.
+
+        Return:
+            The active unit or None if no unit is active.
+        """
+        return self._active
+
+    def add(self, unit: object) -> None:
+        """
+        Add a unit, replacing any unit with the same ID.
+
+        A replaced unit is deactivated then removed, like by remove.
+
+        Params:
+            unit:       The unit.
+        """
+        unitId = unit.getId()
+        with self._lock:
+            previous = self._units.pop(unitId, None)
+            self._units[unitId] = unit
+        if previous is not None:
+            if self._active is previous:
+                self.setActive(None)
+            self._notify(self.REMOVED, previous)
+        self._notify(self.ADDED, unit)
+
+    def remove(self, unitId: str) -> object:
+        """
+        Remove a unit, deactivating it if it is active.
+
+        Params:
+            unitId:     The unit ID.
+
+        Return:
+            The removed unit or None if it was not registered.
+        """
+        with self._lock:
+            unit = self._units.pop(unitId, None)
+        if unit is None:
+            return None
+        if self._active is unit:
+            self.setActive(None)
+        self._notify(self.REMOVED, unit)
+        return unit
+
+    def notifyChanged(self, unitId: str) -> None:
+        """
+        Notify the listeners that a unit state changed.
+
+        Params:
+            unitId:     The unit ID.
+        """
+        unit = self._units.get(unitId)
+        if unit is not None:
+            self._notify(self.CHANGED, unit)
+
+    def setActive(self, unitId: str) -> object:
+        """
+        Set the active unit.
+
+        Params:
+            unitId:     The unit ID or None to deactivate the active unit.
+
+        Return:
+            The active unit.
+        """
+        unit = None if unitId is None else self._units.get(unitId)
+        if unitId is not None and unit is None:
+            raise ValueError(f"unknown unit {unitId}")
+        if unit is not self._active:
+            self._active = unit
+            self._notify(self.ACTIVATED, unit)
+        return unit
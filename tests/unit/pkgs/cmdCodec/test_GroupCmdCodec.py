@@ -0,0 +1,60 @@
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.cmdCodec import GroupCmdCodec     # noqa: E402
+
+
+class TestGroupCmdCodec(TestCase):
+    """
+    The GroupCmdCodec class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testCodec = GroupCmdCodec('group/test/cmd')
+        self.testCommands = [(GroupCmdCodec.encodeId('unit 1'), 0.5, -0.25),
+                             (GroupCmdCodec.encodeId('unit 2'), -1.0, 1.0)]
+
+    def test_roundTrip(self):
+        """
+        The decode method must return the encoded member commands.
+        """
+        payload = self.testCodec.encode(self.testCommands, 2.5)
+        seq, timestamp, commands = GroupCmdCodec.decode(payload)
+        self.assertEqual(seq, 0)
+        self.assertEqual(timestamp, 2500)
+        self.assertEqual(list(commands), ['unit 1', 'unit 2'])
+        self.assertAlmostEqual(commands['unit 1'][0], 0.5, delta=1e-4)
+        self.assertAlmostEqual(commands['unit 1'][1], -0.25, delta=1e-4)
+        self.assertEqual(commands['unit 2'], (-1.0, 1.0))
+
+    def test_encodeSequence(self):
+        """
+        The encode method must number the payloads in sequence.
+        """
+        self.testCodec.encode(self.testCommands)
+        payload = self.testCodec.encode(self.testCommands)
+        self.assertEqual(GroupCmdCodec.decode(payload)[0], 1)
+
+    def test_encodeIdTooLong(self):
+        """
+        The encodeId method must raise a ValueError for an ID too long
+        for its prefix.
+        """
+        with self.assertRaises(ValueError):
+            GroupCmdCodec.encodeId('x' * (GroupCmdCodec.MAX_ID_SIZE + 1))
+
+    def test_decodeInvalid(self):
+        """
+        The decode method must raise a ValueError for a truncated or
+        padded payload.
+        """
+        payload = self.testCodec.encode(self.testCommands)
+        for invalid in (payload[:-1], payload + b'\x00', payload[:3]):
+            with self.assertRaises(ValueError):
+                GroupCmdCodec.decode(invalid)
@@ -0,0 +1,111 @@
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.cmdCodec import WhldCmdCodec, combineThrtlBrake  # noqa: E402
+
+
+class TestWhldCmdCodec(TestCase):
+    """
+    The WhldCmdCodec class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testCodec = WhldCmdCodec('unit/test/cmd/bin')
+
+    def test_encodeSize(self):
+        """
+        The encode method must pack the command in the fixed layout.
+        """
+        payload = self.testCodec.encode(0.5, -0.5, 1.0)
+        self.assertEqual(len(payload), 13)
+        self.assertEqual(payload[0], WhldCmdCodec.VERSION)
+
+    def test_roundTrip(self):
+        """
+        The decode method must return the encoded command within the
+        scaling resolution.
+        """
+        for steering, throttle in ((0.0, 0.0), (1.0, -1.0), (-0.123, 0.77)):
+            cmd = WhldCmdCodec.decode(
+                self.testCodec.encode(steering, throttle, 12.345))
+            self.assertAlmostEqual(cmd.steering, steering, delta=1e-4)
+            self.assertAlmostEqual(cmd.throttle, throttle, delta=1e-4)
+            self.assertEqual(cmd.timestamp, 12345)
+
+    def test_encodeClamp(self):
+        """
+        The encode method must clamp the axes to their range.
+        """
+        cmd = WhldCmdCodec.decode(self.testCodec.encode(1.5, -2.0, 0.0))
+        self.assertEqual(cmd.steering, 1.0)
+        self.assertEqual(cmd.throttle, -1.0)
+
+    def test_encodeSequence(self):
+        """
+        The encode method must number the commands in sequence, wrapping
+        at 32 bits.
+        """
+        self.testCodec._seq = WhldCmdCodec.SEQ_MOD - 1
+        first = WhldCmdCodec.decode(self.testCodec.encode(0.0, 0.0, 0.0))
+        second = WhldCmdCodec.decode(self.testCodec.encode(0.0, 0.0, 0.0))
+        self.assertEqual(first.seq, WhldCmdCodec.SEQ_MOD - 1)
+        self.assertEqual(second.seq, 0)
+        self.assertTrue(WhldCmdCodec.isNewer(second.seq, first.seq))
+        self.assertFalse(WhldCmdCodec.isNewer(first.seq, second.seq))
+        self.assertFalse(WhldCmdCodec.isNewer(first.seq, first.seq))
+
+    def test_decodeInvalid(self):
+        """
+        The decode method must raise a ValueError for a payload of the
+        wrong size or version.
+        """
+        payload = bytearray(self.testCodec.encode(0.0, 0.0, 0.0))
+        with self.assertRaises(ValueError):
+            WhldCmdCodec.decode(bytes(payload[:-1]))
+        payload[0] = WhldCmdCodec.VERSION + 1
+        with self.assertRaises(ValueError):
+            WhldCmdCodec.decode(bytes(payload))
+
+    def test_negotiate(self):
+        """
+        The negotiate method must agree on the codec version only if the
+        unit supports it.
+        """
+        self.assertEqual(WhldCmdCodec.negotiate([WhldCmdCodec.VERSION]),
+                         WhldCmdCodec.VERSION)
+        self.assertIsNone(WhldCmdCodec.negotiate([]))
+        self.assertIsNone(WhldCmdCodec.negotiate(None))
+
+
+class TestCombineThrtlBrake(TestCase):
+    """
+    The combineThrtlBrake function test cases.
+    """
+    def test_throttleActive(self):
+        """
+        The combineThrtlBrake function must generate the throttle command
+        base from the throttle modifier if only the throttle is active.
+        """
+        self.assertEqual(combineThrtlBrake(0.54, 0.0), 0.54)
+
+    def test_brakeActive(self):
+        """
+        The combineThrtlBrake function must generate the throttle command
+        base from the brake modifier * -1 if only the brake is active.
+        """
+        self.assertEqual(combineThrtlBrake(0.0, 0.99), -0.99)
+
+    def test_zeroModifier(self):
+        """
+        The combineThrtlBrake function must set the throttle command to 0
+        if both the throttle and the brake are inactive or active.
+        """
+        for thrtlModifier, brakeModifier in ((0.0, 0.0), (0.56, 0.12)):
+            self.assertEqual(combineThrtlBrake(thrtlModifier,
+                                               brakeModifier), 0.0)
@@ -0,0 +1,140 @@
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.cmdFilter import AxisFilter, CmdFilter    # noqa: E402
+from pkgs.controller import ModifierSnapshot   # noqa: E402
+
+
+class TestAxisFilter(TestCase):
+    """
+    The AxisFilter class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testFilter = AxisFilter(deadzone=0.05, hysteresis=0.01,
+                                     minDelta=0.05)
+
+    def test_updateFirstValue(self):
+        """
+        The update method must publish the first value.
+        """
+        self.assertEqual(self.testFilter.update(0.3), (0.3, True))
+
+    def test_updateDeadzone(self):
+        """
+        The update method must snap the values in the deadzone to 0.
+        """
+        for value in (-0.05, 0.03, 0.05):
+            testResult, _ = self.testFilter.update(value)
+            self.assertEqual(testResult, 0.0)
+
+    def test_updateHysteresis(self):
+        """
+        The update method must hold the value until it moves beyond the
+        hysteresis.
+        """
+        self.testFilter.update(0.5)
+        self.assertEqual(self.testFilter.update(0.51)[0], 0.5)
+        self.assertEqual(self.testFilter.update(0.49)[0], 0.5)
+        self.assertEqual(self.testFilter.update(0.52)[0], 0.52)
+
+    def test_updateMinDelta(self):
+        """
+        The update method must only publish a change of at least the
+        minimum delta from the last published value.
+        """
+        self.testFilter.update(0.5)
+        self.testFilter.markSent()
+        self.assertEqual(self.testFilter.update(0.53), (0.53, False))
+        self.assertEqual(self.testFilter.update(0.56), (0.56, True))
+
+    def test_updateEndpoints(self):
+        """
+        The update method must always accept and publish the endpoints.
+        """
+        testFilter = AxisFilter(deadzone=0.0, hysteresis=0.1, minDelta=0.5)
+        testFilter.update(0.95)
+        testFilter.markSent()
+        self.assertEqual(testFilter.update(1.0), (1.0, True))
+
+    def test_reset(self):
+        """
+        The reset method must publish the next value.
+        """
+        self.testFilter.update(0.5)
+        self.testFilter.markSent()
+        self.testFilter.reset()
+        self.assertEqual(self.testFilter.update(0.5), (0.5, True))
+
+
+class TestCmdFilter(TestCase):
+    """
+    The CmdFilter class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.keepalivePeriod = 1.0
+        self.testFilter = CmdFilter(self.keepalivePeriod)
+        self.testModifiers = ModifierSnapshot(0.25, 0.5, 0.0, 10.0)
+
+    def test_updateFirstCommand(self):
+        """
+        The update method must publish the first command.
+        """
+        testResult = self.testFilter.update(self.testModifiers)
+        self.assertEqual(testResult, self.testModifiers)
+
+    def test_updateNoChange(self):
+        """
+        The update method must suppress an unchanged command.
+        """
+        self.testFilter.update(self.testModifiers)
+        testModifiers = self.testModifiers._replace(steering=0.26,
+                                                    timestamp=10.5)
+        self.assertIsNone(self.testFilter.update(testModifiers))
+
+    def test_updateChange(self):
+        """
+        The update method must publish a changed command.
+        """
+        self.testFilter.update(self.testModifiers)
+        testModifiers = self.testModifiers._replace(throttle=0.75,
+                                                    timestamp=10.1)
+        testResult = self.testFilter.update(testModifiers)
+        self.assertEqual(testResult, testModifiers)
+
+    def test_updateKeepalive(self):
+        """
+        The update method must publish the unchanged command once the
+        keepalive period elapsed.
+        """
+        self.testFilter.update(self.testModifiers)
+        testModifiers = self.testModifiers._replace(
+            timestamp=self.testModifiers.timestamp + self.keepalivePeriod)
+        testResult = self.testFilter.update(testModifiers)
+        self.assertEqual(testResult, testModifiers)
+
+    def test_updateFiltered(self):
+        """
+        The update method must publish the filtered values.
+        """
+        testModifiers = self.testModifiers._replace(steering=0.01)
+        testResult = self.testFilter.update(testModifiers)
+        self.assertEqual(testResult.steering, 0.0)
+
+    def test_reset(self):
+        """
+        The reset method must publish the next command.
+        """
+        self.testFilter.update(self.testModifiers)
+        self.testFilter.reset()
+        testResult = self.testFilter.update(self.testModifiers)
+        self.assertEqual(testResult, self.testModifiers)
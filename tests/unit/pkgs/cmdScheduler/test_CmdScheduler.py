@@ -0,0 +1,132 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.cmdScheduler import CmdScheduler     # noqa: E402
+
+
+class TestCmdScheduler(TestCase):
+    """
+    The CmdScheduler class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.monotonic = 'pkgs.cmdScheduler.cmdScheduler.time.monotonic'
+        self.logger = Mock()
+        self.testScheduler = CmdScheduler(self.logger, tickRate=100,
+                                          wheelSize=8)
+        self.testScheduler._start = 0.0
+        self.testUnits = [Mock(), Mock()]
+
+    def _runTicks(self, first: int, last: int) -> None:
+        """
+        Run the ticks from first to last on time.
+        """
+        for tick in range(first, last + 1):
+            with patch(self.monotonic, return_value=tick / 100):
+                self.testScheduler._runTick(tick, tick)
+
+    def test_constructorInvalidRate(self):
+        """
+        The constructor must raise a ValueError for a tick rate out of
+        range.
+        """
+        with self.assertRaises(ValueError):
+            CmdScheduler(self.logger, tickRate=0)
+        with self.assertRaises(ValueError):
+            CmdScheduler(self.logger, tickRate=CmdScheduler.MAX_TICK_RATE + 1)
+
+    def test_addUnitInvalidRate(self):
+        """
+        The addUnit method must raise a ValueError for a unit rate out
+        of range.
+        """
+        with self.assertRaises(ValueError):
+            self.testScheduler.addUnit(self.testUnits[0], 0)
+        with self.assertRaises(ValueError):
+            self.testScheduler.addUnit(self.testUnits[0], 200)
+
+    def test_unitRates(self):
+        """
+        The scheduler must send the command of each unit at its rate,
+        including periods longer than the wheel.
+        """
+        self.testScheduler.addUnit(self.testUnits[0], 50)
+        self.testScheduler.addUnit(self.testUnits[1], 10)
+        self._runTicks(1, 40)
+        self.assertEqual(self.testUnits[0].sendCommandMsg.call_count, 20)
+        self.assertEqual(self.testUnits[1].sendCommandMsg.call_count, 4)
+        self.assertEqual(self.testScheduler.getUnitCount(), 2)
+
+    def test_addUnitReschedule(self):
+        """
+        The addUnit method must replace the rate of a scheduled unit.
+        """
+        self.testScheduler.addUnit(self.testUnits[0], 10)
+        self._runTicks(1, 10)
+        self.testScheduler.addUnit(self.testUnits[0], 100)
+        self._runTicks(11, 20)
+        self.assertEqual(self.testUnits[0].sendCommandMsg.call_count, 11)
+        self.assertEqual(self.testScheduler.getUnitCount(), 1)
+
+    def test_removeUnit(self):
+        """
+        The removeUnit method must stop sending the unit command.
+        """
+        self.testScheduler.addUnit(self.testUnits[0], 100)
+        self._runTicks(1, 5)
+        self.testScheduler.removeUnit(self.testUnits[0])
+        self._runTicks(6, 10)
+        self.assertEqual(self.testUnits[0].sendCommandMsg.call_count, 5)
+        self.assertEqual(self.testScheduler.getUnitCount(), 0)
+
+    def test_overrunSkipsMissedSends(self):
+        """
+        The scheduler must send a late unit command once and put it back
+        on its grid instead of sending the missed commands.
+        """
+        self.testScheduler.addUnit(self.testUnits[0], 100)
+        self._runTicks(1, 1)
+        with patch(self.monotonic, return_value=0.055):
+            for tick in range(2, 6):
+                self.testScheduler._runTick(tick, 5)
+        self.assertEqual(self.testUnits[0].sendCommandMsg.call_count, 2)
+        self._runTicks(6, 6)
+        self.assertEqual(self.testUnits[0].sendCommandMsg.call_count, 3)
+
+    def test_sendFailure(self):
+        """
+        A failed send must be logged without stopping the unit schedule.
+        """
+        self.testUnits[0].sendCommandMsg.side_effect = RuntimeError
+        self.testScheduler.addUnit(self.testUnits[0], 100)
+        self._runTicks(1, 3)
+        self.assertEqual(self.testUnits[0].sendCommandMsg.call_count, 3)
+        self.testScheduler._logger.exception.assert_called()
+
+    def test_getJitterSummary(self):
+        """
+        The getJitterSummary method must return the lateness statistics
+        of the sends in microseconds.
+        """
+        self.testScheduler.addUnit(self.testUnits[0], 100)
+        with patch(self.monotonic, return_value=0.012):
+            self.testScheduler._runTick(1, 1)
+        summary = self.testScheduler.getJitterSummary()
+        self.assertEqual(summary['count'], 1)
+        self.assertAlmostEqual(summary['max'], 2000, delta=40)
+
+    def test_runStop(self):
+        """
+        The stop method must end the scheduler thread.
+        """
+        self.testScheduler.addUnit(self.testUnits[0], 100)
+        self.testScheduler.start()
+        self.testScheduler.stop()
+        self.assertFalse(self.testScheduler.is_alive())
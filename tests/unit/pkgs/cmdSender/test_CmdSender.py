@@ -0,0 +1,71 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import os
+import sys
+import threading
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.cmdSender import CmdSender      # noqa: E402
+
+
+class TestCmdSender(TestCase):
+    """
+    The CmdSender class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testLogger = Mock()
+        self.testSender = CmdSender(self.testLogger)
+        self.testUnits = [Mock(), Mock()]
+
+    def test_submitLatestWins(self):
+        """
+        The submit method must keep a single pending command per unit.
+        """
+        for _ in range(3):
+            self.testSender.submit(self.testUnits[0])
+        self.testSender.submit(self.testUnits[1])
+        self.assertEqual(self.testSender.getPendingCount(), 2)
+        self.assertEqual(self.testSender.getReplacedCount(), 2)
+
+    def test_drain(self):
+        """
+        The _drain method must publish the command of each pending unit
+        once.
+        """
+        for unit in self.testUnits * 2:
+            self.testSender.submit(unit)
+        self.testSender._drain()
+        for unit in self.testUnits:
+            unit.publishCommandMsg.assert_called_once()
+        self.assertEqual(self.testSender.getPendingCount(), 0)
+        self.assertEqual(self.testSender.getSentCount(), 2)
+
+    def test_drainFailure(self):
+        """
+        A failed publish must be logged without dropping the other
+        units.
+        """
+        self.testUnits[0].publishCommandMsg.side_effect = RuntimeError
+        for unit in self.testUnits:
+            self.testSender.submit(unit)
+        self.testSender._drain()
+        self.testUnits[1].publishCommandMsg.assert_called_once()
+        self.testSender._logger.exception.assert_called_once()
+
+    def test_run(self):
+        """
+        The sender thread must publish the submitted commands until
+        stopped.
+        """
+        published = threading.Event()
+        self.testUnits[0].publishCommandMsg.side_effect = published.set
+        self.testSender.start()
+        self.testSender.submit(self.testUnits[0])
+        self.assertTrue(published.wait(1))
+        self.testSender.stop()
+        self.assertFalse(self.testSender.is_alive())
@@ -0,0 +1,129 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.controller.calibrationStore import CalibrationStore  # noqa: E402
+from pkgs.controller.modifiers import Calibration  # noqa: E402
+
+
+class TestCalibrationStore(TestCase):
+    """
+    The CalibrationStore class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.storePath = os.path.join(self.tmpDir.name, 'profiles',
+                                      'calibrations.json')
+        self.testGuid = '030000006d04000024c2000011010000'
+        self.testConfigName = 'logitech_driving_force'
+        self.testCalibration = Calibration(0.9, 0.95, 1.0, -1.0, 1.0, -0.8)
+        self.testStore = CalibrationStore(self.storePath)
+
+    def tearDown(self):
+        """
+        Test cases teardown.
+        """
+        self.tmpDir.cleanup()
+
+    def test_makeKey(self):
+        """
+        The makeKey method must combine the GUID and configuration name.
+        """
+        self.assertEqual(CalibrationStore.makeKey('guid', 'config'),
+                         'guid/config')
+
+    def test_loadMissingStore(self):
+        """
+        The load method must return None when the store does not exist.
+        """
+        self.assertIsNone(self.testStore.load(self.testGuid,
+                                              self.testConfigName))
+
+    def test_loadCorruptedStore(self):
+        """
+        The load method must return None when the store is corrupted.
+        """
+        os.makedirs(os.path.dirname(self.storePath))
+        with open(self.storePath, 'w') as storeFile:
+            storeFile.write('{not json')
+        self.assertIsNone(self.testStore.load(self.testGuid,
+                                              self.testConfigName))
+
+    def test_loadInvalidProfile(self):
+        """
+        The load method must return None for a degenerate profile.
+        """
+        os.makedirs(os.path.dirname(self.storePath))
+        key = CalibrationStore.makeKey(self.testGuid, self.testConfigName)
+        with open(self.storePath, 'w') as storeFile:
+            json.dump({key: [0, 0, 0, 0, 0, 0]}, storeFile)
+        self.assertIsNone(self.testStore.load(self.testGuid,
+                                              self.testConfigName))
+
+    def test_saveLoad(self):
+        """
+        The save method must persist the profile so a new store loads it.
+        """
+        self.testStore.save(self.testGuid, self.testConfigName,
+                            self.testCalibration)
+        testResult = CalibrationStore(self.storePath).load(
+            self.testGuid, self.testConfigName)
+        self.assertEqual(testResult.positions,
+                         self.testCalibration.positions)
+        self.assertIsNone(self.testStore.load(self.testGuid, 'other'))
+
+    def test_saveKeepsOtherProfiles(self):
+        """
+        The save method must keep the profiles of the other controllers.
+        """
+        otherCalibration = Calibration(1, 1, 1, 0, 1, 0)
+        self.testStore.save('other guid', self.testConfigName,
+                            otherCalibration)
+        self.testStore.save(self.testGuid, self.testConfigName,
+                            self.testCalibration)
+        testStore = CalibrationStore(self.storePath)
+        testResult = testStore.load('other guid', self.testConfigName)
+        self.assertEqual(testResult.positions, otherCalibration.positions)
+
+    def test_saveReadOnce(self):
+        """
+        The store must only read its file on the first access.
+        """
+        self.testStore.load(self.testGuid, self.testConfigName)
+        with patch('pkgs.controller.calibrationStore.json.load') \
+                as mockedLoad:
+            self.testStore.save(self.testGuid, self.testConfigName,
+                                self.testCalibration)
+            self.testStore.load(self.testGuid, self.testConfigName)
+            mockedLoad.assert_not_called()
+
+    def test_saveAtomic(self):
+        """
+        The save method must leave the previous store intact when the
+        write fails.
+        """
+        self.testStore.save(self.testGuid, self.testConfigName,
+                            self.testCalibration)
+        with patch('pkgs.controller.calibrationStore.json.dump') \
+                as mockedDump:
+            mockedDump.side_effect = OSError('disk full')
+            with self.assertRaises(OSError):
+                self.testStore.save('other guid', self.testConfigName,
+                                    self.testCalibration)
+        with open(self.storePath) as storeFile:
+            self.assertEqual(list(json.load(storeFile)),
+                             [CalibrationStore.makeKey(self.testGuid,
+                                                       self.testConfigName)])
+        self.assertEqual(os.listdir(os.path.dirname(self.storePath)),
+                         ['calibrations.json'])
+        self.assertIsNone(self.testStore.load('other guid',
+                                              self.testConfigName))
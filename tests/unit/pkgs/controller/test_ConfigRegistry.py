@@ -0,0 +1,185 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.controller.configRegistry import ConfigRegistry  # noqa: E402
+
+
+class TestConfigRegistry(TestCase):
+    """
+    The ConfigRegistry class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.timePkg = 'pkgs.controller.configRegistry.time'
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.rootDir = self.tmpDir.name
+        self.testConfigs = {'test_ctrlr_1': {'type': 'steering wheel'},
+                            'test_ctrlr_2': {'type': 'gamepad'}}
+        for name, config in self.testConfigs.items():
+            self._writeConfig(name, config)
+        with open(os.path.join(self.rootDir, 'README.md'), 'w') as readme:
+            readme.write('not a configuration')
+        self.testRegistry = ConfigRegistry(self.rootDir, checkPeriod=1.0)
+
+    def tearDown(self):
+        """
+        Test cases teardown.
+        """
+        self.tmpDir.cleanup()
+
+    def _writeConfig(self, name: str, config: dict, mtime: int = 0) -> None:
+        """
+        Write a test configuration.
+
+        Params:
+            name:       The configuration name.
+            config:     The configuration.
+            mtime:      The configuration modification time.
+        """
+        path = os.path.join(self.rootDir, f"{name}.json")
+        with open(path, 'w') as configFile:
+            json.dump(config, configFile)
+        os.utime(path, (mtime, mtime))
+
+    def test_normalizeName(self):
+        """
+        The normalizeName method must lower the name and replace the
+        spaces.
+        """
+        self.assertEqual(ConfigRegistry.normalizeName('Test Ctrlr 1'),
+                         'test_ctrlr_1')
+
+    def test_listSupported(self):
+        """
+        The listSupported method must list the configurations.
+        """
+        testResult = self.testRegistry.listSupported()
+        self.assertEqual(sorted(testResult), sorted(self.testConfigs))
+
+    def test_isSupported(self):
+        """
+        The isSupported method must check the normalized name.
+        """
+        self.assertTrue(self.testRegistry.isSupported('Test Ctrlr 2'))
+        self.assertFalse(self.testRegistry.isSupported('Test Ctrlr 3'))
+
+    def test_getConfig(self):
+        """
+        The getConfig method must return the configuration of the
+        normalized name.
+        """
+        testResult = self.testRegistry.getConfig('Test Ctrlr 1')
+        self.assertEqual(testResult, self.testConfigs['test_ctrlr_1'])
+
+    def test_getConfigUnsupported(self):
+        """
+        The getConfig method must raise a ValueError for an unsupported
+        controller.
+        """
+        with self.assertRaises(ValueError):
+            self.testRegistry.getConfig('Test Ctrlr 3')
+
+    def test_refreshCheckPeriod(self):
+        """
+        The registry must not touch the directory before the check
+        period elapsed.
+        """
+        with patch(self.timePkg) as mockedTime:
+            mockedTime.monotonic.return_value = 100.0
+            self.testRegistry.listSupported()
+            with patch('pkgs.controller.configRegistry.os.scandir') \
+                    as mockedScandir:
+                mockedTime.monotonic.return_value = 100.5
+                self.testRegistry.listSupported()
+                self.testRegistry.getConfig('test_ctrlr_1')
+                mockedScandir.assert_not_called()
+
+    def test_refreshUnmodified(self):
+        """
+        The registry must not parse an unmodified configuration again.
+        """
+        with patch(self.timePkg) as mockedTime:
+            mockedTime.monotonic.return_value = 100.0
+            self.testRegistry.listSupported()
+            with patch('pkgs.controller.configRegistry.json.load') \
+                    as mockedLoad:
+                mockedTime.monotonic.return_value = 102.0
+                self.testRegistry.listSupported()
+                mockedLoad.assert_not_called()
+
+    def test_refreshModified(self):
+        """
+        The registry must parse a modified configuration again.
+        """
+        newConfig = {'type': 'joystick'}
+        with patch(self.timePkg) as mockedTime:
+            mockedTime.monotonic.return_value = 100.0
+            self.testRegistry.listSupported()
+            self._writeConfig('test_ctrlr_2', newConfig, mtime=10)
+            mockedTime.monotonic.return_value = 102.0
+            testResult = self.testRegistry.getConfig('test_ctrlr_2')
+            self.assertEqual(testResult, newConfig)
+
+    def test_refreshAddedRemoved(self):
+        """
+        The registry must index the added configurations and drop the
+        removed ones.
+        """
+        with patch(self.timePkg) as mockedTime:
+            mockedTime.monotonic.return_value = 100.0
+            self.testRegistry.listSupported()
+            os.remove(os.path.join(self.rootDir, 'test_ctrlr_1.json'))
+            self._writeConfig('test_ctrlr_3', {'type': 'pedals'})
+            mockedTime.monotonic.return_value = 102.0
+            testResult = self.testRegistry.listSupported()
+            self.assertEqual(sorted(testResult),
+                             ['test_ctrlr_2', 'test_ctrlr_3'])
+
+    def test_invalidate(self):
+        """
+        The invalidate method must force a check on the next lookup.
+        """
+        with patch(self.timePkg) as mockedTime:
+            mockedTime.monotonic.return_value = 100.0
+            self.testRegistry.listSupported()
+            self._writeConfig('test_ctrlr_3', {'type': 'pedals'})
+            self.testRegistry.invalidate()
+            self.assertTrue(self.testRegistry.isSupported('test_ctrlr_3'))
+
+    def test_refreshInvalid(self):
+        """
+        The registry must log and skip the configurations that cannot be
+        parsed or read.
+        """
+        with open(os.path.join(self.rootDir, 'broken.json'), 'w') \
+                as configFile:
+            configFile.write('{"type": ')
+        os.mkdir(os.path.join(self.rootDir, 'unreadable.json'))
+        with self.assertLogs('CTRLR_CONFIG', 'ERROR') as logs:
+            testResult = self.testRegistry.listSupported()
+        self.assertEqual(sorted(testResult), sorted(self.testConfigs))
+        self.assertEqual(len(logs.records), 2)
+        self.assertFalse(self.testRegistry.isSupported('broken'))
+
+    def test_refreshInvalidModified(self):
+        """
+        A configuration broken by a modification must be dropped.
+        """
+        self.testRegistry.listSupported()
+        path = os.path.join(self.rootDir, 'test_ctrlr_1.json')
+        with open(path, 'w') as configFile:
+            configFile.write('not json')
+        os.utime(path, (1, 1))
+        self.testRegistry.invalidate()
+        with self.assertLogs('CTRLR_CONFIG', 'ERROR'):
+            self.assertFalse(self.testRegistry.isSupported('test ctrlr 1'))
+        self.assertTrue(self.testRegistry.isSupported('test ctrlr 2'))
@@ -0,0 +1,120 @@
+from unittest import TestCase
+
+import json
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.controller.controlMap import ControlMap  # noqa: E402
+
+
+class TestControlMap(TestCase):
+    """
+    The ControlMap class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        with open('src/pkgs/controller/configs/logitech_driving_force.json') \
+                as configFile:
+            self.testConfig = json.load(configFile)
+        self.testConfig[ControlMap.CTRLS_KEY][ControlMap.AXES_KEY] = \
+            ['clutch', 'brake', 'steering', 'throttle']
+        self.testCtrlMap = ControlMap(self.testConfig)
+
+    def test_constructorControls(self):
+        """
+        The constructor must save the controller type and controls.
+        """
+        controls = self.testConfig[ControlMap.CTRLS_KEY]
+        self.assertEqual(self.testCtrlMap.type,
+                         self.testConfig[ControlMap.TYPE_KEY])
+        self.assertEqual(self.testCtrlMap.axes,
+                         tuple(controls[ControlMap.AXES_KEY]))
+        self.assertEqual(self.testCtrlMap.buttons,
+                         tuple(controls[ControlMap.BTNS_KEY]))
+        self.assertEqual(self.testCtrlMap.hats,
+                         tuple(controls[ControlMap.HATS_KEY]))
+
+    def test_constructorDrivingAxes(self):
+        """
+        The constructor must resolve the axis index of the driving
+        functions.
+        """
+        self.assertEqual(self.testCtrlMap.steeringAxis, 2)
+        self.assertEqual(self.testCtrlMap.throttleAxis, 3)
+        self.assertEqual(self.testCtrlMap.brakeAxis, 1)
+
+    def test_constructorUnmappedAxis(self):
+        """
+        The constructor must resolve an unmapped driving function to
+        None.
+        """
+        del self.testConfig[ControlMap.FUNC_KEY][ControlMap.BRK_KEY]
+        testCtrlMap = ControlMap(self.testConfig)
+        self.assertIsNone(testCtrlMap.brakeAxis)
+        self.assertEqual(testCtrlMap.axisFuncs,
+                         (None, None, 'steering', 'throttle'))
+
+    def test_constructorButtonAndHatFuncs(self):
+        """
+        The constructor must resolve the function of each button and hat.
+        """
+        buttons = self.testConfig[ControlMap.CTRLS_KEY][ControlMap.BTNS_KEY]
+        self.assertEqual(self.testCtrlMap.buttonFuncs[buttons.index('x')],
+                         'reverse')
+        self.assertEqual(self.testCtrlMap.buttonFuncs.count(None),
+                         len(buttons) - 1)
+        self.assertEqual(self.testCtrlMap.hatFuncs, (None,))
+
+    def test_constructorUnknownControl(self):
+        """
+        The constructor must raise a ValueError if a function is mapped
+        to an unknown control.
+        """
+        self.testConfig[ControlMap.FUNC_KEY]['pedal'] = 'clutch'
+        with self.assertRaises(ValueError):
+            ControlMap(self.testConfig)
+
+    def test_constructorNoCurves(self):
+        """
+        The constructor must leave the functions without a curve linear.
+        """
+        self.assertIsNone(self.testCtrlMap.steeringCurve)
+        self.assertIsNone(self.testCtrlMap.throttleCurve)
+        self.assertIsNone(self.testCtrlMap.brakeCurve)
+
+    def test_constructorCurves(self):
+        """
+        The constructor must compile the response curves of the driving
+        functions.
+        """
+        self.testConfig[ControlMap.CURVES_KEY] = {
+            'steering': {'type': 'expo', 'expo': 0.5},
+            'throttle': {'type': 'linear'},
+        }
+        testCtrlMap = ControlMap(self.testConfig)
+        self.assertEqual(testCtrlMap.steeringCurve.apply(0.5),
+                         0.5 * 0.5 + 0.5 * 0.5 ** 3)
+        self.assertIsNone(testCtrlMap.throttleCurve)
+        self.assertIsNone(testCtrlMap.brakeCurve)
+
+    def test_constructorUnknownCurveFunction(self):
+        """
+        The constructor must raise a ValueError for the curve of an
+        unknown function.
+        """
+        self.testConfig[ControlMap.CURVES_KEY] = {'clutch': {'type': 'expo'}}
+        with self.assertRaises(ValueError):
+            ControlMap(self.testConfig)
+
+    def test_immutable(self):
+        """
+        The map must be immutable once compiled.
+        """
+        with self.assertRaises(AttributeError):
+            self.testCtrlMap.steeringAxis = 0
+        with self.assertRaises(AttributeError):
+            self.testCtrlMap.newAttribute = 0
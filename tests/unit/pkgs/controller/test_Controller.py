@@ -1,12 +1,20 @@
 from unittest import TestCase
-from unittest.mock import Mock, mock_open, patch
+from unittest.mock import Mock, patch
 
+import json
 import os
 import sys
+import tempfile
+
+import pygame as pg
 
 sys.path.append(os.path.abspath('./src'))
 
+from pkgs.controller.configRegistry import ConfigRegistry  # noqa: E402
 from pkgs.controller.controller import Controller  # noqa: E402
+from pkgs.controller.eventRouter import EventRouter  # noqa: E402
+from pkgs.controller.inputBackend import VirtualBackend  # noqa: E402
+from pkgs.controller.modifiers import Calibration  # noqa: E402
 
 
 class TestController(TestCase):
@@ -17,8 +25,22 @@ class TestController(TestCase):
         """
         Teast cases setup.
         """
-        self.pygamePkg = 'pkgs.controller.controller.pg'
-        self.joystickClass = 'pkgs.controller.controller.joystick.Joystick'
+        self.pygamePkg = 'pkgs.controller.inputBackend.pg'
+        self.joystickClass = 'pkgs.controller.inputBackend.joystick.Joystick'
+        self.registry = Controller.CONFIG_REGISTRY
+        self.store = Controller.CALIBRATION_STORE
+        loadPatcher = patch.object(self.store, 'load', return_value=None)
+        savePatcher = patch.object(self.store, 'save')
+        self.mockedLoad = loadPatcher.start()
+        self.mockedSave = savePatcher.start()
+        self.addCleanup(loadPatcher.stop)
+        self.addCleanup(savePatcher.stop)
+        self.testRouter = EventRouter()
+        routerPatcher = patch.object(Controller, 'EVENT_ROUTER',
+                                     self.testRouter)
+        routerPatcher.start()
+        self.addCleanup(routerPatcher.stop)
+        self.testInstanceId = 3
         self.testLogger = Mock()
         self.testNames = ('test ctrlr 1', 'test ctrlr 2', 'test ctrlr 3')
         self.testIdxes = (0, 1, 2)
@@ -26,18 +48,35 @@ class TestController(TestCase):
         for idx in range(len(self.testNames)):
             mockedJoystick = Mock()
             mockedJoystick.get_name.return_value = self.testNames[idx]
+            mockedJoystick.get_instance_id.return_value = \
+                self.testInstanceId + idx
             self.testJoysticks.append(mockedJoystick)
         with open('src/pkgs/controller/configs/logitech_driving_force.json') \
                 as configFile:
-            self.testConfig = configFile.read()
-        with patch('builtins.open', mock_open(read_data=self.testConfig)), \
+            self.testConfig = json.load(configFile)
+        with patch.object(self.registry, 'getConfig') as mockedGetConfig, \
                 patch(self.joystickClass) as mockedJoystick:
+            mockedGetConfig.return_value = self.testConfig
             mockedJoystick.return_value = self.testJoysticks[0]
             self.testCtrlr = Controller(self.testLogger, 0, self.testNames[0])
         self._setSteeringValues()
         self._setThrottleValues()
         self._setBrakeValues()
 
+    def _makeEvent(self, type: int, **kwargs) -> Mock:
+        """
+        Make a test joystick event.
+
+        Params:
+            type:       The event type.
+            kwargs:     The event attributes.
+
+        Return:
+            The test event.
+        """
+        attributes = {'instance_id': self.testInstanceId, **kwargs}
+        return Mock(type=type, **attributes)
+
     def _setSteeringValues(self):
         """
         Set the test controller steering axis test values.
@@ -90,9 +129,9 @@ class TestController(TestCase):
         The constructor must initialize the pygame joystick.
         """
         self.testJoysticks[0].reset_mock()
-        with patch('builtins.open', mock_open(read_data=self.testConfig)), \
-                patch(self.joystickClass) \
-                as mockedJoystick:
+        with patch.object(self.registry, 'getConfig') as mockedGetConfig, \
+                patch(self.joystickClass) as mockedJoystick:
+            mockedGetConfig.return_value = self.testConfig
             mockedJoystick.return_value = self.testJoysticks[0]
             testCtrlr = Controller(self.testLogger,  # noqa: F841 E501
                                    self.testIdxes[0], self.testNames[0])
@@ -101,17 +140,45 @@ class TestController(TestCase):
 
     def test_constructorLoadConfig(self):
         """
-        The constructor must load the controller configuration.
+        The constructor must get the controller configuration from the
+        registry.
         """
-        expectedPath = os.path.join(Controller.CONFIG_ROOT_DIR,
-                                    f"{self.testNames[0].replace(' ', '_')}.json")  # noqa: E501
-        with patch('builtins.open', mock_open(read_data=self.testConfig)) \
-                as mockedConfigFile, \
+        with patch.object(self.registry, 'getConfig') as mockedGetConfig, \
                 patch(self.joystickClass):
-            testCtrlr = Controller(self.testLogger,  # noqa: F841 E501
+            mockedGetConfig.return_value = self.testConfig
+            testCtrlr = Controller(self.testLogger,
                                    self.testIdxes[0], self.testNames[0])
-            mockedConfigFile.assert_called_once_with(expectedPath)
-            mockedConfigFile().read.assert_called_once()
+            mockedGetConfig.assert_called_once_with(self.testNames[0])
+            self.assertEqual(testCtrlr._config, self.testConfig)
+
+    def test_constructorLoadCalibration(self):
+        """
+        The constructor must load and apply the calibration profile of
+        the joystick GUID and configuration.
+        """
+        testGuid = '030000006d04000024c2000011010000'
+        testCalibration = Calibration(1, 1, 1, -1, 1, -1)
+        self.testJoysticks[0].get_guid.return_value = testGuid
+        self.mockedLoad.reset_mock()
+        self.mockedLoad.return_value = testCalibration
+        with patch.object(self.registry, 'getConfig') as mockedGetConfig, \
+                patch(self.joystickClass) as mockedJoystick:
+            mockedGetConfig.return_value = self.testConfig
+            mockedJoystick.return_value = self.testJoysticks[0]
+            testCtrlr = Controller(self.testLogger,
+                                   self.testIdxes[0], self.testNames[0])
+            self.mockedLoad.assert_called_once_with(testGuid, 'test_ctrlr_1')
+            self.assertTrue(testCtrlr.isCalibrated())
+            self.assertEqual(testCtrlr._calibration, testCalibration)
+            self.assertEqual(testCtrlr._throttleFull, -1)
+
+    def test_constructorNoCalibration(self):
+        """
+        The constructor must leave the controller uncalibrated when there
+        is no calibration profile.
+        """
+        self.assertFalse(self.testCtrlr.isCalibrated())
+        self.assertIsNone(self.testCtrlr._calibration)
 
     def test_initFramework(self):
         """
@@ -122,20 +189,125 @@ class TestController(TestCase):
             mockedPygame.JOYBUTTONDOWN = 1
             mockedPygame.JOYBUTTONUP = 2,
             mockedPygame.JOYHATMOTION = 3
+            mockedPygame.JOYDEVICEADDED = 4
+            mockedPygame.JOYDEVICEREMOVED = 5
             expectedEvents = [mockedPygame.JOYAXISMOTION,
                               mockedPygame.JOYBUTTONDOWN,
                               mockedPygame.JOYBUTTONUP,
-                              mockedPygame.JOYHATMOTION]
+                              mockedPygame.JOYHATMOTION,
+                              mockedPygame.JOYDEVICEADDED,
+                              mockedPygame.JOYDEVICEREMOVED]
             Controller.initFramework()
             mockedPygame.init.assert_called_once()
             mockedPygame.event.set_allowed.assert_called_once_with(expectedEvents)  # noqa: E501
 
+    def test_setBackend(self):
+        """
+        The setBackend method must switch the backend of all the
+        controllers.
+        """
+        testBackend = Mock()
+        with patch.object(Controller, 'BACKEND'):
+            Controller.setBackend(testBackend)
+            self.assertEqual(Controller.BACKEND, testBackend)
+            Controller.initFramework()
+            testBackend.init.assert_called_once()
+
+    def test_listControllersVirtual(self):
+        """
+        The listControllers method must list the supported virtual
+        devices.
+        """
+        testBackend = VirtualBackend('logitech_driving_force')
+        testBackend.addDevice()
+        testBackend.addDevice('unsupported wheel')
+        with patch.object(Controller, 'BACKEND', testBackend):
+            testResult = Controller.listControllers()
+        self.assertEqual(testResult, {'logitech_driving_force': 0})
+
+    def test_virtualController(self):
+        """
+        A controller of a virtual device must compute the modifiers of
+        the device inputs.
+        """
+        testBackend = VirtualBackend('logitech_driving_force')
+        device = testBackend.addDevice()
+        with patch.object(Controller, 'BACKEND', testBackend):
+            testCtrlr = Controller(self.testLogger, 0,
+                                   'logitech_driving_force')
+            ctrlMap = testCtrlr._ctrlMap
+            calibrationSteps = (
+                (ctrlMap.steeringAxis, -1.0), (ctrlMap.steeringAxis, 1.0),
+                (ctrlMap.throttleAxis, 1.0), (ctrlMap.throttleAxis, 0.0),
+                (ctrlMap.brakeAxis, 1.0), (ctrlMap.brakeAxis, 0.0))
+            for seq, (axis, value) in enumerate(calibrationSteps):
+                device.setAxis(axis, value)
+                testCtrlr._calibrate(seq)
+            device.setAxis(ctrlMap.steeringAxis, -0.5)
+            device.setAxis(ctrlMap.throttleAxis, 0.5)
+            device.setAxis(ctrlMap.brakeAxis, 1.0)
+            testCtrlr.processEvents()
+            testResult = testCtrlr.getModifiers()
+        self.assertEqual(testCtrlr.getGuid(), 'virtual-0')
+        self.assertEqual(testResult[:3], (-0.5, 0.5, 0.0))
+
+    def test_applyCalibration(self):
+        """
+        The applyCalibration method must calibrate the controller without
+        saving the calibration profile.
+        """
+        testCalibration = Calibration(0.9, 0.8, 1.0, -1.0, 1.0, -1.0)
+        self.testCtrlr.applyCalibration(testCalibration)
+        self.assertTrue(self.testCtrlr.isCalibrated())
+        self.assertIs(self.testCtrlr.getCalibration(), testCalibration)
+        self.assertEqual(self.testCtrlr._throttleFull, -1.0)
+        self.mockedSave.assert_not_called()
+
+    def test_virtualControllerOpposedPedals(self):
+        """
+        A controller whose pedals go from 1 when off to -1 when full must
+        calibrate and compute the pedal modifiers.
+        """
+        testBackend = VirtualBackend('logitech_driving_force')
+        device = testBackend.addDevice()
+        with patch.object(Controller, 'BACKEND', testBackend):
+            testCtrlr = Controller(self.testLogger, 0,
+                                   'logitech_driving_force')
+            ctrlMap = testCtrlr._ctrlMap
+            calibrationSteps = (
+                (ctrlMap.steeringAxis, -1.0), (ctrlMap.steeringAxis, 1.0),
+                (ctrlMap.throttleAxis, 1.0), (ctrlMap.throttleAxis, -1.0),
+                (ctrlMap.brakeAxis, 1.0), (ctrlMap.brakeAxis, -1.0))
+            for seq, (axis, value) in enumerate(calibrationSteps):
+                device.setAxis(axis, value)
+                self.assertTrue(testCtrlr._calibrate(seq))
+            device.setAxis(ctrlMap.throttleAxis, 0.0)
+            device.setAxis(ctrlMap.brakeAxis, -1.0)
+            testCtrlr.processEvents()
+            testResult = testCtrlr.getModifiers()
+        self.assertTrue(testCtrlr.isCalibrated())
+        self.mockedSave.assert_called_once()
+        self.assertEqual(testResult[1:3], (0.5, 1.0))
+
+    def test_calibrateDegenerate(self):
+        """
+        The _calibrate method must log a degenerate calibration and ask
+        for the sequence to restart.
+        """
+        self.testCtrlr._throttleFull = self.testCtrlr._throttleOff
+        with patch.object(self.testCtrlr, '_saveBrakeFull'):
+            testResult = self.testCtrlr._calibrate(self.testCtrlr.CAL_SEQ - 1)
+        self.assertFalse(testResult)
+        self.assertFalse(self.testCtrlr.isCalibrated())
+        self.mockedSave.assert_not_called()
+        self.testCtrlr._logger.error.assert_called_once()
+
     def test_listConnected(self):
         """
         The _listConnected mothod must return the list of
         connected controller name.
         """
-        with patch('pkgs.controller.controller.joystick') as mockJoystickMod:
+        with patch('pkgs.controller.inputBackend.joystick') as mockJoystickMod:
             mockJoystickMod.get_count.return_value = len(self.testNames)
             mockJoystickMod.Joystick.side_effect = self.testJoysticks
             testResult = Controller._listConnected()
@@ -159,6 +331,61 @@ class TestController(TestCase):
                                                    testSupported)
         self.assertEqual(testResult, expectedList)
 
+    def test_filterUnsupportedExactName(self):
+        """
+        The _filterUnsupported method must only keep the controllers whose
+        normalized name is supported, like the registry isSupported
+        method.
+        """
+        testConnected = ('Test Ctrlr 1', 'test ctrlr', 'ctrlr 1')
+        with tempfile.TemporaryDirectory() as rootDir:
+            for name in ('test_ctrlr_1', 'test_ctrlr_2'):
+                with open(os.path.join(rootDir, f"{name}.json"), 'w') \
+                        as configFile:
+                    json.dump(self.testConfig, configFile)
+            testRegistry = ConfigRegistry(rootDir)
+            testResult = Controller._filterUnsupported(
+                testConnected, testRegistry.listSupported())
+            self.assertEqual(testResult, {'Test Ctrlr 1': 0})
+            for name in testConnected:
+                self.assertEqual(testRegistry.isSupported(name),
+                                 name in testResult)
+
+    def test_getDeviceEvents(self):
+        """
+        The getDeviceEvents method must get the device added and removed
+        events only.
+        """
+        testEvents = [self._makeEvent(Controller.DEVICE_ADDED,
+                                      device_index=1)]
+        with patch('pkgs.controller.inputBackend.event') as mockedEvent:
+            mockedEvent.get.return_value = testEvents
+            testResult = Controller.getDeviceEvents()
+            mockedEvent.get.assert_called_once_with(
+                (Controller.DEVICE_ADDED, Controller.DEVICE_REMOVED))
+            self.assertEqual(testResult, testEvents)
+
+    def test_describeDevice(self):
+        """
+        The describeDevice method must return the device name and
+        instance ID.
+        """
+        self.testJoysticks[1].get_instance_id.return_value = 7
+        with patch(self.joystickClass) as mockedJoystick:
+            mockedJoystick.return_value = self.testJoysticks[1]
+            testResult = Controller.describeDevice(self.testIdxes[1])
+            mockedJoystick.assert_called_once_with(self.testIdxes[1])
+            self.assertEqual(testResult, (self.testNames[1], 7))
+
+    def test_isSupported(self):
+        """
+        The isSupported method must check the registry.
+        """
+        with patch.object(self.registry, 'isSupported') as mockedSupported:
+            mockedSupported.return_value = True
+            self.assertTrue(Controller.isSupported(self.testNames[0]))
+            mockedSupported.assert_called_once_with(self.testNames[0])
+
     def test_listControllerConncted(self):
         """
         The listController method must list the connected controller.
@@ -166,38 +393,39 @@ class TestController(TestCase):
         with patch.object(Controller, '_listConnected') \
                 as mockedListConnected, \
                 patch.object(Controller, '_filterUnsupported'), \
-                patch('pkgs.controller.controller.os.listdir'):
+                patch.object(self.registry, 'listSupported'):
             Controller.listControllers()
             mockedListConnected.assert_called_once()
 
     def test_listControllerSupported(self):
         """
-        The listController method must list the supported controller.
+        The listController method must list the supported controller
+        from the registry.
         """
         with patch.object(Controller, '_listConnected'), \
                 patch.object(Controller, '_filterUnsupported'), \
-                patch('pkgs.controller.controller.os.listdir') as mockedListDir:    # noqa: E501
+                patch.object(self.registry, 'listSupported') \
+                as mockedListSupported:
             Controller.listControllers()
-            mockedListDir.assert_called_once_with(Controller.CONFIG_ROOT_DIR)
+            mockedListSupported.assert_called_once()
 
     def test_listControllerFilterUnsupported(self):
         """
         The listController method must filter the unsupported controllers.
         """
-        testSupported = [f"{self.testNames[0].replace(' ', '_')}.json",
-                         f"{self.testNames[2].replace(' ', '_')}.json"]
-        expectedSupported = (f"{self.testNames[0].replace(' ', '_')}",
-                             f"{self.testNames[2].replace(' ', '_')}")
+        testSupported = (f"{self.testNames[0].replace(' ', '_')}",
+                         f"{self.testNames[2].replace(' ', '_')}")
         with patch.object(Controller, '_listConnected') \
                 as mockedListConnected, \
                 patch.object(Controller, '_filterUnsupported') \
                 as mockedFilterUnsupported, \
-                patch('pkgs.controller.controller.os.listdir') as mockedListSupported:  # noqa: E501
+                patch.object(self.registry, 'listSupported') \
+                as mockedListSupported:
             mockedListConnected.return_value = self.testNames
             mockedListSupported.return_value = testSupported
             Controller.listControllers()
             mockedFilterUnsupported.assert_called_once_with(self.testNames,
-                                                            expectedSupported)
+                                                            testSupported)
 
     def test_listController(self):
         """
@@ -210,7 +438,7 @@ class TestController(TestCase):
         with patch.object(Controller, '_listConnected'), \
                 patch.object(Controller, '_filterUnsupported') \
                 as mockedFilterUnsupported, \
-                patch('pkgs.controller.controller.os.listdir'):
+                patch.object(self.registry, 'listSupported'):
             mockedFilterUnsupported.return_value = expectedList
             testResult = Controller.listControllers()
             self.assertEqual(testResult, expectedList)
@@ -219,7 +447,7 @@ class TestController(TestCase):
         """
         The _saveSteeringLeft must save the fully left steering axis.
         """
-        expectedAxisIdx = self.testCtrlr._getAxesMap().index('steering')
+        expectedAxisIdx = self.testCtrlr._ctrlMap.steeringAxis
         expectedAxisValue = -0.97
         self.testJoysticks[0].get_axis.return_value = expectedAxisValue
         self.testCtrlr._saveSteeringLeft()
@@ -231,7 +459,7 @@ class TestController(TestCase):
         """
         The _saveSteeringRight must save the fully right steering axis.
         """
-        expectedAxisIdx = self.testCtrlr._getAxesMap().index('steering')
+        expectedAxisIdx = self.testCtrlr._ctrlMap.steeringAxis
         expectedAxisValue = -0.43
         self.testJoysticks[0].get_axis.return_value = expectedAxisValue
         self.testCtrlr._saveSteeringRight()
@@ -243,117 +471,45 @@ class TestController(TestCase):
         """
         The _saveThrottleOff must save the fully off throttle axis.
         """
-        expectedAxisIdx = self.testCtrlr._getAxesMap().index('throttle')
+        expectedAxisIdx = self.testCtrlr._ctrlMap.throttleAxis
         expectedAxisValue = -0.27
         self.testJoysticks[0].get_axis.return_value = expectedAxisValue
         self.testCtrlr._saveThrottleOff()
         self.testJoysticks[0].get_axis.assert_called_once_with(expectedAxisIdx)
-        self.assertEqual(self.testCtrlr._throttleOff,
-                         abs(expectedAxisValue))
+        self.assertEqual(self.testCtrlr._throttleOff, expectedAxisValue)
 
     def test_saveThrottleFull(self):
         """
         The _saveThrottleFull must save the fully on throttle axis.
         """
-        expectedAxisIdx = self.testCtrlr._getAxesMap().index('throttle')
+        expectedAxisIdx = self.testCtrlr._ctrlMap.throttleAxis
         expectedAxisValue = -0.78
         self.testJoysticks[0].get_axis.return_value = expectedAxisValue
         self.testCtrlr._saveThrottleFull()
         self.testJoysticks[0].get_axis.assert_called_once_with(expectedAxisIdx)
-        self.assertEqual(self.testCtrlr._throttleFull,
-                         abs(expectedAxisValue))
+        self.assertEqual(self.testCtrlr._throttleFull, expectedAxisValue)
 
     def test_saveBrakeOff(self):
         """
         The _saveBrakeOff must save the fully off brake axis.
         """
-        expectedAxisIdx = self.testCtrlr._getAxesMap().index('brake')
+        expectedAxisIdx = self.testCtrlr._ctrlMap.brakeAxis
         expectedAxisValue = -0.10
         self.testJoysticks[0].get_axis.return_value = expectedAxisValue
         self.testCtrlr._saveBrakeOff()
         self.testJoysticks[0].get_axis.assert_called_once_with(expectedAxisIdx)
-        self.assertEqual(self.testCtrlr._brakeOff,
-                         abs(expectedAxisValue))
+        self.assertEqual(self.testCtrlr._brakeOff, expectedAxisValue)
 
     def test_saveBrakeFull(self):
         """
         The _saveBrakeFull must save the fully on brake axis.
         """
-        expectedAxisIdx = self.testCtrlr._getAxesMap().index('brake')
+        expectedAxisIdx = self.testCtrlr._ctrlMap.brakeAxis
         expectedAxisValue = -0.86
         self.testJoysticks[0].get_axis.return_value = expectedAxisValue
         self.testCtrlr._saveBrakeFull()
         self.testJoysticks[0].get_axis.assert_called_once_with(expectedAxisIdx)
-        self.assertEqual(self.testCtrlr._brakeFull,
-                         abs(expectedAxisValue))
-
-    def test_getAxesMap(self):
-        """
-        The _getAxesMap method must return the controller axes mapping.
-        """
-        testResult = self.testCtrlr._getAxesMap()
-        self.assertEqual(testResult,
-                         self.testCtrlr._config[Controller.CTRLS_KEY][Controller.AXES_KEY])    # noqa: E501
-
-    def test_getButtonsMap(self):
-        """
-        The _getButtonsMap method must return the controller buttons mapping.
-        """
-        testResult = self.testCtrlr._getButtonsMap()
-        self.assertEqual(testResult,
-                         self.testCtrlr._config[Controller.CTRLS_KEY][Controller.BTNS_KEY])    # noqa: E501
-
-    def test_getHatsMap(self):
-        """
-        The _getHatsMap method must return the controller hats mapping.
-        """
-        testResult = self.testCtrlr._getHatsMap()
-        self.assertEqual(testResult,
-                         self.testCtrlr._config[Controller.CTRLS_KEY][Controller.HATS_KEY])    # noqa: E501
-
-    def test_getFuncMap(self):
-        """
-        The _getFuncMap method must return the controller functions mapping.
-        """
-        testResult = self.testCtrlr._getFuncMap()
-        self.assertEqual(testResult,
-                         self.testCtrlr._config[Controller.FUNC_KEY])
-
-    def test_getSterringModifier(self):
-        """
-        The _getSterringModifier must return the sterring modifer.
-        """
-        expectedAxisIdx = self.testCtrlr._getAxesMap().index(Controller.STRG_KEY)       # noqa: E501
-        for idx, value in enumerate(self.steeringAxisValues):
-            self.testJoysticks[0].get_axis.return_value = value
-            testResult = self.testCtrlr._getSteeringModifier()
-            self.testJoysticks[0].get_axis.assert_called_once_with(expectedAxisIdx)     # noqa: E501
-            self.testJoysticks[0].get_axis.reset_mock()
-            self.assertEqual(testResult, self.expectedSteeringMod[idx])
-
-    def test_getThrottleModifier(self):
-        """
-        The _getThrottleModifier must return the throttle modifier.
-        """
-        expectedAxisIdx = self.testCtrlr._getAxesMap().index(Controller.THRTL_KEY)      # noqa: E501
-        for idx, value in enumerate(self.throttleAxisValues):
-            self.testJoysticks[0].get_axis.return_value = value
-            testResult = self.testCtrlr._getThrottleModifier()
-            self.testJoysticks[0].get_axis.assert_called_once_with(expectedAxisIdx)     # noqa: E501
-            self.testJoysticks[0].get_axis.reset_mock()
-            self.assertEqual(testResult, self.expectedThrottleMod[idx])
-
-    def test_getBrakeModifier(self):
-        """
-        The _getBrakeModifier must return the brake modifier.
-        """
-        expectedAxisIdx = self.testCtrlr._getAxesMap().index(Controller.BRK_KEY)        # noqa: E501
-        for idx, value in enumerate(self.brakeAxisValues):
-            self.testJoysticks[0].get_axis.return_value = value
-            testResult = self.testCtrlr._getBrakeModifier()
-            self.testJoysticks[0].get_axis.assert_called_once_with(expectedAxisIdx)     # noqa: E501
-            self.testJoysticks[0].get_axis.reset_mock()
-            self.assertEqual(testResult, self.expectedBrakeMod[idx])
+        self.assertEqual(self.testCtrlr._brakeFull, expectedAxisValue)
 
     def test_calibrateSaveStrgLeft(self):
         """
@@ -428,6 +584,60 @@ class TestController(TestCase):
             mockedSave.assert_called_once()
             self.assertTrue(self.testCtrlr._isCalibrated)
 
+    def test_calibrateCompileCalibration(self):
+        """
+        The _calibrate method must compile the calibration and read the
+        axes positions when the calibration sequence is complete.
+        """
+        testCalibSeqNumber = 5
+        with patch.object(self.testCtrlr, '_saveBrakeFull'), \
+                patch.object(self.testCtrlr, '_readAxes') as mockedReadAxes:
+            self.testCtrlr._calibrate(testCalibSeqNumber)
+            mockedReadAxes.assert_called_once()
+            self.assertEqual(self.testCtrlr._calibration.positions,
+                             (self.testCtrlr._steeringLeft,
+                              self.testCtrlr._steeringRight,
+                              self.testCtrlr._throttleOff,
+                              self.testCtrlr._throttleFull,
+                              self.testCtrlr._brakeOff,
+                              self.testCtrlr._brakeFull))
+
+    def test_calibrateSaveProfile(self):
+        """
+        The _calibrate method must save the calibration profile when the
+        calibration sequence is complete.
+        """
+        testGuid = '030000006d04000024c2000011010000'
+        self.testJoysticks[0].get_guid.return_value = testGuid
+        with patch.object(self.testCtrlr, '_saveBrakeFull'), \
+                patch.object(self.testCtrlr, '_readAxes'):
+            self.testCtrlr._calibrate(self.testCtrlr.CAL_SEQ - 1)
+            self.mockedSave.assert_called_once_with(
+                testGuid, 'test_ctrlr_1', self.testCtrlr._calibration)
+
+    def test_calibrateSaveProfileError(self):
+        """
+        The _calibrate method must complete the calibration even if the
+        profile cannot be saved.
+        """
+        self.mockedSave.side_effect = OSError('read-only')
+        with patch.object(self.testCtrlr, '_saveBrakeFull'), \
+                patch.object(self.testCtrlr, '_readAxes'):
+            self.testCtrlr._calibrate(self.testCtrlr.CAL_SEQ - 1)
+            self.assertTrue(self.testCtrlr.isCalibrated())
+
+    def test_readAxes(self):
+        """
+        The _readAxes method must read the mapped axes positions.
+        """
+        ctrlMap = self.testCtrlr._ctrlMap
+        self.testJoysticks[0].get_axis.side_effect = lambda axis: axis / 10
+        self.testCtrlr._readAxes()
+        self.assertEqual(self.testCtrlr._axisValues,
+                         {ctrlMap.steeringAxis: ctrlMap.steeringAxis / 10,
+                          ctrlMap.throttleAxis: ctrlMap.throttleAxis / 10,
+                          ctrlMap.brakeAxis: ctrlMap.brakeAxis / 10})
+
     def test_getName(self):
         """
         The getName method must return the controller name.
@@ -444,6 +654,20 @@ class TestController(TestCase):
         testResult = self.testCtrlr.getIdx()
         self.assertEqual(testResult, self.testIdxes[0])
 
+    def test_getInstanceId(self):
+        """
+        The getInstanceId method must return the joystick instance ID.
+        """
+        self.assertEqual(self.testCtrlr.getInstanceId(), self.testInstanceId)
+
+    def test_getGuid(self):
+        """
+        The getGuid method must return the joystick GUID.
+        """
+        expectedGuid = '030000006d04000024c2000011010000'
+        self.testJoysticks[0].get_guid.return_value = expectedGuid
+        self.assertEqual(self.testCtrlr.getGuid(), expectedGuid)
+
     def test_getType(self):
         """
         The getType method must return the controller type.
@@ -452,24 +676,243 @@ class TestController(TestCase):
         self.assertEqual(testResult,
                          self.testCtrlr._config[Controller.TYPE_KEY])
 
+    def test_getConfigName(self):
+        """
+        The getConfigName method must return the normalized configuration
+        name.
+        """
+        self.assertEqual(self.testCtrlr.getConfigName(), 'test_ctrlr_1')
+
+    def test_getCalibration(self):
+        """
+        The getCalibration method must return the controller calibration.
+        """
+        testCalibration = Calibration(1, 1, 1, 0, 1, 0)
+        self.testCtrlr._calibration = testCalibration
+        self.assertEqual(self.testCtrlr.getCalibration(), testCalibration)
+
+    def test_isCalibrated(self):
+        """
+        The isCalibrated method must return the calibration state.
+        """
+        self.assertFalse(self.testCtrlr.isCalibrated())
+        self.testCtrlr._isCalibrated = True
+        self.assertTrue(self.testCtrlr.isCalibrated())
+
+    def test_getModifiers(self):
+        """
+        The getModifiers method must return the steering, throttle and
+        brake modifiers snapshot of the latest axes positions.
+        """
+        self.testCtrlr._calibration = \
+            Calibration(self.testCtrlr._steeringLeft,
+                        self.testCtrlr._steeringRight,
+                        self.testCtrlr._throttleOff,
+                        self.testCtrlr._throttleFull,
+                        self.testCtrlr._brakeOff,
+                        self.testCtrlr._brakeFull)
+        ctrlMap = self.testCtrlr._ctrlMap
+        for idx in range(len(self.brakeAxisValues)):
+            self.testCtrlr._axisValues = {
+                ctrlMap.steeringAxis: self.steeringAxisValues[idx],
+                ctrlMap.throttleAxis: self.throttleAxisValues[idx],
+                ctrlMap.brakeAxis: self.brakeAxisValues[idx],
+            }
+            with patch('pkgs.controller.controller.time') as mockedTime:
+                mockedTime.monotonic.return_value = 42.0 + idx
+                testResult = self.testCtrlr.getModifiers()
+            self.assertEqual(testResult,
+                             (self.expectedSteeringMod[idx],
+                              self.expectedThrottleMod[idx],
+                              self.expectedBrakeMod[idx], 42.0 + idx))
+
+    def test_getModifiersCurves(self):
+        """
+        The getModifiers method must shape the modifiers with the
+        response curves before rounding them.
+        """
+        self.testConfig['curves'] = {
+            'steering': {'type': 'expo', 'expo': 1.0},
+            'brake': {'type': 'scurve', 'gain': 2.0},
+        }
+        with patch.object(self.registry, 'getConfig') as mockedGetConfig, \
+                patch(self.joystickClass) as mockedJoystick:
+            mockedGetConfig.return_value = self.testConfig
+            mockedJoystick.return_value = self.testJoysticks[0]
+            testCtrlr = Controller(self.testLogger, 0, self.testNames[0])
+        testCtrlr._calibration = Calibration(1, 1, 1, 0, 1, 0)
+        ctrlMap = testCtrlr._ctrlMap
+        testCtrlr._axisValues = {ctrlMap.steeringAxis: -0.5,
+                                 ctrlMap.throttleAxis: 0.25,
+                                 ctrlMap.brakeAxis: 0.75}
+        testResult = testCtrlr.getModifiers(1.0)
+        self.assertEqual(testResult, (-0.12, 0.75, 0.1, 1.0))
+
+    def test_getModifiersTimestamp(self):
+        """
+        The getModifiers method must stamp the snapshot with the given
+        timestamp.
+        """
+        self.testCtrlr._calibration = Calibration(1, 1, 1, 0, 1, 0)
+        testResult = self.testCtrlr.getModifiers(12.5)
+        self.assertEqual(testResult.timestamp, 12.5)
+
     def test_processEventsNotCalibrated(self):
         """
         The processEvents method must not process event if not calibrated.
         """
-        with patch('pkgs.controller.controller.event') as mockedEvent:
+        testEvents = [self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.1)]
+        with patch.object(self.testCtrlr, '_processAxis') \
+                as mockedProcessAxis:
+            self.testCtrlr.processEvents(testEvents)
+            mockedProcessAxis.assert_not_called()
+
+    def test_processEventsPump(self):
+        """
+        The processEvents method must pump the pending events without a
+        batch.
+        """
+        with patch.object(Controller, 'pumpEvents') as mockedPump:
             self.testCtrlr.processEvents()
-            mockedEvent.get.assert_not_called()
+            mockedPump.assert_called_once()
 
-    def test_processEventPygameEvent(self):
+    def test_pumpEvents(self):
         """
-        The processEvents method must fetch the pygame events.
+        The pumpEvents method must drain the input events once and
+        dispatch them to each controller.
         """
+        with patch.object(self.registry, 'getConfig') as mockedGetConfig, \
+                patch(self.joystickClass) as mockedJoystick:
+            mockedGetConfig.return_value = self.testConfig
+            mockedJoystick.return_value = self.testJoysticks[1]
+            otherCtrlr = Controller(self.testLogger, 1, self.testNames[1])
+        ownEvent = self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.1)
+        otherEvent = self._makeEvent(pg.JOYAXISMOTION,
+                                     instance_id=self.testInstanceId + 1,
+                                     axis=0, value=0.5)
         self.testCtrlr._isCalibrated = True
-        with patch('pkgs.controller.controller.event') as mockedEvent:
-            print(mockedEvent)
-            mockedEvent.return_value = []
+        otherCtrlr._isCalibrated = True
+        with patch('pkgs.controller.inputBackend.event') as mockedEvent:
+            mockedEvent.get.return_value = [ownEvent, otherEvent]
             self.testCtrlr.processEvents()
-            mockedEvent.get.assert_called_once()
+            mockedEvent.get.assert_called_once_with(Controller.INPUT_EVENTS)
+        self.assertEqual(self.testCtrlr._axisValues, {0: 0.1})
+        self.assertEqual(otherCtrlr._axisValues, {0: 0.5})
+
+    def test_processEventsBatch(self):
+        """
+        The processEvents method must process the given batch instead of
+        the pygame events.
+        """
+        testEvents = [self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.1)]
+        self.testCtrlr._isCalibrated = True
+        with patch('pkgs.controller.inputBackend.event') as mockedEvent, \
+                patch.object(self.testCtrlr, '_processAxis') \
+                as mockedProcessAxis:
+            self.testCtrlr.processEvents(testEvents)
+            mockedEvent.get.assert_not_called()
+            mockedProcessAxis.assert_called_once_with(0, 0.1)
+
+    def test_processEventsRecorder(self):
+        """
+        The processEvents method must hand the raw events of its own
+        joystick to the recorder.
+        """
+        ownEvents = [self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.1),
+                     self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.2)]
+        otherEvent = self._makeEvent(pg.JOYAXISMOTION, instance_id=4,
+                                     axis=0, value=0.5)
+        testRecorder = Mock()
+        self.testCtrlr._isCalibrated = True
+        self.testCtrlr.setRecorder(testRecorder)
+        self.testCtrlr.processEvents([ownEvents[0], otherEvent,
+                                      ownEvents[1]])
+        testRecorder.record.assert_called_once_with(ownEvents)
+
+    def test_coalesceEventsLatestAxis(self):
+        """
+        The _coalesceEvents method must keep only the latest value of
+        each axis of each joystick.
+        """
+        testEvents = [
+            self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.1),
+            self._makeEvent(pg.JOYAXISMOTION, axis=1, value=0.7),
+            self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.2),
+            self._makeEvent(pg.JOYAXISMOTION, instance_id=4, axis=0,
+                            value=-0.5),
+            self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.3),
+        ]
+        expectedAxes = {(self.testInstanceId, 0): 0.3,
+                        (self.testInstanceId, 1): 0.7,
+                        (4, 0): -0.5}
+        axes, edges = Controller._coalesceEvents(testEvents)
+        self.assertEqual(axes, expectedAxes)
+        self.assertEqual(edges, [])
+
+    def test_coalesceEventsEdges(self):
+        """
+        The _coalesceEvents method must keep all button and hat events
+        in order.
+        """
+        testEdges = [
+            self._makeEvent(pg.JOYBUTTONDOWN, button=0),
+            self._makeEvent(pg.JOYHATMOTION, hat=0, value=(1, 0)),
+            self._makeEvent(pg.JOYBUTTONUP, button=0),
+            self._makeEvent(pg.JOYBUTTONDOWN, button=0),
+        ]
+        testEvents = [self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.1),
+                      *testEdges]
+        _, edges = Controller._coalesceEvents(testEvents)
+        self.assertEqual(edges, testEdges)
+
+    def test_processAxis(self):
+        """
+        The _processAxis method must save the axis value.
+        """
+        self.testCtrlr._processAxis(2, -0.4)
+        self.assertEqual(self.testCtrlr._axisValues[2], -0.4)
+
+    def test_processEdgeButton(self):
+        """
+        The _processEdge method must save the button states.
+        """
+        self.testCtrlr._processEdge(self._makeEvent(pg.JOYBUTTONDOWN,
+                                                    button=1))
+        self.assertTrue(self.testCtrlr._buttonStates[1])
+        self.testCtrlr._processEdge(self._makeEvent(pg.JOYBUTTONUP,
+                                                    button=1))
+        self.assertFalse(self.testCtrlr._buttonStates[1])
+
+    def test_processEdgeHat(self):
+        """
+        The _processEdge method must save the hat states.
+        """
+        self.testCtrlr._processEdge(self._makeEvent(pg.JOYHATMOTION, hat=0,
+                                                    value=(0, -1)))
+        self.assertEqual(self.testCtrlr._hatStates[0], (0, -1))
+
+    def test_processEventsOwnEvents(self):
+        """
+        The processEvents method must process the coalesced events of
+        its own joystick only.
+        """
+        ownEdge = self._makeEvent(pg.JOYBUTTONDOWN, button=0)
+        testEvents = [
+            self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.1),
+            self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.2),
+            self._makeEvent(pg.JOYAXISMOTION, instance_id=4, axis=1,
+                            value=0.5),
+            ownEdge,
+            self._makeEvent(pg.JOYBUTTONDOWN, instance_id=4, button=0),
+        ]
+        self.testCtrlr._isCalibrated = True
+        with patch.object(self.testCtrlr, '_processAxis') \
+                as mockedProcessAxis, \
+                patch.object(self.testCtrlr, '_processEdge') \
+                as mockedProcessEdge:
+            self.testCtrlr.processEvents(testEvents)
+            mockedProcessAxis.assert_called_once_with(0, 0.2)
+            mockedProcessEdge.assert_called_once_with(ownEdge)
 
     def test_quit(self):
         """
@@ -477,3 +920,18 @@ class TestController(TestCase):
         """
         self.testCtrlr.quit()
         self.testJoysticks[0].quit.assert_called_once()
+
+    def test_routeRegistration(self):
+        """
+        The controller must route its events from its construction until
+        it quits.
+        """
+        testEvent = self._makeEvent(pg.JOYAXISMOTION, axis=0, value=0.1)
+        with patch.object(self.testCtrlr, '_processAxis') \
+                as mockedProcessAxis:
+            self.testCtrlr._isCalibrated = True
+            self.testRouter.dispatch([testEvent])
+            mockedProcessAxis.assert_called_once_with(0, 0.1)
+            self.testCtrlr.quit()
+            self.testRouter.dispatch([testEvent])
+            mockedProcessAxis.assert_called_once()
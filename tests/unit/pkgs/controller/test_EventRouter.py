@@ -0,0 +1,70 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.controller.eventRouter import EventRouter  # noqa: E402
+
+
+class TestEventRouter(TestCase):
+    """
+    The EventRouter class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testHandlers = {0: Mock(), 1: Mock()}
+        self.testRouter = EventRouter()
+        for instanceId, handler in self.testHandlers.items():
+            self.testRouter.register(instanceId, handler)
+
+    def test_dispatch(self):
+        """
+        The dispatch method must hand each joystick its events in order.
+        """
+        testEvents = [Mock(instance_id=0), Mock(instance_id=1),
+                      Mock(instance_id=0)]
+        self.testRouter.dispatch(testEvents)
+        self.testHandlers[0].assert_called_once_with([testEvents[0],
+                                                      testEvents[2]])
+        self.testHandlers[1].assert_called_once_with([testEvents[1]])
+
+    def test_dispatchNoEvents(self):
+        """
+        The dispatch method must not call the handlers of the joysticks
+        without events.
+        """
+        self.testRouter.dispatch([Mock(instance_id=1)])
+        self.testHandlers[0].assert_not_called()
+
+    def test_dispatchUnknownJoystick(self):
+        """
+        The dispatch method must drop the events of unknown joysticks.
+        """
+        self.testRouter.dispatch([Mock(instance_id=7)])
+        for handler in self.testHandlers.values():
+            handler.assert_not_called()
+
+    def test_unregister(self):
+        """
+        The unregister method must stop routing the joystick events.
+        """
+        self.testRouter.unregister(0)
+        self.testRouter.unregister(7)
+        self.testRouter.dispatch([Mock(instance_id=0)])
+        self.testHandlers[0].assert_not_called()
+
+    def test_registerReplace(self):
+        """
+        The register method must replace the previous handler of the
+        joystick.
+        """
+        newHandler = Mock()
+        self.testRouter.register(0, newHandler)
+        self.testRouter.dispatch([Mock(instance_id=0)])
+        newHandler.assert_called_once()
+        self.testHandlers[0].assert_not_called()
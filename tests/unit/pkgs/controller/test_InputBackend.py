@@ -0,0 +1,142 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import os
+import sys
+
+import pygame as pg
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.controller.inputBackend import PygameBackend, \
+    VirtualBackend  # noqa: E402
+
+
+class TestPygameBackend(TestCase):
+    """
+    The PygameBackend class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testBackend = PygameBackend()
+
+    def test_getCount(self):
+        """
+        The getCount method must return the pygame joystick count.
+        """
+        with patch('pkgs.controller.inputBackend.joystick') as mockedJoystick:
+            mockedJoystick.get_count.return_value = 2
+            self.assertEqual(self.testBackend.getCount(), 2)
+
+    def test_getDevice(self):
+        """
+        The getDevice method must return the pygame joystick.
+        """
+        with patch('pkgs.controller.inputBackend.joystick') as mockedJoystick:
+            testResult = self.testBackend.getDevice(1)
+            mockedJoystick.Joystick.assert_called_once_with(1)
+            self.assertEqual(testResult, mockedJoystick.Joystick.return_value)
+
+    def test_getEvents(self):
+        """
+        The getEvents method must get the pygame events of the types.
+        """
+        testTypes = (pg.JOYAXISMOTION,)
+        with patch('pkgs.controller.inputBackend.event') as mockedEvent:
+            testResult = self.testBackend.getEvents(testTypes)
+            mockedEvent.get.assert_called_once_with(testTypes)
+            self.assertEqual(testResult, mockedEvent.get.return_value)
+
+
+class TestVirtualBackend(TestCase):
+    """
+    The VirtualBackend class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.deviceEvents = (pg.JOYDEVICEADDED, pg.JOYDEVICEREMOVED)
+        self.inputEvents = (pg.JOYAXISMOTION, pg.JOYBUTTONDOWN,
+                            pg.JOYBUTTONUP, pg.JOYHATMOTION)
+        self.testBackend = VirtualBackend('test_ctrlr')
+
+    def test_addDevice(self):
+        """
+        The addDevice method must connect a device named after the
+        configuration and post its added event.
+        """
+        firstDevice = self.testBackend.addDevice()
+        secondDevice = self.testBackend.addDevice('other ctrlr')
+        self.assertEqual(self.testBackend.getCount(), 2)
+        self.assertEqual(self.testBackend.getDevice(0), firstDevice)
+        self.assertEqual(firstDevice.get_name(), 'test_ctrlr')
+        self.assertEqual(secondDevice.get_name(), 'other ctrlr')
+        self.assertNotEqual(firstDevice.get_instance_id(),
+                            secondDevice.get_instance_id())
+        testResult = self.testBackend.getEvents(self.deviceEvents)
+        self.assertEqual([ev.device_index for ev in testResult], [0, 1])
+
+    def test_removeDevice(self):
+        """
+        The removeDevice method must disconnect the device and post its
+        removed event.
+        """
+        device = self.testBackend.addDevice()
+        self.testBackend.removeDevice(device)
+        self.assertEqual(self.testBackend.getCount(), 0)
+        testResult = self.testBackend.getEvents((pg.JOYDEVICEREMOVED,))
+        self.assertEqual([ev.instance_id for ev in testResult],
+                         [device.get_instance_id()])
+
+    def test_getEventsByType(self):
+        """
+        The getEvents method must drain the events of the types and keep
+        the others in order.
+        """
+        device = self.testBackend.addDevice()
+        device.setAxis(0, 0.5)
+        device.setButton(2, True)
+        device.setHat(0, (1, 0))
+        testResult = self.testBackend.getEvents(self.inputEvents)
+        self.assertEqual([ev.type for ev in testResult],
+                         [pg.JOYAXISMOTION, pg.JOYBUTTONDOWN,
+                          pg.JOYHATMOTION])
+        self.assertEqual(self.testBackend.getEvents(self.inputEvents), [])
+        self.assertEqual(len(self.testBackend.getEvents(self.deviceEvents)),
+                         1)
+
+    def test_deviceState(self):
+        """
+        The virtual joystick must keep the state of its controls.
+        """
+        device = self.testBackend.addDevice()
+        device.setAxis(1, -0.25)
+        device.setButton(3, True)
+        device.setHat(0, (0, -1))
+        self.assertEqual(device.get_axis(1), -0.25)
+        self.assertTrue(device.get_button(3))
+        self.assertEqual(device.get_hat(0), (0, -1))
+        self.assertEqual(device.get_guid(), 'virtual-0')
+
+    def test_playEvents(self):
+        """
+        The playEvents method must replay the events on the device.
+        """
+        device = self.testBackend.addDevice()
+        testEvents = [
+            pg.event.Event(pg.JOYAXISMOTION, instance_id=9, axis=2,
+                           value=0.75),
+            pg.event.Event(pg.JOYBUTTONDOWN, instance_id=9, button=1),
+            pg.event.Event(pg.JOYBUTTONUP, instance_id=9, button=1),
+            pg.event.Event(pg.JOYHATMOTION, instance_id=9, hat=0,
+                           value=(-1, 0)),
+        ]
+        device.playEvents(testEvents)
+        testResult = self.testBackend.getEvents(self.inputEvents)
+        self.assertEqual(testResult,
+                         [pg.event.Event(ev.type, ev.dict, instance_id=0)
+                          for ev in testEvents])
+        self.assertEqual(device.get_axis(2), 0.75)
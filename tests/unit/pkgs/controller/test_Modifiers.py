@@ -0,0 +1,120 @@
+from unittest import TestCase
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.controller.modifiers import Calibration, \
+    computeModifiersArray    # noqa: E402
+
+
+class TestCalibration(TestCase):
+    """
+    The Calibration class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.ndigit = 2
+        self.testPositions = (0.8, 0.9, 1.0, 0.0, 0.9, 0.1)
+        self.testCalibration = Calibration(*self.testPositions)
+        self.testSamples = [(-0.8, 1.0, 0.9), (-0.2, 0.75, 0.5),
+                            (0.0, 0.5, 0.1), (0.45, 0.0, 0.3),
+                            (0.9, 0.2, 0.7)]
+
+    def _expectedModifiers(self, sample: tuple) -> tuple:
+        """
+        Compute the expected modifiers the way the single axis
+        modifiers do.
+
+        Params:
+            sample:     The steering, throttle and brake positions.
+
+        Return:
+            The expected modifiers.
+        """
+        left, right, thrtlOff, thrtlFull, brkOff, brkFull = \
+            self.testPositions
+        steeringPos, throttlePos, brakePos = sample
+        if steeringPos < 0:
+            steering = round(steeringPos / left, self.ndigit)
+        else:
+            steering = round(steeringPos / right, self.ndigit)
+        throttle = round((thrtlOff - throttlePos) / (thrtlOff - thrtlFull),
+                         self.ndigit)
+        brake = round((brkOff - brakePos) / (brkOff - brkFull), self.ndigit)
+        return steering, throttle, brake
+
+    def test_constructorDegenerate(self):
+        """
+        The constructor must raise a ValueError if a calibration range
+        is empty.
+        """
+        for positions in ((0, 0.9, 1.0, 0.0, 0.9, 0.1),
+                          (0.8, 0.9, 1.0, 1.0, 0.9, 0.1),
+                          (0.8, 0.9, 1.0, 0.0, 0.5, 0.5)):
+            with self.assertRaises(ValueError):
+                Calibration(*positions)
+
+    def test_constructorVectors(self):
+        """
+        The constructor must compile the offset and scale vectors.
+        """
+        self.assertEqual(self.testCalibration.positions, self.testPositions)
+        self.assertEqual(self.testCalibration.offsets, (0.0, 1.0, 0.9))
+        self.assertEqual(self.testCalibration.negScales[0], 1 / 0.8)
+        self.assertEqual(self.testCalibration.posScales[0], 1 / 0.9)
+        self.assertEqual(self.testCalibration.negScales[1:],
+                         self.testCalibration.posScales[1:])
+
+    def test_apply(self):
+        """
+        The apply method must compute the modifiers of a sample.
+        """
+        for sample in self.testSamples:
+            testResult = self.testCalibration.apply(*sample, self.ndigit)
+            self.assertEqual(testResult, self._expectedModifiers(sample))
+
+    def test_applyNoRounding(self):
+        """
+        The apply method must not round the modifiers without a digit
+        number.
+        """
+        testResult = self.testCalibration.apply(-0.3, 0.333, 0.9)
+        for modifier, expected in zip(testResult, (-0.375, 0.667, 0.0)):
+            self.assertAlmostEqual(modifier, expected)
+
+    def test_applyArray(self):
+        """
+        The applyArray method must compute the modifiers of a batch of
+        samples.
+        """
+        expectedModifiers = [self._expectedModifiers(sample)
+                             for sample in self.testSamples]
+        testResult = self.testCalibration.applyArray(self.testSamples,
+                                                     self.ndigit)
+        np.testing.assert_allclose(testResult, expectedModifiers)
+
+    def test_stackVectors(self):
+        """
+        The stackVectors method must stack the vectors of many
+        calibrations to compute the modifiers of many controllers.
+        """
+        otherCalibration = Calibration(1.0, 1.0, 1.0, 0.0, 1.0, 0.0)
+        offsets, negScales, posScales = \
+            Calibration.stackVectors([self.testCalibration,
+                                      otherCalibration])
+        self.assertEqual(offsets.shape, (2, 3))
+        samples = np.array([self.testSamples[1], self.testSamples[1]])
+        testResult = computeModifiersArray(samples, offsets, negScales,
+                                           posScales, self.ndigit)
+        np.testing.assert_allclose(testResult[0],
+                                   self.testCalibration
+                                   .apply(*self.testSamples[1], self.ndigit))
+        np.testing.assert_allclose(testResult[1],
+                                   otherCalibration
+                                   .apply(*self.testSamples[1], self.ndigit))
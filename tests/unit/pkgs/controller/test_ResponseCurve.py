@@ -0,0 +1,93 @@
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.controller.responseCurve import ResponseCurve  # noqa: E402
+
+
+class TestResponseCurve(TestCase):
+    """
+    The ResponseCurve class test cases.
+    """
+    def test_constructorTable(self):
+        """
+        The constructor must tabulate the clamped curve over [0, 1].
+        """
+        testCurve = ResponseCurve(lambda x: 2 * x - 0.5, size=5)
+        self.assertEqual(list(testCurve.table), [0.0, 0.0, 0.5, 1.0, 1.0])
+
+    def test_applyIndexedRead(self):
+        """
+        The apply method must read the nearest table entry and mirror the
+        negative modifiers.
+        """
+        testCurve = ResponseCurve(lambda x: x * x, size=5)
+        self.assertEqual(testCurve.apply(0.5), 0.25)
+        self.assertEqual(testCurve.apply(0.55), 0.25)
+        self.assertEqual(testCurve.apply(-0.75), -0.5625)
+        self.assertEqual(testCurve.apply(0.0), 0.0)
+
+    def test_applyOutOfRange(self):
+        """
+        The apply method must saturate the modifiers beyond 1.
+        """
+        testCurve = ResponseCurve(lambda x: x, size=5)
+        self.assertEqual(testCurve.apply(1.2), 1.0)
+        self.assertEqual(testCurve.apply(-1.2), -1.0)
+
+    def test_fromConfigLinear(self):
+        """
+        The fromConfig method must compile the linear curve.
+        """
+        testCurve = ResponseCurve.fromConfig({'type': 'linear'})
+        self.assertEqual(testCurve.apply(0.5), 0.5)
+
+    def test_fromConfigExpo(self):
+        """
+        The fromConfig method must compile the expo curve.
+        """
+        testCurve = ResponseCurve.fromConfig({'type': 'expo', 'expo': 1.0})
+        self.assertEqual(testCurve.apply(0.5), 0.125)
+        self.assertEqual(testCurve.apply(1.0), 1.0)
+
+    def test_fromConfigScurve(self):
+        """
+        The fromConfig method must compile the S-curve, soft at both
+        ends and centered on 0.5.
+        """
+        testCurve = ResponseCurve.fromConfig({'type': 'scurve',
+                                              'gain': 3.0})
+        self.assertEqual(testCurve.apply(0.5), 0.5)
+        self.assertLess(testCurve.apply(0.25), 0.25)
+        self.assertGreater(testCurve.apply(0.75), 0.75)
+
+    def test_fromConfigSpline(self):
+        """
+        The fromConfig method must compile a monotone spline through the
+        points.
+        """
+        points = [[0.0, 0.0], [0.5, 0.2], [0.75, 0.3], [1.0, 1.0]]
+        testCurve = ResponseCurve.fromConfig({'type': 'spline',
+                                              'points': points})
+        for x, y in points:
+            self.assertAlmostEqual(testCurve.apply(x), y)
+        table = list(testCurve.table)
+        self.assertTrue(all(y1 >= y0 for y0, y1 in zip(table, table[1:])))
+
+    def test_fromConfigInvalid(self):
+        """
+        The fromConfig method must raise a ValueError for an invalid
+        configuration.
+        """
+        for config in ({'type': 'cubic'},
+                       {'type': 'expo', 'expo': 2.0},
+                       {'type': 'scurve', 'gain': 0.5},
+                       {'type': 'spline', 'points': [[0.0, 0.0]]},
+                       {'type': 'spline',
+                        'points': [[0.0, 0.0], [0.6, 0.5], [0.5, 0.6],
+                                   [1.0, 1.0]]}):
+            with self.assertRaises(ValueError):
+                ResponseCurve.fromConfig(config)
@@ -0,0 +1,164 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock
+
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.cmdCodec import WhldCmdCodec      # noqa: E402
+from pkgs.fleetBench import BenchPublisher, FleetBench, SimUnit  # noqa: E402
+from pkgs.latency import LatencyHistogram   # noqa: E402
+from pkgs.mqttBroker import MqttBroker      # noqa: E402
+
+
+class TestBenchPublisher(TestCase):
+    """
+    The BenchPublisher class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testPublisher = BenchPublisher()
+        self.testPublisher._loop = Mock()
+        self.testPublisher._writer = Mock()
+        self.testCodec = WhldCmdCodec('unit/1/cmd')
+
+    def test_publishRawBatch(self):
+        """
+        The publishRaw method must wake the event loop once per batch and
+        write the batch in a single call.
+        """
+        for _ in range(3):
+            self.testPublisher.publishRaw(self.testCodec.topic,
+                                          self.testCodec.encode(0.5, 0.5))
+        self.testPublisher._loop.call_soon_threadsafe \
+            .assert_called_once_with(self.testPublisher._flush)
+        self.testPublisher._flush()
+        self.testPublisher._writer.write.assert_called_once()
+        self.assertEqual(self.testPublisher.getSentCount(), 3)
+
+    def test_sendTimes(self):
+        """
+        The publishRaw method must stamp each command by topic and
+        sequence number.
+        """
+        before = time.perf_counter()
+        for _ in range(2):
+            self.testPublisher.publishRaw(self.testCodec.topic,
+                                          self.testCodec.encode(0.0, 0.0))
+        sent = self.testPublisher.popSendTime(self.testCodec.topic, 1)
+        self.assertGreaterEqual(sent, before)
+        self.assertIsNone(self.testPublisher.popSendTime(
+            self.testCodec.topic, 1))
+        self.testPublisher.reset()
+        self.assertIsNone(self.testPublisher.popSendTime(
+            self.testCodec.topic, 0))
+        self.assertEqual(self.testPublisher.getSentCount(), 0)
+
+
+class TestSimUnit(TestCase):
+    """
+    The SimUnit class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testPublisher = Mock()
+        self.testHistogram = LatencyHistogram()
+        self.testUnit = SimUnit('sim-0', 'unit/0/cmd', self.testPublisher,
+                                self.testHistogram)
+        self.testCodec = WhldCmdCodec('unit/0/cmd')
+
+    def test_onCommand(self):
+        """
+        The onCommand method must record the latency of the stamped
+        commands.
+        """
+        self.testPublisher.popSendTime.return_value = \
+            time.perf_counter() - 0.002
+        self.testUnit.onCommand('unit/0/cmd', self.testCodec.encode(0, 0))
+        self.testPublisher.popSendTime.assert_called_once_with('unit/0/cmd',
+                                                               0)
+        self.assertEqual(self.testUnit.receivedCount, 1)
+        self.assertEqual(self.testHistogram.getCount(), 1)
+        self.assertGreaterEqual(self.testHistogram.getMax(), 2000)
+
+    def test_onCommandUnstamped(self):
+        """
+        The onCommand method must count the unstamped commands without
+        recording their latency.
+        """
+        self.testPublisher.popSendTime.return_value = None
+        self.testUnit.onCommand('unit/0/cmd', self.testCodec.encode(0, 0))
+        self.assertEqual(self.testUnit.receivedCount, 1)
+        self.assertEqual(self.testHistogram.getCount(), 0)
+
+    def test_onCommandInvalid(self):
+        """
+        The onCommand method must count the invalid commands.
+        """
+        self.testUnit.onCommand('unit/0/cmd', b'\x00')
+        self.assertEqual(self.testUnit.invalidCount, 1)
+        self.assertEqual(self.testUnit.receivedCount, 0)
+
+
+class TestFleetBench(IsolatedAsyncioTestCase):
+    """
+    The FleetBench class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testLogger = Mock()
+        self.testUnits = []
+        self.testBench = FleetBench(self.testLogger, rate=50,
+                                    unitFactory=self._makeUnit)
+        self.testBench.SETTLE_TIME = 0.05
+
+    def _makeUnit(self, appLogger, client, unitId, topic):
+        """
+        Make a unit publishing a binary command on each send.
+        """
+        codec = WhldCmdCodec(topic)
+        unit = Mock()
+        unit.sendCommandMsg.side_effect = \
+            lambda: client.publishRaw(topic, codec.encode(0, 0))
+        self.testUnits.append(unit)
+        return unit
+
+    async def test_runStepInvalid(self):
+        """
+        The runStep method must reject an invalid unit count.
+        """
+        with self.assertRaises(ValueError):
+            await self.testBench.runStep(0, 0.1)
+
+    async def test_runStep(self):
+        """
+        The runStep method must drive every unit from the scheduler and
+        report the fleet throughput and latency.
+        """
+        broker = MqttBroker(self.testLogger, users={'bench': 'secret'})
+        broker.start()
+        self.testBench._host = '127.0.0.1'
+        self.testBench._port = broker.getPort()
+        self.testBench._username = 'bench'
+        self.testBench._password = 'secret'
+        try:
+            report = await self.testBench.runStep(3, 0.2)
+        finally:
+            broker.stop()
+        self.assertEqual(report['units'], 3)
+        self.assertEqual(len(self.testUnits), 3)
+        for unit in self.testUnits:
+            unit.updateSteeringCmd.assert_called_once()
+            unit.sendCommandMsg.assert_called()
+        self.assertGreater(report['sent'], 0)
+        self.assertEqual(report['received'], report['sent'])
+        self.assertEqual(report['latency']['count'], report['sent'])
+        self.assertGreater(report['rss'], 0)
@@ -0,0 +1,259 @@
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.controller import ModifierSnapshot   # noqa: E402
+from pkgs.inputPoller import InputPoller    # noqa: E402
+
+
+class TestInputPoller(TestCase):
+    """
+    The InputPoller class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.timePkg = 'pkgs.inputPoller.inputPoller.time'
+        self.ctrlrClass = 'pkgs.inputPoller.inputPoller.Controller'
+        self.testLogger = Mock()
+        self.testRate = 200
+        self.testModifiers = ModifierSnapshot(-0.25, 0.5, 0.0, 12.5)
+        self.testCtrlr = Mock()
+        self.testCtrlr.isCalibrated.return_value = True
+        self.testCtrlr.getModifiers.return_value = self.testModifiers
+        self.testUnit = Mock()
+        self.testCmdFilter = Mock()
+        self.testCmdFilter.update.side_effect = lambda modifiers: modifiers
+        self.testPoller = InputPoller(self.testLogger, self.testRate,
+                                      self.testCmdFilter)
+
+    def test_constructorRateOutOfRange(self):
+        """
+        The constructor must raise a ValueError if the rate is out of
+        range.
+        """
+        for rate in (InputPoller.MIN_RATE - 1, InputPoller.MAX_RATE + 1):
+            with self.assertRaises(ValueError):
+                InputPoller(self.testLogger, rate)
+
+    def test_constructorPeriod(self):
+        """
+        The constructor must compute the polling period from the rate.
+        """
+        self.assertEqual(self.testPoller._period, 1 / self.testRate)
+
+    def test_setController(self):
+        """
+        The setController method must save the controller and reset the
+        latest modifiers.
+        """
+        self.testPoller._latest = self.testModifiers
+        self.testPoller.setController(self.testCtrlr)
+        self.assertEqual(self.testPoller._ctrlr, self.testCtrlr)
+        self.assertIsNone(self.testPoller.getLatest())
+
+    def test_setUnit(self):
+        """
+        The setUnit method must save the unit.
+        """
+        self.testPoller.setUnit(self.testUnit)
+        self.assertEqual(self.testPoller._unit, self.testUnit)
+
+    def test_setUnitResetFilter(self):
+        """
+        The setUnit method must reset the command filter so the new
+        unit gets a command right away.
+        """
+        self.testPoller.setUnit(self.testUnit)
+        self.testCmdFilter.reset.assert_called_once()
+
+    def test_setDeviceHandler(self):
+        """
+        The setDeviceHandler method must save the device handler.
+        """
+        testHandler = Mock()
+        self.testPoller.setDeviceHandler(testHandler)
+        self.assertEqual(self.testPoller._deviceHandler, testHandler)
+
+    def test_tickDeviceEvents(self):
+        """
+        The _tick method must hand each device event to the device
+        handler.
+        """
+        testEvents = [Mock(), Mock()]
+        testHandler = Mock()
+        self.testPoller.setDeviceHandler(testHandler)
+        with patch(self.ctrlrClass) as mockedCtrlr:
+            mockedCtrlr.getDeviceEvents.return_value = testEvents
+            self.testPoller._tick()
+            self.assertEqual(testHandler.call_args_list,
+                             [call(ev) for ev in testEvents])
+
+    def test_tickNoDeviceHandler(self):
+        """
+        The _tick method must leave the device events without a device
+        handler.
+        """
+        with patch(self.ctrlrClass) as mockedCtrlr:
+            self.testPoller._tick()
+            mockedCtrlr.getDeviceEvents.assert_not_called()
+
+    def test_tickNoController(self):
+        """
+        The _tick method must do nothing without a controller.
+        """
+        self.testPoller.setUnit(self.testUnit)
+        self.testPoller._tick()
+        self.testUnit.sendCommandMsg.assert_not_called()
+
+    def test_tickNotCalibrated(self):
+        """
+        The _tick method must process the controller events but not
+        compute the modifiers if the controller is not calibrated.
+        """
+        self.testCtrlr.isCalibrated.return_value = False
+        self.testPoller.setController(self.testCtrlr)
+        self.testPoller._tick()
+        self.testCtrlr.processEvents.assert_called_once()
+        self.testCtrlr.getModifiers.assert_not_called()
+
+    def test_tickLatest(self):
+        """
+        The _tick method must save the latest modifiers.
+        """
+        self.testPoller.setController(self.testCtrlr)
+        self.testPoller._tick()
+        self.assertEqual(self.testPoller.getLatest(), self.testModifiers)
+
+    def test_tickUnit(self):
+        """
+        The _tick method must update and send the unit command.
+        """
+        self.testPoller.setController(self.testCtrlr)
+        self.testPoller.setUnit(self.testUnit)
+        self.testPoller._tick()
+        self.testUnit.updateSteeringCmd \
+            .assert_called_once_with(self.testModifiers.steering)
+        self.testUnit.updateThrottleCmd \
+            .assert_called_once_with(self.testModifiers.throttle,
+                                     self.testModifiers.brake)
+        self.testUnit.sendCommandMsg.assert_called_once()
+
+    def test_tickFiltered(self):
+        """
+        The _tick method must send the filtered command.
+        """
+        filteredModifiers = self.testModifiers._replace(steering=-0.2)
+        self.testCmdFilter.update.side_effect = None
+        self.testCmdFilter.update.return_value = filteredModifiers
+        self.testPoller.setController(self.testCtrlr)
+        self.testPoller.setUnit(self.testUnit)
+        self.testPoller._tick()
+        self.testCmdFilter.update.assert_called_once_with(self.testModifiers)
+        self.testUnit.updateSteeringCmd \
+            .assert_called_once_with(filteredModifiers.steering)
+        self.assertEqual(self.testPoller.getLatest(), self.testModifiers)
+
+    def test_tickSuppressed(self):
+        """
+        The _tick method must not send the command suppressed by the
+        filter.
+        """
+        self.testCmdFilter.update.side_effect = None
+        self.testCmdFilter.update.return_value = None
+        self.testPoller.setController(self.testCtrlr)
+        self.testPoller.setUnit(self.testUnit)
+        self.testPoller._tick()
+        self.testUnit.sendCommandMsg.assert_not_called()
+
+    def test_publish(self):
+        """
+        The publish method must save the latest modifiers and send the
+        filtered unit command.
+        """
+        self.testPoller.setUnit(self.testUnit)
+        self.testPoller.publish(self.testModifiers)
+        self.assertEqual(self.testPoller.getLatest(), self.testModifiers)
+        self.testCmdFilter.update.assert_called_once_with(self.testModifiers)
+        self.testUnit.sendCommandMsg.assert_called_once()
+
+    def test_publishLatency(self):
+        """
+        The publish method must track the latency of the sent command
+        from the events dequeue.
+        """
+        testLatency = Mock()
+        testPoller = InputPoller(self.testLogger, self.testRate,
+                                 self.testCmdFilter, testLatency)
+        testPoller.setUnit(self.testUnit)
+        testPoller.publish(self.testModifiers, 12.0)
+        self.testUnit.sendCommandMsg.assert_called_once_with(
+            testLatency, 12.0, self.testModifiers.timestamp)
+
+    def test_publishLatencyNoDequeue(self):
+        """
+        The publish method must not track the latency without the events
+        dequeue time.
+        """
+        testLatency = Mock()
+        testPoller = InputPoller(self.testLogger, self.testRate,
+                                 self.testCmdFilter, testLatency)
+        testPoller.setUnit(self.testUnit)
+        testPoller.publish(self.testModifiers)
+        self.testUnit.sendCommandMsg.assert_called_once_with()
+
+    def test_tickDequeueTime(self):
+        """
+        The _tick method must publish the modifiers with the time the
+        events were dequeued.
+        """
+        self.testPoller.setController(self.testCtrlr)
+        with patch(self.timePkg) as mockedTime, \
+                patch.object(self.testPoller, 'publish') as mockedPublish:
+            mockedTime.monotonic.return_value = 11.5
+            self.testPoller._tick()
+            mockedPublish.assert_called_once_with(self.testModifiers, 11.5)
+
+    def test_waitNextTickOnSchedule(self):
+        """
+        The _waitNextTick method must wait until the next deadline.
+        """
+        period = self.testPoller._period
+        with patch(self.timePkg) as mockedTime, \
+                patch.object(self.testPoller._stopEvent, 'wait') \
+                as mockedWait:
+            mockedTime.monotonic.return_value = 10.0 + period / 4
+            testResult = self.testPoller._waitNextTick(10.0)
+            self.assertEqual(testResult, 10.0 + period)
+            mockedWait.assert_called_once()
+            self.assertAlmostEqual(mockedWait.call_args[0][0],
+                                   period * 3 / 4)
+            self.assertEqual(self.testPoller.getOverruns(), 0)
+
+    def test_waitNextTickOverrun(self):
+        """
+        The _waitNextTick method must skip the missed ticks and keep the
+        schedule aligned.
+        """
+        period = self.testPoller._period
+        with patch(self.timePkg) as mockedTime, \
+                patch.object(self.testPoller._stopEvent, 'wait'):
+            mockedTime.monotonic.return_value = 10.0 + period * 3.5
+            testResult = self.testPoller._waitNextTick(10.0)
+            self.assertAlmostEqual(testResult, 10.0 + period * 3)
+            self.assertEqual(self.testPoller.getOverruns(), 2)
+
+    def test_runStop(self):
+        """
+        The run method must poll until the poller is stopped.
+        """
+        self.testPoller.setController(self.testCtrlr)
+        self.testPoller.start()
+        self.testPoller.stop()
+        self.assertFalse(self.testPoller.is_alive())
+        self.testCtrlr.processEvents.assert_called()
@@ -0,0 +1,163 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import os
+import sys
+import tempfile
+
+import pygame as pg
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.controller import Calibration  # noqa: E402
+from pkgs.inputRecord import InputRecorder  # noqa: E402
+from pkgs.inputRecord.recordFormat import HEADER, RECORD, AXIS, \
+    BUTTON_DOWN, BUTTON_UP, HAT, decodeRecord, encodeEvent    # noqa: E402
+
+
+class TestRecordFormat(TestCase):
+    """
+    The record format test cases.
+    """
+    def test_encodeDecode(self):
+        """
+        The encodeEvent and decodeRecord functions must round trip the
+        input events.
+        """
+        testEvents = [
+            pg.event.Event(pg.JOYAXISMOTION, instance_id=1, axis=2,
+                           value=-0.337),
+            pg.event.Event(pg.JOYBUTTONDOWN, instance_id=1, button=7),
+            pg.event.Event(pg.JOYBUTTONUP, instance_id=1, button=7),
+            pg.event.Event(pg.JOYHATMOTION, instance_id=1, hat=0,
+                           value=(-1, 1)),
+        ]
+        for ev in testEvents:
+            timestamp, *fields = RECORD.unpack(encodeEvent(1.5, ev))
+            self.assertEqual(timestamp, 1.5)
+            self.assertEqual(decodeRecord(5, *fields),
+                             pg.event.Event(ev.type, ev.dict,
+                                            instance_id=5))
+
+    def test_encodeKinds(self):
+        """
+        The encodeEvent function must encode the record kind.
+        """
+        testCases = ((pg.event.Event(pg.JOYAXISMOTION, axis=0, value=0.0),
+                      AXIS),
+                     (pg.event.Event(pg.JOYBUTTONDOWN, button=0),
+                      BUTTON_DOWN),
+                     (pg.event.Event(pg.JOYBUTTONUP, button=0), BUTTON_UP),
+                     (pg.event.Event(pg.JOYHATMOTION, hat=0, value=(0, 0)),
+                      HAT))
+        for ev, kind in testCases:
+            self.assertEqual(RECORD.unpack(encodeEvent(0.0, ev))[1], kind)
+
+    def test_encodeNotInput(self):
+        """
+        The encodeEvent function must return None for a non-input event.
+        """
+        ev = pg.event.Event(pg.JOYDEVICEADDED, device_index=0)
+        self.assertIsNone(encodeEvent(0.0, ev))
+
+    def test_decodeUnknownKind(self):
+        """
+        The decodeRecord function must raise a ValueError for an unknown
+        record kind.
+        """
+        with self.assertRaises(ValueError):
+            decodeRecord(0, 42, 0, 0, 0, 0.0)
+
+
+class TestInputRecorder(TestCase):
+    """
+    The InputRecorder class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.timePkg = 'pkgs.inputRecord.inputRecorder.time'
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.recordPath = os.path.join(self.tmpDir.name, 'session.rcir')
+        self.testCalibration = Calibration(1, 1, 1, -1, 1, -1)
+        self.testEvents = [
+            pg.event.Event(pg.JOYAXISMOTION, instance_id=0, axis=0,
+                           value=0.5),
+            pg.event.Event(pg.JOYBUTTONDOWN, instance_id=0, button=1),
+        ]
+
+    def tearDown(self):
+        """
+        Test cases teardown.
+        """
+        self.tmpDir.cleanup()
+
+    def _readRecords(self) -> list:
+        """
+        Read the records of the test recording.
+
+        Return:
+            The list of records.
+        """
+        with open(self.recordPath, 'rb') as recordFile:
+            data = recordFile.read()
+        return list(RECORD.iter_unpack(data[HEADER.size:]))
+
+    def test_constructorHeader(self):
+        """
+        The constructor must write the header with the configuration
+        name and calibration.
+        """
+        testRecorder = InputRecorder(self.recordPath, 'test_ctrlr',
+                                     self.testCalibration)
+        testRecorder.close()
+        with open(self.recordPath, 'rb') as recordFile:
+            _, _, hasCalibration, *positions, configName = \
+                HEADER.unpack(recordFile.read())
+        self.assertTrue(hasCalibration)
+        self.assertEqual(tuple(positions), self.testCalibration.positions)
+        self.assertEqual(configName.rstrip(b'\0'), b'test_ctrlr')
+
+    def test_constructorNameTooLong(self):
+        """
+        The constructor must raise a ValueError if the configuration name
+        does not fit the header.
+        """
+        with self.assertRaises(ValueError):
+            InputRecorder(self.recordPath, 'x' * 33)
+
+    def test_record(self):
+        """
+        The record method must append one record per event stamped with
+        the time elapsed since the start.
+        """
+        with patch(self.timePkg) as mockedTime:
+            mockedTime.monotonic.return_value = 100.0
+            testRecorder = InputRecorder(self.recordPath, 'test_ctrlr')
+            mockedTime.monotonic.return_value = 100.25
+            testRecorder.record(self.testEvents)
+            testRecorder.close()
+        testResult = self._readRecords()
+        self.assertEqual(testRecorder.getRecordCount(), 2)
+        self.assertEqual([record[:3] for record in testResult],
+                         [(0.25, AXIS, 0), (0.25, BUTTON_DOWN, 1)])
+        self.assertEqual(testResult[0][5], 0.5)
+
+    def test_recordTimestamp(self):
+        """
+        The record method must use the given timestamp.
+        """
+        testRecorder = InputRecorder(self.recordPath, 'test_ctrlr')
+        testRecorder.record(self.testEvents[:1], 3.0)
+        testRecorder.close()
+        self.assertEqual(self._readRecords()[0][0], 3.0)
+
+    def test_recordClosed(self):
+        """
+        The record method must ignore the events once closed.
+        """
+        testRecorder = InputRecorder(self.recordPath, 'test_ctrlr')
+        testRecorder.close()
+        testRecorder.record(self.testEvents)
+        self.assertEqual(testRecorder.getRecordCount(), 0)
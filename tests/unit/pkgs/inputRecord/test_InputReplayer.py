@@ -0,0 +1,230 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import os
+import sys
+import tempfile
+
+import pygame as pg
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.controller import Calibration, Controller  # noqa: E402
+from pkgs.controller.inputBackend import VirtualBackend  # noqa: E402
+from pkgs.inputRecord import InputRecorder, InputReplayer  # noqa: E402
+
+
+class TestInputReplayer(TestCase):
+    """
+    The InputReplayer class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.timePkg = 'pkgs.inputRecord.inputReplayer.time'
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.recordPath = os.path.join(self.tmpDir.name, 'session.rcir')
+        self.testCalibration = Calibration(1, 1, 1, -1, 1, -1)
+        self.testBatches = [
+            (0.1, [pg.event.Event(pg.JOYAXISMOTION, instance_id=0, axis=0,
+                                  value=0.5),
+                   pg.event.Event(pg.JOYAXISMOTION, instance_id=0, axis=0,
+                                  value=0.75)]),
+            (0.2, [pg.event.Event(pg.JOYHATMOTION, instance_id=0, hat=0,
+                                  value=(1, 0))]),
+            (0.5, [pg.event.Event(pg.JOYBUTTONUP, instance_id=0,
+                                  button=3)]),
+        ]
+        recorder = InputRecorder(self.recordPath, 'test_ctrlr',
+                                 self.testCalibration)
+        for timestamp, events in self.testBatches:
+            recorder.record(events, timestamp)
+        recorder.close()
+        self.testReplayer = InputReplayer(self.recordPath)
+        self.testCtrlr = Mock()
+        self.testCtrlr.getInstanceId.return_value = 7
+        self.testCtrlr.isCalibrated.return_value = True
+
+    def tearDown(self):
+        """
+        Test cases teardown.
+        """
+        self.testReplayer.close()
+        self.tmpDir.cleanup()
+
+    def _expectedBatches(self, instanceId: int) -> list:
+        """
+        Get the expected replayed batches.
+
+        Params:
+            instanceId: The replayed joystick instance ID.
+
+        Return:
+            The expected batches.
+        """
+        return [(timestamp,
+                 [pg.event.Event(ev.type, ev.dict, instance_id=instanceId)
+                  for ev in events])
+                for timestamp, events in self.testBatches]
+
+    def test_constructorHeader(self):
+        """
+        The constructor must read the recording header.
+        """
+        self.assertEqual(self.testReplayer.getConfigName(), 'test_ctrlr')
+        self.assertEqual(self.testReplayer.getCalibration().positions,
+                         self.testCalibration.positions)
+        self.assertEqual(self.testReplayer.getRecordCount(), 4)
+        self.assertEqual(self.testReplayer.getDuration(), 0.5)
+
+    def test_constructorNoCalibration(self):
+        """
+        The constructor must not create a calibration if the controller
+        was not calibrated.
+        """
+        InputRecorder(self.recordPath, 'test_ctrlr').close()
+        testReplayer = InputReplayer(self.recordPath)
+        self.assertIsNone(testReplayer.getCalibration())
+        self.assertEqual(testReplayer.getDuration(), 0.0)
+        testReplayer.close()
+
+    def test_constructorInvalid(self):
+        """
+        The constructor must raise a ValueError for an empty, truncated
+        or foreign file.
+        """
+        for content in (b'', b'RCIR', b'X' * 256):
+            with open(self.recordPath, 'wb') as recordFile:
+                recordFile.write(content)
+            with self.assertRaises(ValueError):
+                InputReplayer(self.recordPath)
+
+    def test_constructorPartialRecord(self):
+        """
+        The constructor must ignore a partial trailing record.
+        """
+        with open(self.recordPath, 'ab') as recordFile:
+            recordFile.write(b'\0' * 5)
+        testReplayer = InputReplayer(self.recordPath)
+        self.assertEqual(testReplayer.getRecordCount(), 4)
+        testReplayer.close()
+
+    def test_iterBatches(self):
+        """
+        The iterBatches method must rebuild the recorded batches for the
+        given joystick.
+        """
+        testResult = list(self.testReplayer.iterBatches(7))
+        self.assertEqual(testResult, self._expectedBatches(7))
+
+    def test_replayAsFastAsPossible(self):
+        """
+        The replay method must process each batch and publish the
+        modifiers stamped with the recorded timestamp without waiting.
+        """
+        testPublish = Mock()
+        with patch.object(self.testReplayer._stopEvent, 'wait') \
+                as mockedWait:
+            testResult = self.testReplayer.replay(self.testCtrlr,
+                                                  testPublish, None)
+            mockedWait.assert_not_called()
+        self.assertEqual(testResult, len(self.testBatches))
+        self.assertEqual([c.args[0] for c in
+                          self.testCtrlr.processEvents.call_args_list],
+                         [events for _, events in self._expectedBatches(7)])
+        self.assertEqual([c.args[0] for c in
+                          self.testCtrlr.getModifiers.call_args_list],
+                         [timestamp for timestamp, _ in self.testBatches])
+        self.assertEqual(testPublish.call_count, len(self.testBatches))
+
+    def test_replaySpeed(self):
+        """
+        The replay method must pace the batches by the speed factor.
+        """
+        with patch(self.timePkg) as mockedTime, \
+                patch.object(self.testReplayer._stopEvent, 'wait',
+                             return_value=False) as mockedWait:
+            mockedTime.monotonic.return_value = 10.0
+            self.testReplayer.replay(self.testCtrlr, speed=2.0)
+            testResult = [c.args[0] for c in mockedWait.call_args_list]
+            for delay, expectedDelay in zip(testResult, [0.05, 0.1, 0.25]):
+                self.assertAlmostEqual(delay, expectedDelay)
+            self.assertEqual(len(testResult), len(self.testBatches))
+
+    def test_replayNotCalibrated(self):
+        """
+        The replay method must not publish the modifiers of a controller
+        not calibrated.
+        """
+        testPublish = Mock()
+        self.testCtrlr.isCalibrated.return_value = False
+        self.testReplayer.replay(self.testCtrlr, testPublish, None)
+        testPublish.assert_not_called()
+
+    def test_replayAppliesCalibration(self):
+        """
+        The replay method must apply the recorded calibration to a
+        controller not calibrated.
+        """
+        self.testCtrlr.isCalibrated.return_value = False
+        self.testReplayer.replay(self.testCtrlr, speed=None)
+        self.testCtrlr.applyCalibration.assert_called_once_with(
+            self.testReplayer.getCalibration())
+
+    def test_replayKeepsCalibration(self):
+        """
+        The replay method must keep the calibration of a calibrated
+        controller.
+        """
+        self.testReplayer.replay(self.testCtrlr, speed=None)
+        self.testCtrlr.applyCalibration.assert_not_called()
+
+    def test_replayVirtualController(self):
+        """
+        The replay method must compute the modifiers of a controller not
+        calibrated with the recorded calibration.
+        """
+        testBackend = VirtualBackend('logitech_driving_force')
+        testBackend.addDevice()
+        store = Controller.CALIBRATION_STORE
+        with patch.object(Controller, 'BACKEND', testBackend), \
+                patch.object(store, 'load', return_value=None), \
+                patch.object(store, 'save') as mockedSave:
+            testCtrlr = Controller(Mock(), 0, 'logitech_driving_force')
+            ctrlMap = testCtrlr._ctrlMap
+            recordPath = os.path.join(self.tmpDir.name, 'virtual.rcir')
+            recorder = InputRecorder(recordPath, 'logitech_driving_force',
+                                     self.testCalibration)
+            recorder.record([
+                pg.event.Event(pg.JOYAXISMOTION, instance_id=0,
+                               axis=ctrlMap.steeringAxis, value=-0.5),
+                pg.event.Event(pg.JOYAXISMOTION, instance_id=0,
+                               axis=ctrlMap.throttleAxis, value=0.0),
+                pg.event.Event(pg.JOYAXISMOTION, instance_id=0,
+                               axis=ctrlMap.brakeAxis, value=1.0)], 0.1)
+            recorder.close()
+            testReplayer = InputReplayer(recordPath)
+            testPublish = Mock()
+            try:
+                testResult = testReplayer.replay(testCtrlr, testPublish,
+                                                 None)
+            finally:
+                testReplayer.close()
+                testCtrlr.quit()
+            mockedSave.assert_not_called()
+        self.assertEqual(testResult, 1)
+        self.assertTrue(testCtrlr.isCalibrated())
+        testPublish.assert_called_once()
+        self.assertEqual(tuple(testPublish.call_args.args[0]),
+                         (-0.5, 0.5, 0.0, 0.1))
+
+    def test_replayStop(self):
+        """
+        The replay method must end once stopped.
+        """
+        with patch.object(self.testReplayer._stopEvent, 'wait',
+                          return_value=True):
+            testResult = self.testReplayer.replay(self.testCtrlr)
+        self.assertEqual(testResult, 0)
+        self.testCtrlr.processEvents.assert_not_called()
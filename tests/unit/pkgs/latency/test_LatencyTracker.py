@@ -0,0 +1,130 @@
+from unittest import TestCase
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.latency import LatencyHistogram, LatencyTracker  # noqa: E402
+
+
+class TestLatencyHistogram(TestCase):
+    """
+    The LatencyHistogram class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testHistogram = LatencyHistogram()
+
+    def test_bucketBounds(self):
+        """
+        Each value must fall in a bucket whose highest value is at least
+        the value, with a relative error under 2%.
+        """
+        for value in (0, 1, 127, 128, 129, 1000, 65535, 1_000_000,
+                      LatencyHistogram.MAX_VALUE):
+            index = LatencyHistogram._index(value)
+            highest = LatencyHistogram._highestEquivalent(index)
+            self.assertGreaterEqual(highest, value)
+            self.assertLessEqual(highest - value, max(value * 0.02, 0))
+
+    def test_emptyHistogram(self):
+        """
+        An empty histogram must report 0 latencies.
+        """
+        self.assertEqual(self.testHistogram.getCount(), 0)
+        self.assertEqual(self.testHistogram.getPercentile(99), 0)
+        self.assertEqual(self.testHistogram.getMax(), 0)
+
+    def test_percentiles(self):
+        """
+        The getPercentile method must return the latency under which the
+        percentile of the recorded latencies are.
+        """
+        for value in range(1, 101):
+            self.testHistogram.record(value * 1e-6)
+        self.assertEqual(self.testHistogram.getCount(), 100)
+        self.assertEqual(self.testHistogram.getPercentile(50), 50)
+        self.assertEqual(self.testHistogram.getPercentile(99), 99)
+        self.assertEqual(self.testHistogram.getPercentile(100), 100)
+        self.assertEqual(self.testHistogram.getMax(), 100)
+
+    def test_percentileCappedByMax(self):
+        """
+        The getPercentile method must not report more than the maximum.
+        """
+        self.testHistogram.record(0.001001)
+        self.assertEqual(self.testHistogram.getPercentile(50), 1001)
+
+    def test_recordClamped(self):
+        """
+        The record method must clamp the latencies to the histogram
+        range.
+        """
+        self.testHistogram.record(-1.0)
+        self.testHistogram.record(1e6)
+        self.assertEqual(self.testHistogram.getPercentile(50), 0)
+        self.assertEqual(self.testHistogram.getMax(),
+                         LatencyHistogram.MAX_VALUE)
+
+    def test_reset(self):
+        """
+        The reset method must clear the histogram.
+        """
+        self.testHistogram.record(0.5)
+        self.testHistogram.reset()
+        self.assertEqual(self.testHistogram.getCount(), 0)
+        self.assertEqual(self.testHistogram.getMax(), 0)
+
+
+class TestLatencyTracker(TestCase):
+    """
+    The LatencyTracker class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testTracker = LatencyTracker()
+
+    def test_recordCommand(self):
+        """
+        The recordCommand method must record the latency of each stage.
+        """
+        self.testTracker.recordCommand(10.0, 10.000100, 10.000120,
+                                       10.000170)
+        testResult = self.testTracker.getSummary()
+        self.assertEqual(set(testResult), set(LatencyTracker.STAGES))
+        expectedMax = {'modifiers': 100, 'build': 20, 'publish': 50,
+                       'total': 170}
+        for stage, maxLatency in expectedMax.items():
+            self.assertEqual(testResult[stage]['count'], 1)
+            self.assertAlmostEqual(testResult[stage]['max'], maxLatency,
+                                   delta=1)
+            self.assertEqual(testResult[stage]['p50'],
+                             testResult[stage]['max'])
+
+    def test_reset(self):
+        """
+        The reset method must clear every stage.
+        """
+        self.testTracker.recordCommand(1.0, 1.1, 1.2, 1.3)
+        self.testTracker.reset()
+        for stageSummary in self.testTracker.getSummary().values():
+            self.assertEqual(stageSummary['count'], 0)
+
+    def test_dump(self):
+        """
+        The dump method must write the summary to a JSON file.
+        """
+        self.testTracker.recordCommand(1.0, 1.1, 1.2, 1.3)
+        with tempfile.TemporaryDirectory() as tmpDir:
+            path = os.path.join(tmpDir, 'latency.json')
+            self.testTracker.dump(path)
+            with open(path) as dumpFile:
+                self.assertEqual(json.load(dumpFile),
+                                 self.testTracker.getSummary())
@@ -0,0 +1,300 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+from unittest.mock import Mock
+
+import asyncio
+import os
+import queue
+import sys
+import warnings
+
+import paho.mqtt.client as mqtt
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.mqttBroker import MqttBroker      # noqa: E402
+from pkgs.mqttWire import CONNACK, PINGRESP, PUBACK, PUBLISH, SUBACK, \
+    UNSUBACK, connectPacket, disconnectPacket, parseConnack, \
+    parsePacketId, parsePublish, pingreqPacket, publishPacket, \
+    readPacket, subscribePacket  # noqa: E402
+
+
+def _makePahoClient(clientId: str) -> mqtt.Client:
+    """
+    Make a paho client for the installed paho version.
+    """
+    if not hasattr(mqtt, 'CallbackAPIVersion'):
+        return mqtt.Client(clientId)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', DeprecationWarning)
+        return mqtt.Client(mqtt.CallbackAPIVersion.VERSION1, clientId)
+
+
+class TestMqttBrokerPaho(TestCase):
+    """
+    The MqttBroker class test cases with the paho client.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testBroker = MqttBroker(Mock(), users={'commander': '12345'})
+        self.testBroker.start()
+        self.testClients = []
+
+    def tearDown(self):
+        """
+        Test cases teardown.
+        """
+        for client in self.testClients:
+            client.disconnect()
+            client.loop_stop()
+        self.testBroker.stop()
+
+    def _connect(self, clientId: str, password: str = '12345') -> tuple:
+        """
+        Connect a paho client and queue its CONNACK and messages.
+        """
+        client = _makePahoClient(clientId)
+        client.username_pw_set('commander', password)
+        events = queue.Queue()
+        client.on_connect = lambda c, u, f, rc: events.put(('connack', rc))
+        client.on_message = lambda c, u, msg: events.put(
+            (msg.topic, msg.payload, msg.qos, msg.retain))
+        client.on_subscribe = lambda c, u, mid, qos: events.put(
+            ('suback', tuple(qos)))
+        client.connect('127.0.0.1', self.testBroker.getPort())
+        client.loop_start()
+        self.testClients.append(client)
+        return client, events
+
+    def test_connectAuth(self):
+        """
+        The broker must accept the valid credentials and refuse the
+        invalid ones.
+        """
+        _, events = self._connect('good')
+        self.assertEqual(events.get(timeout=2), ('connack', 0))
+        _, events = self._connect('bad', 'wrong')
+        self.assertEqual(events.get(timeout=2),
+                         ('connack', MqttBroker.CONNACK_BAD_CREDENTIALS))
+
+    def test_publishSubscribe(self):
+        """
+        The broker must route the QoS 0 and 1 messages to the wildcard
+        subscribers at the granted QoS.
+        """
+        sub, subEvents = self._connect('sub')
+        self.assertEqual(subEvents.get(timeout=2), ('connack', 0))
+        sub.subscribe([('unit/+/cmd', 1), ('unit/#', 0)])
+        self.assertEqual(subEvents.get(timeout=2), ('suback', (1, 0)))
+        pub, pubEvents = self._connect('pub')
+        self.assertEqual(pubEvents.get(timeout=2), ('connack', 0))
+        pub.publish('unit/1/cmd', b'go', qos=1).wait_for_publish()
+        self.assertEqual(subEvents.get(timeout=2),
+                         ('unit/1/cmd', b'go', 1, False))
+        pub.publish('unit/1/state', b'on', qos=0)
+        self.assertEqual(subEvents.get(timeout=2),
+                         ('unit/1/state', b'on', 0, False))
+        self.assertEqual(self.testBroker.getStats()['delivered'], 2)
+
+    def test_retained(self):
+        """
+        The broker must send the retained message to a new subscriber
+        and clear it on an empty retained message.
+        """
+        pub, pubEvents = self._connect('pub')
+        self.assertEqual(pubEvents.get(timeout=2), ('connack', 0))
+        pub.publish('unit/1/state', b'on', qos=1,
+                    retain=True).wait_for_publish()
+        sub, subEvents = self._connect('sub')
+        self.assertEqual(subEvents.get(timeout=2), ('connack', 0))
+        sub.subscribe('unit/+/state', 1)
+        self.assertEqual(subEvents.get(timeout=2), ('suback', (1,)))
+        self.assertEqual(subEvents.get(timeout=2),
+                         ('unit/1/state', b'on', 1, True))
+        pub.publish('unit/1/state', b'', retain=True).wait_for_publish()
+        self.assertEqual(subEvents.get(timeout=2),
+                         ('unit/1/state', b'', 0, False))
+        self.assertEqual(self.testBroker.getStats()['retained'], 0)
+
+
+class TestMqttBroker(IsolatedAsyncioTestCase):
+    """
+    The MqttBroker class test cases with raw clients.
+    """
+    async def asyncSetUp(self):
+        """
+        Test cases setup.
+        """
+        self.testBroker = MqttBroker(Mock())
+        self.testBroker.start()
+        self.testWriters = []
+
+    async def asyncTearDown(self):
+        """
+        Test cases teardown.
+        """
+        for writer in self.testWriters:
+            writer.close()
+        self.testBroker.stop()
+
+    async def _connect(self, clientId: str, **kwargs) -> tuple:
+        """
+        Connect a raw client.
+        """
+        reader, writer = await asyncio.open_connection(
+            '127.0.0.1', self.testBroker.getPort())
+        self.testWriters.append(writer)
+        writer.write(connectPacket(clientId, **kwargs))
+        packetType, _, body = await readPacket(reader)
+        self.assertEqual((packetType, parseConnack(body)), (CONNACK, 0))
+        return reader, writer
+
+    async def _read(self, reader: asyncio.StreamReader) -> tuple:
+        """
+        Read a packet with a timeout.
+        """
+        return await asyncio.wait_for(readPacket(reader), 2)
+
+    async def test_unsubscribe(self):
+        """
+        The broker must stop routing the messages of an unsubscribed
+        filter.
+        """
+        reader, writer = await self._connect('sub')
+        writer.write(subscribePacket(1, ['a/#']))
+        self.assertEqual((await self._read(reader))[0], SUBACK)
+        writer.write(b'\xa2\x07\x00\x02\x00\x03a/#')
+        packetType, _, body = await self._read(reader)
+        self.assertEqual((packetType, parsePacketId(body)), (UNSUBACK, 2))
+        writer.write(publishPacket('a/b', b'x'))
+        writer.write(pingreqPacket())
+        self.assertEqual((await self._read(reader))[0], PINGRESP)
+
+    async def test_publishQos1Ack(self):
+        """
+        The broker must acknowledge a QoS 1 publish.
+        """
+        reader, writer = await self._connect('pub')
+        writer.write(publishPacket('a', b'x', 1, 42))
+        packetType, _, body = await self._read(reader)
+        self.assertEqual((packetType, parsePacketId(body)), (PUBACK, 42))
+
+    async def test_retainedMixedQos(self):
+        """
+        The broker must send each retained message at the lower of its
+        QoS and the granted QoS.
+        """
+        pubReader, pubWriter = await self._connect('pub')
+        for packetId, (topic, qos) in enumerate(
+                (('r/a', 1), ('r/b', 0), ('r/c', 1)), 1):
+            pubWriter.write(publishPacket(
+                topic, b'x', qos, packetId if qos else None, True))
+        pubWriter.write(pingreqPacket())
+        packetTypes = [(await self._read(pubReader))[0] for _ in range(3)]
+        self.assertEqual(packetTypes, [PUBACK, PUBACK, PINGRESP])
+        reader, writer = await self._connect('sub')
+        writer.write(subscribePacket(1, ['r/#'], 1))
+        self.assertEqual((await self._read(reader))[0], SUBACK)
+        delivered = {}
+        for _ in range(3):
+            packetType, flags, body = await self._read(reader)
+            self.assertEqual(packetType, PUBLISH)
+            message = parsePublish(flags, body)
+            delivered[message.topic] = message.qos
+        self.assertEqual(delivered, {'r/a': 1, 'r/b': 0, 'r/c': 1})
+
+    async def test_publishWildcard(self):
+        """
+        The broker must close a client publishing to a wildcard topic
+        without routing the message.
+        """
+        reader, writer = await self._connect('sub')
+        writer.write(subscribePacket(1, ['#']))
+        self.assertEqual((await self._read(reader))[0], SUBACK)
+        for topic in ('a/+', 'a/#'):
+            pubReader, pubWriter = await self._connect(f"pub {topic}")
+            pubWriter.write(publishPacket(topic, b'x'))
+            with self.assertRaises(asyncio.IncompleteReadError):
+                await self._read(pubReader)
+        writer.write(pingreqPacket())
+        self.assertEqual((await self._read(reader))[0], PINGRESP)
+
+    async def test_will(self):
+        """
+        The broker must publish the will of a lost client only.
+        """
+        reader, writer = await self._connect('sub')
+        writer.write(subscribePacket(1, ['state/#']))
+        self.assertEqual((await self._read(reader))[0], SUBACK)
+        for clientId, graceful in (('lost', False), ('left', True)):
+            body = b'\x00\x04MQTT\x04\x06\x00\x00' + \
+                b''.join(len(field).to_bytes(2, 'big') + field
+                         for field in (clientId.encode(),
+                                       f"state/{clientId}".encode(), b'off'))
+            unitReader, unitWriter = await asyncio.open_connection(
+                '127.0.0.1', self.testBroker.getPort())
+            unitWriter.write(bytes((0x10, len(body))) + body)
+            self.assertEqual((await self._read(unitReader))[0], CONNACK)
+            if graceful:
+                unitWriter.write(disconnectPacket())
+            unitWriter.close()
+        packetType, flags, body = await self._read(reader)
+        self.assertEqual(packetType, PUBLISH)
+        self.assertEqual(parsePublish(flags, body).topic, 'state/lost')
+        await asyncio.sleep(0.1)
+        writer.write(pingreqPacket())
+        self.assertEqual((await self._read(reader))[0], PINGRESP)
+
+    async def test_willWildcard(self):
+        """
+        The broker must refuse a will with a wildcard topic.
+        """
+        body = b'\x00\x04MQTT\x04\x06\x00\x00' + \
+            b''.join(len(field).to_bytes(2, 'big') + field
+                     for field in (b'unit', b'state/+', b'off'))
+        reader, writer = await asyncio.open_connection(
+            '127.0.0.1', self.testBroker.getPort())
+        self.testWriters.append(writer)
+        writer.write(bytes((0x10, len(body))) + body)
+        with self.assertRaises(asyncio.IncompleteReadError):
+            await self._read(reader)
+        self.assertEqual(self.testBroker.getStats()['clients'], 0)
+
+    async def test_takeover(self):
+        """
+        The broker must close the session of a reconnected client ID.
+        """
+        reader, _ = await self._connect('unit')
+        await self._connect('unit')
+        with self.assertRaises(asyncio.IncompleteReadError):
+            await self._read(reader)
+        self.assertEqual(self.testBroker.getStats()['clients'], 1)
+
+    async def test_keepalive(self):
+        """
+        The broker must close a client silent past its keep alive.
+        """
+        self.testBroker.KEEPALIVE_CHECK_PERIOD = 0.05
+        reader, _ = await self._connect('slow', keepalive=1)
+        with self.assertRaises(asyncio.IncompleteReadError):
+            await asyncio.wait_for(readPacket(reader), 3)
+
+    async def test_invalidFirstPacket(self):
+        """
+        The broker must close a connection not starting with CONNECT.
+        """
+        reader, writer = await asyncio.open_connection(
+            '127.0.0.1', self.testBroker.getPort())
+        self.testWriters.append(writer)
+        writer.write(pingreqPacket())
+        with self.assertRaises(asyncio.IncompleteReadError):
+            await self._read(reader)
+
+    async def test_startError(self):
+        """
+        The start method must raise the listening error.
+        """
+        broker = MqttBroker(Mock(), port=self.testBroker.getPort())
+        with self.assertRaises(OSError):
+            broker.start()
@@ -0,0 +1,96 @@
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.mqttBroker import TopicTree       # noqa: E402
+
+
+class TestTopicTree(TestCase):
+    """
+    The TopicTree class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testTree = TopicTree()
+
+    def test_isValidFilter(self):
+        """
+        The isValidFilter method must only accept the whole level
+        wildcards and # as the last level.
+        """
+        for topicFilter in ('a', 'a/b', '+', '#', 'a/+/c', 'a/#', '+/+'):
+            self.assertTrue(TopicTree.isValidFilter(topicFilter))
+        for topicFilter in ('', 'a#', 'a/#/c', 'a+', 'a/b+/c'):
+            self.assertFalse(TopicTree.isValidFilter(topicFilter))
+
+    def test_isValidTopic(self):
+        """
+        The isValidTopic method must refuse the empty topics and the
+        wildcards.
+        """
+        for topic in ('a', 'a/b', '/a', '$SYS/a'):
+            self.assertTrue(TopicTree.isValidTopic(topic))
+        for topic in ('', '+', 'a/+', 'a/#', 'a#'):
+            self.assertFalse(TopicTree.isValidTopic(topic))
+
+    def test_matchFilter(self):
+        """
+        The matchFilter method must match the wildcards level by level,
+        # matching its parent level, and keep the $ topics out of the
+        first level wildcards.
+        """
+        cases = (('a/b', 'a/b', True), ('a/b', 'a/c', False),
+                 ('a/+', 'a/b', True), ('a/+', 'a/b/c', False),
+                 ('a/#', 'a', True), ('a/#', 'a/b/c', True),
+                 ('#', 'a/b', True), ('+/b', 'a/b', True),
+                 ('a/b', 'a', False), ('#', '$SYS/x', False),
+                 ('$SYS/#', '$SYS/x', True))
+        for topicFilter, topic, expected in cases:
+            self.assertEqual(TopicTree.matchFilter(topicFilter, topic),
+                             expected, (topicFilter, topic))
+
+    def test_match(self):
+        """
+        The match method must return each matching subscriber once with
+        its highest QoS.
+        """
+        self.testTree.subscribe('unit/+/cmd', 'sub1', 0)
+        self.testTree.subscribe('unit/#', 'sub1', 1)
+        self.testTree.subscribe('unit/1/cmd', 'sub2', 0)
+        self.testTree.subscribe('#', 'sub3', 0)
+        self.assertEqual(self.testTree.match('unit/1/cmd'),
+                         {'sub1': 1, 'sub2': 0, 'sub3': 0})
+        self.assertEqual(self.testTree.match('unit/2/cmd'),
+                         {'sub1': 1, 'sub3': 0})
+        self.assertEqual(self.testTree.match('$SYS/load'), {})
+
+    def test_matchCache(self):
+        """
+        The match method must not return a stale match after a
+        subscription change.
+        """
+        self.testTree.subscribe('a/+', 'sub1', 0)
+        self.assertEqual(self.testTree.match('a/b'), {'sub1': 0})
+        self.testTree.subscribe('a/b', 'sub2', 1)
+        self.assertEqual(self.testTree.match('a/b'), {'sub1': 0, 'sub2': 1})
+        self.testTree.unsubscribe('a/+', 'sub1')
+        self.assertEqual(self.testTree.match('a/b'), {'sub2': 1})
+
+    def test_unsubscribe(self):
+        """
+        The unsubscribe method must prune the emptied levels and report
+        the unknown subscriptions.
+        """
+        self.testTree.subscribe('a/b/c', 'sub1', 0)
+        self.testTree.subscribe('a/d', 'sub1', 0)
+        self.assertTrue(self.testTree.unsubscribe('a/b/c', 'sub1'))
+        self.assertNotIn('b', self.testTree._root.children['a'].children)
+        self.assertFalse(self.testTree.unsubscribe('a/b/c', 'sub1'))
+        self.assertFalse(self.testTree.unsubscribe('a/d', 'sub2'))
+        self.assertTrue(self.testTree.unsubscribe('a/d', 'sub1'))
+        self.assertEqual(self.testTree._root.children, {})
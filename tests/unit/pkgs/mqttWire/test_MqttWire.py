@@ -0,0 +1,148 @@
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.mqttWire import CONNECT, PUBACK, PUBLISH, SUBSCRIBE, \
+    ConnectMsg, PublishMsg, connackPacket, connectPacket, parseConnack, \
+    parseConnect, parsePacketId, parsePublish, parseSubscribe, \
+    parseUnsubscribe, pubackPacket, publishPacket, readPacket, \
+    subscribePacket  # noqa: E402
+from pkgs.mqttWire.mqttWire import _encodeLength    # noqa: E402
+
+
+async def _readBytes(packet: bytes) -> tuple:
+    """
+    Read a packet from bytes.
+    """
+    reader = asyncio.StreamReader()
+    reader.feed_data(packet)
+    reader.feed_eof()
+    return await readPacket(reader)
+
+
+class TestMqttWire(TestCase):
+    """
+    The mqttWire packet test cases.
+    """
+    def test_encodeLength(self):
+        """
+        The _encodeLength function must encode the remaining length on
+        7 bits per byte and reject the lengths over the maximum.
+        """
+        self.assertEqual(_encodeLength(0), b'\x00')
+        self.assertEqual(_encodeLength(127), b'\x7f')
+        self.assertEqual(_encodeLength(128), b'\x80\x01')
+        self.assertEqual(_encodeLength(16384), b'\x80\x80\x01')
+        with self.assertRaises(ValueError):
+            _encodeLength(268435456)
+
+    def test_connect(self):
+        """
+        The parseConnect function must return the fields of a packet
+        built by connectPacket.
+        """
+        packet = connectPacket('unit-1', 'user', 'secret', keepalive=30)
+        self.assertEqual(packet[0] >> 4, CONNECT)
+        self.assertEqual(parseConnect(packet[2:]),
+                         ConnectMsg('unit-1', 'user', 'secret', 30, True,
+                                    None))
+        packet = connectPacket('unit-1')
+        self.assertEqual(parseConnect(packet[2:]),
+                         ConnectMsg('unit-1', None, None, 60, True, None))
+        with self.assertRaises(ValueError):
+            parseConnect(b'\x00\x04MQTX\x04\x02\x00\x00\x00\x00')
+
+    def test_connectWill(self):
+        """
+        The parseConnect function must return the will of an MQTT 3.1
+        packet.
+        """
+        body = b'\x00\x06MQIsdp\x03' + bytes((0x04 | 0x08 | 0x20,)) + \
+            b'\x00\x0a\x00\x01c\x00\x05state\x00\x03off'
+        self.assertEqual(parseConnect(body),
+                         ConnectMsg('c', None, None, 10, False,
+                                    PublishMsg('state', b'off', 1, True,
+                                               None)))
+
+    def test_connack(self):
+        """
+        The parseConnack function must return the return code.
+        """
+        self.assertEqual(parseConnack(connackPacket(5)[2:]), 5)
+        with self.assertRaises(ValueError):
+            parseConnack(b'\x00')
+
+    def test_publish(self):
+        """
+        The parsePublish function must return the topic and payload and
+        skip the packet ID of the QoS 1 packets.
+        """
+        packet = publishPacket('unit/1/cmd', b'\x01\x02')
+        self.assertEqual(packet[0] >> 4, PUBLISH)
+        self.assertEqual(parsePublish(0, packet[2:]),
+                         PublishMsg('unit/1/cmd', b'\x01\x02', 0, False,
+                                    None))
+        packet = publishPacket('a', b'payload', 1, 7, True)
+        self.assertEqual(parsePublish(packet[0] & 0x0f, packet[2:]),
+                         PublishMsg('a', b'payload', 1, True, 7))
+
+    def test_puback(self):
+        """
+        The parsePacketId function must return the ID of a PUBACK packet
+        and reject a truncated packet.
+        """
+        packet = pubackPacket(513)
+        self.assertEqual(packet[0] >> 4, PUBACK)
+        self.assertEqual(parsePacketId(packet[2:]), 513)
+        with self.assertRaises(ValueError):
+            parsePacketId(b'\x01')
+
+    def test_subscribe(self):
+        """
+        The parseSubscribe function must return the packet ID and the
+        topic filters and reject an empty packet.
+        """
+        packet = subscribePacket(7, ['a/+', 'b/#'], 1)
+        self.assertEqual(packet[0], SUBSCRIBE << 4 | 0x02)
+        self.assertEqual(parseSubscribe(packet[2:]),
+                         (7, [('a/+', 1), ('b/#', 1)]))
+        with self.assertRaises(ValueError):
+            parseSubscribe(b'\x00\x07')
+
+    def test_unsubscribe(self):
+        """
+        The parseUnsubscribe function must return the packet ID and the
+        topic filters.
+        """
+        self.assertEqual(parseUnsubscribe(b'\x00\x02\x00\x01a\x00\x03b/#'),
+                         (2, ['a', 'b/#']))
+        with self.assertRaises(ValueError):
+            parseUnsubscribe(b'\x00\x02')
+
+
+class TestReadPacket(IsolatedAsyncioTestCase):
+    """
+    The readPacket function test cases.
+    """
+    async def test_readPacket(self):
+        """
+        The readPacket function must return the type, flags and body of a
+        packet with a multi-byte remaining length.
+        """
+        payload = bytes(300)
+        packetType, flags, body = await _readBytes(
+            publishPacket('t', payload))
+        self.assertEqual((packetType, flags), (PUBLISH, 0))
+        self.assertEqual(parsePublish(flags, body).payload, payload)
+
+    async def test_readTruncated(self):
+        """
+        The readPacket function must raise an IncompleteReadError on a
+        truncated packet.
+        """
+        with self.assertRaises(asyncio.IncompleteReadError):
+            await _readBytes(publishPacket('t', b'abc')[:-1])
@@ -0,0 +1,186 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.sessionLog import SessionReader, SessionRecorder  # noqa: E402
+from pkgs.sessionLog import sessionFormat                   # noqa: E402
+
+
+class TestSessionLog(TestCase):
+    """
+    The SessionRecorder and SessionReader classes test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.sessionDir = os.path.join(self.tmpDir.name, 'session')
+        self.testLogger = Mock()
+        self.testRecorder = SessionRecorder(self.testLogger,
+                                            self.sessionDir)
+        self.start = self.testRecorder._start
+
+    def tearDown(self):
+        """
+        Test cases teardown.
+        """
+        self.testRecorder.stop()
+        self.tmpDir.cleanup()
+
+    def test_recordQueued(self):
+        """
+        The record methods must only queue the records until flushed.
+        """
+        self.testRecorder.recordCommand('unit 1', 0.5, -0.5)
+        self.testRecorder.recordTelemetry('unit 1', 1.0, (1.0, 2.0, 3.0))
+        self.assertEqual(self.testRecorder.getRowCount('commands'), 0)
+        self.assertEqual(self.testRecorder.flush(), 2)
+        self.assertEqual(self.testRecorder.getRowCount('commands'), 1)
+        self.assertEqual(self.testRecorder.getRowCount('telemetry'), 1)
+
+    def test_readColumns(self):
+        """
+        The reader must return the recorded columns, sorted by time,
+        with the unit codes of the manifest.
+        """
+        self.testRecorder.recordCommand('unit 2', 0.25, 1.0,
+                                        self.start + 2.0)
+        self.testRecorder.recordCommand('unit 1', 0.5, -0.5,
+                                        self.start + 1.0)
+        self.testRecorder.recordTelemetry('unit 1', 12.5, (1.0, 2.0, 3.0),
+                                          self.start + 1.5)
+        self.testRecorder.flush()
+        reader = SessionReader(self.sessionDir)
+        commands = reader.getRange('commands', 0.0, 10.0)
+        np.testing.assert_array_equal(commands['time'], [1.0, 2.0])
+        np.testing.assert_array_equal(commands['steering'], [0.5, 0.25])
+        units = reader.getUnitIds()
+        self.assertEqual([units[code] for code in commands['unit']],
+                         ['unit 1', 'unit 2'])
+        telemetry = reader.getRange('telemetry', 0.0, 10.0)
+        np.testing.assert_array_equal(telemetry['unitTime'], [12.5])
+        np.testing.assert_array_equal(telemetry['rssi'], [3.0])
+        self.assertEqual(reader.getColumnNames('commands'),
+                         ['time', 'unit', 'steering', 'throttle'])
+
+    def test_getRange(self):
+        """
+        The getRange method must return the rows of the time range,
+        across the index blocks and the flushes.
+        """
+        with patch.object(sessionFormat, 'INDEX_STRIDE', 16), \
+                patch('pkgs.sessionLog.sessionRecorder.INDEX_STRIDE', 16), \
+                patch('pkgs.sessionLog.sessionReader.INDEX_STRIDE', 16):
+            for batch in range(5):
+                for idx in range(batch * 37, (batch + 1) * 37):
+                    self.testRecorder.recordCommand('unit 1', idx, 0.0,
+                                                    self.start + idx * 0.1)
+                self.testRecorder.flush()
+            reader = SessionReader(self.sessionDir)
+            self.assertEqual(reader.getRowCount('commands'), 185)
+            times = reader.getRange('commands', -1.0, 99.0)['time']
+            self.assertEqual(len(times), 185)
+            for start, end in ((0.0, 18.5), (3.05, 7.0), (5.0, 5.0),
+                               (-1.0, 0.0), (18.0, 99.0), (1.55, 1.65)):
+                rows = reader.getRange('commands', start, end)
+                expected = [idx for idx in range(185)
+                            if start <= times[idx] < end]
+                np.testing.assert_array_equal(rows['steering'], expected)
+
+    def test_getRangeView(self):
+        """
+        The getRange method must return views of the mapped columns.
+        """
+        self.testRecorder.recordCommand('unit 1', 0.5, -0.5)
+        self.testRecorder.flush()
+        rows = SessionReader(self.sessionDir).getRange('commands', 0, 1e9)
+        self.assertIsInstance(rows['time'], np.memmap)
+
+    def test_readerIgnoresUnflushed(self):
+        """
+        The reader must ignore the rows written after the manifest.
+        """
+        self.testRecorder.recordCommand('unit 1', 0.5, -0.5)
+        self.testRecorder.flush()
+        with open(sessionFormat.getColumnPath(self.sessionDir, 'commands',
+                                              'time'), 'ab') as column:
+            column.write(b'\0' * 8)
+        reader = SessionReader(self.sessionDir)
+        self.assertEqual(reader.getRowCount('commands'), 1)
+
+    def test_readerEmptyStream(self):
+        """
+        The reader must read a stream without rows.
+        """
+        reader = SessionReader(self.sessionDir)
+        self.assertEqual(reader.getRowCount('telemetry'), 0)
+        self.assertEqual(len(reader.getRange('telemetry', 0, 1)['time']), 0)
+
+    def test_readerInvalid(self):
+        """
+        The reader must raise a ValueError for a missing session or an
+        unknown stream.
+        """
+        with self.assertRaises(ValueError):
+            SessionReader(self.tmpDir.name)
+        with self.assertRaises(ValueError):
+            SessionReader(self.sessionDir).getRange('unknown', 0, 1)
+
+    def test_run(self):
+        """
+        The recorder thread must write the queued records and the
+        remaining ones on stop.
+        """
+        self.testRecorder.start()
+        self.testRecorder.recordCommand('unit 1', 0.5, -0.5)
+        self.testRecorder.stop()
+        reader = SessionReader(self.sessionDir)
+        self.assertEqual(reader.getRowCount('commands'), 1)
+
+    def test_recordQueueFull(self):
+        """
+        The record methods must drop and count the oldest records once
+        the queue is full.
+        """
+        testRecorder = SessionRecorder(
+            self.testLogger, os.path.join(self.tmpDir.name, 'capped'),
+            maxQueued=2)
+        for idx in range(5):
+            testRecorder.recordCommand('unit 1', 0.0, 0.0,
+                                       testRecorder._start + idx)
+        self.assertEqual(testRecorder.getDroppedCount(), 3)
+        self.assertEqual(testRecorder.flush(), 2)
+        testRecorder.stop()
+        reader = SessionReader(os.path.join(self.tmpDir.name, 'capped'))
+        np.testing.assert_array_equal(
+            reader.getRange('commands', 0.0, 10.0)['time'], [3.0, 4.0])
+        reader.close()
+        self.testLogger.getLogger.return_value.warning.assert_called_once()
+
+    def test_runFailure(self):
+        """
+        The recorder thread must log any write failure and stop
+        recording.
+        """
+        logger = self.testLogger.getLogger.return_value
+        with patch.object(self.testRecorder, 'flush',
+                          side_effect=TypeError('bad record')) \
+                as mockedFlush:
+            self.testRecorder._flushPeriod = 0.01
+            self.testRecorder.start()
+            self.testRecorder.join(5.0)
+            self.assertFalse(self.testRecorder.is_alive())
+            self.testRecorder.recordCommand('unit 1', 0.5, -0.5)
+            self.testRecorder.stop()
+            mockedFlush.assert_called_once()
+        logger.exception.assert_called_once()
+        self.assertTrue(self.testRecorder.isFailed())
+        self.assertEqual(len(self.testRecorder._queue), 0)
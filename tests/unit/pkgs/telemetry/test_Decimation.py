@@ -0,0 +1,81 @@
+from unittest import TestCase
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.telemetry import lttbDecimate, minMaxDecimate     # noqa: E402
+
+
+class TestDecimation(TestCase):
+    """
+    The decimation functions test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testTimes = np.arange(1000, dtype=np.float64)
+        self.testValues = np.sin(self.testTimes / 40)
+        self.testValues[333] = 5.0
+        self.testValues[777] = -5.0
+
+    def test_minMaxDecimate(self):
+        """
+        The minMaxDecimate function must keep the minimum and maximum of
+        each bucket in time order.
+        """
+        times, values = minMaxDecimate(np.arange(6.0),
+                                       np.array([3, 1, 2, 0, 5, 4.0]), 4)
+        np.testing.assert_array_equal(times, [0, 3, 4, 5])
+        np.testing.assert_array_equal(values, [3, 0, 5, 4])
+
+    def test_minMaxDecimatePeaks(self):
+        """
+        The minMaxDecimate function must keep the peaks.
+        """
+        times, values = minMaxDecimate(self.testTimes, self.testValues, 64)
+        self.assertEqual(len(values), 32)
+        self.assertIn(5.0, values)
+        self.assertIn(-5.0, values)
+        self.assertTrue(np.all(np.diff(times) > 0))
+
+    def test_minMaxDecimateEmpty(self):
+        """
+        The minMaxDecimate function must return no point without sample.
+        """
+        times, values = minMaxDecimate(np.empty(0), np.empty(0), 4)
+        self.assertEqual(len(values), 0)
+
+    def test_lttbDecimate(self):
+        """
+        The lttbDecimate function must keep the threshold number of
+        points, the ends and the peaks.
+        """
+        times, values = lttbDecimate(self.testTimes, self.testValues, 100)
+        self.assertEqual(len(values), 100)
+        self.assertEqual(times[0], 0)
+        self.assertEqual(times[-1], 999)
+        self.assertIn(333, times)
+        self.assertIn(777, times)
+        self.assertTrue(np.all(np.diff(times) > 0))
+
+    def test_lttbDecimateUnderThreshold(self):
+        """
+        The lttbDecimate function must keep all the samples under the
+        threshold.
+        """
+        times, values = lttbDecimate(self.testTimes[:10],
+                                     self.testValues[:10], 100)
+        self.assertEqual(len(values), 10)
+
+    def test_lttbDecimateInvalidThreshold(self):
+        """
+        The lttbDecimate function must raise a ValueError for a
+        threshold under 3.
+        """
+        with self.assertRaises(ValueError):
+            lttbDecimate(self.testTimes, self.testValues, 2)
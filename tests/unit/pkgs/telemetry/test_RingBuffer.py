@@ -0,0 +1,84 @@
+from unittest import TestCase
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.telemetry import RingBuffer       # noqa: E402
+
+
+class TestRingBuffer(TestCase):
+    """
+    The RingBuffer class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testBuffer = RingBuffer(4, 2)
+
+    def test_constructorInvalidShape(self):
+        """
+        The constructor must raise a ValueError for an empty shape.
+        """
+        with self.assertRaises(ValueError):
+            RingBuffer(0)
+
+    def test_getWindowBeforeWrap(self):
+        """
+        The getWindow method must return the appended rows in order
+        before the buffer is full.
+        """
+        self.testBuffer.append((1, 10))
+        self.testBuffer.append((2, 20))
+        np.testing.assert_array_equal(self.testBuffer.getWindow(),
+                                      [[1, 10], [2, 20]])
+        self.assertEqual(len(self.testBuffer), 2)
+
+    def test_getWindowWrapped(self):
+        """
+        The getWindow method must return the latest rows in order once
+        the oldest were overwritten.
+        """
+        for idx in range(11):
+            self.testBuffer.append((idx, idx * 10))
+        np.testing.assert_array_equal(self.testBuffer.getWindow(),
+                                      [[7, 70], [8, 80], [9, 90],
+                                       [10, 100]])
+        np.testing.assert_array_equal(self.testBuffer.getWindow(2),
+                                      [[9, 90], [10, 100]])
+        self.assertEqual(len(self.testBuffer), 4)
+        self.assertEqual(self.testBuffer.getTotal(), 11)
+
+    def test_getWindowView(self):
+        """
+        The getWindow method must return a view of the buffer, not a
+        copy.
+        """
+        for idx in range(6):
+            self.testBuffer.append((idx, idx))
+        window = self.testBuffer.getWindow()
+        self.assertIs(window.base, self.testBuffer._data)
+        self.assertTrue(window.flags['C_CONTIGUOUS'])
+
+    def test_clear(self):
+        """
+        The clear method must drop all the rows.
+        """
+        self.testBuffer.append((1, 1))
+        self.testBuffer.clear()
+        self.assertEqual(len(self.testBuffer.getWindow()), 0)
+
+    def test_getSnapshot(self):
+        """
+        The getSnapshot method must return the latest rows with the
+        number of rows appended up to them.
+        """
+        for idx in range(6):
+            self.testBuffer.append((idx, idx))
+        window, total = self.testBuffer.getSnapshot(2)
+        np.testing.assert_array_equal(window, [[4, 4], [5, 5]])
+        self.assertEqual(total, 6)
@@ -0,0 +1,118 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import os
+import struct
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.telemetry import TelemetryStore       # noqa: E402
+
+
+class TestTelemetryStore(TestCase):
+    """
+    The TelemetryStore class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testStore = TelemetryStore(capacity=8)
+        self.testLayout = struct.Struct('<BI3f')
+
+    def test_ingest(self):
+        """
+        The ingest method must decode the payload into the unit buffer.
+        """
+        payload = self.testLayout.pack(TelemetryStore.VERSION, 1500, 2.5,
+                                       7.25, -60.0)
+        self.testStore.ingest('unit 1', payload)
+        times, values = self.testStore.getWindow('unit 1', 'battery')
+        np.testing.assert_array_equal(times, [1.5])
+        np.testing.assert_array_equal(values, [7.25])
+        self.assertEqual(self.testStore.getUnitIds(), ['unit 1'])
+
+    def test_ingestInvalid(self):
+        """
+        The ingest method must raise a ValueError for a payload of the
+        wrong size or version.
+        """
+        payload = self.testLayout.pack(TelemetryStore.VERSION + 1, 0, 0.0,
+                                       0.0, 0.0)
+        for invalid in (payload, payload[:-1]):
+            with self.assertRaises(ValueError):
+                self.testStore.ingest('unit 1', invalid)
+
+    def test_onTelemetryMsg(self):
+        """
+        The onTelemetryMsg method must ingest the payload for the unit
+        of the topic.
+        """
+        payload = self.testLayout.pack(TelemetryStore.VERSION, 0, 1.0, 2.0,
+                                       3.0)
+        self.testStore.onTelemetryMsg(TelemetryStore.getTopic('unit 2'),
+                                      payload)
+        self.assertEqual(self.testStore.getUnitIds(), ['unit 2'])
+        with self.assertRaises(ValueError):
+            self.testStore.onTelemetryMsg('unit/unit 2/state', payload)
+
+    def test_getWindow(self):
+        """
+        The getWindow method must return the latest samples of the
+        channel as views.
+        """
+        for idx in range(10):
+            self.testStore.append('unit 1', idx, (idx, idx * 2, idx * 3))
+        times, values = self.testStore.getWindow('unit 1', 'rssi', 3)
+        np.testing.assert_array_equal(times, [7, 8, 9])
+        np.testing.assert_array_equal(values, [21, 24, 27])
+        self.assertIsNotNone(values.base)
+
+    def test_getWindowUnknown(self):
+        """
+        The getWindow method must return empty samples for an unknown
+        unit and raise a ValueError for an unknown channel.
+        """
+        times, values = self.testStore.getWindow('unknown', 'speed')
+        self.assertEqual(len(times), 0)
+        with self.assertRaises(ValueError):
+            self.testStore.getWindow('unit 1', 'unknown')
+
+    def test_getSince(self):
+        """
+        The getSince method must return the samples from the time on.
+        """
+        for idx in range(5):
+            self.testStore.append('unit 1', idx * 0.5, (idx, 0.0, 0.0))
+        times, values = self.testStore.getSince('unit 1', 'speed', 1.0)
+        np.testing.assert_array_equal(times, [1.0, 1.5, 2.0])
+        np.testing.assert_array_equal(values, [2, 3, 4])
+
+    def test_appendInvalid(self):
+        """
+        The append method must raise a ValueError for a wrong number of
+        channel values.
+        """
+        with self.assertRaises(ValueError):
+            self.testStore.append('unit 1', 0.0, (1.0,))
+
+    def test_removeUnit(self):
+        """
+        The removeUnit method must drop the unit telemetry.
+        """
+        self.testStore.append('unit 1', 0.0, (1.0, 2.0, 3.0))
+        self.testStore.removeUnit('unit 1')
+        self.assertEqual(self.testStore.getUnitIds(), [])
+
+    def test_appendRecorder(self):
+        """
+        The append method must record the sample.
+        """
+        testRecorder = Mock()
+        self.testStore.setRecorder(testRecorder)
+        self.testStore.append('unit 1', 1.5, (1.0, 2.0, 3.0))
+        testRecorder.recordTelemetry.assert_called_once_with(
+            'unit 1', 1.5, (1.0, 2.0, 3.0))
@@ -0,0 +1,95 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.telemetry import TelemetryStore, TelemetryView    # noqa: E402
+
+
+class TestTelemetryView(TestCase):
+    """
+    The TelemetryView class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.decimate = 'pkgs.telemetry.telemetryView.minMaxDecimate'
+        self.testStore = TelemetryStore(capacity=256)
+        self.testView = TelemetryView(self.testStore, 'unit 1', 'speed')
+        self._append(0, 1000)
+
+    def _append(self, first: int, last: int) -> None:
+        """
+        Append the samples from first to last.
+        """
+        for idx in range(first, last):
+            self.testStore.append('unit 1', idx, (np.sin(idx / 10), 0, 0))
+
+    def test_constructorInvalidMethod(self):
+        """
+        The constructor must raise a ValueError for an unknown method.
+        """
+        with self.assertRaises(ValueError):
+            TelemetryView(self.testStore, 'unit 1', 'speed', 'unknown')
+
+    def test_getPointsBounded(self):
+        """
+        The getPoints method must return a number of points bounded by
+        the width, the peaks of the kept samples included.
+        """
+        times, values = self.testView.getPoints(40)
+        self.assertLessEqual(len(values), 44)
+        _, raw = self.testStore.getWindow('unit 1', 'speed')
+        self.assertEqual(values.max(), raw.max())
+        self.assertEqual(values.min(), raw.min())
+        self.assertEqual(times[-1], 999)
+
+    def test_getPointsCached(self):
+        """
+        The getPoints method must reuse its result until a sample
+        arrives.
+        """
+        first = self.testView.getPoints(40)
+        with patch(self.decimate) as mockedDecimate:
+            self.assertIs(self.testView.getPoints(40), first)
+            mockedDecimate.assert_not_called()
+
+    def test_getPointsIncremental(self):
+        """
+        The getPoints method must only decimate the new buckets and
+        match a full decimation.
+        """
+        self.testView.getPoints(40)
+        self._append(1000, 1040)
+        incremental = self.testView.getPoints(40)
+        fresh = TelemetryView(self.testStore, 'unit 1', 'speed')
+        expected = fresh.getPoints(40)
+        np.testing.assert_array_equal(incremental[0], expected[0])
+        np.testing.assert_array_equal(incremental[1], expected[1])
+        self.assertEqual(self.testView._firstBucket,
+                         fresh._firstBucket)
+
+    def test_getPointsLttb(self):
+        """
+        The getPoints method must decimate to the width with LTTB.
+        """
+        testView = TelemetryView(self.testStore, 'unit 1', 'speed',
+                                 TelemetryView.LTTB)
+        times, values = testView.getPoints(50)
+        self.assertEqual(len(values), 50)
+        self.assertEqual(times[-1], 999)
+
+    def test_getPointsUnknownUnit(self):
+        """
+        The getPoints method must return no point for a unit without
+        telemetry.
+        """
+        testView = TelemetryView(self.testStore, 'unknown', 'speed')
+        times, values = testView.getPoints(50)
+        self.assertEqual(len(values), 0)
@@ -0,0 +1,77 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from PySide2.QtCore import Qt     # noqa: E402
+
+from pkgs.ui.models.ctrlrModel.ctrlrListModel import CtrlrListModel    # noqa: E402 E501
+
+
+class TestCtrlrListModel(TestCase):
+    """
+    The CtrlrListModel class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testCtrlrs = []
+        for name in ('ctrlr 1', 'ctrlr 2', 'ctrlr 3'):
+            ctrlr = Mock()
+            ctrlr.getName.return_value = name
+            self.testCtrlrs.append(ctrlr)
+        self.testModel = CtrlrListModel()
+        for ctrlr in self.testCtrlrs:
+            self.testModel.appendCtrlr(ctrlr)
+
+    def test_rowCount(self):
+        """
+        The rowCount method must return the number of controllers.
+        """
+        self.assertEqual(self.testModel.rowCount(), len(self.testCtrlrs))
+
+    def test_data(self):
+        """
+        The data method must return the controller name for the display
+        role and the controller for the user role.
+        """
+        for row, ctrlr in enumerate(self.testCtrlrs):
+            index = self.testModel.index(row)
+            self.assertEqual(self.testModel.data(index, Qt.DisplayRole),
+                             ctrlr.getName())
+            self.assertEqual(self.testModel.data(index, Qt.UserRole), ctrlr)
+
+    def test_dataInvalid(self):
+        """
+        The data method must return None for an invalid index.
+        """
+        index = self.testModel.index(len(self.testCtrlrs))
+        self.assertIsNone(self.testModel.data(index, Qt.DisplayRole))
+
+    def test_appendCtrlr(self):
+        """
+        The appendCtrlr method must insert only the new row.
+        """
+        newCtrlr = Mock()
+        inserted = []
+        self.testModel.rowsInserted.connect(
+            lambda parent, first, last: inserted.append((first, last)))
+        self.testModel.appendCtrlr(newCtrlr)
+        self.assertEqual(inserted, [(3, 3)])
+        self.assertEqual(self.testModel.getCtrlrs()[-1], newCtrlr)
+
+    def test_removeCtrlr(self):
+        """
+        The removeCtrlr method must remove only the controller row.
+        """
+        removed = []
+        self.testModel.rowsRemoved.connect(
+            lambda parent, first, last: removed.append((first, last)))
+        self.testModel.removeCtrlr(self.testCtrlrs[1])
+        self.assertEqual(removed, [(1, 1)])
+        self.assertEqual(self.testModel.getCtrlrs(),
+                         (self.testCtrlrs[0], self.testCtrlrs[2]))
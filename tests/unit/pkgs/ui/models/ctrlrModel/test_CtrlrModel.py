@@ -1,5 +1,5 @@
 from unittest import TestCase
-from unittest.mock import Mock, call, patch
+from unittest.mock import Mock, patch
 
 import os
 import sys
@@ -18,20 +18,20 @@ class TestCtrlrModel(TestCase):
         Test cases setup.
         """
         self.ctrlr = 'pkgs.ui.models.ctrlrModel.ctrlrModel.Controller'
-        self.QStdItem = 'pkgs.ui.models.ctrlrModel.ctrlrModel.QStandardItem'
-        self.QStdItemModel = 'pkgs.ui.models.ctrlrModel.ctrlrModel.QStandardItemModel'   # noqa: E501
+        self.CtrlrListModel = 'pkgs.ui.models.ctrlrModel.ctrlrModel.CtrlrListModel'  # noqa: E501
         self.testLogger = Mock()
         self.testCtrlrList = {'test controller 1': 0, 'test controller 2': 1,
                               'test controller 3': 2, 'test controller 4': 3}
         self.mockedCtrlrs = self._setUpMockedCtrlrs(self.testCtrlrList)
-        self.mockedStdItemModel = Mock()
         with patch(self.ctrlr) as mockedCtrlr, \
                 patch.object(mockedCtrlr, 'initFramework'), \
                 patch.object(CtrlrModel, 'updateCtrlrList'):
             self.ctrlrMdl = CtrlrModel(self.testLogger)
             self.ctrlrMdl._controllers['active'] = self.mockedCtrlrs[0]
-            self.ctrlrMdl._controllers['list'] = self.mockedCtrlrs
-            self.ctrlrMdl.model = self.mockedStdItemModel
+            self.ctrlrMdl._controllers['ids'] = \
+                {ctrlr.getInstanceId(): ctrlr for ctrlr in self.mockedCtrlrs}
+            for ctrlr in self.mockedCtrlrs:
+                self.ctrlrMdl.model.appendCtrlr(ctrlr)
 
     def _setUpMockedCtrlrs(self, ctrlrList: dict):
         """
@@ -45,6 +45,7 @@ class TestCtrlrModel(TestCase):
             mockedCtrlr = Mock()
             mockedCtrlr.getName.return_value = testCtrlr
             mockedCtrlr.getIdx.return_value = ctrlrList[testCtrlr]
+            mockedCtrlr.getInstanceId.return_value = ctrlrList[testCtrlr] + 10
             mockedCtrlrs.append(mockedCtrlr)
         return mockedCtrlrs
 
@@ -54,12 +55,12 @@ class TestCtrlrModel(TestCase):
         create the combobox model and update the controller list.
         """
         with patch(f"{self.ctrlr}.initFramework") as mockedinitFmk, \
-                patch(self.QStdItemModel) as mockedQStdItemMdl, \
+                patch(self.CtrlrListModel) as mockedCtrlrListMdl, \
                 patch.object(CtrlrModel, 'updateCtrlrList') \
                 as mockedInitCtrlrs:
             CtrlrModel(self.testLogger)
             mockedinitFmk.assert_called_once()
-            mockedQStdItemMdl.assert_called_once_with(0, 1)
+            mockedCtrlrListMdl.assert_called_once_with()
             mockedInitCtrlrs.assert_called_once()
 
     def test_listCurrentCtrlrs(self):
@@ -104,7 +105,9 @@ class TestCtrlrModel(TestCase):
             self.ctrlrMdl._addControllers(newList, tuple(addedCtrlrs))
             for mockedCtrlr in mockedNewCtrlrs:
                 self.assertTrue(mockedCtrlr in
-                                self.ctrlrMdl._controllers['list'])
+                                self.ctrlrMdl.model.getCtrlrs())
+                self.assertEqual(self.ctrlrMdl._controllers['ids']
+                                 [mockedCtrlr.getInstanceId()], mockedCtrlr)
 
     def test_removeControllers(self):
         """
@@ -115,47 +118,167 @@ class TestCtrlrModel(TestCase):
         last = len(self.testCtrlrList) - 1
         ctrlrNames = list(self.testCtrlrList.keys())
         oldCtrlrs = (ctrlrNames[first], ctrlrNames[last])
-        expectedCtrlrList = self.ctrlrMdl._controllers['list'].copy()
-        expectedCtrlrList.remove(self.ctrlrMdl._controllers['list'][first])
-        expectedCtrlrList.remove(self.ctrlrMdl._controllers['list'][last])
+        expectedCtrlrList = self.mockedCtrlrs[first + 1:last]
         self.ctrlrMdl._removeControllers(oldCtrlrs)
         self.assertEqual(self.ctrlrMdl._controllers['active'], None)
-        self.assertEqual(self.ctrlrMdl._controllers['list'], expectedCtrlrList)
+        self.assertEqual(self.ctrlrMdl.model.getCtrlrs(),
+                         tuple(expectedCtrlrList))
+        self.assertEqual(list(self.ctrlrMdl._controllers['ids'].values()),
+                         expectedCtrlrList)
+        self.mockedCtrlrs[first].quit.assert_called_once()
+        self.mockedCtrlrs[last].quit.assert_called_once()
 
-    def test_updateModelClear(self):
+    def test_addController(self):
         """
-        The _updateModel method must clear the model.
+        The _addController method must index the controller and append
+        its row.
         """
-        with patch(self.QStdItem):
-            self.ctrlrMdl._updateModel()
-            self.mockedStdItemModel.clear.assert_called_once()
+        newCtrlr = self._setUpMockedCtrlrs({'new controller': 5})[0]
+        with patch.object(self.ctrlrMdl.model, 'appendCtrlr') \
+                as mockedAppend:
+            self.ctrlrMdl._addController(newCtrlr)
+            mockedAppend.assert_called_once_with(newCtrlr)
+            self.assertEqual(self.ctrlrMdl._controllers['ids'][15], newCtrlr)
 
-    def test_updateModelItem(self):
+    def test_removeController(self):
+        """
+        The _removeController method must remove the controller index and
+        row only.
+        """
+        removedCtrlr = self.mockedCtrlrs[2]
+        with patch.object(self.ctrlrMdl.model, 'removeCtrlr') \
+                as mockedRemove:
+            self.ctrlrMdl._removeController(removedCtrlr)
+            mockedRemove.assert_called_once_with(removedCtrlr)
+            self.assertNotIn(removedCtrlr.getInstanceId(),
+                             self.ctrlrMdl._controllers['ids'])
+            self.assertEqual(self.ctrlrMdl._controllers['active'],
+                             self.mockedCtrlrs[0])
+            removedCtrlr.quit.assert_called_once()
+
+    def test_removeActiveController(self):
+        """
+        The _removeController method must deactivate the active
+        controller before it quits.
+        """
+        removedCtrlr = self.mockedCtrlrs[0]
+        calls = Mock()
+        self.ctrlrMdl._activeHandler = calls.handler
+        removedCtrlr.quit = calls.quit
+        self.ctrlrMdl._removeController(removedCtrlr)
+        self.assertEqual([name for name, _, _ in calls.mock_calls],
+                         ['handler', 'quit'])
+        calls.handler.assert_called_once_with(None)
+        self.assertIsNone(self.ctrlrMdl.getActiveCtrlr())
+
+    def test_setActiveHandler(self):
+        """
+        The setActiveHandler method must call the handler at once with
+        the active controller.
+        """
+        testHandler = Mock()
+        self.ctrlrMdl.setActiveHandler(testHandler)
+        testHandler.assert_called_once_with(self.mockedCtrlrs[0])
+
+    def test_setActiveCtrlr(self):
+        """
+        The setActiveCtrlr method must notify the handler of the active
+        controller changes only.
+        """
+        testHandler = Mock()
+        self.ctrlrMdl._activeHandler = testHandler
+        self.ctrlrMdl.setActiveCtrlr(self.mockedCtrlrs[0])
+        testHandler.assert_not_called()
+        self.ctrlrMdl.setActiveCtrlr(self.mockedCtrlrs[1])
+        testHandler.assert_called_once_with(self.mockedCtrlrs[1])
+        self.assertEqual(self.ctrlrMdl.getActiveCtrlr(),
+                         self.mockedCtrlrs[1])
+
+    def test_onDeviceAdded(self):
+        """
+        The _onDeviceAdded method must add the controller of a supported
+        device and its row.
+        """
+        newCtrlrs = self._setUpMockedCtrlrs({'new controller': 5})
+        with patch(self.ctrlr) as mockedCtrlr:
+            mockedCtrlr.describeDevice.return_value = ('new controller', 15)
+            mockedCtrlr.isSupported.return_value = True
+            mockedCtrlr.return_value = newCtrlrs[0]
+            self.ctrlrMdl._onDeviceAdded(5)
+            mockedCtrlr.assert_called_once_with(self.testLogger, 5,
+                                                'new controller')
+            self.assertEqual(self.ctrlrMdl.model.getCtrlrs()[-1],
+                             newCtrlrs[0])
+            self.assertEqual(self.ctrlrMdl._controllers['ids'][15],
+                             newCtrlrs[0])
+
+    def test_onDeviceAddedKnown(self):
+        """
+        The _onDeviceAdded method must ignore an already known device.
+        """
+        with patch(self.ctrlr) as mockedCtrlr:
+            mockedCtrlr.describeDevice.return_value = ('test controller 2',
+                                                       11)
+            mockedCtrlr.isSupported.return_value = True
+            self.ctrlrMdl._onDeviceAdded(1)
+            mockedCtrlr.assert_not_called()
+            self.assertEqual(len(self.ctrlrMdl.model.getCtrlrs()),
+                             len(self.testCtrlrList))
+
+    def test_onDeviceAddedUnsupported(self):
+        """
+        The _onDeviceAdded method must ignore an unsupported device.
         """
-        The _updateModel method must create and add items
-        for each controllers.
+        with patch(self.ctrlr) as mockedCtrlr:
+            mockedCtrlr.describeDevice.return_value = ('unsupported', 15)
+            mockedCtrlr.isSupported.return_value = False
+            self.ctrlrMdl._onDeviceAdded(5)
+            mockedCtrlr.assert_not_called()
+            self.assertEqual(len(self.ctrlrMdl.model.getCtrlrs()),
+                             len(self.testCtrlrList))
+
+    def test_onDeviceRemoved(self):
+        """
+        The _onDeviceRemoved method must remove the controller of the
+        device.
+        """
+        removedCtrlr = self.mockedCtrlrs[0]
+        with patch.object(self.ctrlrMdl, '_removeController') \
+                as mockedRemove:
+            self.ctrlrMdl._onDeviceRemoved(removedCtrlr.getInstanceId())
+            mockedRemove.assert_called_once_with(removedCtrlr)
+
+    def test_onDeviceRemovedUnknown(self):
+        """
+        The _onDeviceRemoved method must ignore an unknown device.
         """
-        mockedItems = []
-        itemCalls = []
-        addItemCalls = []
-        for ctrlr in self.testCtrlrList:
-            mockedItems.append(ctrlr)
-            itemCalls.append(call(ctrlr))
-            addItemCalls.append(call(ctrlr))
-        with patch(self.QStdItem) as mockedStdItem:
-            mockedStdItem.side_effect = mockedItems
-            self.ctrlrMdl._updateModel()
-            mockedStdItem.assert_has_calls(itemCalls)
-            self.ctrlrMdl.model.appendRow.assert_has_calls(addItemCalls)
+        with patch.object(self.ctrlrMdl, '_removeController') \
+                as mockedRemove:
+            self.ctrlrMdl._onDeviceRemoved(99)
+            mockedRemove.assert_not_called()
+
+    def test_onDeviceEvent(self):
+        """
+        The onDeviceEvent method must signal the device added and
+        removed events.
+        """
+        with patch(self.ctrlr) as mockedCtrlr, \
+                patch.object(self.ctrlrMdl, '_deviceAdded') as mockedAdded, \
+                patch.object(self.ctrlrMdl, '_deviceRemoved') \
+                as mockedRemoved:
+            mockedCtrlr.DEVICE_ADDED = 1541
+            mockedCtrlr.DEVICE_REMOVED = 1542
+            self.ctrlrMdl.onDeviceEvent(Mock(type=1541, device_index=2))
+            self.ctrlrMdl.onDeviceEvent(Mock(type=1542, instance_id=12))
+            mockedAdded.emit.assert_called_once_with(2)
+            mockedRemoved.emit.assert_called_once_with(12)
 
     def test_updateCtrlrListListConnected(self):
         """
         The updateCtrlrList method must list the currently
         connected controllers.
         """
-        with patch.object(self.ctrlrMdl, '_updateModel'), \
-                patch(f"{self.ctrlr}.listControllers") \
-                as mockedListCtrlrs:
+        with patch(f"{self.ctrlr}.listControllers") as mockedListCtrlrs:
             mockedListCtrlrs.return_value = {}
             self.ctrlrMdl.updateCtrlrList()
             mockedListCtrlrs.assert_called_once()
@@ -165,8 +288,7 @@ class TestCtrlrModel(TestCase):
         The updateCtrlrList method must filter the
         newly added controllers.
         """
-        with patch.object(self.ctrlrMdl, '_updateModel'), \
-                patch(f"{self.ctrlr}.listControllers") as mockedCtrlList, \
+        with patch(f"{self.ctrlr}.listControllers") as mockedCtrlList, \
                 patch.object(self.ctrlrMdl, '_filterAddedCtrlrs') \
                 as mockedFilterAdded:
             mockedCtrlList.return_value = self.testCtrlrList
@@ -180,12 +302,10 @@ class TestCtrlrModel(TestCase):
         """
         newCtrlrs = {"new controller 1": 5, "new controller 2": 6}
         newCtrlrList = {**self.testCtrlrList, **newCtrlrs}
-        with patch.object(self.ctrlrMdl, '_updateModel'), \
-                patch(f"{self.ctrlr}.listControllers") as mockedCtrlList, \
+        with patch(f"{self.ctrlr}.listControllers") as mockedCtrlList, \
                 patch.object(self.ctrlrMdl, '_addControllers') \
                 as mockedAddCtrlrs:
             mockedCtrlList.return_value = newCtrlrList
-            print(self.ctrlrMdl._controllers['list'])
             self.ctrlrMdl.updateCtrlrList()
             mockedAddCtrlrs.assert_called_once_with(newCtrlrList,
                                                     tuple(newCtrlrs))
@@ -195,8 +315,7 @@ class TestCtrlrModel(TestCase):
         The updateCtrlrList method must filter the
         removed controllers.
         """
-        with patch.object(self.ctrlrMdl, '_updateModel'), \
-                patch(f"{self.ctrlr}.listControllers") as mockedCtrlrList, \
+        with patch(f"{self.ctrlr}.listControllers") as mockedCtrlrList, \
                 patch.object(self.ctrlrMdl, '_filterRemovedCtrlrs') \
                 as mockedFilterRemove:
             mockedCtrlrList.return_value = self.testCtrlrList
@@ -212,21 +331,9 @@ class TestCtrlrModel(TestCase):
         newCtrlrList = self.testCtrlrList.copy()
         for ctrlr2Remove in ctrlrs2Remove:
             del newCtrlrList[ctrlr2Remove]
-        with patch.object(self.ctrlrMdl, '_updateModel'), \
-                patch(f"{self.ctrlr}.listControllers") as mockedCtrlrList, \
+        with patch(f"{self.ctrlr}.listControllers") as mockedCtrlrList, \
                 patch.object(self.ctrlrMdl, '_removeControllers') \
                 as mockedRemoveCtrlr:
             mockedCtrlrList.return_value = newCtrlrList
             self.ctrlrMdl.updateCtrlrList()
             mockedRemoveCtrlr.assert_called_once_with(tuple(ctrlrs2Remove))
-
-    def test_updateCtrlrListUpdateModel(self):
-        """
-        The updateCtrlrList method must update the selection combobox.
-        """
-        with patch.object(self.ctrlrMdl, '_updateModel') \
-                as mockedUpdateModel, \
-                patch(f"{self.ctrlr}.listControllers") as mockedCtrlrList:
-            mockedCtrlrList.return_value = self.testCtrlrList
-            self.ctrlrMdl.updateCtrlrList()
-            mockedUpdateModel.assert_called_once()
@@ -0,0 +1,56 @@
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from PySide2.QtCore import Qt     # noqa: E402
+
+from pkgs.ui.models.unitModel import UnitListModel    # noqa: E402
+
+
+class TestUnitListModel(TestCase):
+    """
+    The UnitListModel class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testModel = UnitListModel()
+        self.testModel.applyDiff(['unit b', 'unit d'], [])
+
+    def test_data(self):
+        """
+        The data method must return the unit ID of the row.
+        """
+        index = self.testModel.index(1)
+        self.assertEqual(self.testModel.data(index, Qt.DisplayRole),
+                         'unit d')
+        self.assertIsNone(self.testModel.data(self.testModel.index(2)))
+
+    def test_applyDiff(self):
+        """
+        The applyDiff method must insert and remove only the changed
+        rows, keeping the units sorted.
+        """
+        inserted = []
+        removed = []
+        self.testModel.rowsInserted.connect(
+            lambda parent, first, last: inserted.append(first))
+        self.testModel.rowsRemoved.connect(
+            lambda parent, first, last: removed.append(first))
+        self.testModel.applyDiff(['unit a', 'unit c', 'unit b'], ['unit d'])
+        self.assertEqual(removed, [1])
+        self.assertEqual(inserted, [0, 2])
+        self.assertEqual(self.testModel.getUnitIds(),
+                         ('unit a', 'unit b', 'unit c'))
+        self.assertEqual(self.testModel.rowCount(), 3)
+
+    def test_applyDiffUnknownOffline(self):
+        """
+        The applyDiff method must ignore an offline unit not listed.
+        """
+        self.testModel.applyDiff([], ['unit z'])
+        self.assertEqual(self.testModel.getUnitIds(), ('unit b', 'unit d'))
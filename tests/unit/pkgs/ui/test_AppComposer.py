@@ -1,5 +1,5 @@
 from unittest import TestCase
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
 import os
 import sys
@@ -16,27 +16,50 @@ class TestAppComposer(TestCase):
     def setUp(self) -> None:
         self.QAppClass = 'pkgs.ui.appComposer.QApplication'
         self.AppWindowClass = 'pkgs.ui.appComposer.AppWindow'
+        self.InputPollerClass = 'pkgs.ui.appComposer.InputPoller'
+        self.QTimerClass = 'pkgs.ui.appComposer.QTimer'
+        self.CmdSchedulerClass = 'pkgs.ui.appComposer.CmdScheduler'
+        self.CmdSenderClass = 'pkgs.ui.appComposer.CmdSender'
         self.sys = 'pkgs.ui.appComposer.sys'
         self.logger = Mock()
         self.QApplication = Mock()
         self.AppWindow = Mock()
+        self.InputPoller = Mock()
+        self.QTimer = Mock()
+        self.CmdScheduler = Mock()
+        self.CmdScheduler.getJitterSummary.return_value = {}
+        self.CmdSender = Mock()
         with patch(self.QAppClass) as mockedQApplication, \
-                patch(self.AppWindowClass) as mockedAppWindow:
+                patch(self.AppWindowClass) as mockedAppWindow, \
+                patch(self.InputPollerClass) as mockedInputPoller, \
+                patch(self.QTimerClass) as mockedQTimer, \
+                patch(self.CmdSchedulerClass) as mockedCmdScheduler, \
+                patch(self.CmdSenderClass) as mockedCmdSender:
             mockedQApplication.return_value = self.QApplication
             mockedAppWindow.return_value = self.AppWindow
+            mockedInputPoller.return_value = self.InputPoller
+            mockedQTimer.return_value = self.QTimer
+            mockedCmdScheduler.return_value = self.CmdScheduler
+            mockedCmdSender.return_value = self.CmdSender
             self.testAppComposer = AppComposer(self.logger)
 
     def tearDown(self) -> None:
         self.logger.reset_mock()
         self.QApplication.reset_mock()
         self.AppWindow.reset_mock()
+        self.InputPoller.reset_mock()
+        self.QTimer.reset_mock()
+        self.CmdScheduler.reset_mock()
+        self.CmdSender.reset_mock()
 
     def test_constructorGetLogger(self):
         """
         The constuctor must get the class logger.
         """
         self.logger.reset_mock()
-        with patch(self.QAppClass), patch(self.AppWindowClass):
+        with patch(self.QAppClass), patch(self.AppWindowClass), \
+                patch(self.InputPollerClass), patch(self.QTimerClass), \
+                patch(self.CmdSchedulerClass), patch(self.CmdSenderClass):
             AppComposer(self.logger)
             self.logger.getLogger.assert_called_once()
 
@@ -45,7 +68,8 @@ class TestAppComposer(TestCase):
         The constructor must create the QApplication.
         """
         with patch(self.QAppClass) as mockedQApplication, \
-                patch(self.AppWindowClass):
+                patch(self.AppWindowClass), \
+                patch(self.InputPollerClass), patch(self.QTimerClass):
             AppComposer(self.logger)
             mockedQApplication.assert_called_once()
 
@@ -54,10 +78,254 @@ class TestAppComposer(TestCase):
         The constructor must create the AppWindow.
         """
         with patch(self.QAppClass), \
-                patch(self.AppWindowClass) as mockedAppWindow:
+                patch(self.AppWindowClass) as mockedAppWindow, \
+                patch(self.InputPollerClass), patch(self.QTimerClass):
             AppComposer(self.logger)
             mockedAppWindow.assert_called_once_with(self.logger)
 
+    def test_constructorInputPoller(self):
+        """
+        The constructor must create the input poller at the given rate.
+        """
+        testRate = 500
+        with patch(self.QAppClass), patch(self.AppWindowClass), \
+                patch(self.InputPollerClass) as mockedInputPoller, \
+                patch(self.QTimerClass):
+            testAppComposer = AppComposer(self.logger, testRate)
+            mockedInputPoller.assert_called_once_with(
+                self.logger, testRate, latency=testAppComposer._latency)
+
+    def test_constructorDeviceHandler(self):
+        """
+        The constructor must hand the controller device events to the
+        AppWindow.
+        """
+        self.InputPoller.setDeviceHandler \
+            .assert_called_once_with(self.AppWindow.onCtrlrDeviceEvent)
+
+    def test_constructorCtrlrHandler(self):
+        """
+        The constructor must hand the selected controller to the input
+        poller.
+        """
+        self.AppWindow.setCtrlrHandler \
+            .assert_called_once_with(self.InputPoller.setController)
+        handler = self.AppWindow.setCtrlrHandler.call_args[0][0]
+        testCtrlr = Mock()
+        handler(testCtrlr)
+        self.InputPoller.setController.assert_called_once_with(testCtrlr)
+
+    def test_constructorUnitHandler(self):
+        """
+        The constructor must activate the unit selected in the AppWindow.
+        """
+        self.AppWindow.setUnitHandler.assert_called_once_with(
+            self.testAppComposer._onUnitSelected)
+
+    def test_onUnitSelected(self):
+        """
+        The _onUnitSelected method must activate the selected unit, and
+        none if it is not connected.
+        """
+        testUnits = self.testAppComposer.getUnits()
+        testUnit = Mock()
+        testUnit.getId.return_value = 'unit 1'
+        testUnits.add(testUnit)
+        self.testAppComposer._onUnitSelected('unit 1')
+        self.assertIs(testUnits.getActive(), testUnit)
+        self.InputPoller.setUnit.assert_called_with(testUnit)
+        self.testAppComposer._onUnitSelected('unit 2')
+        self.assertIsNone(testUnits.getActive())
+        self.testAppComposer._onUnitSelected('unit 1')
+        self.testAppComposer._onUnitSelected(None)
+        self.assertIsNone(testUnits.getActive())
+        self.InputPoller.setUnit.assert_called_with(None)
+
+    def test_constructorCmdScheduler(self):
+        """
+        The constructor must create the unit command scheduler.
+        """
+        with patch(self.QAppClass), patch(self.AppWindowClass), \
+                patch(self.InputPollerClass), patch(self.QTimerClass), \
+                patch(self.CmdSchedulerClass) as mockedCmdScheduler:
+            testAppComposer = AppComposer(self.logger)
+            mockedCmdScheduler.assert_called_once_with(self.logger)
+            self.assertEqual(testAppComposer.getCmdScheduler(),
+                             mockedCmdScheduler.return_value)
+
+    def test_constructorCmdSender(self):
+        """
+        The constructor must create the unit command sender.
+        """
+        with patch(self.QAppClass), patch(self.AppWindowClass), \
+                patch(self.InputPollerClass), patch(self.QTimerClass), \
+                patch(self.CmdSenderClass) as mockedCmdSender:
+            testAppComposer = AppComposer(self.logger)
+            mockedCmdSender.assert_called_once_with(self.logger)
+            self.assertEqual(testAppComposer.getCmdSender(),
+                             mockedCmdSender.return_value)
+
+    def test_refreshUnitPresenceNoDiff(self):
+        """
+        The _refreshUnitPresence method must not update the window when
+        no unit presence changed.
+        """
+        self.testAppComposer._refreshUnitPresence()
+        self.AppWindow.updateUnitPresence.assert_not_called()
+
+    def test_refreshUnitPresence(self):
+        """
+        The _refreshUnitPresence method must push the presence diff to
+        the window, expiring the silent units.
+        """
+        presence = self.testAppComposer.getPresence()
+        presence.onHeartbeat('unit 1')
+        presence.onHeartbeat('unit 2', 0.0)
+        presence.takeDiff()
+        presence.onCxnState('unit 3', True)
+        self.testAppComposer._refreshUnitPresence()
+        self.AppWindow.updateUnitPresence \
+            .assert_called_once_with(['unit 3'], ['unit 2'])
+
+    def test_onUnitEvent(self):
+        """
+        The unit registry events must give the added units the command
+        sender and schedule their keepalive, unschedule the removed ones,
+        drop their telemetry and command and plot the active one.
+        """
+        testUnit = Mock()
+        testUnit.getId.return_value = 'unit 1'
+        units = self.testAppComposer.getUnits()
+        units.add(testUnit)
+        testUnit.setSender.assert_called_once_with(self.CmdSender)
+        self.CmdScheduler.addUnit.assert_called_once_with(
+            testUnit, AppComposer.UNIT_KEEPALIVE_RATE)
+        units.setActive('unit 1')
+        self.InputPoller.setUnit.assert_called_once_with(testUnit)
+        self.AppWindow.setTelemetryUnit.assert_called_once_with(
+            self.testAppComposer.getTelemetry(), 'unit 1')
+        telemetry = self.testAppComposer.getTelemetry()
+        telemetry.append('unit 1', 0.0, (0.0, 0.0, 0.0))
+        self.CmdScheduler.removeUnit.reset_mock()
+        units.remove('unit 1')
+        self.InputPoller.setUnit.assert_called_with(None)
+        self.AppWindow.setTelemetryUnit.assert_called_with(
+            self.testAppComposer.getTelemetry(), None)
+        self.CmdScheduler.removeUnit.assert_called_once_with(testUnit)
+        self.CmdScheduler.addUnit.assert_called_once()
+        testUnit.setSender.assert_called_with(None)
+        self.assertEqual(telemetry.getUnitIds(), [])
+
+    def test_onUnitEventActiveKeepalive(self):
+        """
+        The active unit must be commanded by the input poller only, the
+        deactivated one getting back its scheduled keepalive.
+        """
+        testUnits = [Mock(), Mock()]
+        units = self.testAppComposer.getUnits()
+        for idx, unit in enumerate(testUnits):
+            unit.getId.return_value = f"unit {idx}"
+            units.add(unit)
+        units.setActive('unit 0')
+        self.CmdScheduler.removeUnit.assert_called_once_with(testUnits[0])
+        self.CmdScheduler.addUnit.reset_mock()
+        units.setActive('unit 1')
+        self.CmdScheduler.removeUnit.assert_called_with(testUnits[1])
+        self.InputPoller.setUnit.assert_called_with(testUnits[1])
+        self.CmdScheduler.addUnit.assert_called_once_with(
+            testUnits[0], AppComposer.UNIT_KEEPALIVE_RATE)
+
+    def test_onUnitEventDeactivatedNeutral(self):
+        """
+        A deactivated unit must be set back to neutral before its
+        keepalive is scheduled.
+        """
+        testUnits = [Mock(), Mock()]
+        units = self.testAppComposer.getUnits()
+        for idx, unit in enumerate(testUnits):
+            unit.getId.return_value = f"unit {idx}"
+            units.add(unit)
+        units.setActive('unit 0')
+        calls = Mock()
+        calls.attach_mock(testUnits[0], 'unit')
+        calls.attach_mock(self.CmdScheduler.addUnit, 'addUnit')
+        units.setActive('unit 1')
+        self.assertEqual(calls.mock_calls, [
+            call.unit.getId(),
+            call.unit.updateSteeringCmd(0.0),
+            call.unit.updateThrottleCmd(0.0, 0.0),
+            call.unit.sendCommandMsg(),
+            call.addUnit(testUnits[0], AppComposer.UNIT_KEEPALIVE_RATE)])
+        testUnits[1].updateSteeringCmd.assert_not_called()
+
+    def test_onUnitConnected(self):
+        """
+        The onUnitConnected method must negotiate the unit command format
+        and register the unit online.
+        """
+        testUnit = Mock()
+        testUnit.getId.return_value = 'unit 1'
+        self.testAppComposer.onUnitConnected(testUnit, [1])
+        testUnit.negotiateCmdCodec.assert_called_once_with([1])
+        self.assertIs(self.testAppComposer.getUnits().get('unit 1'),
+                      testUnit)
+        self.assertTrue(self.testAppComposer.getPresence()
+                        .isOnline('unit 1'))
+
+    def test_sessionRecorder(self):
+        """
+        The composer must record the session in the given directory,
+        the telemetry and the added units included.
+        """
+        with patch(self.QAppClass), patch(self.AppWindowClass), \
+                patch(self.InputPollerClass), patch(self.QTimerClass), \
+                patch(self.CmdSchedulerClass), patch(self.CmdSenderClass), \
+                patch('pkgs.ui.appComposer.SessionRecorder') \
+                as mockedSessionRecorder:
+            testAppComposer = AppComposer(self.logger, sessionDir='session')
+        testRecorder = mockedSessionRecorder.return_value
+        telemetry = testAppComposer.getTelemetry()
+        mockedSessionRecorder.assert_called_once_with(
+            self.logger, 'session', telemetry.getChannels())
+        self.assertEqual(telemetry._recorder, testRecorder)
+        testUnit = Mock()
+        testUnit.getId.return_value = 'unit 1'
+        testAppComposer.getUnits().add(testUnit)
+        testUnit.setRecorder.assert_called_once_with(testRecorder)
+        with patch(self.sys):
+            testAppComposer.run()
+        testRecorder.start.assert_called_once()
+        testRecorder.stop.assert_called_once()
+
+    def test_getLatencySummary(self):
+        """
+        The getLatencySummary method must return the command latency
+        summary.
+        """
+        testResult = self.testAppComposer.getLatencySummary()
+        self.assertEqual(testResult,
+                         self.testAppComposer._latency.getSummary())
+
+    def test_refreshCtrlrFeedbackNoModifiers(self):
+        """
+        The _refreshCtrlrFeedback method must not update the window
+        when no modifiers were computed yet.
+        """
+        self.InputPoller.getLatest.return_value = None
+        self.testAppComposer._refreshCtrlrFeedback()
+        self.AppWindow.updateCtrlrFeedback.assert_not_called()
+
+    def test_refreshCtrlrFeedback(self):
+        """
+        The _refreshCtrlrFeedback method must update the window with
+        the latest modifiers.
+        """
+        testModifiers = (0.1, 0.2, 0.0)
+        self.InputPoller.getLatest.return_value = testModifiers
+        self.testAppComposer._refreshCtrlrFeedback()
+        self.AppWindow.updateCtrlrFeedback \
+            .assert_called_once_with(testModifiers)
+
     def test_run(self):
         """
         The run method must show the AppWindow and
@@ -68,5 +336,27 @@ class TestAppComposer(TestCase):
             self.QApplication.exec_.return_value = execReturn
             self.testAppComposer.run()
             self.AppWindow.show.assert_called_once()
+            self.InputPoller.start.assert_called_once()
+            self.QTimer.start.assert_has_calls([
+                call(AppComposer.UI_REFRESH_PERIOD),
+                call(AppComposer.PRESENCE_REFRESH_PERIOD)])
             self.QApplication.exec_.assert_called_once()
+            self.InputPoller.stop.assert_called_once()
+            self.CmdScheduler.start.assert_called_once()
+            self.CmdScheduler.stop.assert_called_once()
+            self.CmdSender.start.assert_called_once()
+            self.CmdSender.stop.assert_called_once()
             mockedSys.exit.assert_called_once_with(execReturn)
+
+    def test_runDumpLatency(self):
+        """
+        The run method must dump the command latency summary on exit
+        when a dump path is given.
+        """
+        testPath = 'latency.json'
+        self.testAppComposer._latencyDumpPath = testPath
+        with patch(self.sys), \
+                patch.object(self.testAppComposer._latency, 'dump') \
+                as mockedDump:
+            self.testAppComposer.run()
+            mockedDump.assert_called_once_with(testPath)
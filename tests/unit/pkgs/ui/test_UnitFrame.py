@@ -0,0 +1,101 @@
+from unittest import TestCase
+from unittest.mock import Mock, call, patch
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.ui.unitFrame import UnitFrame     # noqa: E402
+from pkgs.unitRegistry import UnitRegistry  # noqa: E402
+
+
+class TestUnitFrame(TestCase):
+    """
+    The UnitFrame class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.LabelFrameInit = 'pkgs.ui.unitFrame.tk.LabelFrame.__init__'
+        self.ListboxClass = 'pkgs.ui.unitFrame.tk.Listbox'
+        self.testUnits = UnitRegistry()
+        for unitId in ('unit 3', 'unit 1'):
+            unit = Mock()
+            unit.getId.return_value = unitId
+            self.testUnits.add(unit)
+        with patch(self.LabelFrameInit), \
+                patch(self.ListboxClass) as mockedListbox:
+            self.testFrame = UnitFrame(Mock(), self.testUnits)
+        self.testListbox = mockedListbox.return_value
+        self.testListbox.reset_mock()
+
+    def test_constructorSorted(self):
+        """
+        The constructor must list the registered units sorted by ID.
+        """
+        with patch(self.LabelFrameInit), \
+                patch(self.ListboxClass) as mockedListbox:
+            UnitFrame(Mock(), self.testUnits)
+            mockedListbox.return_value.insert.assert_has_calls([
+                call('end', 'unit 1'), call('end', 'unit 3')])
+
+    def test_onUnitEventScheduled(self):
+        """
+        The unit registry events must be handled in the tkinter event
+        loop.
+        """
+        unit = Mock()
+        unit.getId.return_value = 'unit 2'
+        with patch.object(UnitFrame, 'after') as mockedAfter:
+            self.testUnits.add(unit)
+            self.testUnits.setActive('unit 2')
+            mockedAfter.assert_called_once_with(
+                0, self.testFrame._update_unit_row, UnitRegistry.ADDED,
+                'unit 2')
+        self.testListbox.insert.assert_not_called()
+
+    def test_updateUnitRowAdded(self):
+        """
+        An added unit must be inserted at its sorted row.
+        """
+        self.testFrame._update_unit_row(UnitRegistry.ADDED, 'unit 2')
+        self.testFrame._update_unit_row(UnitRegistry.ADDED, 'unit 4')
+        self.assertEqual(self.testListbox.insert.call_args_list,
+                         [call(1, 'unit 2'), call(3, 'unit 4')])
+        self.assertEqual(self.testFrame._unitIds,
+                         ['unit 1', 'unit 2', 'unit 3', 'unit 4'])
+
+    def test_updateUnitRowAddedListed(self):
+        """
+        A unit already listed must not be inserted again.
+        """
+        self.testFrame._update_unit_row(UnitRegistry.ADDED, 'unit 3')
+        self.testListbox.insert.assert_not_called()
+
+    def test_updateUnitRowRemoved(self):
+        """
+        A removed unit must have its row deleted.
+        """
+        self.testFrame._update_unit_row(UnitRegistry.REMOVED, 'unit 3')
+        self.testListbox.delete.assert_called_once_with(1)
+        self.assertEqual(self.testFrame._unitIds, ['unit 1'])
+
+    def test_updateUnitRowRemovedUnknown(self):
+        """
+        A unit not listed must be ignored once removed.
+        """
+        self.testFrame._update_unit_row(UnitRegistry.REMOVED, 'unit 2')
+        self.testFrame._update_unit_row(UnitRegistry.REMOVED, 'unit 4')
+        self.testListbox.delete.assert_not_called()
+
+    def test_updateUnitRowReplaced(self):
+        """
+        A replaced unit must keep a single row.
+        """
+        self.testFrame._update_unit_row(UnitRegistry.REMOVED, 'unit 1')
+        self.testFrame._update_unit_row(UnitRegistry.ADDED, 'unit 1')
+        self.testListbox.delete.assert_called_once_with(0)
+        self.testListbox.insert.assert_called_once_with(0, 'unit 1')
+        self.assertEqual(self.testFrame._unitIds, ['unit 1', 'unit 3'])
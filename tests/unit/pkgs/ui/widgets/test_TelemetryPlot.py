@@ -0,0 +1,61 @@
+from unittest import TestCase
+from unittest.mock import Mock
+
+import os
+import sys
+
+import numpy as np
+from PySide2.QtWidgets import QApplication
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.ui.widgets import TelemetryPlot      # noqa: E402
+
+
+class TestTelemetryPlot(TestCase):
+    """
+    The TelemetryPlot class test cases.
+    """
+    @classmethod
+    def setUpClass(cls):
+        """
+        Test class setup.
+        """
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testPlot = TelemetryPlot('speed')
+        self.testPlot.resize(101, 61)
+
+    def test_mapPoints(self):
+        """
+        The mapPoints method must scale the points to the widget, the
+        highest value at the top.
+        """
+        polygon = self.testPlot.mapPoints(np.array([1.0, 2.0, 3.0]),
+                                          np.array([0.0, 10.0, 5.0]))
+        points = [(polygon[idx].x(), polygon[idx].y())
+                  for idx in range(polygon.size())]
+        self.assertEqual(points, [(0.0, 60.0), (50.0, 0.0), (100.0, 30.0)])
+
+    def test_mapPointsFlat(self):
+        """
+        The mapPoints method must center a flat line.
+        """
+        polygon = self.testPlot.mapPoints(np.array([1.0, 2.0]),
+                                          np.array([3.0, 3.0]))
+        self.assertEqual(polygon[0].y(), 30.0)
+
+    def test_paintView(self):
+        """
+        The plot must draw the view points decimated to its width.
+        """
+        testView = Mock()
+        testView.getPoints.return_value = (np.array([0.0, 1.0]),
+                                           np.array([0.0, 1.0]))
+        self.testPlot.setView(testView)
+        self.testPlot.grab()
+        testView.getPoints.assert_called_with(self.testPlot.width())
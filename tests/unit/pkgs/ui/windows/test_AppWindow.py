@@ -6,6 +6,7 @@ import sys
 
 sys.path.append(os.path.abspath('./src'))
 
+from pkgs.controller import ModifierSnapshot   # noqa: E402
 from pkgs.ui.windows import AppWindow    # noqa: E402
 
 
@@ -49,3 +50,135 @@ class TestAppWindow(TestCase):
                 as mockedInitCtrlModel:
             self.testAppWindow._initModels(self.logger)
             mockedInitCtrlModel.assert_called_once_with(self.logger)
+
+    def test_initModelsUnitModel(self):
+        """
+        The _initModels method must initialize the unit model and the
+        telemetry plots.
+        """
+        testWindow = Mock()
+        AppWindow._initModels(testWindow, self.logger)
+        testWindow._initUnitModel.assert_called_once_with()
+        testWindow._initTelemetryPlots.assert_called_once_with()
+
+    def test_onCtrlrSelected(self):
+        """
+        The _onCtrlrSelected method must activate the selected
+        controller, or none without selection.
+        """
+        testWindow = Mock()
+        testCtrlrs = (Mock(), Mock())
+        testWindow._ctrlrModel.model.getCtrlrs.return_value = testCtrlrs
+        AppWindow._onCtrlrSelected(testWindow, 1)
+        testWindow._ctrlrModel.setActiveCtrlr \
+            .assert_called_once_with(testCtrlrs[1])
+        AppWindow._onCtrlrSelected(testWindow, -1)
+        testWindow._ctrlrModel.setActiveCtrlr.assert_called_with(None)
+
+    def test_setCtrlrHandler(self):
+        """
+        The setCtrlrHandler method must set the active controller
+        handler of the controller model.
+        """
+        testWindow = Mock()
+        testHandler = Mock()
+        AppWindow.setCtrlrHandler(testWindow, testHandler)
+        testWindow._ctrlrModel.setActiveHandler \
+            .assert_called_once_with(testHandler)
+
+    def test_initUnitModel(self):
+        """
+        The _initUnitModel method must set the unit model of the unit
+        list view.
+        """
+        testWindow = Mock()
+        AppWindow._initUnitModel(testWindow)
+        testWindow.unitsListView.setModel \
+            .assert_called_once_with(testWindow._unitModel)
+        testWindow.unitsListView.selectionModel.return_value \
+            .selectionChanged.connect \
+            .assert_called_once_with(testWindow._onUnitSelected)
+
+    def test_onUnitSelected(self):
+        """
+        The _onUnitSelected method must hand the selected unit ID to the
+        unit handler, or None without selection.
+        """
+        testWindow = Mock()
+        testIndex = Mock()
+        testIndex.data.return_value = 'unit 1'
+        selectionModel = testWindow.unitsListView.selectionModel.return_value
+        selectionModel.selectedIndexes.return_value = [testIndex]
+        AppWindow._onUnitSelected(testWindow, Mock(), Mock())
+        testWindow._unitHandler.assert_called_once_with('unit 1')
+        selectionModel.selectedIndexes.return_value = []
+        AppWindow._onUnitSelected(testWindow, Mock(), Mock())
+        testWindow._unitHandler.assert_called_with(None)
+
+    def test_setUnitHandler(self):
+        """
+        The setUnitHandler method must set the selected unit handler.
+        """
+        testWindow = Mock()
+        testHandler = Mock()
+        AppWindow.setUnitHandler(testWindow, testHandler)
+        self.assertIs(testWindow._unitHandler, testHandler)
+
+    def test_setTelemetryUnit(self):
+        """
+        The setTelemetryUnit method must set a view of the unit channel
+        in each plot, or clear them without unit.
+        """
+        testWindow = Mock()
+        testPlot = Mock()
+        testWindow._telemetryPlots = {'speed': testPlot}
+        testStore = Mock()
+        AppWindow.setTelemetryUnit(testWindow, testStore, 'unit 1')
+        testView = testPlot.setView.call_args[0][0]
+        self.assertEqual(testView._unitId, 'unit 1')
+        self.assertEqual(testView._channel, 'speed')
+        AppWindow.setTelemetryUnit(testWindow, testStore, None)
+        testPlot.setView.assert_called_with(None)
+
+    def test_refreshTelemetry(self):
+        """
+        The refreshTelemetry method must repaint the telemetry plots.
+        """
+        testWindow = Mock()
+        testPlot = Mock()
+        testWindow._telemetryPlots = {'speed': testPlot}
+        AppWindow.refreshTelemetry(testWindow)
+        testPlot.update.assert_called_once_with()
+
+    def test_updateUnitPresence(self):
+        """
+        The updateUnitPresence method must apply the presence diff to
+        the unit model.
+        """
+        testWindow = Mock()
+        AppWindow.updateUnitPresence(testWindow, ['unit 1'], ['unit 2'])
+        testWindow._unitModel.applyDiff \
+            .assert_called_once_with(['unit 1'], ['unit 2'])
+
+    def test_onCtrlrDeviceEvent(self):
+        """
+        The onCtrlrDeviceEvent method must hand the event to the
+        controller model.
+        """
+        testWindow = Mock()
+        testEvent = Mock()
+        AppWindow.onCtrlrDeviceEvent(testWindow, testEvent)
+        testWindow._ctrlrModel.onDeviceEvent.assert_called_once_with(testEvent)
+
+    def test_updateCtrlrFeedback(self):
+        """
+        The updateCtrlrFeedback method must update the throttle and
+        brake bars.
+        """
+        testWindow = Mock()
+        testWindow.ctrlrThrlBar.maximum.return_value = 100
+        testWindow.ctrlrBrkBar.maximum.return_value = 100
+        testModifiers = ModifierSnapshot(-0.3, 0.42, 0.0, 12.5)
+        AppWindow.updateCtrlrFeedback(testWindow, testModifiers)
+        testWindow.ctrlrThrlBar.setValue.assert_called_once_with(42)
+        testWindow.ctrlrBrkBar.setValue.assert_called_once_with(0)
@@ -3,9 +3,11 @@ from unittest.mock import Mock, patch
 
 import os
 import sys
+import threading
 
 sys.path.append(os.path.abspath('./src'))
 
+from pkgs.cmdCodec import WhldCmdCodec  # noqa: E402
 from pkgs.unit.unit import Unit      # noqa: E402
 
 
@@ -42,40 +44,6 @@ class TestUnit(TestCase):
             self.assertEqual(testUnit._client, self.testClient)
             mockedUnitWhledCmdMsg.assert_called_once_with(testId)
 
-    def test_combineThrtlBrakeThrtlActive(self):
-        """
-        The _combineThrlBrake must generate the throttle command base
-        from the throttle modifier if only the throttle is active.
-        """
-        expectedThrtlMod = 0.54
-        brakeModifier = 0.0
-        testResult = self.testUnit._combineThrtlBrake(expectedThrtlMod,
-                                                      brakeModifier)
-        self.assertEqual(testResult, expectedThrtlMod)
-
-    def test_combineThrtlBrakeBrakeActive(self):
-        """
-        The _combineThrlBrake must generate the throttle command base
-        from the brake modifier * -1 if only the brake is active.
-        """
-        throttleModifier = 0.0
-        expectedBrakeMod = 0.99
-        testResult = self.testUnit._combineThrtlBrake(throttleModifier,
-                                                      expectedBrakeMod)
-        self.assertEqual(testResult, expectedBrakeMod * -1)
-
-    def test_combineThrtlBrakeZeroMod(self):
-        """
-        The _combineThrlBrake must set the throttle command to 0 if
-        both the throttle and the brake are inactive or active.
-        """
-        throttleModifiers = [0.0, 0.56]
-        brakeModifiers = [0.0, 0.12]
-        for idx in range(len(throttleModifiers)):
-            testResult = self.testUnit._combineThrtlBrake(throttleModifiers[idx],   # noqa: E501
-                                                          brakeModifiers[idx])
-            self.assertEqual(testResult, 0.0)
-
     def test_getId(self):
         """
         The getId method must return the unit id.
@@ -100,8 +68,8 @@ class TestUnit(TestCase):
         """
         expectedThrtlMod = 0.34
         expectedBrakeMod = 0.98
-        with patch.object(self.testUnit, '_combineThrtlBrake') \
-                as mockedCombine:
+        with patch('pkgs.unit.unit.combineThrtlBrake') as mockedCombine:
+            mockedCombine.return_value = 0.0
             self.testUnit.updateThrottleCmd(expectedThrtlMod, expectedBrakeMod)
             mockedCombine.assert_called_once_with(expectedThrtlMod,
                                                   expectedBrakeMod)
@@ -123,3 +91,167 @@ class TestUnit(TestCase):
         """
         self.testUnit.sendCommandMsg()
         self.testClient.publish.assert_called_once_with(self.testMsg)
+
+    def test_sendCommandSender(self):
+        """
+        The sendCommand method must only submit the unit to its command
+        sender.
+        """
+        testSender = Mock()
+        with patch('pkgs.unit.unit.UnitWhldCmdMsg'):
+            testUnit = Unit(self.testLogging, self.testClient,
+                            self.testUnitId, testSender)
+        testUnit.sendCommandMsg()
+        testSender.submit.assert_called_once_with(testUnit)
+        self.testClient.publish.assert_not_called()
+
+    def test_setSender(self):
+        """
+        The setSender method must submit the next commands to the
+        command sender and publish them in the sender message.
+        """
+        testSender = Mock()
+        testSendMsg = Mock()
+        with patch('pkgs.unit.unit.UnitWhldCmdMsg') as mockedUnitWhldCmdMsg:
+            mockedUnitWhldCmdMsg.return_value = testSendMsg
+            self.testUnit.setSender(testSender)
+            self.testUnit.setSender(testSender)
+            mockedUnitWhldCmdMsg.assert_called_once_with(self.testUnitId)
+        self.testUnit.sendCommandMsg()
+        testSender.submit.assert_called_once_with(self.testUnit)
+        self.testUnit.publishCommandMsg()
+        self.testClient.publish.assert_called_once_with(testSendMsg)
+        self.testUnit.setSender(None)
+        self.testUnit.sendCommandMsg()
+        testSender.submit.assert_called_once()
+        self.testClient.publish.assert_called_with(self.testMsg)
+
+    def test_publishCommandMsg(self):
+        """
+        The publishCommandMsg method must publish the latest command in
+        the sender message.
+        """
+        testSendMsg = Mock()
+        with patch('pkgs.unit.unit.UnitWhldCmdMsg') as mockedUnitWhldCmdMsg:
+            mockedUnitWhldCmdMsg.side_effect = [self.testMsg, testSendMsg]
+            testUnit = Unit(self.testLogging, self.testClient,
+                            self.testUnitId, Mock())
+        testUnit.updateSteeringCmd(0.25)
+        testUnit.updateThrottleCmd(0.5, 0.0)
+        testUnit.updateSteeringCmd(-0.75)
+        testUnit.publishCommandMsg()
+        testSendMsg.setSteering.assert_called_once_with(-0.75)
+        testSendMsg.setThrottle.assert_called_once_with(0.5)
+        self.testClient.publish.assert_called_once_with(testSendMsg)
+
+    def test_sendCommandLatency(self):
+        """
+        The sendCommand method must record the command latency once the
+        command is encoded and published.
+        """
+        testCodec = Mock()
+        testLatency = Mock()
+        self.testUnit.setCmdCodec(testCodec)
+        with patch('pkgs.unit.unit.time') as mockedTime:
+            mockedTime.monotonic.side_effect = [12.5, 13.0]
+            self.testUnit.sendCommandMsg(testLatency, 11.0, 12.0)
+        testCodec.encode.assert_called_once()
+        testLatency.recordCommand.assert_called_once_with(
+            11.0, 12.0, 12.5, 13.0)
+
+    def test_publishCommandMsgLatency(self):
+        """
+        The publishCommandMsg method must record the latency of the
+        submitted command from the sender thread, and only once.
+        """
+        testLatency = Mock()
+        with patch('pkgs.unit.unit.UnitWhldCmdMsg'):
+            testUnit = Unit(self.testLogging, self.testClient,
+                            self.testUnitId, Mock())
+        testUnit.sendCommandMsg(testLatency, 11.0, 12.0)
+        testLatency.recordCommand.assert_not_called()
+        with patch('pkgs.unit.unit.time') as mockedTime:
+            mockedTime.monotonic.side_effect = [12.5, 13.0, 14.0]
+            testUnit.publishCommandMsg()
+            testUnit.publishCommandMsg()
+        testLatency.recordCommand.assert_called_once_with(
+            11.0, 12.0, 12.5, 13.0)
+
+    def test_sendCommandCodec(self):
+        """
+        The sendCommand method must publish the binary command when a
+        codec was negotiated.
+        """
+        testCodec = Mock()
+        self.testUnit.setCmdCodec(testCodec)
+        self.testUnit.updateSteeringCmd(0.5)
+        self.testUnit.sendCommandMsg()
+        testCodec.encode.assert_called_once_with(0.5, 0.0)
+        self.testClient.publishRaw.assert_called_once_with(
+            testCodec.topic, testCodec.encode.return_value)
+        self.testClient.publish.assert_not_called()
+
+    def test_setCmdCodecNoRawPublish(self):
+        """
+        The setCmdCodec method must keep the message format when the
+        client cannot publish binary payloads.
+        """
+        self.testUnit._client = Mock(spec=['publish'])
+        self.testUnit.setCmdCodec(Mock())
+        self.testUnit.sendCommandMsg()
+        self.testUnit._client.publish.assert_called_once_with(self.testMsg)
+        self.testLogger.warning.assert_called_once()
+
+    def test_negotiateCmdCodec(self):
+        """
+        The negotiateCmdCodec method must use the binary format only when
+        the unit advertises the codec version.
+        """
+        self.assertTrue(self.testUnit.negotiateCmdCodec(
+            [WhldCmdCodec.VERSION]))
+        self.assertEqual(self.testUnit._cmdCodec.topic,
+                         Unit.CMD_CODEC_TOPIC.format(self.testUnitId))
+        self.assertFalse(self.testUnit.negotiateCmdCodec(None))
+        self.assertIsNone(self.testUnit._cmdCodec)
+        self.testUnit._client = Mock(spec=['publish'])
+        self.assertFalse(self.testUnit.negotiateCmdCodec(
+            [WhldCmdCodec.VERSION]))
+
+    def test_sendCommandCodecThreads(self):
+        """
+        The commands sent from several threads must each get their own
+        sequence number.
+        """
+        self.testUnit.setCmdCodec(WhldCmdCodec('unit/cmd'))
+        threads = [threading.Thread(target=lambda: [
+            self.testUnit.sendCommandMsg() for _ in range(500)])
+            for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        seqs = [WhldCmdCodec.decode(call.args[1]).seq
+                for call in self.testClient.publishRaw.call_args_list]
+        self.assertEqual(sorted(seqs), list(range(2000)))
+
+    def test_sendCommandCodecFallback(self):
+        """
+        The sendCommand method must publish the command message again
+        once the codec is cleared.
+        """
+        self.testUnit.setCmdCodec(Mock())
+        self.testUnit.setCmdCodec(None)
+        self.testUnit.sendCommandMsg()
+        self.testClient.publish.assert_called_once_with(self.testMsg)
+        self.testClient.publishRaw.assert_not_called()
+
+    def test_sendCommandRecorder(self):
+        """
+        The sendCommand method must record the sent command.
+        """
+        testRecorder = Mock()
+        self.testUnit.setRecorder(testRecorder)
+        self.testUnit.updateSteeringCmd(-0.5)
+        self.testUnit.sendCommandMsg()
+        testRecorder.recordCommand.assert_called_once_with(
+            self.testUnitId, -0.5, 0.0)
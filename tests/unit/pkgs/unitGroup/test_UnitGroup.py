@@ -0,0 +1,180 @@
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+import os
+import sys
+import threading
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.cmdCodec import GroupCmdCodec     # noqa: E402
+from pkgs.unitGroup import UnitGroup        # noqa: E402
+
+
+class TestUnitGroup(TestCase):
+    """
+    The UnitGroup class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testLogging = Mock()
+        self.testClient = Mock()
+        self.testTopic = 'group/convoy/cmd'
+        self.testGroup = UnitGroup(self.testLogging, self.testClient,
+                                   'convoy', self.testTopic)
+        self.testGroup.addMember('lead')
+        self.testGroup.addMember('left', steeringOffset=-0.25,
+                                 throttleScale=0.5)
+        self.testGroup.addMember('right', steeringScale=-1.0,
+                                 throttleOffset=0.75)
+
+    def test_messageFallback(self):
+        """
+        A group whose client cannot publish binary payloads must publish
+        the group command message.
+        """
+        testClient = Mock(spec=['publish'])
+        with patch('pkgs.unitGroup.unitGroup.UnitWhldCmdMsg') \
+                as mockedUnitWhldCmdMsg:
+            testGroup = UnitGroup(self.testLogging, testClient, 'convoy',
+                                  self.testTopic)
+            mockedUnitWhldCmdMsg.assert_called_once_with('convoy')
+        testMsg = mockedUnitWhldCmdMsg.return_value
+        testGroup.addMember('lead')
+        testGroup.addMember('left')
+        testGroup.updateSteeringCmd(0.5)
+        testGroup.updateThrottleCmd(0.0, 0.25)
+        testGroup.sendCommandMsg()
+        testMsg.setSteering.assert_called_once_with(0.5)
+        testMsg.setThrottle.assert_called_once_with(-0.25)
+        testClient.publish.assert_called_once_with(testMsg)
+        with self.assertRaises(ValueError):
+            testGroup.addMember('right', steeringScale=-1.0)
+        with self.assertRaises(ValueError):
+            testGroup.buildPayload()
+
+    def _publishedCommands(self) -> dict:
+        """
+        Decode the member commands of the last publish.
+        """
+        topic, payload = self.testClient.publishRaw.call_args[0]
+        self.assertEqual(topic, self.testTopic)
+        return GroupCmdCodec.decode(payload)[2]
+
+    def test_getMemberIds(self):
+        """
+        The getMemberIds method must return the members in their
+        addition order.
+        """
+        self.assertEqual(self.testGroup.getMemberIds(),
+                         ['lead', 'left', 'right'])
+        self.testGroup.removeMember('left')
+        self.assertEqual(self.testGroup.getMemberIds(), ['lead', 'right'])
+
+    def test_sendCommandMsg(self):
+        """
+        The sendCommandMsg method must publish a single payload with the
+        scaled, offset and clamped command of each member.
+        """
+        self.testGroup.updateSteeringCmd(0.5)
+        self.testGroup.updateThrottleCmd(0.8, 0.0)
+        self.testGroup.sendCommandMsg()
+        self.testClient.publishRaw.assert_called_once()
+        commands = self._publishedCommands()
+        expected = {'lead': (0.5, 0.8), 'left': (0.25, 0.4),
+                    'right': (-0.5, 1.0)}
+        self.assertEqual(list(commands), list(expected))
+        for unitId, (steering, throttle) in expected.items():
+            self.assertAlmostEqual(commands[unitId][0], steering, delta=1e-4)
+            self.assertAlmostEqual(commands[unitId][1], throttle, delta=1e-4)
+
+    def test_sendCommandMsgThreads(self):
+        """
+        The sendCommandMsg method must give each payload its own
+        sequence number whatever thread sends it.
+        """
+        def send():
+            for _ in range(200):
+                self.testGroup.sendCommandMsg()
+
+        threads = [threading.Thread(target=send) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        seqs = [GroupCmdCodec.decode(args[0][1])[0] for args in
+                self.testClient.publishRaw.call_args_list]
+        self.assertEqual(sorted(seqs), list(range(800)))
+
+    def test_updateThrottleCmdBrake(self):
+        """
+        The updateThrottleCmd method must combine the throttle and brake
+        modifiers like a unit.
+        """
+        self.testGroup.updateThrottleCmd(0.0, 0.5)
+        self.testGroup.sendCommandMsg()
+        self.assertAlmostEqual(self._publishedCommands()['lead'][1], -0.5,
+                               delta=1e-4)
+        self.testGroup.updateThrottleCmd(0.3, 0.5)
+        self.testGroup.sendCommandMsg()
+        self.assertEqual(self._publishedCommands()['lead'][1], 0.0)
+
+    def test_sendCommandMsgEmpty(self):
+        """
+        The sendCommandMsg method must not publish for an empty group.
+        """
+        testGroup = UnitGroup(self.testLogging, self.testClient, 'empty',
+                              self.testTopic)
+        testGroup.sendCommandMsg()
+        self.testClient.publishRaw.assert_not_called()
+
+    def test_sendCommandSender(self):
+        """
+        The sendCommandMsg method must only submit the group to its
+        command sender.
+        """
+        testSender = Mock()
+        testGroup = UnitGroup(self.testLogging, self.testClient, 'convoy',
+                              self.testTopic, testSender)
+        testGroup.sendCommandMsg()
+        testSender.submit.assert_called_once_with(testGroup)
+        self.testClient.publishRaw.assert_not_called()
+
+    def test_setSender(self):
+        """
+        The setSender method must submit the next commands to the
+        command sender.
+        """
+        testSender = Mock()
+        self.testGroup.setSender(testSender)
+        self.testGroup.sendCommandMsg()
+        testSender.submit.assert_called_once_with(self.testGroup)
+        self.testClient.publishRaw.assert_not_called()
+
+    def test_addMemberFull(self):
+        """
+        The addMember method must raise a ValueError once the group is
+        full.
+        """
+        for idx in range(GroupCmdCodec.MAX_MEMBERS - 3):
+            self.testGroup.addMember(f"unit {idx}")
+        with self.assertRaises(ValueError):
+            self.testGroup.addMember('one too many')
+        self.testGroup.addMember('lead', steeringScale=0.5)
+
+    def test_sendCommandRecorder(self):
+        """
+        The sendCommandMsg method must record the command of each
+        member.
+        """
+        testRecorder = Mock()
+        self.testGroup.setRecorder(testRecorder)
+        self.testGroup.updateSteeringCmd(0.5)
+        self.testGroup.sendCommandMsg()
+        self.assertEqual(
+            [args[0][0] for args in
+             testRecorder.recordCommand.call_args_list],
+            ['lead', 'left', 'right'])
+        testRecorder.recordCommand.assert_any_call('right', -0.5, 0.75)
@@ -0,0 +1,87 @@
+from unittest import TestCase
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.unitPresence import UnitPresence      # noqa: E402
+
+
+class TestUnitPresence(TestCase):
+    """
+    The UnitPresence class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testPresence = UnitPresence(ttl=1.0)
+
+    def test_constructorInvalidTtl(self):
+        """
+        The constructor must raise a ValueError for a TTL that is not
+        positive.
+        """
+        with self.assertRaises(ValueError):
+            UnitPresence(ttl=0)
+
+    def test_onHeartbeat(self):
+        """
+        The onHeartbeat method must put a new unit online once.
+        """
+        self.testPresence.onHeartbeat('unit 1', 0.0)
+        self.testPresence.onHeartbeat('unit 1', 0.5)
+        self.assertTrue(self.testPresence.isOnline('unit 1'))
+        self.assertEqual(self.testPresence.takeDiff(), (['unit 1'], []))
+        self.assertEqual(self.testPresence.takeDiff(), ([], []))
+
+    def test_expire(self):
+        """
+        The expire method must put offline only the units whose TTL
+        expired since their last heartbeat.
+        """
+        self.testPresence.onHeartbeat('unit 1', 0.0)
+        self.testPresence.onHeartbeat('unit 2', 0.0)
+        self.testPresence.takeDiff()
+        self.testPresence.onHeartbeat('unit 2', 0.8)
+        self.assertEqual(self.testPresence.expire(1.0), 1)
+        self.assertEqual(self.testPresence.getOnlineIds(), ['unit 2'])
+        self.assertEqual(self.testPresence.takeDiff(), ([], ['unit 1']))
+        self.assertEqual(self.testPresence.expire(1.5), 0)
+        self.assertEqual(self.testPresence.expire(1.8), 1)
+        self.assertEqual(self.testPresence.getOnlineIds(), [])
+
+    def test_heapEntryPerUnit(self):
+        """
+        The heap must hold a single entry per unit whatever the number
+        of heartbeats and reconnections.
+        """
+        for idx in range(100):
+            self.testPresence.onHeartbeat('unit 1', idx * 0.01)
+            self.testPresence.onCxnState('unit 1', idx % 2 == 0,
+                                         idx * 0.01)
+        self.assertEqual(len(self.testPresence._heap), 1)
+
+    def test_onCxnStateDisconnected(self):
+        """
+        The onCxnState method must put a disconnected unit offline
+        immediately, even if its old heap entry is still queued.
+        """
+        self.testPresence.onCxnState('unit 1', True, 0.0)
+        self.testPresence.takeDiff()
+        self.testPresence.onCxnState('unit 1', False, 0.5)
+        self.assertFalse(self.testPresence.isOnline('unit 1'))
+        self.assertEqual(self.testPresence.takeDiff(), ([], ['unit 1']))
+        self.assertEqual(self.testPresence.expire(2.0), 0)
+        self.assertEqual(self.testPresence._heap, [])
+
+    def test_takeDiffCoalesce(self):
+        """
+        The takeDiff method must cancel the changes undone before the
+        diff is taken.
+        """
+        self.testPresence.onHeartbeat('unit 1', 0.0)
+        self.testPresence.onCxnState('unit 1', False, 0.1)
+        self.testPresence.onHeartbeat('unit 2', 0.0)
+        self.assertEqual(self.testPresence.takeDiff(), (['unit 2'], []))
@@ -0,0 +1,134 @@
+from unittest import TestCase
+from unittest.mock import Mock, call
+
+import os
+import sys
+
+sys.path.append(os.path.abspath('./src'))
+
+from pkgs.unitRegistry import UnitRegistry      # noqa: E402
+
+
+class TestUnitRegistry(TestCase):
+    """
+    The UnitRegistry class test cases.
+    """
+    def setUp(self):
+        """
+        Test cases setup.
+        """
+        self.testUnits = []
+        for unitId in ('unit 1', 'unit 2', 'unit 3'):
+            unit = Mock()
+            unit.getId.return_value = unitId
+            self.testUnits.append(unit)
+        self.testRegistry = UnitRegistry()
+        for unit in self.testUnits:
+            self.testRegistry.add(unit)
+        self.testListener = Mock()
+        self.testRegistry.addListener(self.testListener)
+
+    def test_iterOrder(self):
+        """
+        The registry must iterate over the units in their connection
+        order.
+        """
+        self.assertEqual(list(self.testRegistry), self.testUnits)
+        self.assertEqual(self.testRegistry.getIds(),
+                         ['unit 1', 'unit 2', 'unit 3'])
+        self.assertEqual(len(self.testRegistry), 3)
+
+    def test_get(self):
+        """
+        The get method must return the unit with the ID or None.
+        """
+        self.assertEqual(self.testRegistry.get('unit 2'), self.testUnits[1])
+        self.assertIsNone(self.testRegistry.get('unknown'))
+        self.assertIn('unit 3', self.testRegistry)
+
+    def test_add(self):
+        """
+        The add method must append the unit and notify it.
+        """
+        newUnit = Mock()
+        newUnit.getId.return_value = 'unit 4'
+        self.testRegistry.add(newUnit)
+        self.assertEqual(list(self.testRegistry)[-1], newUnit)
+        self.testListener.assert_called_once_with(UnitRegistry.ADDED,
+                                                  newUnit)
+
+    def test_addReplace(self):
+        """
+        The add method must replace the unit with the same ID,
+        deactivating it before removing it like the remove method.
+        """
+        self.testRegistry.setActive('unit 1')
+        self.testListener.reset_mock()
+        newUnit = Mock()
+        newUnit.getId.return_value = 'unit 1'
+        self.testRegistry.add(newUnit)
+        self.assertEqual(self.testRegistry.get('unit 1'), newUnit)
+        self.assertEqual(len(self.testRegistry), 3)
+        self.assertIsNone(self.testRegistry.getActive())
+        self.assertEqual(self.testListener.call_args_list, [
+            call(UnitRegistry.ACTIVATED, None),
+            call(UnitRegistry.REMOVED, self.testUnits[0]),
+            call(UnitRegistry.ADDED, newUnit)])
+
+    def test_remove(self):
+        """
+        The remove method must remove the unit, deactivate it and
+        notify it.
+        """
+        self.testRegistry.setActive('unit 2')
+        self.testListener.reset_mock()
+        testResult = self.testRegistry.remove('unit 2')
+        self.assertEqual(testResult, self.testUnits[1])
+        self.assertNotIn('unit 2', self.testRegistry)
+        self.assertIsNone(self.testRegistry.getActive())
+        self.testListener.assert_has_calls([
+            call(UnitRegistry.ACTIVATED, None),
+            call(UnitRegistry.REMOVED, self.testUnits[1])])
+
+    def test_removeUnknown(self):
+        """
+        The remove method must ignore an unknown unit.
+        """
+        self.assertIsNone(self.testRegistry.remove('unknown'))
+        self.testListener.assert_not_called()
+
+    def test_notifyChanged(self):
+        """
+        The notifyChanged method must notify the change of a registered
+        unit only.
+        """
+        self.testRegistry.notifyChanged('unit 3')
+        self.testRegistry.notifyChanged('unknown')
+        self.testListener.assert_called_once_with(UnitRegistry.CHANGED,
+                                                  self.testUnits[2])
+
+    def test_setActive(self):
+        """
+        The setActive method must activate the unit and notify only a
+        change of active unit.
+        """
+        self.testRegistry.setActive('unit 3')
+        self.testRegistry.setActive('unit 3')
+        self.assertEqual(self.testRegistry.getActive(), self.testUnits[2])
+        self.testListener.assert_called_once_with(UnitRegistry.ACTIVATED,
+                                                  self.testUnits[2])
+
+    def test_setActiveUnknown(self):
+        """
+        The setActive method must raise a ValueError for an unknown unit.
+        """
+        with self.assertRaises(ValueError):
+            self.testRegistry.setActive('unknown')
+
+    def test_removeListener(self):
+        """
+        The removeListener method must stop notifying the listener.
+        """
+        self.testRegistry.removeListener(self.testListener)
+        self.testRegistry.notifyChanged('unit 1')
+        self.testListener.assert_not_called()
@@ -32,5 +32,5 @@ class TestApp(TestCase):
                 patch('app.AppComposer') as mockedAppComp:
             mockedInitLogger.return_value = logger
             app.main()
-            mockedAppComp.assert_called_once_with(logger)
+            mockedAppComp.assert_called_once_with(logger, app._CTRL_POLL_RATE)
             mockedAppComp().run.assert_called_once()